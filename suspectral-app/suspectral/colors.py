@@ -1,5 +1,12 @@
+from functools import cache
+
+import numpy as np
+import pyqtgraph as pg
 from PySide6.QtGui import QColor
 
+NUM_COLORS = 9
+"""Number of distinct colors in the palette used by `get_color`."""
+
 
 def get_color(index: int) -> QColor:
     """
@@ -25,4 +32,81 @@ def get_color(index: int) -> QColor:
         QColor.fromHsvF(0.728111, 0.755276, 1.000000, 1.0),
         QColor.fromHsvF(0.815028, 0.819898, 1.000000, 1.0),
         QColor.fromHsvF(0.925917, 0.821912, 0.800000, 1.0),
-    ][index % 9]
+    ][index % NUM_COLORS]
+
+
+def get_label_color(index: int) -> QColor:
+    """
+    Returns a color for the label with the given index, for images with many distinct labels.
+
+    The first labels use the same palette as `get_color`. Further labels are spread around the
+    hue circle by the golden angle, so that no two labels share a color.
+
+    Parameters:
+        index (int): The index of the label.
+
+    Returns:
+        QColor: The color of the label.
+    """
+    if index < NUM_COLORS:
+        return get_color(index)
+
+    hue = (index * 0.618033988749895) % 1.0
+    value = 1.0 if index % 2 == 0 else 0.7
+    return QColor.fromHsvF(hue, 0.85, value, 1.0)
+
+
+def get_label_palette(count: int) -> np.ndarray:
+    """
+    Returns the colors of the first labels as an array, for rendering label images.
+
+    Parameters:
+        count (int): The number of labels.
+
+    Returns:
+        np.ndarray: Array of shape (count, 3) with RGB values in the range [0, 1].
+    """
+    return np.array([get_label_color(it).getRgbF()[:3] for it in range(count)]).reshape(count, 3)
+
+
+COLORMAPS = ["viridis", "inferno", "magma", "plasma", "cividis"]
+"""Names of the color maps offered for displaying scalar images."""
+
+
+@cache
+def get_colormap_lut(name: str) -> np.ndarray:
+    """
+    Returns the lookup table of a color map.
+
+    Parameters:
+        name (str): The name of a color map known to pyqtgraph, such as those in `COLORMAPS`.
+
+    Returns:
+        np.ndarray: Array of shape (256, 3) with RGB values as uint8.
+    """
+    lut = pg.colormap.get(name).getLookupTable(nPts=256, alpha=False)
+    lut.setflags(write=False)
+    return lut
+
+
+def apply_colormap(values: np.ndarray, start: float, end: float, name: str = "viridis") -> np.ndarray:
+    """
+    Colors scalar values with a color map, clipping them to the given range.
+
+    Parameters:
+        values (np.ndarray): The values to color.
+        start (float): The value mapped to the first color of the map.
+        end (float): The value mapped to the last color of the map. May be less than `start`.
+        name (str): The name of the color map, by default "viridis".
+
+    Returns:
+        np.ndarray: Array of shape (*values.shape, 3) with RGB values as uint8. Non-finite values are black.
+    """
+    lut = get_colormap_lut(name)
+    span = end - start if end != start else 1.0
+    with np.errstate(invalid="ignore"):
+        positions = np.clip((values - start) / span, 0.0, 1.0)
+
+    colors = lut[(np.nan_to_num(positions) * (len(lut) - 1)).astype(np.intp)]
+    colors[~np.isfinite(values)] = 0
+    return colors
@@ -0,0 +1,135 @@
+import numpy as np
+from PySide6.QtCore import QObject, Slot, QTimer
+from PySide6.QtGui import QPolygonF
+
+from suspectral.model.cross_section import CrossSection
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.tool.manager import ToolManager
+from suspectral.view.cross_section.cross_section_view import CrossSectionView
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_section import SectionWorker
+
+
+class CrossSectionController(QObject):
+    """
+    Controller which displays the spectra along the line drawn with the cross-section tool.
+
+    The line changes with every movement of the mouse while it is drawn or dragged, so
+    changes are coalesced: only the latest line is read, once control returns to the event
+    loop. Reads go through a `CrossSection` kept for as long as the hypercube is open, so
+    that the columns it caches are reused between consecutive lines. Columns which are not
+    cached yet are read in the background; until they are, the rest of the line is shown
+    with gaps in their place.
+
+    Parameters
+    ----------
+    view : CrossSectionView
+        The view displaying the cross-section.
+    tools : ToolManager
+        The tool manager providing the cross-section tool.
+    model : HypercubeContainer
+        The hypercube container model emitting opened and closed signals.
+    parent : QObject or None, optional
+        The parent object of the controller, by default None.
+    """
+
+    def __init__(self, *,
+                 view: CrossSectionView,
+                 tools: ToolManager,
+                 model: HypercubeContainer,
+                 parent: QObject | None = None):
+        super().__init__(parent)
+        self._view = view
+        self._model = model
+
+        self._section: CrossSection | None = None
+        self._pending: QPolygonF | None = None
+        self._worker: SectionWorker | None = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._update)
+
+        model.opened.connect(self._handle_hypercube_opened)
+        model.closed.connect(self._handle_hypercube_closed)
+
+        tools.cross_section.sectionChanged.connect(self._handle_section_changed)
+        tools.cross_section.sectionEnded.connect(self._handle_section_ended)
+
+    @Slot()
+    def _handle_hypercube_opened(self, hypercube: Hypercube):
+        self._stop_worker()
+        self._section = CrossSection(hypercube)
+        self._pending = None
+        self._view.clear()
+
+        if hypercube.wavelengths is None:
+            self._view.set_band_numbers()
+        else:
+            self._view.set_wavelengths(hypercube.wavelengths, hypercube.wavelengths_unit)
+
+    @Slot()
+    def _handle_hypercube_closed(self):
+        self._stop_worker()
+        self._section = None
+        self._pending = None
+        self._view.clear()
+
+    @Slot()
+    def _handle_section_changed(self, polyline: QPolygonF):
+        self._pending = polyline
+        self._timer.start()
+
+    @Slot()
+    def _handle_section_ended(self):
+        self._stop_worker()
+        self._pending = None
+        self._timer.stop()
+        self._view.clear()
+
+    @Slot()
+    def _update(self):
+        polyline, self._pending = self._pending, None
+        if polyline is None or self._section is None:
+            return
+
+        hypercube = self._model.hypercube
+        points = np.array([(point.x(), point.y()) for point in polyline])
+        rows, cols = CrossSection.trace(points, hypercube.num_rows, hypercube.num_cols)
+        if len(rows) < 2:
+            self._stop_worker()
+            self._view.clear()
+            return
+
+        spectra, available = self._section.read_available(rows, cols)
+        if available.all():
+            self._stop_worker()
+            self._view.display(spectra)
+            return
+
+        partial = spectra.astype(np.float32)
+        partial[~available] = np.nan
+        self._view.display(partial)
+
+        self._stop_worker()
+        self._worker = SectionWorker(hypercube, self._section, rows, cols)
+        self._worker.loaded.connect(self._handle_section_loaded)
+        self._worker.finished.connect(self._handle_worker_finished)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_section_loaded(self, spectra: np.ndarray):
+        if self.sender() is self._worker:
+            self._view.display(spectra)
+
+    @Slot()
+    def _handle_worker_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    def _stop_worker(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
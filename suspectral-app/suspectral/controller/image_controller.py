@@ -1,11 +1,12 @@
-import itertools
 import numpy as np
 from PySide6.QtCore import QObject, Slot, QStandardPaths, QPoint
 from PySide6.QtGui import QImage, QPixmap, QAction
 from PySide6.QtWidgets import QMenu, QApplication, QFileDialog, QMessageBox
 
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
 from suspectral.theme_icon import ThemeIcon
+from suspectral.tool.highlight_points import PointsHighlight
 from suspectral.tool.manager import ToolManager
 from suspectral.view.image.image_controls_view import ImageControlsView
 from suspectral.view.image.image_view import ImageView
@@ -29,6 +30,9 @@ class ImageController(QObject):
         The parent object of the controller, by default None.
     """
 
+    REFERENCE_LIMIT = 1000
+    """Maximum number of points of a selection that are offered as references."""
+
     def __init__(self, *,
                  tools: ToolManager,
                  model: HypercubeContainer,
@@ -40,11 +44,13 @@ class ImageController(QObject):
         self._model = model
         self._image_display_view = image_display_view
         self._image_controls_view = image_controls_view
+        self._highlight: PointsHighlight | None = None
 
         model.opened.connect(self._handle_hypercube_opened)
         model.closed.connect(self._handle_hypercube_closed)
 
         image_controls_view.imagedChanged.connect(self._handle_image_changed)
+        image_controls_view.pointsHighlighted.connect(self._handle_points_highlighted)
         image_display_view.contextMenuRequested.connect(self._handle_context_menu)
 
         tools.toolChanged.connect(self._handle_tool_changed)
@@ -55,19 +61,34 @@ class ImageController(QObject):
         tools.area.selectionMoved.connect(self._handle_selection_changed)
         tools.area.selectionEnded.connect(self._handle_selection_changed)
         tools.area.selectionSampled.connect(self._handle_selection_sampled)
+        tools.area.selectionResampled.connect(self._handle_selection_changed)
+
+        tools.polygon.selectionStarted.connect(self._handle_selection_changed)
+        tools.polygon.selectionEnded.connect(self._handle_selection_changed)
+        tools.polygon.selectionSampled.connect(self._handle_selection_masked)
+
+        tools.wand.selectionStarted.connect(self._handle_selection_changed)
+        tools.wand.selectionEnded.connect(self._handle_selection_changed)
+        tools.wand.selectionSampled.connect(self._handle_selection_masked)
 
     @Slot()
     def _handle_tool_changed(self):
+        self._remove_highlight()
         self._image_controls_view.clear_reference_points()
 
     @Slot()
     def _handle_selection_changed(self):
+        self._remove_highlight()
         self._image_controls_view.clear_reference_points()
 
     @Slot()
     def _handle_selection_sampled(self, xs: np.ndarray, ys: np.ndarray):
-        for point in [QPoint(x, y) for y, x in itertools.product(ys, xs)]:
-            self._image_controls_view.add_reference_points(point)
+        grid_xs, grid_ys = np.meshgrid(xs, ys)
+        self._extend_reference_points(grid_xs.ravel(), grid_ys.ravel())
+
+    @Slot()
+    def _handle_selection_masked(self, mask: SelectionMask):
+        self._extend_reference_points(*mask.coordinates())
 
     @Slot()
     def _handle_pixel_clicked(self, point: QPoint):
@@ -75,15 +96,39 @@ class ImageController(QObject):
 
     @Slot()
     def _handle_pixel_cleared(self):
+        self._remove_highlight()
         self._image_controls_view.clear_reference_points()
 
+    @Slot()
+    def _handle_points_highlighted(self, xs: np.ndarray, ys: np.ndarray):
+        self._remove_highlight()
+        self._highlight = PointsHighlight(xs, ys)
+        self._image_display_view.scene().addItem(self._highlight)
+
+    def _extend_reference_points(self, xs: np.ndarray, ys: np.ndarray):
+        # Large selections are thinned out evenly, since that many references could not
+        # be meaningfully browsed anyway, and each one costs an item in the list.
+        if len(xs) > self.REFERENCE_LIMIT:
+            indices = np.linspace(0, len(xs) - 1, self.REFERENCE_LIMIT).astype(int)
+            xs, ys = xs[indices], ys[indices]
+
+        points = [QPoint(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        self._image_controls_view.extend_reference_points(points)
+
+    def _remove_highlight(self):
+        if self._highlight is not None:
+            self._image_display_view.scene().removeItem(self._highlight)
+            self._highlight = None
+
     @Slot()
     def _handle_hypercube_opened(self):
+        self._remove_highlight()
         self._image_display_view.reset()
         self._image_controls_view.activate()
 
     @Slot()
     def _handle_hypercube_closed(self):
+        self._remove_highlight()
         self._image_controls_view.deactivate()
         self._image_display_view.reset()
 
@@ -0,0 +1,293 @@
+import numpy as np
+from PySide6.QtCore import QObject, Slot, QPoint
+from PySide6.QtGui import QColor, QImage, QPixmap
+
+from suspectral.colors import apply_colormap
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.spectral_index import SpectralIndex
+from suspectral.tool.manager import ToolManager
+from suspectral.view.image.image_view import ImageView
+from suspectral.view.overlay.overlay_view import OverlayView
+from suspectral.worker.worker import Worker, start_worker
+from suspectral.worker.worker_index import IndexWorker
+from suspectral.worker.worker_neighbours import NeighboursWorker
+from suspectral.worker.worker_rx import RXWorker
+from suspectral.worker.worker_similarity import SimilarityWorker
+
+
+class OverlayController(QObject):
+    """
+    Controller which computes per-pixel score maps and displays them as a thresholded overlay.
+
+    Score maps are computed by background workers. Once a map is available, pixels on the
+    matching side of the threshold chosen in the overlay view are highlighted on top of the
+    image. Moving the threshold only re-renders the overlay, without recomputing the map.
+
+    Queries for the nearest pixels go through the spectral index of the hypercube instead,
+    which is loaded or built once per hypercube and only scores the pixels it returns.
+    The index is kept in the memory cache of the hypercube, so that it outlives switching
+    to other hypercubes of the workspace and back, for as long as the memory budget allows.
+    The queries themselves run in the background as well.
+
+    Score maps may also be displayed as a heat map, where matching pixels are colored by
+    their score rather than all in the same color.
+
+    Parameters
+    ----------
+    view : OverlayView
+        The view controlling the overlay threshold.
+    image_view : ImageView
+        The image view on which the overlay is displayed.
+    tools : ToolManager
+        The tool manager whose tools request score maps.
+    model : HypercubeContainer
+        The hypercube container model emitting opened and closed signals.
+    parent : QObject or None, optional
+        The parent object of the controller, by default None.
+    """
+
+    COLOR = QColor(255, 0, 255, 160)
+    """Color of the highlighted pixels."""
+
+    HEATMAP = "inferno"
+    """Name of the color map used to color highlighted pixels of heat maps."""
+
+    DEFAULT_QUANTILE = 0.01
+    """Fraction of the best-matching pixels highlighted by default."""
+
+    NUM_NEIGHBOURS = 1000
+    """Number of pixels returned by queries for the nearest pixels."""
+
+    INDEX_KEY = "spectral index"
+    """Key under which the spectral index is kept in the memory cache of the hypercube."""
+
+    def __init__(self, *,
+                 view: OverlayView,
+                 image_view: ImageView,
+                 tools: ToolManager,
+                 model: HypercubeContainer,
+                 parent: QObject | None = None):
+        super().__init__(parent)
+        self._view = view
+        self._image_view = image_view
+        self._model = model
+
+        self._worker: Worker | None = None
+        self._scores: np.ndarray | None = None
+        self._higher_matches = False
+        self._heatmap = False
+        self._rgba: np.ndarray | None = None
+
+        self._index: SpectralIndex | None = None
+        self._index_worker: IndexWorker | None = None
+        self._pending_query: QPoint | None = None
+
+        model.opened.connect(self._handle_hypercube_changed)
+        model.closed.connect(self._handle_hypercube_changed)
+
+        view.thresholdChanged.connect(self._handle_threshold_changed)
+        view.clearRequested.connect(self.clear)
+        view.anomaliesRequested.connect(self._handle_anomalies_requested)
+
+        tools.inspect.similarityRequested.connect(self._handle_similarity_requested)
+        tools.inspect.neighboursRequested.connect(self._handle_neighbours_requested)
+
+    def compute(self, name: str, worker: Worker, higher_matches: bool = False, heatmap: bool = False):
+        """
+        Run a worker producing a score map and display the map once it is computed.
+
+        The worker must provide a `computed` signal carrying the map of shape (rows, columns).
+
+        Parameters
+        ----------
+        name : str
+            The display name of the overlay.
+        worker : Worker
+            The job computing the map. It is started by this method.
+        higher_matches : bool, optional
+            Whether higher scores rather than lower ones mean a match, by default False.
+        heatmap : bool, optional
+            Whether to color matching pixels by their score, by default False.
+        """
+        self.clear()
+        self._view.start(name)
+
+        self._worker = worker
+        self._higher_matches = higher_matches
+        self._heatmap = heatmap
+        worker.progress.connect(self._handle_worker_progress)
+        worker.computed.connect(self._handle_worker_computed)
+        worker.finished.connect(self._handle_worker_finished)
+        start_worker(worker, self)
+
+    def show_scores(self,
+                    scores: np.ndarray,
+                    higher_matches: bool = False,
+                    threshold: float | None = None,
+                    heatmap: bool = False):
+        """
+        Display a precomputed score map, by default choosing a threshold that highlights the best matches.
+
+        Parameters
+        ----------
+        scores : np.ndarray
+            The map of scores of shape (rows, columns). NaN values never match.
+        higher_matches : bool, optional
+            Whether higher scores rather than lower ones mean a match, by default False.
+        threshold : float, optional
+            The initial threshold. Defaults to the one matching `DEFAULT_QUANTILE` of the pixels.
+        heatmap : bool, optional
+            Whether to color matching pixels by their score, by default False.
+        """
+        self._scores = scores
+        self._higher_matches = higher_matches
+        self._heatmap = heatmap
+        self._rgba = np.zeros((*scores.shape, 4), dtype=np.uint8)
+        self._rgba[...] = self.COLOR.getRgb()
+
+        finite = scores[np.isfinite(scores)]
+        if finite.size == 0:
+            self._view.set_range(0.0, 1.0, 0.0)
+            self._render(np.nan)
+            return
+
+        if threshold is None:
+            quantile = 1.0 - self.DEFAULT_QUANTILE if higher_matches else self.DEFAULT_QUANTILE
+            threshold = float(np.quantile(finite, quantile))
+
+        if heatmap:
+            # Spread the colors over the initial matches, since scores tend to have long tails.
+            extreme = float(finite.max()) if higher_matches else float(finite.min())
+            self._rgba[..., :3] = apply_colormap(scores, threshold, extreme, self.HEATMAP)
+
+        self._view.set_range(float(finite.min()), float(finite.max()), threshold)
+        self._render(threshold)
+
+    @Slot()
+    def clear(self):
+        """Stop any computation in progress and remove the overlay."""
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+        if self._index_worker is not None:
+            self._index_worker.stop()
+            self._index_worker = None
+
+        self._scores = None
+        self._rgba = None
+        self._view.clear()
+        self._image_view.clear_overlay()
+
+    @Slot()
+    def _handle_hypercube_changed(self):
+        self.clear()
+
+        # The index of a hypercube opened before may still be cached.
+        hypercube = self._model.hypercube
+        self._index = hypercube.get_cached(self.INDEX_KEY) if hypercube is not None else None
+        self._view.set_detection_enabled(hypercube is not None)
+
+    @Slot()
+    def _handle_similarity_requested(self, point: QPoint, metric: str):
+        hypercube = self._model.hypercube
+        target = hypercube.read_pixel(point.y(), point.x())
+
+        name = f"{SimilarityWorker.METRICS[metric]} to ({point.x()}, {point.y()})"
+        self.compute(name, SimilarityWorker(hypercube, target, metric))
+
+    @Slot()
+    def _handle_anomalies_requested(self, window: int, guard: int):
+        if window:
+            name = f"Local RX Anomalies ({window} × {window} px)"
+        else:
+            name = "Global RX Anomalies"
+
+        worker = RXWorker(self._model.hypercube, window, guard)
+        self.compute(name, worker, higher_matches=True, heatmap=True)
+
+    @Slot()
+    def _handle_neighbours_requested(self, point: QPoint):
+        if self._index is not None:
+            self._query_neighbours(point)
+            return
+
+        # The index is loaded or built once, after which the query is answered.
+        self.clear()
+        self._view.start("Indexing Spectra...")
+
+        self._pending_query = point
+        self._index_worker = IndexWorker(self._model.hypercube)
+        self._index_worker.progress.connect(self._handle_index_progress)
+        self._index_worker.indexed.connect(self._handle_index_ready)
+        self._index_worker.finished.connect(self._handle_index_finished)
+        start_worker(self._index_worker, self)
+
+    @Slot()
+    def _handle_index_progress(self, percent: int):
+        if self.sender() is self._index_worker:
+            self._view.set_progress(percent)
+
+    @Slot()
+    def _handle_index_ready(self, index: SpectralIndex):
+        if self.sender() is self._index_worker:
+            self._index = index
+            self._model.hypercube.set_cached(self.INDEX_KEY, index)
+            self._query_neighbours(self._pending_query)
+
+    @Slot()
+    def _handle_index_finished(self):
+        if self.sender() is self._index_worker:
+            self._index_worker = None
+
+    def _query_neighbours(self, point: QPoint):
+        self.clear()
+
+        k = min(self.NUM_NEIGHBOURS, self._index.num_pixels)
+        self._view.start(f"Nearest {k} Pixels to ({point.x()}, {point.y()})")
+
+        self._worker = NeighboursWorker(self._model.hypercube, self._index, point.y(), point.x(), k)
+        self._worker.progress.connect(self._handle_worker_progress)
+        self._worker.found.connect(self._handle_neighbours_found)
+        self._worker.finished.connect(self._handle_worker_finished)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_neighbours_found(self, pixels: np.ndarray, angles: np.ndarray):
+        if self.sender() is not self._worker:
+            return
+
+        scores = np.full(self._index.shape, np.nan, dtype=np.float32)
+        scores.flat[pixels] = angles
+        self.show_scores(scores, threshold=float(angles.max()) if len(angles) else None)
+
+    @Slot()
+    def _handle_threshold_changed(self, threshold: float):
+        if self._scores is not None:
+            self._render(threshold)
+
+    @Slot()
+    def _handle_worker_progress(self, percent: int):
+        if self.sender() is self._worker:
+            self._view.set_progress(percent)
+
+    @Slot()
+    def _handle_worker_computed(self, scores: np.ndarray):
+        if self.sender() is self._worker:
+            self.show_scores(scores, self._higher_matches, heatmap=self._heatmap)
+
+    @Slot()
+    def _handle_worker_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    def _render(self, threshold: float):
+        with np.errstate(invalid="ignore"):
+            matches = self._scores >= threshold if self._higher_matches else self._scores <= threshold
+
+        # Only the alpha channel changes between thresholds.
+        self._rgba[..., 3] = matches * np.uint8(self.COLOR.alpha())
+
+        height, width = self._scores.shape
+        image = QImage(self._rgba.data, width, height, 4 * width, QImage.Format.Format_RGBA8888)
+        self._image_view.set_overlay(QPixmap.fromImage(image))
@@ -1,8 +1,8 @@
-import itertools
 import numpy as np
 from PySide6.QtCore import QObject, Slot, QPoint
 
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
 from suspectral.tool.manager import ToolManager
 from suspectral.view.selection.selection_view import SelectionView
 
@@ -44,6 +44,15 @@ class SelectionController(QObject):
         tools.area.selectionMoved.connect(self._handle_selection_changed)
         tools.area.selectionEnded.connect(self._handle_selection_changed)
         tools.area.selectionSampled.connect(self._handle_selection_sampled)
+        tools.area.selectionResampled.connect(self._handle_selection_changed)
+
+        tools.polygon.selectionStarted.connect(self._handle_selection_changed)
+        tools.polygon.selectionEnded.connect(self._handle_selection_changed)
+        tools.polygon.selectionSampled.connect(self._handle_selection_masked)
+
+        tools.wand.selectionStarted.connect(self._handle_selection_changed)
+        tools.wand.selectionEnded.connect(self._handle_selection_changed)
+        tools.wand.selectionSampled.connect(self._handle_selection_masked)
 
     @Slot()
     def _handle_hypercube_opened(self):
@@ -63,7 +72,12 @@ class SelectionController(QObject):
 
     @Slot()
     def _handle_selection_sampled(self, xs: np.ndarray, ys: np.ndarray):
-        self._view.add_points([QPoint(x, y) for y, x in itertools.product(ys, xs)])
+        grid_xs, grid_ys = np.meshgrid(xs, ys)
+        self._view.add_coordinates(grid_xs.ravel(), grid_ys.ravel())
+
+    @Slot()
+    def _handle_selection_masked(self, mask: SelectionMask):
+        self._view.add_coordinates(*mask.coordinates())
 
     @Slot()
     def _handle_pixel_clicked(self, point: QPoint):
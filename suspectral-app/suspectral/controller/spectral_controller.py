@@ -1,14 +1,18 @@
 import numpy as np
-from PySide6.QtCore import QObject, Slot, QPoint, QStandardPaths
+from PySide6.QtCore import QObject, Slot, QPoint, QRect, QStandardPaths
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMenu, QApplication, QFileDialog, QMessageBox
 
 from suspectral.exporter.exporter import Exporter
 from suspectral.model.hypercube import Hypercube
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
 from suspectral.tool.manager import ToolManager
 from suspectral.view.spectral.spectral_view import SpectralView
 from suspectral.theme_icon import ThemeIcon
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_density import DensityWorker
+from suspectral.worker.worker_spectra import SpectraWorker
 
 
 class SpectralController(QObject):
@@ -40,6 +44,10 @@ class SpectralController(QObject):
         self._model = model
         self._exporters = exporters
 
+        self._selection: QRect | SelectionMask | None = None
+        self._density_worker: DensityWorker | None = None
+        self._spectra_worker: SpectraWorker | None = None
+
         model.opened.connect(self._handle_hypercube_opened)
         model.closed.connect(self._handle_hypercube_closed)
 
@@ -52,7 +60,37 @@ class SpectralController(QObject):
 
         tools.area.selectionMoved.connect(self._handle_selection_changed)
         tools.area.selectionEnded.connect(self._handle_selection_changed)
+        tools.area.selectionStopped.connect(self._handle_selection_stopped)
         tools.area.selectionSampled.connect(self._handle_selection_sampled)
+        tools.area.selectionResampled.connect(self._handle_selection_resampled)
+
+        tools.polygon.selectionStarted.connect(self._handle_selection_changed)
+        tools.polygon.selectionEnded.connect(self._handle_selection_changed)
+        tools.polygon.selectionMasked.connect(self._handle_selection_stopped)
+        tools.polygon.selectionSampled.connect(self._handle_selection_masked)
+
+        tools.wand.selectionStarted.connect(self._handle_selection_changed)
+        tools.wand.selectionEnded.connect(self._handle_selection_changed)
+        tools.wand.selectionMasked.connect(self._handle_selection_stopped)
+        tools.wand.selectionSampled.connect(self._handle_selection_masked)
+
+    @Slot()
+    def show_spectra(self, spectra: np.ndarray):
+        """
+        Replace the plotted spectra, for example with spectra derived from the whole image.
+
+        The spectra can then be exported like any other plotted spectra.
+
+        Parameters
+        ----------
+        spectra : np.ndarray
+            The spectra of shape (spectra, bands).
+        """
+        self._stop_density()
+        self._stop_spectra()
+        self._selection = None
+        self._view.clear_spectra()
+        self._view.add_spectra(spectra)
 
     @Slot()
     def _handle_hypercube_opened(self, hypercube: Hypercube):
@@ -67,10 +105,16 @@ class SpectralController(QObject):
 
     @Slot()
     def _handle_hypercube_closed(self):
+        self._stop_density()
+        self._stop_spectra()
+        self._selection = None
         self._view.reset()
 
     @Slot()
     def _handle_tool_changed(self):
+        self._stop_density()
+        self._stop_spectra()
+        self._selection = None
         self._view.clear_spectra()
 
     @Slot()
@@ -84,14 +128,37 @@ class SpectralController(QObject):
 
     @Slot()
     def _handle_selection_changed(self):
+        self._stop_density()
+        self._stop_spectra()
+        self._selection = None
         self._view.clear_spectra()
 
+    @Slot()
+    def _handle_selection_stopped(self, selection: QRect | SelectionMask):
+        self._selection = selection
+        if self._view.density_mode:
+            self._start_density()
+
+    @Slot()
+    def _handle_selection_resampled(self):
+        # Clearing the sampled spectra also clears the density, which is then recomputed.
+        self._view.clear_spectra()
+        if self._view.density_mode:
+            self._start_density()
+
     @Slot()
     def _handle_selection_sampled(self, xs: np.ndarray, ys: np.ndarray):
         spectra = self._model.hypercube.read_subimage(ys, xs)
-        spectra = spectra.reshape(-1, spectra.shape[-1])
-        for spectrum in spectra:
-            self._view.add_spectrum(spectrum)
+        self._view.add_spectra(spectra.reshape(-1, spectra.shape[-1]))
+
+    @Slot()
+    def _handle_selection_masked(self, mask: SelectionMask):
+        # Spectra are read in the background and plotted as they arrive.
+        self._stop_spectra()
+        self._spectra_worker = SpectraWorker(self._model.hypercube, mask)
+        self._spectra_worker.loaded.connect(self._handle_spectra_loaded)
+        self._spectra_worker.finished.connect(self._handle_spectra_finished)
+        start_worker(self._spectra_worker, self)
 
     @Slot()
     def _handle_context_menu(self, menu: QMenu):
@@ -107,11 +174,76 @@ class SpectralController(QObject):
 
         menu.addSeparator()
 
+        density_action = QAction("Density Plot", self)
+        density_action.setCheckable(True)
+        density_action.setChecked(self._view.density_mode)
+        density_action.toggled.connect(self._set_density_mode)
+        menu.addAction(density_action)
+
+        menu.addSeparator()
+
         for exporter in self._exporters:
             action = QAction(f"Export to {exporter.label}", self)
             action.triggered.connect(lambda _, _exporter=exporter: self._export_spectra(_exporter))
             menu.addAction(action)
 
+    def _set_density_mode(self, enabled: bool):
+        self._stop_density()
+        self._view.set_density_mode(enabled)
+        if enabled:
+            self._start_density()
+
+    def _start_density(self):
+        self._stop_density()
+        self._view.clear_density()
+
+        # Without a selection, the density of the entire image is plotted.
+        hypercube = self._model.hypercube
+        rows, cols, mask = None, None, None
+        if isinstance(self._selection, SelectionMask):
+            mask = self._selection
+        elif self._selection is not None:
+            tl = self._selection.topLeft()
+            br = self._selection.bottomRight()
+            rows = (tl.y(), br.y())
+            cols = (tl.x(), br.x())
+
+        self._density_worker = DensityWorker(hypercube, rows=rows, cols=cols, mask=mask)
+        self._density_worker.accumulated.connect(self._handle_density_accumulated)
+        self._density_worker.finished.connect(self._handle_density_finished)
+        start_worker(self._density_worker, self)
+
+    def _stop_spectra(self):
+        if self._spectra_worker is not None:
+            self._spectra_worker.stop()
+            self._spectra_worker = None
+
+    @Slot()
+    def _handle_spectra_loaded(self, spectra: np.ndarray):
+        if self.sender() is self._spectra_worker:
+            self._view.add_spectra(spectra)
+
+    @Slot()
+    def _handle_spectra_finished(self):
+        if self.sender() is self._spectra_worker:
+            self._spectra_worker = None
+
+    def _stop_density(self):
+        if self._density_worker is not None:
+            self._density_worker.stop()
+            self._density_worker = None
+
+    @Slot()
+    def _handle_density_accumulated(self, counts: np.ndarray, lo: float, hi: float):
+        # Snapshots from workers which have since been stopped are discarded.
+        if self.sender() is self._density_worker:
+            self._view.set_density(counts, lo, hi)
+
+    @Slot()
+    def _handle_density_finished(self):
+        if self.sender() is self._density_worker:
+            self._density_worker = None
+
     def _copy_plot(self):
         clipboard = QApplication.clipboard()
         clipboard.setPixmap(self._view.grab())
@@ -38,6 +38,8 @@ class StatusController(QObject):
 
         model.opened.connect(self._handle_hypercube_opened)
         model.closed.connect(self._handle_hypercube_closed)
+        model.loadProgress.connect(self._handle_load_progress)
+        model.residencyChanged.connect(self._handle_residency_changed)
 
         tools.area.selectionMoved.connect(self._handle_selection_moved)
         tools.area.selectionEnded.connect(self._handle_selection_ended)
@@ -53,6 +55,16 @@ class StatusController(QObject):
     def _handle_hypercube_closed(self):
         self._view.clear()
 
+    @Slot()
+    def _handle_load_progress(self, hypercube: Hypercube, percent: int):
+        if hypercube is self._model.hypercube:
+            self._view.update_loading(percent)
+
+    @Slot()
+    def _handle_residency_changed(self, hypercube: Hypercube):
+        if hypercube is self._model.hypercube:
+            self._view.update_memory(hypercube)
+
     @Slot()
     def _handle_selection_moved(self, selection: QRect):
         self._view.update_selection(selection)
@@ -0,0 +1,55 @@
+from PySide6.QtCore import QObject, Slot
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.workspace.workspace_view import WorkspaceView
+
+
+class WorkspaceController(QObject):
+    """
+    Controller which synchronizes the workspace view with the hypercubes open in the model.
+
+    Selecting a hypercube in the view makes it the current one, and closing it in the view
+    removes it from the workspace.
+
+    Parameters
+    ----------
+    view : WorkspaceView
+        The workspace view to update.
+    model : HypercubeContainer
+        The model that manages the open hypercubes.
+    parent : QObject or None, optional
+        The parent object of the controller, by default None.
+    """
+
+    def __init__(self, *,
+                 view: WorkspaceView,
+                 model: HypercubeContainer,
+                 parent: QObject | None = None):
+        super().__init__(parent)
+        self._model = model
+        self._view = view
+
+        model.workspaceChanged.connect(self._handle_workspace_changed)
+        view.hypercubeSelected.connect(self._handle_hypercube_selected)
+        view.hypercubeClosed.connect(self._handle_hypercube_closed)
+
+    @Slot()
+    def _handle_workspace_changed(self):
+        hypercubes = self._model.hypercubes
+        if not hypercubes:
+            self._view.clear()
+            return
+
+        current = self._model.hypercube
+        self._view.set(
+            [hypercube.name for hypercube in hypercubes],
+            hypercubes.index(current) if current in hypercubes else None,
+        )
+
+    @Slot()
+    def _handle_hypercube_selected(self, index: int):
+        self._model.select(self._model.hypercubes[index])
+
+    @Slot()
+    def _handle_hypercube_closed(self, index: int):
+        self._model.close(self._model.hypercubes[index])
@@ -29,7 +29,8 @@ HTML_INTRODUCTION = """
 <h1>Suspectral</h1>
 <p>
   The purpose of this software is to provide interactive visualization of hyperspectral imaging data
-  stored in the popular ENVI hypercube format. The hypercubes can be visualized either through assignment
+  stored in the popular ENVI hypercube format, as well as in HDF5 (including MATLAB 7.3), MATLAB, and NumPy
+  files, and in stacks of PNG images with one image per band. The hypercubes can be visualized either through assignment
   of individual spectral bands to color channels of the image or through synthesis using spectral sensitivities.
   The pixels can then be selected individually or in groups to plot or extract their spectra.
 </p>
@@ -99,6 +100,21 @@ HTML_TOOLS = """
 </table>
 """
 
+HTML_WORKSPACE_VIEW = """
+<h2>Workspace</h2>
+<p>
+  The Workspace area lists the open hypercubes. Opening another hypercube keeps the ones opened before it, and
+  clicking a hypercube in the list switches back to it. Images rendered from the hypercubes are kept in memory up
+  to a shared limit, so switching is usually instant. Right-click a hypercube to close it.
+</p>
+<p>
+  Hypercubes are read from their files as needed. For faster work with hypercubes that fit into memory, choose
+  File &gt; Load into Memory, which loads the current hypercube in the background, or File &gt; Load into Memory
+  Automatically, which loads every hypercube opened afterward that takes up at most half of the available memory.
+  The memory indicator in the status bar shows the size of the hypercube in memory and on disk.
+</p>
+"""
+
 HTML_METADATA_VIEW = """
 <h2>Metadata</h2>
 <p>
@@ -149,6 +165,13 @@ HTML_IMAGE_CONTROLS = """
   values for each color channel are normalized through contrasting, disregarding the relative strengths of each sensor but creating a more
   visually realistic image.
 </p>
+<p>With the white and black references selected, either true coloring mode may also calibrate the hypercube into reflectance once.
+  The calibrated hypercube is kept in a temporary file, and read in place of the raw data by all tools, so that its spectra, exports,
+  and synthesized images are all calibrated, until the calibration is removed.
+</p>
+<p>Both true coloring modes may synthesize a preview at reduced resolution, from the averages of blocks of 4 × 4 pixels, which takes
+  a fraction of the time. The preview is enlarged to the size of the hypercube, so that reference pixels may still be picked from it.
+</p>
 """
 
 HTML_EXPORTING = """
@@ -180,7 +203,7 @@ HTML_SHORTCUTS = """
   </thead>
   <tbody>
     <tr><td>Ctrl + O</td><td>Open a hypercube.</td></tr>
-    <tr><td>Ctrl + W</td><td>Close the hypercube.</td></tr>
+    <tr><td>Ctrl + W</td><td>Close the current hypercube.</td></tr>
     <tr><td>Ctrl + Q</td><td>Quit the program.</td></tr>
     <tr><td>Ctrl + Plus</td><td>Zoom the image in.</td></tr>
     <tr><td>Ctrl + Minus</td><td>Zoom the image out.</td></tr>
@@ -223,6 +246,7 @@ class HelpDialog(QDialog):
             + HTML_INTRODUCTION
             + HTML_IMAGE_VIEW
             + HTML_TOOLS.format(theme=theme)
+            + HTML_WORKSPACE_VIEW
             + HTML_METADATA_VIEW
             + HTML_SELECTION_VIEW
             + HTML_SPECTRAL_VIEW
@@ -0,0 +1,208 @@
+import ast
+
+import numpy as np
+
+
+class BandExpression:
+    """
+    An arithmetic expression over the bands of a hypercube, such as a spectral index.
+
+    Bands are referenced either by index as `b[80]`, or by wavelength as `w[860]`, which
+    refers to the band closest to the given wavelength. Expressions may combine them with
+    numbers, the operators `+`, `-`, `*`, `/`, `**`, and the functions in `FUNCTIONS`.
+
+    The expression is compiled into a sequence of in-place operations on the rows of a scratch
+    buffer, which `evaluate` allocates once and then reuses for chunks of pixels, so that the
+    memory needed does not depend on the number of pixels.
+
+    Parameters
+    ----------
+    text : str
+        The expression, for example `(b[80] - b[55]) / (b[80] + b[55])`.
+    num_bands : int
+        The number of bands of the hypercube.
+    wavelengths : np.ndarray, optional
+        The wavelengths of the bands of the hypercube, required to reference bands by wavelength.
+
+    Raises
+    ------
+    ValueError
+        If the expression is malformed or references bands which do not exist.
+    """
+
+    FUNCTIONS = {
+        "abs": np.absolute,
+        "sqrt": np.sqrt,
+        "log": np.log,
+        "exp": np.exp,
+    }
+    """Functions which may be called in expressions."""
+
+    CHUNK_PIXELS = 65536
+    """Number of pixels evaluated at once, which determines the size of the scratch buffer."""
+
+    _BINARY = {
+        ast.Add: np.add,
+        ast.Sub: np.subtract,
+        ast.Mult: np.multiply,
+        ast.Div: np.true_divide,
+        ast.Pow: np.power,
+    }
+
+    _UNARY = {
+        ast.USub: np.negative,
+        ast.UAdd: np.positive,
+    }
+
+    def __init__(self, text: str, num_bands: int, wavelengths: np.ndarray | None = None):
+        self._text = text
+        self._num_bands = num_bands
+        self._wavelengths = wavelengths
+
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except SyntaxError as error:
+            raise ValueError(f"Invalid syntax: {error.msg}.") from None
+
+        self._bands: list[int] = []
+        self._program: list[tuple] = []
+        self._num_registers = 0
+        self._free: list[int] = []
+
+        result = self._compile(tree.body)
+        if not isinstance(result, int):
+            raise ValueError("The expression must reference at least one band.")
+
+        self._result = result
+
+        # Read bands in increasing order, and point the loads at their position among them.
+        self._bands.sort()
+        self._program = [
+            ("load", it[1], self._bands.index(it[2])) if it[0] == "load" else it
+            for it in self._program
+        ]
+
+    @property
+    def text(self) -> str:
+        """The text of the expression."""
+        return self._text
+
+    @property
+    def bands(self) -> list[int]:
+        """Indices of the bands referenced by the expression in increasing order, as `evaluate` expects them."""
+        return list(self._bands)
+
+    def evaluate(self, planes: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the expression for every pixel.
+
+        Parameters
+        ----------
+        planes : np.ndarray
+            The values of the referenced bands of shape (..., len(bands)), for example a block
+            of a hypercube read with `bands`.
+
+        Returns
+        -------
+        np.ndarray
+            The values of the expression of shape (...) as float32.
+        """
+        pixels = planes.reshape(-1, planes.shape[-1])
+        result = np.empty(len(pixels), dtype=np.float32)
+        scratch = np.empty((self._num_registers, min(self.CHUNK_PIXELS, len(pixels))), dtype=np.float32)
+
+        with np.errstate(all="ignore"):
+            for start in range(0, len(pixels), self.CHUNK_PIXELS):
+                chunk = pixels[start:start + self.CHUNK_PIXELS]
+                registers = scratch[:, :len(chunk)]
+                self._run(chunk, registers)
+                result[start:start + len(chunk)] = registers[self._result]
+
+        return result.reshape(planes.shape[:-1])
+
+    def _run(self, chunk: np.ndarray, registers: np.ndarray):
+        for instruction in self._program:
+            opcode, destination, *operands = instruction
+            if opcode == "load":
+                registers[destination] = chunk[:, operands[0]]
+                continue
+
+            # Operands are either registers or constants.
+            values = [registers[it] if isinstance(it, int) else it.value for it in operands]
+            opcode(*values, out=registers[destination])
+
+    def _compile(self, node: ast.AST) -> "int | _Constant":
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return _Constant(float(node.value))
+
+        if isinstance(node, ast.Subscript):
+            return self._compile_band(node)
+
+        if isinstance(node, ast.BinOp) and type(node.op) in self._BINARY:
+            ufunc = self._BINARY[type(node.op)]
+            return self._emit(ufunc, self._compile(node.left), self._compile(node.right))
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in self._UNARY:
+            ufunc = self._UNARY[type(node.op)]
+            return self._emit(ufunc, self._compile(node.operand))
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in self.FUNCTIONS:
+            if len(node.args) != 1 or node.keywords:
+                raise ValueError(f"Function '{node.func.id}' takes exactly one argument.")
+
+            return self._emit(self.FUNCTIONS[node.func.id], self._compile(node.args[0]))
+
+        raise ValueError(f"Unsupported element: '{ast.unparse(node)}'.")
+
+    def _compile_band(self, node: ast.Subscript) -> int:
+        if not isinstance(node.value, ast.Name) or node.value.id not in ("b", "w"):
+            raise ValueError(f"Unsupported element: '{ast.unparse(node)}'. Use b[index] or w[wavelength].")
+
+        key = node.slice
+        if not isinstance(key, ast.Constant) or not isinstance(key.value, (int, float)) \
+                or isinstance(key.value, bool):
+            raise ValueError(f"Band reference '{ast.unparse(node)}' must contain a number.")
+
+        if node.value.id == "b":
+            if not float(key.value).is_integer() or not 0 <= key.value < self._num_bands:
+                raise ValueError(f"Band {key.value} does not exist; bands range from 0 to {self._num_bands - 1}.")
+            band = int(key.value)
+        else:
+            if self._wavelengths is None:
+                raise ValueError("Bands cannot be referenced by wavelength, since they have none.")
+            band = int(np.argmin(np.abs(self._wavelengths - key.value)))
+
+        if band not in self._bands:
+            self._bands.append(band)
+
+        register = self._allocate()
+        self._program.append(("load", register, band))
+        return register
+
+    def _emit(self, ufunc: np.ufunc, *operands) -> "int | _Constant":
+        # Fold operations on constants, so that only operations on bands remain.
+        if all(isinstance(it, _Constant) for it in operands):
+            with np.errstate(all="ignore"):
+                return _Constant(float(ufunc(*(np.float32(it.value) for it in operands))))
+
+        # Write the result over the first register operand and release the others.
+        registers = [it for it in operands if isinstance(it, int)]
+        destination = registers[0]
+        self._free.extend(registers[1:])
+        self._program.append((ufunc, destination, *operands))
+        return destination
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+
+        self._num_registers += 1
+        return self._num_registers - 1
+
+
+class _Constant:
+    """A constant operand, kept apart from register indices."""
+
+    def __init__(self, value: float):
+        self.value = value
@@ -0,0 +1,131 @@
+import queue
+import threading
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from suspectral.model.hypercube import Hypercube
+
+BLOCK_BYTES = 32 * 1024 ** 2
+"""Default upper bound on the size of a single block of rows."""
+
+
+def block_rows(hypercube: "Hypercube",
+               target_bytes: int = BLOCK_BYTES,
+               num_cols: int | None = None,
+               num_bands: int | None = None) -> int:
+    """
+    Find the number of rows of a hypercube which fit into blocks of the given size.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hypercube to read.
+    target_bytes : int, optional
+        The upper bound on the size of a block, which holds at least one row regardless.
+    num_cols : int, optional
+        The number of columns read of each row, by default all of them.
+    num_bands : int, optional
+        The number of bands read of each pixel, by default all of them.
+
+    Returns
+    -------
+    int
+        The number of rows per block.
+    """
+    num_cols = hypercube.num_cols if num_cols is None else num_cols
+    num_bands = hypercube.num_bands if num_bands is None else num_bands
+    row_bytes = num_cols * num_bands * hypercube.bytes_per_sample
+    return max(1, target_bytes // max(1, row_bytes))
+
+
+def iter_blocks(hypercube: "Hypercube",
+                rows_per_block: int | None = None,
+                target_bytes: int = BLOCK_BYTES,
+                bands=None,
+                prefetch: int = 1,
+                rows: tuple[int, int] | None = None,
+                cols: tuple[int, int] | None = None) -> Iterator[tuple[slice, np.ndarray]]:
+    """
+    Read a region of a hypercube in blocks of consecutive rows, reading ahead in the background.
+
+    While a block is being processed, up to `prefetch` of the following blocks are read
+    on a background thread, so that reading overlaps with processing. At most
+    `prefetch + 2` blocks are held at once: the one being processed, those read ahead,
+    and the one being read. Reading stops as soon as iteration does, such as when the
+    loop is broken out of, and errors raised by reads are raised by the iteration.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hypercube to read.
+    rows_per_block : int, optional
+        The number of rows per block, by default as many as fit into `target_bytes`.
+    target_bytes : int, optional
+        The upper bound on the size of a block, used unless `rows_per_block` is given.
+    bands : list or tuple or range, optional
+        Bands to read. If None, reads all bands.
+    prefetch : int, optional
+        The number of blocks read ahead, or 0 to read each block only when it is needed.
+    rows : tuple of int, optional
+        Start and end row indices (inclusive, exclusive). Defaults to all rows.
+    cols : tuple of int, optional
+        Start and end column indices (inclusive, exclusive). Defaults to all columns.
+
+    Yields
+    ------
+    tuple of (slice, np.ndarray)
+        The rows of the block, and the block of shape (rows, columns, bands).
+    """
+    row_start, row_end = rows if rows is not None else (0, hypercube.num_rows)
+    cols = cols if cols is not None else (0, hypercube.num_cols)
+    if rows_per_block is None:
+        num_bands = len(bands) if bands is not None else None
+        rows_per_block = block_rows(hypercube, target_bytes, cols[1] - cols[0], num_bands)
+
+    slices = [slice(start, min(start + rows_per_block, row_end)) for start in range(row_start, row_end, rows_per_block)]
+
+    def read(block: slice) -> np.ndarray:
+        return hypercube.read_subregion((block.start, block.stop), cols, bands)
+
+    if prefetch <= 0:
+        for block in slices:
+            yield block, read(block)
+        return
+
+    blocks = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def read_ahead():
+        for block in slices:
+            try:
+                item = block, read(block), None
+            except Exception as e:
+                item = block, None, e
+
+            # Give up on the block if iteration has stopped in the meantime.
+            while not stopped.is_set():
+                try:
+                    blocks.put(item, timeout=0.05)
+                    break
+                except queue.Full:
+                    pass
+
+            if stopped.is_set() or item[2] is not None:
+                return
+
+    thread = threading.Thread(target=read_ahead, name="suspectral-read-ahead", daemon=True)
+    thread.start()
+
+    try:
+        for _ in slices:
+            block, data, error = blocks.get()
+            if error is not None:
+                raise error
+
+            yield block, data
+    finally:
+        stopped.set()
+        thread.join()
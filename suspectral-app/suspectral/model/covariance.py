@@ -0,0 +1,113 @@
+import numpy as np
+import scipy.linalg
+
+
+class Covariance:
+    """
+    Streaming estimate of the mean and covariance of pixel spectra.
+
+    Spectra are added in batches, such as blocks of rows read from a hypercube, and
+    merged into running moments with the parallel update of Chan et al., so that the
+    estimate is numerically stable and never needs more than one batch in memory.
+
+    Parameters
+    ----------
+    num_bands : int
+        The number of bands of the spectra.
+    """
+
+    def __init__(self, num_bands: int):
+        self._count = 0
+        self._mean = np.zeros(num_bands)
+        self._scatter = np.zeros((num_bands, num_bands))
+
+    @property
+    def count(self) -> int:
+        """Number of spectra added so far."""
+        return self._count
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Mean spectrum of shape (bands,)."""
+        return self._mean.copy()
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Sample covariance matrix of shape (bands, bands)."""
+        return self._scatter / max(1, self._count - 1)
+
+    def update(self, spectra: np.ndarray):
+        """
+        Add a batch of spectra to the estimate.
+
+        Parameters
+        ----------
+        spectra : np.ndarray
+            Spectra of shape (..., bands). Spectra with non-finite values are ignored.
+        """
+        spectra = spectra.reshape(-1, spectra.shape[-1]).astype(np.float64, copy=False)
+        spectra = spectra[np.isfinite(spectra).all(axis=1)]
+
+        count = spectra.shape[0]
+        if count == 0: return
+
+        mean = spectra.mean(axis=0)
+        centered = spectra - mean
+        scatter = centered.T @ centered
+
+        total = self._count + count
+        delta = mean - self._mean
+        self._scatter += scatter + np.outer(delta, delta) * (self._count * count / total)
+        self._mean += delta * (count / total)
+        self._count = total
+
+    def principal_components(self, num_components: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the principal components of the spectra, by decreasing variance.
+
+        Parameters
+        ----------
+        num_components : int, optional
+            The number of components to return. Defaults to all of them.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The variances of shape (components,) and the components as the
+            columns of an array of shape (bands, components).
+        """
+        variances, components = np.linalg.eigh(self.covariance)
+        order = np.argsort(variances)[::-1][:num_components]
+        return np.maximum(variances[order], 0.0), components[:, order]
+
+    def noise_adjusted_components(self,
+                                  noise: "Covariance",
+                                  num_components: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the minimum noise fraction (MNF) components of the spectra, by decreasing signal-to-noise ratio.
+
+        These solve the generalized eigenproblem of the covariance of the spectra with respect
+        to the covariance of their noise, so that noisy bands do not dominate the components.
+
+        Parameters
+        ----------
+        noise : Covariance
+            The estimate of the noise, such as that of differences between neighbouring pixels.
+        num_components : int, optional
+            The number of components to return. Defaults to all of them.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The signal-to-noise ratios of shape (components,), relative to the scale of the noise
+            estimate, and the components as the columns of an array of shape (bands, components).
+        """
+        noise_covariance = noise.covariance
+
+        # Regularize, so that bands without any noise do not make the problem singular.
+        ridge = 1e-9 * max(np.trace(noise_covariance) / len(noise_covariance), np.finfo(float).tiny)
+        noise_covariance = noise_covariance + ridge * np.eye(len(noise_covariance))
+
+        ratios, components = scipy.linalg.eigh(self.covariance, noise_covariance)
+        order = np.argsort(ratios)[::-1][:num_components]
+        return np.maximum(ratios[order], 0.0), components[:, order]
@@ -0,0 +1,255 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from suspectral.model.hypercube import Hypercube
+
+
+class CrossSection:
+    """
+    Reads the spectra of the pixels along a polyline drawn over a hypercube.
+
+    The polyline is rasterized with a vectorized, Bresenham-style walk, and the pixels
+    along it are read in the order of their offsets in the data file, no matter the order
+    in which the line visits them. Pixels are gathered one row at a time, reading only the
+    span of columns which the line covers within the row. Columns which the line runs
+    along instead are read whole, since reading a column is the worst case of strided
+    access for BIP and BIL interleaves, and kept in a cache bounded by `CACHE_BYTES`. As
+    a result, dragging a vertical line, or one of its ends, only reads each column once.
+
+    Since reading a column takes a while, the pixels which are available without doing so
+    can be read on their own with `read_available`, while the missing columns are fetched
+    on another thread with `fetch_column`. The cache may be used from several threads.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to read from.
+    cache_bytes : int, optional
+        The maximum number of bytes of columns kept in the cache.
+    """
+
+    CACHE_BYTES = 64 * 1024 ** 2
+
+    COLUMN_RUN = 8
+    """Minimum number of pixels of the line within a column for the whole column to be read and cached."""
+
+    def __init__(self, hypercube: Hypercube, cache_bytes: int = CACHE_BYTES):
+        self._hypercube = hypercube
+        self._cache_bytes = cache_bytes
+        self._columns: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def trace(points: np.ndarray, num_rows: int, num_cols: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rasterize a polyline into the consecutive pixels it passes through.
+
+        Segments are clipped to the image with the Liang–Barsky algorithm, so that the parts
+        of them outside of it are cut away rather than bent towards its border. Every clipped
+        segment then steps once along its major axis per pixel, rounding the position along
+        its minor axis, so that consecutive pixels of a segment are always 8-connected.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The (x, y) image coordinates of the vertices of the polyline, of shape (vertices, 2).
+        num_rows : int
+            The number of rows of the image.
+        num_cols : int
+            The number of columns of the image.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The rows and columns of the pixels along the polyline, in order. A pixel may
+            appear more than once if the polyline crosses itself, but never twice in a row.
+            Where the polyline leaves the image and enters it again, consecutive pixels
+            are not connected.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(points) == 1:
+            points = np.repeat(points, 2, axis=0)
+
+        starts, deltas = points[:-1], np.diff(points, axis=0)
+
+        # Each edge of the image bounds the parameter of the segment from one side.
+        p = np.stack([-deltas[:, 0], deltas[:, 0], -deltas[:, 1], deltas[:, 1]], axis=1)
+        q = np.stack([starts[:, 0], num_cols - starts[:, 0], starts[:, 1], num_rows - starts[:, 1]], axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = q / p
+
+        t0 = np.max(np.where(p < 0, ratios, 0.0), axis=1)
+        t1 = np.min(np.where(p > 0, ratios, 1.0), axis=1)
+        inside = (t0 <= t1) & ~np.any((p == 0) & (q < 0), axis=1)
+
+        clipped = np.stack([starts + t0[:, None] * deltas, starts + t1[:, None] * deltas], axis=1)[inside]
+        pixels = np.floor(clipped).astype(np.int64)
+        xs = np.clip(pixels[..., 0], 0, num_cols - 1)
+        ys = np.clip(pixels[..., 1], 0, num_rows - 1)
+
+        dx, dy = xs[:, 1] - xs[:, 0], ys[:, 1] - ys[:, 0]
+        counts = np.maximum(np.abs(dx), np.abs(dy)) + 1
+
+        # The segment of every pixel and the step within it, including both of its ends.
+        segments = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.arange(len(segments)) - np.repeat(np.cumsum(counts) - counts, counts)
+        fractions = offsets / np.maximum(counts[segments] - 1, 1)
+
+        cols = xs[segments, 0] + np.rint(fractions * dx[segments]).astype(np.int64)
+        rows = ys[segments, 0] + np.rint(fractions * dy[segments]).astype(np.int64)
+
+        # Consecutive segments share their vertices, which must only be visited once.
+        keep = np.ones(len(rows), dtype=bool)
+        keep[1:] = (np.diff(rows) != 0) | (np.diff(cols) != 0)
+        return rows[keep], cols[keep]
+
+    def read(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """
+        Read the spectra of the given pixels.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            The rows of the pixels.
+        cols : np.ndarray
+            The columns of the pixels.
+
+        Returns
+        -------
+        np.ndarray
+            The spectra of the pixels of shape (pixels, bands) in the data type of the
+            hypercube, in the order they were given.
+        """
+        spectra, _ = self._gather(rows, cols, fetch=True)
+        return spectra
+
+    def read_available(self, rows: np.ndarray, cols: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Read the spectra of the given pixels, except for those within columns not yet cached.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            The rows of the pixels.
+        cols : np.ndarray
+            The columns of the pixels.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The spectra of the pixels as returned by `read`, where those not read are zero,
+            and a boolean array of shape (pixels,) marking the pixels which were read.
+        """
+        return self._gather(rows, cols, fetch=False)
+
+    def missing_columns(self, rows: np.ndarray, cols: np.ndarray) -> list[int]:
+        """
+        Find the columns which reading the given pixels would read whole, but are not cached.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            The rows of the pixels.
+        cols : np.ndarray
+            The columns of the pixels.
+
+        Returns
+        -------
+        list of int
+            The missing columns in increasing order.
+        """
+        _, unique_cols, columnar, _ = self._plan(rows, cols)
+        with self._lock:
+            return [col for col in np.unique(unique_cols[columnar]).tolist() if col not in self._columns]
+
+    def fetch_column(self, col: int) -> np.ndarray:
+        """
+        Read a whole column into the cache, unless it is already there.
+
+        Parameters
+        ----------
+        col : int
+            The column to read.
+
+        Returns
+        -------
+        np.ndarray
+            The spectra of the column of shape (rows, bands).
+        """
+        with self._lock:
+            if col in self._columns:
+                self._columns.move_to_end(col)
+                return self._columns[col]
+
+        # The column is read without holding the lock, so that other threads are not kept waiting.
+        column = np.asarray(self._hypercube.read_col(col))[:, 0]
+
+        with self._lock:
+            if col not in self._columns:
+                self._columns[col] = column
+                self._cached_bytes += column.nbytes
+
+            # Evict the least recently used columns, but always keep the one just read.
+            self._columns.move_to_end(col)
+            while self._cached_bytes > self._cache_bytes and len(self._columns) > 1:
+                _, evicted = self._columns.popitem(last=False)
+                self._cached_bytes -= evicted.nbytes
+
+            return self._columns[col]
+
+    def _plan(self, rows: np.ndarray, cols: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        num_cols = self._hypercube.num_cols
+        rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+
+        # Offsets grow with the row-major index of the pixel in every interleave.
+        unique, inverse = np.unique(rows * num_cols + cols, return_inverse=True)
+        unique_cols = unique % num_cols
+
+        with self._lock:
+            cached = list(self._columns)
+
+        counts = np.bincount(unique_cols, minlength=num_cols)
+        columnar = (counts[unique_cols] >= self.COLUMN_RUN) | np.isin(unique_cols, cached)
+        return unique, unique_cols, columnar, inverse
+
+    def _gather(self, rows: np.ndarray, cols: np.ndarray, fetch: bool) -> tuple[np.ndarray, np.ndarray]:
+        hypercube = self._hypercube
+        result = np.zeros((len(rows), hypercube.num_bands), dtype=hypercube.dtype)
+        if len(rows) == 0:
+            return result, np.ones(0, dtype=bool)
+
+        unique, unique_cols, columnar, inverse = self._plan(rows, cols)
+        unique_rows = unique // hypercube.num_cols
+        spectra = np.zeros((len(unique), hypercube.num_bands), dtype=hypercube.dtype)
+        available = np.ones(len(unique), dtype=bool)
+
+        for col in np.unique(unique_cols[columnar]).tolist():
+            selected = np.flatnonzero(columnar & (unique_cols == col))
+            column = self.fetch_column(col) if fetch else self._get_cached_column(col)
+            if column is None:
+                available[selected] = False
+            else:
+                spectra[selected] = column[unique_rows[selected]]
+
+        remaining = np.flatnonzero(~columnar)
+        if len(remaining):
+            # Pixels are sorted by offset, so the pixels of each row are consecutive.
+            starts = np.flatnonzero(np.diff(unique_rows[remaining], prepend=-1))
+            for indices in np.split(remaining, starts[1:]):
+                row = int(unique_rows[indices[0]])
+                lo, hi = int(unique_cols[indices[0]]), int(unique_cols[indices[-1]])
+                span = hypercube.read_subregion((row, row + 1), (lo, hi + 1))[0]
+                spectra[indices] = span[unique_cols[indices] - lo]
+
+        inverse = inverse.reshape(-1)
+        result[:] = spectra[inverse]
+        return result, available[inverse]
+
+    def _get_cached_column(self, col: int) -> np.ndarray | None:
+        with self._lock:
+            if col in self._columns:
+                self._columns.move_to_end(col)
+            return self._columns.get(col)
@@ -0,0 +1,134 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EnviHeader:
+    """
+    Reads ENVI header files into dictionaries of their fields.
+
+    Field names are lowercase. Values in braces become lists of strings, except for lists
+    of numbers, which become read-only NumPy arrays, converted in one go rather than item
+    by item, since the per-band lists of wide sensors, such as `wavelength`, `fwhm` and
+    `bbl`, easily hold thousands of values. The description stays a single string, and
+    all other values stay strings as well.
+
+    Parsed headers are cached, keyed by the modification time and size of their file, so
+    that reopening a hypercube does not parse its header again.
+    """
+
+    CACHE_SIZE = 64
+    """Maximum number of parsed headers kept in the cache."""
+
+    _FIELD = re.compile(r"^[ \t]*([^;=\n][^=\n]*?)[ \t]*=[ \t]*(\{[^}]*}|[^\n]*)", re.MULTILINE)
+    _INTEGERS = re.compile(r"[.eEnN]")
+
+    _cache: OrderedDict[str, tuple[tuple[int, int], dict[str, object]]] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def read(cls, path: str | os.PathLike) -> dict[str, object]:
+        """
+        Read the fields of a header file, reusing those parsed before if it has not changed since.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The path of the header file.
+
+        Returns
+        -------
+        dict[str, object]
+            The fields of the header, in the order they appear in the file. The dictionary
+            is a copy, but the arrays within it are shared, which is why they are read-only.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        EnviHeaderInvalid
+            If the file is not an ENVI header.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = stat.st_mtime_ns, stat.st_size
+
+        with cls._lock:
+            cached = cls._cache.get(path)
+            if cached is not None and cached[0] == key:
+                cls._cache.move_to_end(path)
+                return dict(cached[1])
+
+        with open(path, "rb") as file:
+            fields = cls.parse(file.read())
+
+        with cls._lock:
+            cls._cache[path] = key, fields
+            cls._cache.move_to_end(path)
+            while len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+
+        return dict(fields)
+
+    @classmethod
+    def parse(cls, content: bytes | str) -> dict[str, object]:
+        """
+        Parse the contents of a header file.
+
+        Parameters
+        ----------
+        content : bytes or str
+            The contents of the header file.
+
+        Returns
+        -------
+        dict[str, object]
+            The fields of the header, in the order they appear.
+
+        Raises
+        ------
+        EnviHeaderInvalid
+            If the contents do not start with "ENVI", or are binary.
+        """
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+
+        if not content.lstrip().startswith("ENVI") or "\0" in content:
+            raise EnviHeaderInvalid("File does not appear to be an ENVI header (missing \"ENVI\" at the beginning).")
+
+        fields = {}
+        for match in cls._FIELD.finditer(content):
+            key, value = match.group(1).lower(), match.group(2).strip()
+            if value.startswith("{") and value.endswith("}"):
+                value = value[1:-1].strip() if key == "description" else cls._parse_list(value[1:-1])
+
+            fields[key] = value
+
+        return fields
+
+    @classmethod
+    def _parse_list(cls, content: str) -> list[str] | np.ndarray:
+        content = content.strip()
+        if not content:
+            return []
+
+        # NumPy converts all items at once, and fails unless every one of them is a number.
+        items = content.split(",")
+        try:
+            values = np.array(items, dtype=np.float64)
+        except ValueError:
+            return [item.strip() for item in items]
+
+        if not cls._INTEGERS.search(content):
+            values = values.astype(np.int64)
+
+        values.flags.writeable = False
+        return values
+
+
+class EnviHeaderInvalid(Exception):
+    """Raised upon attempting to read a file which is not an ENVI header."""
+    pass
@@ -1,82 +1,174 @@
-from pathlib import Path
+import os
+from collections.abc import Iterator
 
 import numpy as np
 from spectral import get_rgb
-from spectral.io import envi
-from spectral.io.envi import (
-    FileNotAnEnviHeader,
-    EnviHeaderParsingError,
-    MissingEnviHeaderParameter,
-    EnviDataFileNotFoundError,
+
+from suspectral.model.block_iterator import BLOCK_BYTES, iter_blocks
+from suspectral.model.memory_cache import MemoryCache
+from suspectral.model.reader import (
+    HypercubeDataMissing,
+    HypercubeFormatUnsupported,
+    HypercubeHeaderInvalid,
+    Reader,
 )
+from suspectral.model.reader_array import MatReader, NpyReader
+from suspectral.model.reader_calibrated import CalibratedReader
+from suspectral.model.reader_envi import EnviReader
+from suspectral.model.reader_hdf5 import Hdf5Reader
+from suspectral.model.reader_png import PngStackReader
+from suspectral.model.reader_resample import ResampleReader
+from suspectral.model.reader_resident import ResidentReader
+from suspectral.model.reader_view import ViewReader
 
 
 class Hypercube:
     """
-    Represents a hyperspectral image stored in ENVI format.
+    Represents a hyperspectral image.
 
     Provides access to image metadata, dimensions, wavelengths, and methods
     to read pixel spectra and extract RGB or grayscale images from the hyperspectral data.
 
+    The data is read by a `Reader` chosen by the extension of the file, so that hypercubes
+    are viewed in the format they are stored in, such as ENVI, HDF5 (including MATLAB 7.3),
+    NumPy or stacks of PNG images, rather than converted to ENVI first. Opening a hypercube
+    only reads what is needed to know its layout, such as the ENVI header, and the data is
+    read on demand.
+
+    Hypercubes which fit into memory may be loaded into it in their entirety (see
+    `LoadWorker`) and made resident with `make_resident`, after which all reads are
+    served from memory, mostly as read-only views, until they are released with `release`.
+
+    Hypercubes may also be calibrated into reflectance once (see `CalibrateWorker`) with
+    `calibrate`, after which all reads return reflectance from the calibrated cube, until
+    the calibration is removed with `remove_calibration`.
+
+    Results derived from the data, such as rendered bands, may be kept with `set_cached`
+    in the cache shared by all open hypercubes (see `MemoryCache`), so that switching back
+    to a hypercube does not derive them again, for as long as the memory budget allows.
+
+    Lazy views of a window of the hypercube, optionally binned to a coarser resolution,
+    are hypercubes in their own right (see `view`), so they may be passed to anything
+    which reads a hypercube. So are lazy views resampled onto other wavelengths (see `resample`).
+
     Parameters
     ----------
     path : str
-        Path to the ENVI header file.
+        Path to the ENVI header file, or to a file of any other supported format.
+    reader : Reader, optional
+        The reader of the data, which is opened by the extension of the file if not given.
 
     Raises
     ------
     HypercubeDataMissing
         If the ENVI data file cannot be found.
     HypercubeHeaderInvalid
-        If the ENVI header is invalid or missing required parameters.
+        If the ENVI header is invalid or missing required parameters, or if the file
+        is not a valid file of its format.
+    HypercubeFormatUnsupported
+        If the format of the file is not supported, or requires a package which is missing.
     """
 
-    def __init__(self, path: str):
-        try:
-            self._envi = envi.open(path)
-            self._metadata = self._envi.metadata
-        except EnviDataFileNotFoundError as e:
-            raise HypercubeDataMissing(e)
-        except (FileNotAnEnviHeader, EnviHeaderParsingError, MissingEnviHeaderParameter) as e:
-            raise HypercubeHeaderInvalid(e)
+    READERS: tuple[type[Reader], ...] = (EnviReader, Hdf5Reader, MatReader, NpyReader, PngStackReader)
+    """Readers of the supported formats, chosen by the extension of the file."""
 
-        self._name = Path(path).stem
+    def __init__(self, path: str, reader: Reader | None = None):
+        self._reader = reader if reader is not None else self.reader_for(path).open(path)
+        self._path = path
         self._wavelengths: np.ndarray | None = None
+        self._band_wavelengths: np.ndarray | None = None
         self._wavelengths_unit: str | None = None
 
-        if self._envi.bands.centers is not None:
-            self._wavelengths = np.array(sorted(self._envi.bands.centers))
-            self._wavelengths_unit = self._metadata.get("wavelength unit", None)
+        wavelengths = self._reader.wavelengths
+        if wavelengths is not None:
+            self._band_wavelengths = np.asarray(wavelengths)
+            self._wavelengths = np.sort(wavelengths)
+            self._wavelengths_unit = self._reader.wavelengths_unit
+
+    @classmethod
+    def reader_for(cls, path: str) -> type[Reader]:
+        """
+        Find the reader for the given file by its extension.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file.
+
+        Returns
+        -------
+        type[Reader]
+            The reader of the format of the file.
+
+        Raises
+        ------
+        HypercubeFormatUnsupported
+            If no reader opens files with the extension of the file.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        for reader in cls.READERS:
+            if extension in reader.EXTENSIONS:
+                return reader
+
+        raise HypercubeFormatUnsupported(f"Files with the extension \"{extension}\" are not supported.")
+
+    @classmethod
+    def supports(cls, path: str) -> bool:
+        """Whether the format of the given file is supported, judging by its extension."""
+        extension = os.path.splitext(path)[1].lower()
+        return any(extension in reader.EXTENSIONS for reader in cls.READERS)
+
+    @classmethod
+    def file_filter(cls) -> str:
+        """A filter of the supported formats for file dialogs, listing all of them first."""
+        patterns = [" ".join(f"*{extension}" for extension in reader.EXTENSIONS) for reader in cls.READERS]
+        formats = [f"{reader.NAME} ({pattern})" for reader, pattern in zip(cls.READERS, patterns)]
+        return ";;".join([f"Hypercubes ({' '.join(patterns)})", *formats])
 
     @property
     def name(self) -> str:
         """Base name of the hyperspectral file (without extension)."""
-        return self._name
+        return self._reader.name
+
+    @property
+    def path(self) -> str:
+        """Path to the opened file, such as the ENVI header file."""
+        return self._path
+
+    @property
+    def data_path(self) -> str:
+        """Path to the file holding the data, such as the ENVI data file."""
+        return self._reader.data_path
 
     @property
     def metadata(self) -> dict[str, object]:
-        """Metadata extracted from the ENVI header, as a dictionary."""
-        return self._metadata
+        """Metadata extracted from the ENVI header or the file itself, as a dictionary."""
+        return self._reader.metadata
 
     @property
     def num_rows(self) -> int:
         """Number of spatial rows in the hyperspectral image."""
-        return self._envi.nrows
+        return self._reader.shape[0]
 
     @property
     def num_cols(self) -> int:
         """Number of spatial columns in the hyperspectral image."""
-        return self._envi.ncols
+        return self._reader.shape[1]
 
     @property
     def num_bands(self) -> int:
         """Number of spectral bands in the hyperspectral image."""
-        return self._envi.nbands
+        return self._reader.shape[2]
 
     @property
     def bytes_per_sample(self) -> int:
         """Number of bytes used per spectral sample."""
-        return self._envi.sample_size
+        return self.dtype.itemsize
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the spectral samples, in native byte order."""
+        return self._reader.dtype
 
     @property
     def num_samples(self) -> int:
@@ -91,7 +183,22 @@ class Hypercube:
     @property
     def shape(self) -> tuple[int, int, int]:
         """Shape of the hyperspectral cube as (rows, columns, bands)."""
-        return self._envi.shape
+        return self.num_rows, self.num_cols, self.num_bands
+
+    @property
+    def resident(self) -> bool:
+        """Whether the hypercube has been loaded into memory in its entirety."""
+        return isinstance(self._reader, ResidentReader)
+
+    @property
+    def resident_bytes(self) -> int:
+        """Number of bytes of the hypercube held in memory, which is zero unless it is resident."""
+        return self._reader.nbytes if isinstance(self._reader, ResidentReader) else 0
+
+    @property
+    def calibrated(self) -> bool:
+        """Whether the hypercube has been calibrated into reflectance."""
+        return isinstance(self._raw_reader(), CalibratedReader)
 
     @property
     def wavelengths(self) -> np.ndarray | None:
@@ -101,6 +208,14 @@ class Hypercube:
 
         return None
 
+    @property
+    def band_wavelengths(self) -> np.ndarray | None:
+        """Band center wavelengths in the order of the bands, if available."""
+        if self._band_wavelengths is not None:
+            return self._band_wavelengths.copy()
+
+        return None
+
     @property
     def wavelengths_unit(self) -> str | None:
         """Unit of the wavelengths if specified in the metadata."""
@@ -109,11 +224,88 @@ class Hypercube:
     @property
     def default_bands(self) -> tuple[int, int, int]:
         """The default RGB band indices (if available, taken from metadata)."""
-        try:
-            red, green, blue = map(int, self._metadata["default bands"])
-            return red, green, blue
-        except (KeyError, TypeError):
-            return self.num_bands - 1, self.num_bands // 2, 0
+        default_bands = self._reader.default_bands
+        if default_bands is not None:
+            return default_bands
+
+        return self.num_bands - 1, self.num_bands // 2, 0
+
+    def make_resident(self, data: np.ndarray):
+        """
+        Serve all reads from the given data, which holds the whole hypercube in memory.
+
+        The data is made read-only, since reads may return views into it.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The data of the hypercube, of shape (rows, columns, bands) and its data type,
+            as loaded by `LoadWorker`.
+
+        Raises
+        ------
+        ValueError
+            If the data does not match the shape of the hypercube.
+        """
+        source = self._reader.source if isinstance(self._reader, ResidentReader) else self._reader
+        self._reader = ResidentReader(source, data)
+
+    def release(self) -> Reader:
+        """
+        Free the data loaded into memory, if any, so that reads go to the file again.
+
+        Returns
+        -------
+        Reader
+            The reader of the file, which now serves all reads.
+        """
+        if isinstance(self._reader, ResidentReader):
+            self._reader = self._reader.source
+
+        return self._reader
+
+    def calibrate(self, data: np.ndarray, white_ref: np.ndarray | None = None, black_ref: np.ndarray | None = None):
+        """
+        Serve all reads from the given reflectance, calibrated from the raw data of the hypercube.
+
+        The hypercube stops being resident, if it was, since the data held in memory is raw.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The calibrated reflectance, of shape (rows, columns, bands), as produced by `CalibrateWorker`.
+        white_ref : numpy.ndarray, optional
+            The spectrum of the white reference used for the calibration.
+        black_ref : numpy.ndarray, optional
+            The spectrum of the black reference used for the calibration.
+
+        Raises
+        ------
+        ValueError
+            If the data does not match the shape of the hypercube.
+        """
+        source = self._raw_reader()
+        if isinstance(source, CalibratedReader):
+            source = source.source
+
+        self._reader = CalibratedReader(source, data, white_ref, black_ref)
+
+    def remove_calibration(self) -> Reader:
+        """
+        Drop the calibrated reflectance, if any, so that reads return the raw data again.
+
+        The hypercube stops being resident, if it was.
+
+        Returns
+        -------
+        Reader
+            The reader of the raw data, which now serves all reads.
+        """
+        self._reader = self._raw_reader()
+        if isinstance(self._reader, CalibratedReader):
+            self._reader = self._reader.source
+
+        return self._reader
 
     def get_rgb(self, r: int, g: int, b: int) -> np.ndarray:
         """
@@ -133,7 +325,7 @@ class Hypercube:
         numpy.ndarray
             RGB image array of shape (rows, columns, 3).
         """
-        return get_rgb(self._envi, (r, g, b))
+        return get_rgb(self._reader.read_bands([r, g, b]), (0, 1, 2))
 
     def get_grayscale(self, band: int) -> np.ndarray:
         """
@@ -149,7 +341,7 @@ class Hypercube:
         numpy.ndarray
             Grayscale image array of shape (rows, columns).
         """
-        return get_rgb(self._envi, (band, band, band))
+        return get_rgb(self._reader.read_bands([band]), (0, 0, 0))
 
     def read_pixel(self, row: int, col: int) -> np.ndarray:
         """
@@ -167,23 +359,33 @@ class Hypercube:
         numpy.ndarray
             Spectrum of the pixel across all bands.
         """
-        return self._envi.read_pixel(row, col)
+        return self._reader.read_pixel(row, col)
 
-    def read_pixels(self, points: list[tuple[int, int]]) -> np.ndarray:
+    def read_pixels(self, points: list[tuple[int, int]] | np.ndarray) -> np.ndarray:
         """
         Read spectra for multiple pixels.
 
+        The pixels are gathered in a single pass, in the order they are stored in the file,
+        regardless of the order in which they are given.
+
         Parameters
         ----------
-        points : list of tuple of int
-            List of (row, col) tuples specifying pixel locations.
+        points : list of tuple of int or numpy.ndarray
+            List of (row, col) tuples specifying pixel locations, or an equivalent array
+            of shape (pixels, 2).
 
         Returns
         -------
         numpy.ndarray
-            Array of spectra for each pixel.
+            Array of spectra for each pixel, of shape (pixels, bands).
         """
-        return np.array([self.read_pixel(row, col) for row, col in points])
+        points = np.asarray(points, dtype=np.intp).reshape(-1, 2)
+        rows, cols = points[:, 0], points[:, 1]
+        order = np.argsort(rows * self.num_cols + cols, kind="stable")
+
+        spectra = np.empty((len(points), self.num_bands), dtype=self.dtype)
+        spectra[order] = self._reader.read_pixels(rows[order], cols[order])
+        return spectra
 
     def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
         """
@@ -203,7 +405,7 @@ class Hypercube:
         numpy.ndarray
             Hyperspectral data of the subregion.
         """
-        return self._envi.read_subregion(rows, cols, bands)
+        return self._reader.read_subregion(rows, cols, bands)
 
     def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
         """
@@ -223,7 +425,7 @@ class Hypercube:
         numpy.ndarray
             Hyperspectral data of the subimage.
         """
-        return self._envi.read_subimage(rows, cols, bands)
+        return self._reader.read_subimage(rows, cols, bands)
 
     def read_row(self, row: int, bands=None) -> np.ndarray:
         """
@@ -261,12 +463,133 @@ class Hypercube:
         """
         return self.read_subregion((0, self.num_rows), (col, col + 1), bands)
 
+    def iter_blocks(self,
+                    rows_per_block: int | None = None,
+                    target_bytes: int = BLOCK_BYTES,
+                    bands=None,
+                    prefetch: int = 1) -> Iterator[tuple[slice, np.ndarray]]:
+        """
+        Read the whole hypercube in blocks of consecutive rows, reading ahead in the background.
+
+        Blocks hold as many rows as fit into `target_bytes`, unless `rows_per_block` is given,
+        and up to `prefetch` of the following blocks are read on a background thread while
+        a block is being processed (see `iter_blocks`). Reading stops when iteration does.
+
+        Parameters
+        ----------
+        rows_per_block : int, optional
+            The number of rows per block, by default as many as fit into `target_bytes`.
+        target_bytes : int, optional
+            The upper bound on the size of a block, used unless `rows_per_block` is given.
+        bands : list or tuple or range, optional
+            Bands to read. If None, reads all bands.
+        prefetch : int, optional
+            The number of blocks read ahead, or 0 to read each block only when it is needed.
+
+        Yields
+        ------
+        tuple of (slice, numpy.ndarray)
+            The rows of the block, and the block of shape (rows, columns, bands).
+        """
+        return iter_blocks(self, rows_per_block, target_bytes, bands, prefetch)
+
+    def view(self,
+             rows: tuple[int, int] | slice | None = None,
+             cols: tuple[int, int] | slice | None = None,
+             bands=None,
+             binning: tuple[int, int, int] = (1, 1, 1)) -> "Hypercube":
+        """
+        Create a lazy view of a window of the hypercube, optionally binned.
+
+        Nothing is read until the view is: reads of the view read the corresponding
+        part of the hypercube in blocks, averaging every `binning` rows, columns and bands
+        into a single sample. Binned views hold floating-point samples, and wavelengths
+        averaged in the same way.
+
+        Parameters
+        ----------
+        rows : tuple of int or slice, optional
+            Start and end row indices (inclusive, exclusive), or a slice of rows. Defaults to all rows.
+        cols : tuple of int or slice, optional
+            Start and end column indices (inclusive, exclusive), or a slice of columns. Defaults to all columns.
+        bands : list or tuple or range or slice, optional
+            Bands to view, in order. Defaults to all bands.
+        binning : tuple of int, optional
+            The number of rows, columns and bands averaged into each sample of the view.
+
+        Returns
+        -------
+        Hypercube
+            The view, which reads from this hypercube.
+
+        Raises
+        ------
+        IndexError
+            If the window exceeds the bounds of the hypercube.
+        ValueError
+            If the binning is not made up of three positive integers.
+        """
+        return Hypercube(self._path, ViewReader(self, rows, cols, bands, binning))
+
+    def resample(self, wavelengths: np.ndarray) -> "Hypercube":
+        """
+        Create a lazy view of the hypercube resampled onto the given wavelengths.
+
+        Spectra are interpolated with cubic splines as they are read, by a single matrix
+        product precomputed for the wavelengths, so nothing is written or held in memory.
+
+        Parameters
+        ----------
+        wavelengths : numpy.ndarray
+            The wavelengths to resample onto, in the unit of the hypercube.
+
+        Returns
+        -------
+        Hypercube
+            The view, which reads from this hypercube.
 
-class HypercubeDataMissing(Exception):
-    """Raised upon attempting to open a hypercube with a missing data file."""
-    pass
+        Raises
+        ------
+        ValueError
+            If the hypercube has no wavelengths, or if there are no wavelengths to resample onto.
+        """
+        return Hypercube(self._path, ResampleReader(self, wavelengths))
+
+    def get_cached(self, key: object) -> object | None:
+        """
+        Look up a result derived from the hypercube in the shared memory cache.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key of the result.
+
+        Returns
+        -------
+        object or None
+            The result, or None if it is not cached (anymore).
+        """
+        return MemoryCache.shared().get(self, key)
+
+    def set_cached(self, key: object, value: object, num_bytes: int | None = None):
+        """
+        Keep a result derived from the hypercube in the shared memory cache.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key of the result.
+        value : object
+            The result, which must not be modified afterward.
+        num_bytes : int, optional
+            The size of the result, taken from its `nbytes` attribute if not given.
+        """
+        MemoryCache.shared().put(self, key, value, num_bytes)
 
+    def clear_cached(self):
+        """Remove all results derived from the hypercube from the shared memory cache."""
+        MemoryCache.shared().discard(self)
 
-class HypercubeHeaderInvalid(Exception):
-    """Raised upon attempting to open a hypercube with a malformed header file."""
-    pass
+    def _raw_reader(self) -> Reader:
+        # The reader which resident data stands in for, if any.
+        return self._reader.source if isinstance(self._reader, ResidentReader) else self._reader
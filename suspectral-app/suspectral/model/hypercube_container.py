@@ -1,57 +1,488 @@
-from PySide6.QtCore import QObject, Signal
+import os
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot
 
 from suspectral.model.hypercube import Hypercube
+from suspectral.model.system_memory import available_memory
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_calibrate import CalibrateWorker
+from suspectral.worker.worker_load import LoadWorker
+from suspectral.worker.worker_open import OpenWorker
 
 
 class HypercubeContainer(QObject):
     """
-    Manages the lifecycle of a Hypercube instance, observable via signals.
+    Manages a workspace of open Hypercube instances, one of which is current, observable via signals.
+
+    Hypercubes may be opened either synchronously with `open`, or in the background with
+    `open_async`, which keeps the application responsive while the header is parsed and
+    the data file is opened. Either way, `opened` is emitted on the thread of the container.
+
+    Opening a hypercube adds it to the workspace and makes it the current one, while the
+    hypercubes opened before stay open, so that `select` switches back to them instantly.
+    Switching emits `closed` followed by `opened`, so that observers only ever deal with
+    the current hypercube. Results derived from the open hypercubes are kept in the memory
+    cache they share (see `MemoryCache`), and are discarded when they are closed.
+
+    Hypercubes are read from their files on demand, unless they are loaded into memory in
+    the background with `load_into_memory`, either on request or, with `auto_load` enabled,
+    as soon as they are opened if they fit within `AUTO_LOAD_FRACTION` of the available memory.
+
+    Hypercubes may also be calibrated into reflectance with white and black references in
+    the background with `calibrate`, after which all tools read the calibrated cube. Since
+    the data changes, the hypercube is then reopened if it is the current one.
 
     Signals
     -------
+    opening : Signal
+        Emitted with the path of the header when a hypercube starts being opened in the background.
     opened : Signal
-        Emitted with the opened `Hypercube` instance when a hypercube is successfully opened.
+        Emitted with the `Hypercube` instance when a hypercube is opened or selected as the current one.
+    failed : Signal
+        Emitted with the error when a hypercube could not be opened in the background.
     closed : Signal
-        Emitted when the current hypercube is closed.
+        Emitted when the current hypercube is closed, or another one is about to be selected.
+    workspaceChanged : Signal
+        Emitted when hypercubes are added to or removed from the workspace, or another is selected.
+    loadProgress : Signal
+        Emitted with a hypercube and the progress in percent while it is loaded into memory.
+    loadFailed : Signal
+        Emitted with a hypercube and the error when it could not be loaded into memory.
+    residencyChanged : Signal
+        Emitted with a hypercube when it starts or stops being loaded into memory, or is loaded.
+    calibrationProgress : Signal
+        Emitted with a hypercube and the progress in percent while it is calibrated.
+    calibrationFailed : Signal
+        Emitted with a hypercube and the error when it could not be calibrated.
+    calibrationChanged : Signal
+        Emitted with a hypercube when it starts or stops being calibrated, or its calibration is removed.
     """
 
+    AUTO_LOAD_FRACTION = 0.5
+    """Largest fraction of the available memory which hypercubes loaded automatically may take up."""
+
+    opening = Signal(str)
     opened = Signal(Hypercube)
+    failed = Signal(object)
     closed = Signal()
+    workspaceChanged = Signal()
+    loadProgress = Signal(Hypercube, int)
+    loadFailed = Signal(Hypercube, object)
+    residencyChanged = Signal(Hypercube)
+    calibrationProgress = Signal(Hypercube, int)
+    calibrationFailed = Signal(Hypercube, object)
+    calibrationChanged = Signal(Hypercube)
 
     def __init__(self):
         super().__init__()
         self._hypercube: Hypercube | None = None
+        self._hypercubes: list[Hypercube] = []
+        self._recent: list[Hypercube] = []
+        self._paths: dict[str, Hypercube] = {}
+        self._worker: OpenWorker | None = None
+        self._load_workers: dict[Hypercube, LoadWorker] = {}
+        self._calibrate_workers: dict[Hypercube, CalibrateWorker] = {}
+        self._auto_load = False
 
     def open(self, path: str) -> Hypercube:
         """
-        Open a hypercube from the given file path.
+        Open a hypercube from the given file path, and make it the current one.
 
-        If another hypercube is already open, it will be closed first.
+        If the file is already open, its hypercube is selected instead of opening it again.
+        Any hypercube being opened in the background is cancelled.
 
         Parameters
         ----------
         path : str
-            Path to the ENVI header file.
+            Path to the hypercube file, such as the ENVI header file.
 
         Returns
         -------
         Hypercube
-            The newly opened Hypercube instance.
+            The opened Hypercube instance.
+        """
+        self.cancel()
+
+        hypercube = self._paths.get(self._normalize(path))
+        if hypercube is None:
+            hypercube = Hypercube(path)
+            self._add(path, hypercube)
+
+        self.select(hypercube)
+        return hypercube
+
+    def open_async(self, path: str):
+        """
+        Open a hypercube from the given file path in the background, and make it the current one.
+
+        Emits `opening` right away, and later either `opened` or `failed`, unless cancelled
+        with `cancel` in the meantime. If the file is already open, its hypercube is selected
+        right away instead. Any hypercube already being opened in the background is cancelled.
+
+        Parameters
+        ----------
+        path : str
+            Path to the hypercube file, such as the ENVI header file.
+        """
+        self.cancel()
+
+        hypercube = self._paths.get(self._normalize(path))
+        if hypercube is not None:
+            self.select(hypercube)
+            return
+
+        self._worker = OpenWorker(path)
+        self._worker.opened.connect(self._handle_worker_opened)
+        self._worker.failed.connect(self._handle_worker_failed)
+        self._worker.finished.connect(self._handle_worker_finished)
+
+        self.opening.emit(path)
+        start_worker(self._worker, self)
+
+    def cancel(self):
+        """Cancel opening a hypercube in the background, if one is being opened."""
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    def select(self, hypercube: Hypercube):
+        """
+        Make an open hypercube the current one.
+
+        Parameters
+        ----------
+        hypercube : Hypercube
+            A hypercube of the workspace.
+
+        Raises
+        ------
+        ValueError
+            If the hypercube is not open in the workspace.
         """
+        if hypercube not in self._hypercubes:
+            raise ValueError("The hypercube is not open in the workspace.")
+
+        if hypercube is self._hypercube:
+            return
+
         if self._hypercube is not None:
-            self.close()
+            self._hypercube = None
+            self.closed.emit()
 
-        self._hypercube = Hypercube(path)
-        self.opened.emit(self._hypercube)
-        return self._hypercube
+        self._recent.remove(hypercube)
+        self._recent.append(hypercube)
+
+        self._hypercube = hypercube
+        self.opened.emit(hypercube)
+        self.workspaceChanged.emit()
+
+    def close(self, hypercube: Hypercube | None = None):
+        """
+        Close a hypercube, removing it from the workspace along with its cached results.
+
+        Closing the current hypercube emits the `closed` signal, after which the most
+        recently selected of the remaining hypercubes, if any, becomes the current one.
+
+        Parameters
+        ----------
+        hypercube : Hypercube, optional
+            The hypercube to close, by default the current one.
+        """
+        hypercube = self._hypercube if hypercube is None else hypercube
+        if hypercube not in self._hypercubes:
+            self.closed.emit()
+            return
+
+        self._stop_loading(hypercube)
+        self._stop_calibrating(hypercube)
+        self._hypercubes.remove(hypercube)
+        self._recent.remove(hypercube)
+        self._paths = {path: it for path, it in self._paths.items() if it is not hypercube}
+        hypercube.clear_cached()
+
+        if hypercube is self._hypercube:
+            self._hypercube = None
+            self.closed.emit()
+
+            if self._recent:
+                self.select(self._recent[-1])
+                return
 
-    def close(self):
-        """Close the currently opened hypercube, if any, and emit the `closed` signal."""
-        del self._hypercube
-        self._hypercube = None
-        self.closed.emit()
+        self.workspaceChanged.emit()
+
+    def close_all(self):
+        """Close all hypercubes of the workspace."""
+        while self._hypercubes:
+            self.close(self._hypercubes[-1])
+
+    def load_into_memory(self, hypercube: Hypercube | None = None):
+        """
+        Load a hypercube into memory in the background, after which it is read from memory.
+
+        Emits `residencyChanged` right away, `loadProgress` while loading, and later either
+        `residencyChanged` again once the hypercube is resident, or `loadFailed`.
+
+        Parameters
+        ----------
+        hypercube : Hypercube, optional
+            The hypercube to load, by default the current one.
+        """
+        hypercube = self._hypercube if hypercube is None else hypercube
+        if hypercube is None or hypercube.resident or hypercube in self._load_workers:
+            return
+
+        worker = LoadWorker(hypercube)
+        worker.progress.connect(self._handle_load_progress)
+        worker.loaded.connect(self._handle_load_loaded)
+        worker.failed.connect(self._handle_load_failed)
+        worker.finished.connect(self._handle_load_finished)
+        self._load_workers[hypercube] = worker
+
+        self.residencyChanged.emit(hypercube)
+        start_worker(worker, self)
+
+    def release_memory(self, hypercube: Hypercube | None = None):
+        """
+        Free the memory taken up by a hypercube, or stop loading it, so that it is read from its file.
+
+        Parameters
+        ----------
+        hypercube : Hypercube, optional
+            The hypercube to release, by default the current one.
+        """
+        hypercube = self._hypercube if hypercube is None else hypercube
+        if hypercube is None or not (hypercube.resident or hypercube in self._load_workers):
+            return
+
+        self._stop_loading(hypercube)
+        hypercube.release()
+        self.residencyChanged.emit(hypercube)
+
+    def cancel_loading(self):
+        """Stop loading any hypercubes into memory, leaving those already loaded resident."""
+        for hypercube in list(self._load_workers):
+            self._stop_loading(hypercube)
+            self.residencyChanged.emit(hypercube)
+
+    def is_loading_into_memory(self, hypercube: Hypercube | None = None) -> bool:
+        """Whether a hypercube, by default the current one, is being loaded into memory."""
+        hypercube = self._hypercube if hypercube is None else hypercube
+        return hypercube in self._load_workers
+
+    def calibrate(self,
+                  white_ref: np.ndarray | None = None,
+                  black_ref: np.ndarray | None = None,
+                  hypercube: Hypercube | None = None):
+        """
+        Calibrate a hypercube into reflectance in the background, after which it is read calibrated.
+
+        Emits `calibrationChanged` right away, `calibrationProgress` while calibrating, and later
+        either `calibrationChanged` again once the hypercube is calibrated, or `calibrationFailed`.
+        A calibrated hypercube is no longer resident, and if it is the current one, it is reopened.
+        Hypercubes which are calibrated already are left as they are, since the references
+        are spectra of their raw data.
+
+        Parameters
+        ----------
+        white_ref : np.ndarray, optional
+            The spectrum of a white reference, which becomes a reflectance of 1.
+        black_ref : np.ndarray, optional
+            The spectrum of a black reference, which becomes a reflectance of 0.
+        hypercube : Hypercube, optional
+            The hypercube to calibrate, by default the current one.
+        """
+        hypercube = self._hypercube if hypercube is None else hypercube
+        if hypercube is None or hypercube.calibrated:
+            return
+
+        self._stop_calibrating(hypercube)
+        worker = CalibrateWorker(hypercube, white_ref, black_ref)
+        worker.progress.connect(self._handle_calibrate_progress)
+        worker.calibrated.connect(self._handle_calibrate_calibrated)
+        worker.failed.connect(self._handle_calibrate_failed)
+        worker.finished.connect(self._handle_calibrate_finished)
+        self._calibrate_workers[hypercube] = worker
+
+        self.calibrationChanged.emit(hypercube)
+        start_worker(worker, self)
+
+    def remove_calibration(self, hypercube: Hypercube | None = None):
+        """
+        Drop the calibration of a hypercube, or stop calibrating it, so that its raw data is read.
+
+        Parameters
+        ----------
+        hypercube : Hypercube, optional
+            The hypercube to restore, by default the current one.
+        """
+        hypercube = self._hypercube if hypercube is None else hypercube
+        if hypercube is None or not (hypercube.calibrated or hypercube in self._calibrate_workers):
+            return
+
+        self._stop_calibrating(hypercube)
+        if hypercube.calibrated:
+            self._stop_loading(hypercube)
+            hypercube.remove_calibration()
+            self._reload(hypercube)
+
+        self.calibrationChanged.emit(hypercube)
+
+    def cancel_calibration(self):
+        """Stop calibrating any hypercubes, leaving those already calibrated as they are."""
+        for hypercube in list(self._calibrate_workers):
+            self._stop_calibrating(hypercube)
+            self.calibrationChanged.emit(hypercube)
+
+    def is_calibrating(self, hypercube: Hypercube | None = None) -> bool:
+        """Whether a hypercube, by default the current one, is being calibrated."""
+        hypercube = self._hypercube if hypercube is None else hypercube
+        return hypercube in self._calibrate_workers
+
+    def fits_in_memory(self, hypercube: Hypercube) -> bool:
+        """Whether a hypercube fits within `AUTO_LOAD_FRACTION` of the available memory."""
+        available = available_memory()
+        return available is not None and hypercube.num_bytes <= self.AUTO_LOAD_FRACTION * available
+
+    @property
+    def auto_load(self) -> bool:
+        """Whether hypercubes are loaded into memory as soon as they are opened, if they fit."""
+        return self._auto_load
+
+    @auto_load.setter
+    def auto_load(self, value: bool):
+        self._auto_load = value
 
     @property
     def hypercube(self) -> Hypercube | None:
-        """The currently opened Hypercube instance, or None if no hypercube is opened."""
+        """The current Hypercube instance, or None if no hypercube is opened."""
         return self._hypercube
+
+    @property
+    def hypercubes(self) -> list[Hypercube]:
+        """All open Hypercube instances, in the order they were opened."""
+        return list(self._hypercubes)
+
+    @property
+    def loading(self) -> bool:
+        """Whether a hypercube is being opened in the background."""
+        return self._worker is not None
+
+    def _add(self, path: str, hypercube: Hypercube):
+        self._hypercubes.append(hypercube)
+        self._recent.append(hypercube)
+        self._paths[self._normalize(path)] = hypercube
+
+        if self._auto_load and self.fits_in_memory(hypercube):
+            self.load_into_memory(hypercube)
+
+    def _stop_loading(self, hypercube: Hypercube):
+        worker = self._load_workers.pop(hypercube, None)
+        if worker is not None:
+            worker.stop()
+
+    def _stop_calibrating(self, hypercube: Hypercube):
+        worker = self._calibrate_workers.pop(hypercube, None)
+        if worker is not None:
+            worker.stop()
+
+    def _reload(self, hypercube: Hypercube):
+        # Results derived from the data are stale, and so is anything showing the current hypercube.
+        hypercube.clear_cached()
+        self.residencyChanged.emit(hypercube)
+
+        if hypercube is self._hypercube:
+            self._hypercube = None
+            self.closed.emit()
+            self.select(hypercube)
+
+    def _is_current_load(self, worker: LoadWorker) -> bool:
+        # Ignore workers which have been stopped.
+        return self._load_workers.get(worker.hypercube) is worker
+
+    def _is_current_calibration(self, worker: CalibrateWorker) -> bool:
+        # Ignore workers which have been stopped.
+        return self._calibrate_workers.get(worker.hypercube) is worker
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    @Slot()
+    def _handle_worker_opened(self, hypercube: Hypercube):
+        # Ignore hypercubes opened by cancelled workers.
+        if self.sender() is self._worker:
+            path, self._worker = self._worker.path, None
+            self._add(path, hypercube)
+            self.select(hypercube)
+
+    @Slot()
+    def _handle_worker_failed(self, error: Exception):
+        if self.sender() is self._worker:
+            self._worker = None
+            self.failed.emit(error)
+
+    @Slot()
+    def _handle_worker_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    @Slot()
+    def _handle_load_progress(self, percent: int):
+        worker = self.sender()
+        if self._is_current_load(worker):
+            self.loadProgress.emit(worker.hypercube, percent)
+
+    @Slot()
+    def _handle_load_loaded(self, data):
+        worker = self.sender()
+        if self._is_current_load(worker):
+            del self._load_workers[worker.hypercube]
+            worker.hypercube.make_resident(data)
+            self.residencyChanged.emit(worker.hypercube)
+
+    @Slot()
+    def _handle_load_failed(self, error: Exception):
+        worker = self.sender()
+        if self._is_current_load(worker):
+            del self._load_workers[worker.hypercube]
+            self.residencyChanged.emit(worker.hypercube)
+            self.loadFailed.emit(worker.hypercube, error)
+
+    @Slot()
+    def _handle_load_finished(self):
+        worker = self.sender()
+        if self._is_current_load(worker):
+            del self._load_workers[worker.hypercube]
+            self.residencyChanged.emit(worker.hypercube)
+
+    @Slot()
+    def _handle_calibrate_progress(self, percent: int):
+        worker = self.sender()
+        if self._is_current_calibration(worker):
+            self.calibrationProgress.emit(worker.hypercube, percent)
+
+    @Slot()
+    def _handle_calibrate_calibrated(self, data):
+        worker = self.sender()
+        if self._is_current_calibration(worker):
+            del self._calibrate_workers[worker.hypercube]
+            self._stop_loading(worker.hypercube)
+            worker.hypercube.calibrate(data, worker.white_ref, worker.black_ref)
+            self._reload(worker.hypercube)
+            self.calibrationChanged.emit(worker.hypercube)
+
+    @Slot()
+    def _handle_calibrate_failed(self, error: Exception):
+        worker = self.sender()
+        if self._is_current_calibration(worker):
+            del self._calibrate_workers[worker.hypercube]
+            self.calibrationChanged.emit(worker.hypercube)
+            self.calibrationFailed.emit(worker.hypercube, error)
+
+    @Slot()
+    def _handle_calibrate_finished(self):
+        worker = self.sender()
+        if self._is_current_calibration(worker):
+            del self._calibrate_workers[worker.hypercube]
+            self.calibrationChanged.emit(worker.hypercube)
@@ -0,0 +1,142 @@
+import threading
+import weakref
+from collections import OrderedDict
+
+
+class MemoryCache:
+    """
+    Keeps results derived from hypercubes in memory, within one budget shared by all of them.
+
+    Each entry belongs to an owner, such as a hypercube, and is looked up by a key of that
+    owner. When the entries exceed the budget, the least recently used ones are evicted,
+    whichever owners they belong to, so that switching between several open hypercubes keeps
+    what was derived from all of them for as long as memory allows. The entries of an owner
+    are discarded along with it, or explicitly via `discard`. The cache may be used from any
+    number of threads at once.
+
+    Parameters
+    ----------
+    budget_bytes : int, optional
+        The maximum number of bytes which the entries may take up together.
+    """
+
+    BUDGET_BYTES = 1024 ** 3
+    """Default budget of the cache, in bytes."""
+
+    _shared: "MemoryCache | None" = None
+
+    def __init__(self, budget_bytes: int = BUDGET_BYTES):
+        self._budget = budget_bytes
+        self._used = 0
+        self._entries: OrderedDict[tuple[int, object], tuple[object, int]] = OrderedDict()
+        self._owners: dict[int, weakref.finalize] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "MemoryCache":
+        """The cache shared by the whole application."""
+        if cls._shared is None:
+            cls._shared = MemoryCache()
+
+        return cls._shared
+
+    @property
+    def budget(self) -> int:
+        """The maximum number of bytes which the entries may take up together."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: int):
+        with self._lock:
+            self._budget = value
+            self._evict()
+
+    @property
+    def used(self) -> int:
+        """The number of bytes taken up by the entries."""
+        return self._used
+
+    def get(self, owner: object, key: object) -> object | None:
+        """
+        Look up an entry, marking it as the most recently used one.
+
+        Parameters
+        ----------
+        owner : object
+            The owner of the entry.
+        key : object
+            The hashable key of the entry.
+
+        Returns
+        -------
+        object or None
+            The value of the entry, or None if there is no such entry.
+        """
+        with self._lock:
+            entry = self._entries.get((id(owner), key))
+            if entry is None:
+                return None
+
+            self._entries.move_to_end((id(owner), key))
+            return entry[0]
+
+    def put(self, owner: object, key: object, value: object, num_bytes: int | None = None):
+        """
+        Store an entry, evicting the least recently used ones if the budget is exceeded.
+
+        Values larger than the whole budget are not stored at all. Arrays should not be
+        modified once they are stored, since they are shared with whoever looks them up.
+
+        Parameters
+        ----------
+        owner : object
+            The owner of the entry, which must support weak references.
+        key : object
+            The hashable key of the entry.
+        value : object
+            The value of the entry.
+        num_bytes : int, optional
+            The size of the value, taken from its `nbytes` attribute if not given.
+        """
+        num_bytes = value.nbytes if num_bytes is None else num_bytes
+
+        with self._lock:
+            self._remove((id(owner), key))
+            if num_bytes > self._budget:
+                return
+
+            if id(owner) not in self._owners:
+                self._owners[id(owner)] = weakref.finalize(owner, self._discard_id, id(owner))
+
+            self._entries[(id(owner), key)] = value, num_bytes
+            self._used += num_bytes
+            self._evict()
+
+    def discard(self, owner: object):
+        """
+        Remove all entries of an owner.
+
+        Parameters
+        ----------
+        owner : object
+            The owner whose entries to remove.
+        """
+        finalizer = self._owners.get(id(owner))
+        if finalizer is not None:
+            finalizer()
+
+    def _discard_id(self, owner_id: int):
+        with self._lock:
+            self._owners.pop(owner_id, None)
+            for entry in [it for it in self._entries if it[0] == owner_id]:
+                self._remove(entry)
+
+    def _remove(self, entry: tuple[int, object]):
+        removed = self._entries.pop(entry, None)
+        if removed is not None:
+            self._used -= removed[1]
+
+    def _evict(self):
+        while self._used > self._budget and self._entries:
+            _, (_, num_bytes) = self._entries.popitem(last=False)
+            self._used -= num_bytes
@@ -0,0 +1,90 @@
+import os
+import threading
+import weakref
+
+import numpy as np
+
+
+class PositionalFile:
+    """
+    Reads a file at given offsets, safely from any number of threads at once.
+
+    Reading with `seek` and `read` moves the position shared by all users of a file, so
+    concurrent reads through one file object race with each other. Positional reads do
+    not use the shared position at all. Where the platform has them (`os.preadv` or
+    `os.pread`), the file is opened once and read by all threads; elsewhere, each thread
+    reads through a file handle of its own. Either way, reads proceed concurrently, since
+    the GIL is released while the operating system performs them.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file to read.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be opened.
+    """
+
+    MAX_READ_BYTES = 1 << 30
+    """Maximum number of bytes requested from the operating system in one read."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._local = threading.local()
+        self._fd: int | None = None
+
+        if hasattr(os, "preadv") or hasattr(os, "pread"):
+            self._fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            self._finalizer = weakref.finalize(self, os.close, self._fd)
+        else:
+            # Opening the first handle right away reports a missing file as early as elsewhere.
+            self._local.file = open(path, "rb")
+
+    @property
+    def path(self) -> str:
+        """Path to the file being read."""
+        return self._path
+
+    def read_into(self, buffer: np.ndarray, offset: int):
+        """
+        Fill a buffer with the bytes of the file at the given offset.
+
+        Parameters
+        ----------
+        buffer : numpy.ndarray
+            Contiguous array to fill, whose size determines the number of bytes read.
+        offset : int
+            Offset of the first byte to read.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read, or ends before the buffer is filled.
+        """
+        view = memoryview(buffer).cast("B")
+        position = 0
+        while position < len(view):
+            size = min(len(view) - position, self.MAX_READ_BYTES)
+            count = self._read(view[position:position + size], offset + position)
+            if count == 0:
+                raise OSError(f"Unexpected end of the file {self._path} at byte {offset + position}.")
+
+            position += count
+
+    def _read(self, view: memoryview, offset: int) -> int:
+        if hasattr(os, "preadv"):
+            return os.preadv(self._fd, [view], offset)
+
+        if hasattr(os, "pread"):
+            data = os.pread(self._fd, len(view), offset)
+            view[:len(data)] = data
+            return len(data)
+
+        file = getattr(self._local, "file", None)
+        if file is None:
+            file = self._local.file = open(self._path, "rb")
+
+        file.seek(offset)
+        return file.readinto(view)
@@ -0,0 +1,263 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+
+
+class Reader(ABC):
+    """
+    Reads the data of a hypercube stored in a particular file format.
+
+    Readers are lazy: opening one only reads what is needed to know the layout of the
+    hypercube, and the data is read on demand, one region at a time. Whatever the layout
+    of the file, the data is presented as (rows, columns, bands).
+
+    Readers are shared by the GUI thread and any number of background workers, so their
+    reads must be safe to perform from several threads at once.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file which was opened.
+    """
+
+    NAME: str = ""
+    """Name of the file format, as shown to the user."""
+
+    EXTENSIONS: tuple[str, ...] = ()
+    """Lowercase extensions of the files which the reader opens, including the dot."""
+
+    def __init__(self, path: str):
+        self._path = path
+
+    @classmethod
+    def open(cls, path: str) -> "Reader":
+        """
+        Open a reader for the file at the given path.
+
+        Subclasses may override this to hand the file over to a more suitable reader.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file to open.
+
+        Returns
+        -------
+        Reader
+            The reader of the file.
+        """
+        return cls(path)
+
+    @property
+    def name(self) -> str:
+        """Name of the hypercube."""
+        return Path(self._path).stem
+
+    @property
+    def path(self) -> str:
+        """Path to the file which was opened."""
+        return self._path
+
+    @property
+    def data_path(self) -> str:
+        """Path to the file holding the data, whose changes invalidate anything derived from it."""
+        return self._path
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        """Metadata of the hypercube, as a dictionary."""
+        return {}
+
+    @property
+    @abstractmethod
+    def shape(self) -> tuple[int, int, int]:
+        """Shape of the hypercube as (rows, columns, bands)."""
+        pass
+
+    @property
+    @abstractmethod
+    def dtype(self) -> np.dtype:
+        """Data type of the spectral samples, in native byte order."""
+        pass
+
+    @property
+    def chunks(self) -> tuple[int, int, int] | None:
+        """Shape of the blocks in which the data is stored, if it is stored in blocks at all."""
+        return None
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        """Band center wavelengths, if known, in the order of the bands."""
+        return None
+
+    @property
+    def wavelengths_unit(self) -> str | None:
+        """Unit of the wavelengths, if known."""
+        return None
+
+    @property
+    def default_bands(self) -> tuple[int, int, int] | None:
+        """The default RGB band indices, if known."""
+        return None
+
+    @abstractmethod
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        """
+        Read a subregion of the hypercube.
+
+        Parameters
+        ----------
+        rows : tuple of int
+            Start and end row indices (inclusive, exclusive).
+        cols : tuple of int
+            Start and end column indices (inclusive, exclusive).
+        bands : list or tuple or range, optional
+            Bands to read. If None, reads all bands.
+
+        Returns
+        -------
+        numpy.ndarray
+            Data of the subregion, of shape (rows, columns, bands).
+        """
+        pass
+
+    def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
+        """
+        Read the pixels at the intersections of the given rows and columns.
+
+        Parameters
+        ----------
+        rows : list or tuple or range
+            Row indices.
+        cols : list or tuple or range
+            Column indices.
+        bands : list or tuple or range, optional
+            Bands to read. If None, reads all bands.
+
+        Returns
+        -------
+        numpy.ndarray
+            Data of the subimage, of shape (rows, columns, bands).
+        """
+        rows, cols = np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)
+        if rows.size == 0 or cols.size == 0:
+            return np.empty((rows.size, cols.size, self._count_bands(bands)), dtype=self.dtype)
+
+        # Only the bounding box is read, which is what the formats read efficiently.
+        region = self.read_subregion(
+            (int(rows.min()), int(rows.max()) + 1),
+            (int(cols.min()), int(cols.max()) + 1),
+            bands,
+        )
+        return region[np.ix_(rows - rows.min(), cols - cols.min())]
+
+    def read_pixel(self, row: int, col: int) -> np.ndarray:
+        """
+        Read the spectrum of a single pixel.
+
+        Parameters
+        ----------
+        row : int
+            Row index of the pixel.
+        col : int
+            Column index of the pixel.
+
+        Returns
+        -------
+        numpy.ndarray
+            Spectrum of the pixel across all bands.
+        """
+        return self.read_subregion((row, row + 1), (col, col + 1))[0, 0]
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """
+        Read the spectra of the given pixels.
+
+        The pixels are expected to be in the order they are stored in row-major order,
+        which lets them be gathered a strip of rows at a time.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            Row indices of the pixels.
+        cols : numpy.ndarray
+            Column indices of the pixels.
+
+        Returns
+        -------
+        numpy.ndarray
+            Spectra of the pixels, of shape (pixels, bands).
+        """
+        spectra = np.empty((len(rows), self.shape[2]), dtype=self.dtype)
+        if len(rows) == 0:
+            return spectra
+
+        height = self.chunks[0] if self.chunks is not None else 1
+
+        strips = rows // height
+        bounds = np.flatnonzero(np.diff(strips)) + 1
+        for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(rows)]):
+            strip_rows, strip_cols = rows[start:end], cols[start:end]
+            top, left = int(strip_rows.min()), int(strip_cols.min())
+            region = self.read_subregion((top, int(strip_rows.max()) + 1), (left, int(strip_cols.max()) + 1))
+            spectra[start:end] = region[strip_rows - top, strip_cols - left]
+
+        return spectra
+
+    def read_bands(self, bands) -> np.ndarray:
+        """
+        Read whole bands of the hypercube.
+
+        Parameters
+        ----------
+        bands : list or tuple or range
+            Bands to read.
+
+        Returns
+        -------
+        numpy.ndarray
+            Data of the bands, of shape (rows, columns, bands).
+        """
+        return self.read_subregion((0, self.shape[0]), (0, self.shape[1]), bands)
+
+    def _count_bands(self, bands) -> int:
+        return self.shape[2] if bands is None else len(bands)
+
+    @staticmethod
+    def find_band_axis(shape: tuple[int, ...], num_wavelengths: int | None = None) -> int:
+        """
+        Guess which axis of a three-dimensional array holds the bands.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Shape of the array.
+        num_wavelengths : int, optional
+            Number of band wavelengths known to belong to the array.
+
+        Returns
+        -------
+        int
+            The axis whose length matches the number of wavelengths, if any does, or else
+            the shortest axis, preferring the last one.
+        """
+        if num_wavelengths is not None and num_wavelengths in shape:
+            return len(shape) - 1 - shape[::-1].index(num_wavelengths)
+
+        return min(reversed(range(len(shape))), key=lambda axis: shape[axis])
+
+
+class HypercubeDataMissing(Exception):
+    """Raised upon attempting to open a hypercube with a missing data file."""
+    pass
+
+
+class HypercubeHeaderInvalid(Exception):
+    """Raised upon attempting to open a hypercube with a malformed header file."""
+    pass
+
+
+class HypercubeFormatUnsupported(Exception):
+    """Raised upon attempting to open a hypercube in a format which cannot be read."""
+    pass
@@ -0,0 +1,169 @@
+import numpy as np
+import scipy.io
+
+from suspectral.model.reader import HypercubeHeaderInvalid, Reader
+from suspectral.model.reader_hdf5 import Hdf5Reader
+
+
+class ArrayReader(Reader):
+    """
+    Reads hypercubes held in NumPy arrays, including memory-mapped ones.
+
+    The bands may be along any axis of the array, and it is transposed into
+    (rows, columns, bands) without copying, so memory-mapped data is still only
+    read on demand.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file which was opened.
+    array : numpy.ndarray
+        Three-dimensional array holding the hypercube.
+    wavelengths : numpy.ndarray, optional
+        Band center wavelengths, used to tell which axis holds the bands.
+    metadata : dict[str, object], optional
+        Metadata to present alongside the layout of the array.
+
+    Raises
+    ------
+    HypercubeHeaderInvalid
+        If the array is not a three-dimensional array of numbers.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            array: np.ndarray,
+            wavelengths: np.ndarray | None = None,
+            metadata: dict[str, object] | None = None,
+    ):
+        super().__init__(path)
+        if array.ndim != 3 or not (np.issubdtype(array.dtype, np.number) or array.dtype == np.bool_):
+            raise HypercubeHeaderInvalid(f"Expected a three-dimensional array of numbers, got {array.dtype} {array.shape}.")
+
+        axis = self.find_band_axis(array.shape, None if wavelengths is None else len(wavelengths))
+        self._array = np.moveaxis(array, axis, -1)
+        self._wavelengths = wavelengths if wavelengths is not None and len(wavelengths) == self._array.shape[2] else None
+        self._metadata = {
+            **(metadata or {}),
+            "lines": self._array.shape[0],
+            "samples": self._array.shape[1],
+            "bands": self._array.shape[2],
+            "data type": str(array.dtype),
+        }
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return self._metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._array.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._array.dtype.newbyteorder("=")
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        return self._wavelengths
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        region = self._array[rows[0]:rows[1], cols[0]:cols[1]]
+        return self._take_bands(region, bands)
+
+    def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
+        region = self._array[np.ix_(np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))]
+        return self._take_bands(region, bands)
+
+    def read_pixel(self, row: int, col: int) -> np.ndarray:
+        return np.array(self._array[row, col], dtype=self.dtype)
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return np.asarray(self._array[rows, cols], dtype=self.dtype)
+
+    def _take_bands(self, region: np.ndarray, bands) -> np.ndarray:
+        if bands is not None:
+            region = region[..., list(bands)]
+
+        return np.array(region, dtype=self.dtype)
+
+
+class NpyReader(ArrayReader):
+    """
+    Reads hypercubes saved as NumPy `.npy` files, memory-mapping them rather than loading them.
+
+    Parameters
+    ----------
+    path : str
+        Path to the `.npy` file.
+
+    Raises
+    ------
+    HypercubeHeaderInvalid
+        If the file is not a `.npy` file of a three-dimensional array of numbers.
+    """
+
+    NAME = "NumPy"
+    EXTENSIONS = (".npy",)
+
+    def __init__(self, path: str):
+        try:
+            array = np.load(path, mmap_mode="r", allow_pickle=False)
+        except ValueError as e:
+            raise HypercubeHeaderInvalid(e)
+
+        super().__init__(path, array, metadata={"file type": self.NAME})
+
+
+class MatReader(ArrayReader):
+    """
+    Reads hypercubes saved as MATLAB `.mat` files of versions older than 7.3.
+
+    Unlike the later versions (see `Hdf5Reader`), these files cannot be read lazily,
+    so the hypercube is loaded into memory as a whole.
+
+    Parameters
+    ----------
+    path : str
+        Path to the `.mat` file.
+
+    Raises
+    ------
+    HypercubeHeaderInvalid
+        If the file holds no three-dimensional array of numbers.
+    """
+
+    NAME = "MATLAB"
+    EXTENSIONS = (".mat",)
+
+    def __init__(self, path: str):
+        try:
+            variables = scipy.io.loadmat(path)
+        except (ValueError, TypeError, NotImplementedError) as e:
+            raise HypercubeHeaderInvalid(e)
+
+        arrays = {
+            name: value for name, value in variables.items()
+            if not name.startswith("__") and isinstance(value, np.ndarray)
+        }
+
+        cubes = {name: value for name, value in arrays.items() if value.ndim == 3}
+        if not cubes:
+            raise HypercubeHeaderInvalid("The file holds no three-dimensional arrays.")
+
+        name = max(cubes, key=lambda it: cubes[it].size)
+        wavelengths = next(
+            (arrays[it].ravel().astype(np.float64) for it in Hdf5Reader.WAVELENGTH_NAMES if it in arrays),
+            None,
+        )
+
+        super().__init__(path, cubes[name], wavelengths, metadata={"file type": self.NAME, "variable": name})
+
+    @classmethod
+    def open(cls, path: str) -> Reader:
+        # Files of version 7.3 are HDF5 files, which can be read lazily.
+        if Hdf5Reader.is_hdf5(path):
+            return Hdf5Reader.open(path)
+
+        return cls(path)
@@ -0,0 +1,123 @@
+import numpy as np
+
+from suspectral.model.reader import Reader
+
+
+class CalibratedReader(Reader):
+    """
+    Reads a hypercube which has been calibrated into reflectance.
+
+    Stands in for the reader of the raw hypercube, which still describes it, while the
+    data is read from the calibrated cube (see `CalibrateWorker`), typically memory-mapped
+    from a temporary file, so that it is read on demand like the raw data. Reads of
+    contiguous regions and ranges of bands are views into the cube, so they are read-only.
+
+    Parameters
+    ----------
+    source : Reader
+        The reader of the raw hypercube.
+    data : numpy.ndarray
+        The calibrated reflectance, of shape (rows, columns, bands) like the source.
+    white_ref : numpy.ndarray, optional
+        The spectrum of the white reference the reflectance is relative to.
+    black_ref : numpy.ndarray, optional
+        The spectrum of the black reference subtracted from the raw data.
+
+    Raises
+    ------
+    ValueError
+        If the data does not match the shape of the source.
+    """
+
+    def __init__(self,
+                 source: Reader,
+                 data: np.ndarray,
+                 white_ref: np.ndarray | None = None,
+                 black_ref: np.ndarray | None = None):
+        super().__init__(source.path)
+        if data.shape != tuple(source.shape):
+            raise ValueError(f"Expected data of shape {tuple(source.shape)}, got {data.shape}.")
+
+        self._source = source
+        self._data = data
+        self._data.flags.writeable = False
+        self._white_ref = white_ref
+        self._black_ref = black_ref
+        self._metadata = {
+            **source.metadata,
+            "data type": str(data.dtype),
+            "calibration": "reflectance",
+            "white reference": None if white_ref is None else np.asarray(white_ref).tolist(),
+            "black reference": None if black_ref is None else np.asarray(black_ref).tolist(),
+        }
+
+    @property
+    def source(self) -> Reader:
+        """The reader of the raw hypercube."""
+        return self._source
+
+    @property
+    def white_ref(self) -> np.ndarray | None:
+        """The spectrum of the white reference the reflectance is relative to."""
+        return self._white_ref
+
+    @property
+    def black_ref(self) -> np.ndarray | None:
+        """The spectrum of the black reference subtracted from the raw data."""
+        return self._black_ref
+
+    @property
+    def name(self) -> str:
+        return self._source.name
+
+    @property
+    def data_path(self) -> str:
+        return self._source.data_path
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return self._metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._data.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._data.dtype
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        return self._source.wavelengths
+
+    @property
+    def wavelengths_unit(self) -> str | None:
+        return self._source.wavelengths_unit
+
+    @property
+    def default_bands(self) -> tuple[int, int, int] | None:
+        return self._source.default_bands
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        return self._take_bands(self._data[rows[0]:rows[1], cols[0]:cols[1]], bands)
+
+    def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
+        region = self._data[np.ix_(np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))]
+        return self._take_bands(region, bands)
+
+    def read_pixel(self, row: int, col: int) -> np.ndarray:
+        return self._data[row, col]
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return self._data[rows, cols]
+
+    @staticmethod
+    def _take_bands(region: np.ndarray, bands) -> np.ndarray:
+        if bands is None:
+            return region
+
+        bands = np.asarray(bands, dtype=np.intp)
+        if len(bands) and np.all(np.diff(bands) == 1):
+            return region[..., bands[0]:bands[-1] + 1]
+
+        return region[..., bands]
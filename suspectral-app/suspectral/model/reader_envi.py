@@ -0,0 +1,274 @@
+import os
+import threading
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from spectral.io.envi import gen_params
+
+from suspectral.model.envi_header import EnviHeader, EnviHeaderInvalid
+from suspectral.model.positional_file import PositionalFile
+from suspectral.model.reader import HypercubeDataMissing, HypercubeHeaderInvalid, Reader
+
+
+class EnviReader(Reader):
+    """
+    Reads hypercubes stored in ENVI format.
+
+    Opening the reader only reads the header (see `EnviHeader`), and checks that the data
+    file exists. The data file itself is opened on the first access to the data.
+
+    The data is read with positional reads (see `PositionalFile`), so any number of threads
+    may read it at once, such as a synthesis running in the background while the user
+    inspects pixels. Each read gathers the runs of samples it needs, which are contiguous
+    along the last axis of the interleave, and reads runs separated by small gaps through
+    in a single request, so that a region is read with as few requests as possible.
+
+    Parameters
+    ----------
+    path : str
+        Path to the ENVI header file.
+
+    Raises
+    ------
+    HypercubeDataMissing
+        If the ENVI data file cannot be found.
+    HypercubeHeaderInvalid
+        If the ENVI header is invalid or missing required parameters.
+    """
+
+    NAME = "ENVI"
+    EXTENSIONS = (".hdr",)
+
+    REQUIRED_FIELDS = ("lines", "samples", "bands", "data type", "interleave", "byte order")
+    """Header fields without which the layout of the data file is unknown."""
+
+    DATA_EXTENSIONS = ("", "img", "dat", "sli", "hyspex", "raw", "bin")
+    """Extensions of the data file next to the header, tried in order after the interleave."""
+
+    GAP_BYTES = 16 * 1024
+    """Largest gap between the runs of a read which is read through rather than skipped."""
+
+    MAX_MERGED_BYTES = 64 * 1024 * 1024
+    """Largest request made by merging the runs of several rows or bands."""
+
+    _FILE_AXES = {"bip": (0, 1, 2), "bil": (0, 2, 1), "bsq": (2, 0, 1)}
+
+    def __init__(self, path: str):
+        super().__init__(path)
+
+        try:
+            self._metadata = EnviHeader.read(path)
+        except EnviHeaderInvalid as e:
+            raise HypercubeHeaderInvalid(e)
+
+        missing = [field for field in self.REQUIRED_FIELDS if field not in self._metadata]
+        if missing:
+            raise HypercubeHeaderInvalid(f"Header is missing required parameters: {', '.join(missing)}.")
+
+        try:
+            self._params = gen_params(self._metadata)
+            self._scale_factor = float(self._metadata.get("reflectance scale factor", 1.0))
+        except (KeyError, TypeError, ValueError) as e:
+            raise HypercubeHeaderInvalid(e)
+
+        self._params.filename = self._find_data_file(path, str(self._metadata["interleave"]))
+        self._interleave = str(self._metadata["interleave"]).lower()
+
+        # The axes of (rows, columns, bands) in the order they are stored in the file.
+        self._file_axes = self._FILE_AXES.get(self._interleave, self._FILE_AXES["bsq"])
+        self._file_dtype = np.dtype(self._params.dtype)
+        self._file_shape = tuple(self.shape[axis] for axis in self._file_axes)
+
+        self._memmap: np.ndarray | None = None
+        self._file: PositionalFile | None = None
+        self._file_lock = threading.Lock()
+
+    @property
+    def data_path(self) -> str:
+        """Path to the ENVI data file."""
+        return self._params.filename
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        """Metadata extracted from the ENVI header, as a dictionary."""
+        return self._metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._params.nrows, self._params.ncols, self._params.nbands
+
+    @property
+    def dtype(self) -> np.dtype:
+        # Scaled samples are divided by the scale factor as they are read.
+        if self._scale_factor != 1:
+            return np.dtype(np.float64)
+
+        return np.dtype(self._params.dtype).newbyteorder("=")
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        try:
+            return np.asarray(self._metadata["wavelength"], dtype=np.float64)
+        except (KeyError, ValueError):
+            return None
+
+    @property
+    def wavelengths_unit(self) -> str | None:
+        return self._metadata.get("wavelength unit", None)
+
+    @property
+    def default_bands(self) -> tuple[int, int, int] | None:
+        try:
+            red, green, blue = map(int, self._metadata["default bands"])
+            return red, green, blue
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        return self._read_selection(
+            np.arange(*rows, dtype=np.intp),
+            np.arange(*cols, dtype=np.intp),
+            None if bands is None else np.asarray(bands, dtype=np.intp),
+        )
+
+    def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
+        return self._read_selection(
+            np.asarray(rows, dtype=np.intp),
+            np.asarray(cols, dtype=np.intp),
+            None if bands is None else np.asarray(bands, dtype=np.intp),
+        )
+
+    def read_pixel(self, row: int, col: int) -> np.ndarray:
+        return self.read_pixels(np.array([row]), np.array([col]))[0]
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        # Memory maps have no shared position either, and gather scattered pixels best.
+        spectra = self._get_memmap()[rows, cols].astype(self.dtype)
+        if self._scale_factor != 1:
+            spectra /= self._scale_factor
+
+        return spectra
+
+    def _read_selection(self, rows: np.ndarray, cols: np.ndarray, bands: np.ndarray | None) -> np.ndarray:
+        selection, inverses = [], []
+        for indices, size in zip((rows, cols, bands), self.shape):
+            if indices is None:
+                indices = np.arange(size, dtype=np.intp)
+            if indices.size and (indices.min() < 0 or indices.max() >= size):
+                raise IndexError(f"Indices out of range for an axis of size {size}.")
+
+            # Reads go forward through the file, so they need sorted indices without duplicates.
+            if indices.size > 1 and np.any(np.diff(indices) <= 0):
+                indices, inverse = np.unique(indices, return_inverse=True)
+                inverses.append(inverse)
+            else:
+                inverses.append(slice(None))
+
+            selection.append(indices)
+
+        data = self._read(*selection)
+        if not all(isinstance(inverse, slice) for inverse in inverses):
+            data = data[np.ix_(*[
+                np.arange(len(indices)) if isinstance(inverse, slice) else inverse
+                for indices, inverse in zip(selection, inverses)
+            ])]
+
+        return data
+
+    def _read(self, rows: np.ndarray, cols: np.ndarray, bands: np.ndarray) -> np.ndarray:
+        data = np.empty((len(rows), len(cols), len(bands)), dtype=self.dtype)
+        if data.size == 0:
+            return data
+
+        file = self._get_file()
+        s0, s1, s2 = ((rows, cols, bands)[axis] for axis in self._file_axes)
+        _, f1, f2 = self._file_shape
+        item = self._file_dtype.itemsize
+        gap, limit = self.GAP_BYTES // item, self.MAX_MERGED_BYTES // item
+
+        # The data is filled in through a view of it in the order of the file.
+        target = data.transpose(self._file_axes)
+        lo2, hi2 = int(s2[0]), int(s2[-1]) + 1
+        for c, d in self._split(s1, f2, hi2 - lo2, gap, limit):
+            lo1, hi1 = int(s1[c]), int(s1[d - 1]) + 1
+            run = (hi1 - lo1 - 1) * f2 + hi2 - lo2
+
+            for a, b in self._split(s0, f1 * f2, run, gap, limit):
+                lo0, hi0 = int(s0[a]), int(s0[b - 1]) + 1
+                start = (lo0 * f1 + lo1) * f2 + lo2
+                raw = np.empty(((hi0 - lo0 - 1) * f1 * f2) + run, dtype=self._file_dtype)
+                file.read_into(raw, self._params.offset + start * item)
+
+                block = as_strided(
+                    raw,
+                    shape=(hi0 - lo0, hi1 - lo1, hi2 - lo2),
+                    strides=(f1 * f2 * item, f2 * item, item),
+                    writeable=False,
+                )
+                block = block[self._relative(s0[a:b], lo0)]
+                block = block[:, self._relative(s1[c:d], lo1)]
+                target[a:b, c:d] = block[:, :, self._relative(s2, lo2)]
+
+        if self._scale_factor != 1:
+            data /= self._scale_factor
+
+        return data
+
+    @staticmethod
+    def _split(indices: np.ndarray, stride: int, length: int, gap: int, limit: int) -> list[tuple[int, int]]:
+        # Groups the runs of `length` samples which start every `stride` samples per index,
+        # as long as the gaps between them, and the whole group, are small enough to read through.
+        starts = indices.astype(np.int64) * stride
+        ends = starts + length
+        bounds = [0, *(np.flatnonzero(starts[1:] - ends[:-1] > gap) + 1).tolist(), len(indices)]
+
+        groups = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            while start < end:
+                split = start + int(np.searchsorted(ends[start:end], starts[start] + limit, side="right"))
+                split = min(max(split, start + 1), end)
+                groups.append((start, split))
+                start = split
+
+        return groups
+
+    @staticmethod
+    def _relative(indices: np.ndarray, start: int) -> slice | np.ndarray:
+        indices = indices - start
+        if indices[-1] - indices[0] + 1 == len(indices):
+            return slice(int(indices[0]), int(indices[-1]) + 1)
+
+        return indices
+
+    def _get_memmap(self) -> np.ndarray:
+        with self._file_lock:
+            if self._memmap is None:
+                memmap = np.memmap(
+                    self.data_path,
+                    dtype=self._file_dtype,
+                    mode="r",
+                    offset=self._params.offset,
+                    shape=self._file_shape,
+                )
+                self._memmap = memmap.transpose(np.argsort(self._file_axes))
+
+            return self._memmap
+
+    def _get_file(self) -> PositionalFile:
+        with self._file_lock:
+            if self._file is None:
+                self._file = PositionalFile(self.data_path)
+
+            return self._file
+
+    @classmethod
+    def _find_data_file(cls, path: str, interleave: str) -> str:
+        stem, extension = os.path.splitext(path)
+        if extension.lower() == ".hdr":
+            extensions = [cls.DATA_EXTENSIONS[0], interleave.lower(), *cls.DATA_EXTENSIONS[1:]]
+            for candidate in extensions + [it.upper() for it in extensions if it]:
+                data_path = f"{stem}.{candidate}" if candidate else stem
+                if os.path.isfile(data_path):
+                    return data_path
+
+        raise HypercubeDataMissing(f"Unable to find the ENVI data file for the header file {path}.")
@@ -0,0 +1,169 @@
+import numpy as np
+
+from suspectral.model.reader import HypercubeFormatUnsupported, HypercubeHeaderInvalid, Reader
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+class Hdf5Reader(Reader):
+    """
+    Reads hypercubes stored in HDF5 files, including MATLAB `.mat` files of version 7.3.
+
+    The hypercube is the largest three-dimensional dataset of numbers in the file, and is
+    read directly from it, one selection at a time, so that HDF5 only decompresses the
+    chunks which are needed. MATLAB stores its arrays in column-major order, so the axes
+    of datasets written by it are reversed first. The bands are along the axis matching
+    the length of a dataset of wavelengths, if the file has one, or else the shortest one.
+
+    Reading HDF5 files requires the optional `h5py` package.
+
+    Parameters
+    ----------
+    path : str
+        Path to the HDF5 file.
+
+    Raises
+    ------
+    HypercubeFormatUnsupported
+        If `h5py` is not installed.
+    HypercubeHeaderInvalid
+        If the file is not an HDF5 file, or holds no three-dimensional dataset of numbers.
+    """
+
+    NAME = "HDF5"
+    EXTENSIONS = (".h5", ".hdf5", ".he5")
+
+    WAVELENGTH_NAMES = ("bands", "wavelength", "wavelengths", "wl", "lambda")
+    """Names of the datasets which may hold the band center wavelengths, in order of preference."""
+
+    SIGNATURE = b"\x89HDF\r\n\x1a\n"
+    """Bytes with which HDF5 files start, possibly after a user block (such as the MATLAB header)."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        if h5py is None:
+            raise HypercubeFormatUnsupported("Reading HDF5 files requires the h5py package.")
+
+        try:
+            self._file = h5py.File(path, "r")
+        except OSError as e:
+            raise HypercubeHeaderInvalid(e)
+
+        cubes, vectors = {}, {}
+
+        def visit(name, item):
+            if isinstance(item, h5py.Dataset) and np.issubdtype(item.dtype, np.number):
+                if item.ndim == 3:
+                    cubes[name] = item
+                elif item.ndim <= 2 and max(item.shape, default=0) == item.size:
+                    vectors[name.rsplit("/", 1)[-1].lower()] = item
+
+        self._file.visititems(visit)
+        if not cubes:
+            raise HypercubeHeaderInvalid("The file holds no three-dimensional datasets.")
+
+        self._dataset = max(cubes.values(), key=lambda it: it.size)
+        matlab = "MATLAB_class" in self._dataset.attrs
+
+        wavelengths = next((vectors[it] for it in self.WAVELENGTH_NAMES if it in vectors), None)
+        wavelengths = None if wavelengths is None else wavelengths[()].ravel().astype(np.float64)
+
+        # The axes are found as the user sees them, and mapped back onto those of the dataset.
+        shape = self._dataset.shape[::-1] if matlab else self._dataset.shape
+        band_axis = self.find_band_axis(shape, None if wavelengths is None else len(wavelengths))
+        axes = [axis for axis in range(3) if axis != band_axis] + [band_axis]
+        self._axes = tuple(2 - axis for axis in axes) if matlab else tuple(axes)
+
+        self._shape = tuple(self._dataset.shape[axis] for axis in self._axes)
+        self._wavelengths = wavelengths if wavelengths is not None and len(wavelengths) == self._shape[2] else None
+        self._metadata = {
+            "file type": "MATLAB" if matlab else self.NAME,
+            "dataset": self._dataset.name,
+            "lines": self._shape[0],
+            "samples": self._shape[1],
+            "bands": self._shape[2],
+            "data type": str(self._dataset.dtype),
+        }
+
+        if self._dataset.chunks is not None:
+            self._metadata["chunks"] = list(self._dataset.chunks)
+        if self._dataset.compression is not None:
+            self._metadata["compression"] = self._dataset.compression
+
+    @classmethod
+    def is_hdf5(cls, path: str) -> bool:
+        """
+        Check whether the file at the given path is an HDF5 file, without requiring `h5py`.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file to check.
+
+        Returns
+        -------
+        bool
+            Whether the file starts with the HDF5 signature, at any of the offsets allowed for it.
+        """
+        try:
+            with open(path, "rb") as file:
+                offset = 0
+                while True:
+                    file.seek(offset)
+                    signature = file.read(len(cls.SIGNATURE))
+                    if signature == cls.SIGNATURE:
+                        return True
+                    if len(signature) < len(cls.SIGNATURE):
+                        return False
+
+                    offset = offset * 2 if offset else 512
+        except OSError:
+            return False
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return self._metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dataset.dtype.newbyteorder("=")
+
+    @property
+    def chunks(self) -> tuple[int, int, int] | None:
+        if self._dataset.chunks is None:
+            return None
+
+        return tuple(self._dataset.chunks[axis] for axis in self._axes)
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        return self._wavelengths
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        selection = [slice(None)] * 3
+        selection[self._axes[0]] = slice(*rows)
+        selection[self._axes[1]] = slice(*cols)
+
+        # HDF5 only selects increasing indices, so the bands are put in order afterward.
+        inverse = None
+        if bands is not None:
+            unique, inverse = np.unique(np.asarray(bands, dtype=np.intp), return_inverse=True)
+            if len(unique) == 0:
+                return np.empty((rows[1] - rows[0], cols[1] - cols[0], 0), dtype=self.dtype)
+            if unique[-1] - unique[0] + 1 == len(unique):
+                selection[self._axes[2]] = slice(int(unique[0]), int(unique[-1]) + 1)
+            else:
+                selection[self._axes[2]] = unique.tolist()
+
+        region = np.transpose(self._dataset[tuple(selection)], self._axes)
+        if inverse is not None:
+            region = region[..., inverse]
+
+        return np.asarray(region, dtype=self.dtype)
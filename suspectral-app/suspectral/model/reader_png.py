@@ -0,0 +1,148 @@
+import re
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtGui import QImage, QImageReader
+
+from suspectral.model.memory_cache import MemoryCache
+from suspectral.model.reader import HypercubeHeaderInvalid, Reader
+
+
+class PngStackReader(Reader):
+    """
+    Reads hypercubes stored as stacks of grayscale PNG images, one image per band.
+
+    The bands are the images next to the opened one whose names only differ from its name
+    in the number at their end, in the order of those numbers, such as the `balloons_ms_01.png`
+    through `balloons_ms_31.png` of the CAVE dataset. Opening the stack only reads the
+    headers of the images. The images are decoded on demand, a band at a time, and the
+    decoded bands are kept in the memory cache shared by all open hypercubes (see
+    `MemoryCache`), until they are evicted to make room for more recently used data.
+
+    Parameters
+    ----------
+    path : str
+        Path to any of the images of the stack.
+
+    Raises
+    ------
+    HypercubeHeaderInvalid
+        If any of the images cannot be read, or the images differ in size.
+    """
+
+    NAME = "PNG Stack"
+    EXTENSIONS = (".png",)
+
+    _NUMBERED = re.compile(r"^(.*?)(\d+)$")
+    _DEEP_FORMATS = (
+        QImage.Format.Format_Grayscale16,
+        QImage.Format.Format_RGBX64,
+        QImage.Format.Format_RGBA64,
+        QImage.Format.Format_RGBA64_Premultiplied,
+    )
+
+    def __init__(self, path: str):
+        super().__init__(path)
+
+        path = Path(path)
+        match = self._NUMBERED.match(path.stem)
+        if match is None:
+            self._name, self._bands = path.stem, [path]
+        else:
+            prefix = match.group(1)
+            numbered = {}
+            for sibling in path.parent.iterdir():
+                other = self._NUMBERED.match(sibling.stem)
+                if other and other.group(1) == prefix and sibling.suffix.lower() == path.suffix.lower():
+                    numbered[sibling] = int(other.group(2))
+
+            self._name = prefix.rstrip("_- .") or path.stem
+            self._bands = sorted(numbered, key=numbered.get)
+
+        sizes, depths = set(), set()
+        for band in self._bands:
+            reader = QImageReader(str(band))
+            if not reader.canRead():
+                raise HypercubeHeaderInvalid(f"Unable to read the image {band}: {reader.errorString()}.")
+
+            sizes.add((reader.size().height(), reader.size().width()))
+            depths.add(reader.imageFormat() in self._DEEP_FORMATS)
+
+        if len(sizes) > 1:
+            raise HypercubeHeaderInvalid("The images of the stack differ in size.")
+
+        self._shape = *sizes.pop(), len(self._bands)
+        self._dtype = np.dtype(np.uint16 if any(depths) else np.uint8)
+        self._metadata = {
+            "file type": self.NAME,
+            "lines": self._shape[0],
+            "samples": self._shape[1],
+            "bands": self._shape[2],
+            "data type": str(self._dtype),
+            "band names": [band.name for band in self._bands],
+        }
+
+        self._cache = MemoryCache.shared()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return self._metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def chunks(self) -> tuple[int, int, int] | None:
+        return self._shape[0], self._shape[1], 1
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        bands = range(self._shape[2]) if bands is None else bands
+        region = np.empty((rows[1] - rows[0], cols[1] - cols[0], len(bands)), dtype=self._dtype)
+        for index, band in enumerate(bands):
+            region[..., index] = self._read_band(band)[rows[0]:rows[1], cols[0]:cols[1]]
+
+        return region
+
+    def read_pixel(self, row: int, col: int) -> np.ndarray:
+        return self.read_pixels(np.array([row]), np.array([col]))[0]
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        spectra = np.empty((len(rows), self._shape[2]), dtype=self._dtype)
+        for band in range(self._shape[2]):
+            spectra[:, band] = self._read_band(band)[rows, cols]
+
+        return spectra
+
+    def _read_band(self, band: int) -> np.ndarray:
+        image = self._cache.get(self, band)
+        if image is None:
+            # Decoding is slow, so it is not locked, even if a band may then be decoded twice.
+            image = self._decode(self._bands[band])
+            self._cache.put(self, band, image)
+
+        return image
+
+    def _decode(self, path: Path) -> np.ndarray:
+        image = QImageReader(str(path)).read()
+        if image.isNull():
+            raise OSError(f"Unable to decode the image {path}.")
+
+        if self._dtype == np.uint16:
+            image = image.convertToFormat(QImage.Format.Format_Grayscale16)
+        else:
+            image = image.convertToFormat(QImage.Format.Format_Grayscale8)
+
+        height, width = self._shape[0], self._shape[1]
+        pixels = np.frombuffer(image.constBits(), dtype=self._dtype)
+        pixels = pixels.reshape(height, image.bytesPerLine() // self._dtype.itemsize)[:, :width].copy()
+        pixels.flags.writeable = False
+        return pixels
@@ -0,0 +1,140 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from suspectral.model.reader import Reader
+
+if TYPE_CHECKING:
+    from suspectral.model.hypercube import Hypercube
+
+
+class ResampleReader(Reader):
+    """
+    Reads a lazy view of another hypercube, resampled onto other wavelengths.
+
+    Each spectrum is interpolated with a cubic spline through its samples. On fixed source
+    and target wavelengths the interpolation is linear in the samples, so it is precomputed
+    once as a matrix (see `operator`), and each read of the view is a single product of
+    the data read from the parent with it, rather than a spline fitted per pixel.
+
+    Parameters
+    ----------
+    parent : Hypercube
+        The hypercube to resample, which must have wavelengths.
+    wavelengths : numpy.ndarray
+        The wavelengths to resample onto, in the unit of the parent. Wavelengths beyond
+        those of the parent are extrapolated.
+
+    Raises
+    ------
+    ValueError
+        If the parent has no wavelengths, or if there are no wavelengths to resample onto.
+    """
+
+    def __init__(self, parent: "Hypercube", wavelengths: np.ndarray):
+        super().__init__(parent.path)
+        if parent.band_wavelengths is None:
+            raise ValueError("Only hypercubes with wavelengths can be resampled.")
+
+        wavelengths = np.asarray(wavelengths, dtype=np.float64).ravel()
+        if len(wavelengths) == 0:
+            raise ValueError("Expected at least one wavelength to resample onto.")
+
+        self._parent = parent
+        self._wavelengths = wavelengths
+        self._operator = self.operator(parent.band_wavelengths, wavelengths)
+        self._dtype = np.result_type(parent.dtype, np.float32)
+        self._metadata = {
+            "file type": "Resampled",
+            "source": parent.path,
+            "lines": parent.num_rows,
+            "samples": parent.num_cols,
+            "bands": len(wavelengths),
+            "data type": str(self._dtype),
+            "wavelength": wavelengths.tolist(),
+            "wavelength units": parent.wavelengths_unit,
+        }
+
+    @staticmethod
+    def operator(source: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """
+        Compute the matrix which interpolates spectra sampled at the source wavelengths onto
+        the target wavelengths with a (not-a-knot) cubic spline.
+
+        Parameters
+        ----------
+        source : numpy.ndarray
+            The distinct wavelengths the spectra are sampled at, in any order.
+        target : numpy.ndarray
+            The wavelengths to interpolate the spectra at.
+
+        Returns
+        -------
+        numpy.ndarray
+            The matrix of shape (target, source), so that spectra of shape (..., source)
+            multiplied by its transpose are the spectra interpolated at the target wavelengths.
+        """
+        source = np.asarray(source, dtype=np.float64)
+        order = np.argsort(source)
+        return CubicSpline(source[order], np.eye(len(source))[order])(np.asarray(target, dtype=np.float64))
+
+    @property
+    def parent(self) -> "Hypercube":
+        """The hypercube being resampled."""
+        return self._parent
+
+    @property
+    def name(self) -> str:
+        return self._parent.name
+
+    @property
+    def data_path(self) -> str:
+        return self._parent.data_path
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return self._metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._parent.num_rows, self._parent.num_cols, len(self._wavelengths)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        return self._wavelengths.copy()
+
+    @property
+    def wavelengths_unit(self) -> str | None:
+        return self._parent.wavelengths_unit
+
+    @property
+    def default_bands(self) -> tuple[int, int, int] | None:
+        # The resampled bands closest to the default bands of the parent.
+        parent_wavelengths = self._parent.band_wavelengths
+        red, green, blue = (
+            int(np.argmin(np.abs(self._wavelengths - parent_wavelengths[band])))
+            for band in self._parent.default_bands
+        )
+        return red, green, blue
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        return self._resample(self._parent.read_subregion(rows, cols), bands)
+
+    def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
+        return self._resample(self._parent.read_subimage(rows, cols), bands)
+
+    def read_pixel(self, row: int, col: int) -> np.ndarray:
+        return self._resample(self._parent.read_pixel(row, col), None)
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        points = np.column_stack([rows, cols])
+        return self._resample(self._parent.read_pixels(points), None)
+
+    def _resample(self, data: np.ndarray, bands) -> np.ndarray:
+        operator = self._operator if bands is None else self._operator[np.asarray(bands, dtype=np.intp)]
+        return (data.astype(self._dtype, copy=False) @ operator.T.astype(self._dtype)).astype(self._dtype, copy=False)
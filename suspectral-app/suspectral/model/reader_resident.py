@@ -0,0 +1,101 @@
+import numpy as np
+
+from suspectral.model.reader import Reader
+
+
+class ResidentReader(Reader):
+    """
+    Reads a hypercube which has been loaded into memory in its entirety.
+
+    Stands in for the reader of the file the hypercube was loaded from, which still
+    describes it, while the data is read from one contiguous array of shape
+    (rows, columns, bands). Reads of contiguous regions and ranges of bands are views
+    into the array rather than copies, so they are read-only.
+
+    Parameters
+    ----------
+    source : Reader
+        The reader of the file the data was loaded from.
+    data : numpy.ndarray
+        The whole hypercube, of the shape and data type of the source.
+
+    Raises
+    ------
+    ValueError
+        If the data does not match the shape of the source.
+    """
+
+    def __init__(self, source: Reader, data: np.ndarray):
+        super().__init__(source.path)
+        if data.shape != tuple(source.shape):
+            raise ValueError(f"Expected data of shape {tuple(source.shape)}, got {data.shape}.")
+
+        self._source = source
+        self._data = data
+        self._data.flags.writeable = False
+
+    @property
+    def source(self) -> Reader:
+        """The reader of the file the data was loaded from."""
+        return self._source
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes taken up by the data in memory."""
+        return self._data.nbytes
+
+    @property
+    def name(self) -> str:
+        return self._source.name
+
+    @property
+    def data_path(self) -> str:
+        return self._source.data_path
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return self._source.metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._data.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._data.dtype
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        return self._source.wavelengths
+
+    @property
+    def wavelengths_unit(self) -> str | None:
+        return self._source.wavelengths_unit
+
+    @property
+    def default_bands(self) -> tuple[int, int, int] | None:
+        return self._source.default_bands
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        return self._take_bands(self._data[rows[0]:rows[1], cols[0]:cols[1]], bands)
+
+    def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
+        region = self._data[np.ix_(np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))]
+        return self._take_bands(region, bands)
+
+    def read_pixel(self, row: int, col: int) -> np.ndarray:
+        return self._data[row, col]
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return self._data[rows, cols]
+
+    @staticmethod
+    def _take_bands(region: np.ndarray, bands) -> np.ndarray:
+        if bands is None:
+            return region
+
+        bands = np.asarray(bands, dtype=np.intp)
+        if len(bands) and np.all(np.diff(bands) == 1):
+            return region[..., bands[0]:bands[-1] + 1]
+
+        return region[..., bands]
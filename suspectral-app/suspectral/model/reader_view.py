@@ -0,0 +1,245 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from suspectral.model.reader import Reader
+
+if TYPE_CHECKING:
+    from suspectral.model.hypercube import Hypercube
+
+
+class ViewReader(Reader):
+    """
+    Reads a lazy view of another hypercube, restricted to a window and optionally binned.
+
+    The view selects a range of rows and columns and any bands of its parent, and then
+    averages blocks of `binning` rows, columns and bands into single samples. Nothing is
+    read up front: each read is translated into reads of the parent, in strips bounded by
+    `MAX_READ_BYTES`, which are binned as they arrive. Since the parent may be a view as
+    well, views compose.
+
+    Parameters
+    ----------
+    parent : Hypercube
+        The hypercube to view.
+    rows : tuple of int or slice, optional
+        Start and end row indices (inclusive, exclusive), or a slice of rows. Defaults to all rows.
+    cols : tuple of int or slice, optional
+        Start and end column indices (inclusive, exclusive), or a slice of columns. Defaults to all columns.
+    bands : list or tuple or range or slice, optional
+        Bands to view, in order. Defaults to all bands.
+    binning : tuple of int, optional
+        The number of rows, columns and bands averaged into each sample of the view.
+        Blocks at the ends of the window which are cut short are averaged as they are.
+
+    Raises
+    ------
+    IndexError
+        If the selection exceeds the bounds of the parent.
+    ValueError
+        If the binning is not made up of three positive integers.
+    """
+
+    MAX_READ_BYTES = 64 * 1024 ** 2
+    """Upper bound on the size of a single read of the parent."""
+
+    def __init__(self,
+                 parent: "Hypercube",
+                 rows: tuple[int, int] | slice | None = None,
+                 cols: tuple[int, int] | slice | None = None,
+                 bands=None,
+                 binning: tuple[int, int, int] = (1, 1, 1)):
+        super().__init__(parent.path)
+
+        binning = tuple(int(factor) for factor in binning)
+        if len(binning) != 3 or min(binning) < 1:
+            raise ValueError(f"Expected three positive binning factors, got {binning}.")
+
+        self._parent = parent
+        self._binning = binning
+        self._selection = (
+            self._select_range(rows, parent.num_rows),
+            self._select_range(cols, parent.num_cols),
+            self._select_bands(bands, parent.num_bands),
+        )
+        self._shape = tuple(-(-len(indices) // factor) for indices, factor in zip(self._selection, binning))
+
+        if binning == (1, 1, 1):
+            self._dtype = parent.dtype
+        else:
+            self._dtype = np.result_type(parent.dtype, np.float32)
+
+        self._metadata = {
+            "file type": "View",
+            "source": parent.path,
+            "lines": self._shape[0],
+            "samples": self._shape[1],
+            "bands": self._shape[2],
+            "data type": str(self._dtype),
+            "binning": list(binning),
+        }
+
+    @property
+    def parent(self) -> "Hypercube":
+        """The hypercube being viewed."""
+        return self._parent
+
+    @property
+    def binning(self) -> tuple[int, int, int]:
+        """The number of rows, columns and bands averaged into each sample of the view."""
+        return self._binning
+
+    @property
+    def name(self) -> str:
+        return self._parent.name
+
+    @property
+    def data_path(self) -> str:
+        return self._parent.data_path
+
+    @property
+    def metadata(self) -> dict[str, object]:
+        return self._metadata
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def wavelengths(self) -> np.ndarray | None:
+        wavelengths = self._parent.band_wavelengths
+        if wavelengths is None:
+            return None
+
+        wavelengths = wavelengths[self._selection[2]]
+        return self._bin(wavelengths.astype(np.float64), 0, np.arange(self._shape[2]), 2)
+
+    @property
+    def wavelengths_unit(self) -> str | None:
+        return self._parent.wavelengths_unit
+
+    @property
+    def default_bands(self) -> tuple[int, int, int] | None:
+        bands = []
+        for band in self._parent.default_bands:
+            positions = np.flatnonzero(self._selection[2] == band)
+            if len(positions) == 0:
+                return None
+
+            bands.append(int(positions[0]) // self._binning[2])
+
+        red, green, blue = bands
+        return red, green, blue
+
+    def read_subregion(self, rows: tuple[int, int], cols: tuple[int, int], bands=None) -> np.ndarray:
+        return self._read(
+            np.arange(*rows, dtype=np.intp),
+            np.arange(*cols, dtype=np.intp),
+            None if bands is None else np.asarray(bands, dtype=np.intp),
+        )
+
+    def read_subimage(self, rows, cols, bands=None) -> np.ndarray:
+        return self._read(
+            np.asarray(rows, dtype=np.intp),
+            np.asarray(cols, dtype=np.intp),
+            None if bands is None else np.asarray(bands, dtype=np.intp),
+        )
+
+    def _read(self, rows: np.ndarray, cols: np.ndarray, bands: np.ndarray | None) -> np.ndarray:
+        bands = np.arange(self._shape[2], dtype=np.intp) if bands is None else bands
+        for indices, size in zip((rows, cols, bands), self._shape):
+            if indices.size and (indices.min() < 0 or indices.max() >= size):
+                raise IndexError(f"Indices out of range for an axis of size {size}.")
+
+        data = np.empty((len(rows), len(cols), len(bands)), dtype=self._dtype)
+        if data.size == 0:
+            return data
+
+        parent_cols = self._expand(1, cols)
+        parent_bands = self._expand(2, bands)
+        if np.array_equal(parent_bands, np.arange(self._parent.num_bands)):
+            parent_bands = None
+
+        # Rows are read in strips, so that binning does not multiply the memory footprint.
+        num_bands = self._parent.num_bands if parent_bands is None else len(parent_bands)
+        row_bytes = len(parent_cols) * num_bands * self._parent.bytes_per_sample * self._binning[0]
+        strip = max(1, self.MAX_READ_BYTES // max(1, row_bytes))
+
+        for start in range(0, len(rows), strip):
+            parent_rows = self._expand(0, rows[start:start + strip])
+            if self._is_range(parent_rows) and self._is_range(parent_cols):
+                block = self._parent.read_subregion(
+                    (int(parent_rows[0]), int(parent_rows[-1]) + 1),
+                    (int(parent_cols[0]), int(parent_cols[-1]) + 1),
+                    parent_bands,
+                )
+            else:
+                block = self._parent.read_subimage(parent_rows, parent_cols, parent_bands)
+
+            block = self._bin(block, 0, rows[start:start + strip], 0)
+            block = self._bin(block, 1, cols, 1)
+            data[start:start + strip] = self._bin(block, 2, bands, 2)
+
+        return data
+
+    def _expand(self, axis: int, indices: np.ndarray) -> np.ndarray:
+        # The indices of the parent covered by the given indices of the view, block after block.
+        selection, factor = self._selection[axis], self._binning[axis]
+        if factor == 1:
+            return selection[indices]
+
+        starts = indices * factor
+        counts = np.minimum(starts + factor, len(selection)) - starts
+        offsets = np.cumsum(counts) - counts
+        positions = np.arange(counts.sum()) - np.repeat(offsets - starts, counts)
+        return selection[positions]
+
+    def _bin(self, data: np.ndarray, axis: int, indices: np.ndarray, selection_axis: int) -> np.ndarray:
+        # Averages the consecutive blocks which `_expand` produced for the given indices.
+        factor = self._binning[selection_axis]
+        if factor == 1:
+            return data
+
+        starts = indices * factor
+        counts = np.minimum(starts + factor, len(self._selection[selection_axis])) - starts
+        offsets = np.cumsum(counts) - counts
+
+        shape = [1] * data.ndim
+        shape[axis] = len(counts)
+        sums = np.add.reduceat(data.astype(self._dtype, copy=False), offsets, axis=axis)
+        return sums / counts.reshape(shape).astype(self._dtype)
+
+    @staticmethod
+    def _is_range(indices: np.ndarray) -> bool:
+        return indices[-1] - indices[0] + 1 == len(indices) and bool(np.all(np.diff(indices) == 1))
+
+    @staticmethod
+    def _select_range(selection: tuple[int, int] | slice | None, size: int) -> np.ndarray:
+        if selection is None:
+            return np.arange(size, dtype=np.intp)
+
+        if not isinstance(selection, slice):
+            start, end = selection
+            if not 0 <= start <= end <= size:
+                raise IndexError(f"The range {start}:{end} exceeds an axis of size {size}.")
+            selection = slice(start, end)
+
+        return np.arange(size, dtype=np.intp)[selection]
+
+    @staticmethod
+    def _select_bands(selection, size: int) -> np.ndarray:
+        if selection is None:
+            return np.arange(size, dtype=np.intp)
+
+        if isinstance(selection, slice):
+            return np.arange(size, dtype=np.intp)[selection]
+
+        selection = np.asarray(selection, dtype=np.intp)
+        if selection.size and (selection.min() < 0 or selection.max() >= size):
+            raise IndexError(f"Bands out of range for {size} bands.")
+
+        return selection
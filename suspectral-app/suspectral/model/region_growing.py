@@ -0,0 +1,200 @@
+import math
+
+import numpy as np
+import scipy.ndimage
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.selection_mask import SelectionMask
+
+
+class RegionGrowing:
+    """
+    Grows a region of spectrally similar, spatially connected pixels from a seed pixel.
+
+    A pixel is similar to the seed if the spectral angle between them is within the
+    tolerance, which makes the similarity insensitive to differences in illumination.
+    Pixels are connected through their edges. Similarity is evaluated lazily: the
+    hypercube is divided into square tiles, and a tile is only read once the region
+    reaches its border. On the first visit, its pixels are compared with the seed and
+    labelled into connected components; the region then takes over every component
+    entered from a neighbouring tile, and spreads through the pixels along the edges it
+    shares with its own neighbours. Since regions tend to be small, only the handful of
+    tiles around them are ever read, rather than the whole hypercube. Once every similar
+    pixel along the border of a tile is within the region, nothing can enter the tile
+    anymore, so its labels are dropped and only its part of the region is kept.
+
+    Growing can be stopped from another thread with `stop`.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to select from.
+    tolerance : float, optional
+        The maximum spectral angle between a pixel and the seed, in degrees.
+    tile_size : int, optional
+        The number of rows and columns of the tiles the hypercube is read in.
+    """
+
+    TOLERANCE = 5.0
+    TILE_SIZE = 64
+
+    def __init__(self, hypercube: Hypercube, tolerance: float = TOLERANCE, tile_size: int = TILE_SIZE):
+        if not 0 <= tolerance <= 180:
+            raise ValueError(f"Tolerance must be between 0 and 180 degrees, got {tolerance}.")
+        if tile_size < 1:
+            raise ValueError(f"Tile size must be positive, got {tile_size}.")
+
+        self._hypercube = hypercube
+        self._tolerance = tolerance
+        self._tile_size = tile_size
+        self._tiles_read = 0
+        self._stopped = False
+
+    @property
+    def tolerance(self) -> float:
+        """The maximum spectral angle between a pixel and the seed, in degrees."""
+        return self._tolerance
+
+    @property
+    def tiles_read(self) -> int:
+        """The number of tiles read from the hypercube by the last call to `grow`."""
+        return self._tiles_read
+
+    def stop(self):
+        """Requests that growing ends early, now or in any later call to `grow`."""
+        self._stopped = True
+
+    def grow(self, row: int, col: int) -> SelectionMask:
+        """
+        Grow the region of pixels similar to and connected with the given seed pixel.
+
+        Parameters
+        ----------
+        row : int
+            The row of the seed pixel.
+        col : int
+            The column of the seed pixel.
+
+        Returns
+        -------
+        SelectionMask
+            The mask of the region, which is empty if the seed has non-finite values
+            or is entirely zero, since its direction is undefined then. If growing has
+            been stopped, only the part of the region grown so far.
+        """
+        self._tiles_read = 0
+
+        seed = np.asarray(self._hypercube.read_pixel(row, col), dtype=np.float64)
+        norm = np.linalg.norm(seed)
+        if not np.isfinite(norm) or norm == 0:
+            return SelectionMask(np.zeros((0, 0), dtype=bool), row, col)
+
+        size = self._tile_size
+        direction = seed / norm
+        threshold = math.cos(math.radians(self._tolerance))
+
+        # Labelled components and the part of them within the region, for every visited tile.
+        # The labels of finished tiles are None.
+        tiles: dict[tuple[int, int], tuple[np.ndarray | None, np.ndarray]] = {}
+        pending = {(row // size, col // size): [(np.array([row % size]), np.array([col % size]))]}
+
+        while pending and not self._stopped:
+            key, entries = pending.popitem()
+            if key not in tiles:
+                tiles[key] = self._visit(key, direction, threshold)
+
+            labels, region = tiles[key]
+            if labels is None:
+                continue
+
+            ys = np.concatenate([ys for ys, _ in entries])
+            xs = np.concatenate([xs for _, xs in entries])
+
+            entered = labels[ys, xs][~region[ys, xs]]
+            entered = np.unique(entered[entered > 0])
+            if not len(entered):
+                continue
+
+            grown = np.isin(labels, entered)
+            region |= grown
+            self._spread(key, grown, pending)
+
+            if self._is_finished(labels, region):
+                tiles[key] = None, region
+
+        return self._assemble(tiles)
+
+    def _visit(self, key: tuple[int, int], direction: np.ndarray, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+        (top, bottom), (left, right) = self._bounds(key)
+        block = self._hypercube.read_subregion((top, bottom), (left, right)).astype(np.float64)
+        self._tiles_read += 1
+
+        # Pixels with non-finite values or entirely zero compare as NaN, and are never similar.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosines = (block @ direction) / np.linalg.norm(block, axis=-1)
+
+        labels, _ = scipy.ndimage.label(cosines >= threshold)
+        return labels, np.zeros(labels.shape, dtype=bool)
+
+    @staticmethod
+    def _is_finished(labels: np.ndarray, region: np.ndarray) -> bool:
+        edges = (np.s_[0, :], np.s_[-1, :], np.s_[:, 0], np.s_[:, -1])
+        return all(region[edge][labels[edge] > 0].all() for edge in edges)
+
+    def _spread(self, key: tuple[int, int], grown: np.ndarray, pending: dict):
+        ty, tx = key
+        rows, cols = self._num_tiles()
+        last_row, last_col = grown.shape[0] - 1, grown.shape[1] - 1
+        size = self._tile_size
+
+        # Pixels along an edge enter the neighbour at the opposite edge of the same row or column.
+        edges = [
+            ((ty - 1, tx), grown[0, :], lambda it: (np.full(len(it), size - 1), it)),
+            ((ty + 1, tx), grown[last_row, :], lambda it: (np.zeros(len(it), dtype=np.int64), it)),
+            ((ty, tx - 1), grown[:, 0], lambda it: (it, np.full(len(it), size - 1))),
+            ((ty, tx + 1), grown[:, last_col], lambda it: (it, np.zeros(len(it), dtype=np.int64))),
+        ]
+
+        for (ny, nx), edge, enter in edges:
+            if not (0 <= ny < rows and 0 <= nx < cols):
+                continue
+
+            indices = np.flatnonzero(edge)
+            if len(indices):
+                pending.setdefault((ny, nx), []).append(enter(indices))
+
+    def _assemble(self, tiles: dict) -> SelectionMask:
+        keys = [key for key, (_, region) in tiles.items() if region.any()]
+        if not keys:
+            return SelectionMask(np.zeros((0, 0), dtype=bool))
+
+        size = self._tile_size
+        ty0, ty1 = min(ty for ty, _ in keys), max(ty for ty, _ in keys)
+        tx0, tx1 = min(tx for _, tx in keys), max(tx for _, tx in keys)
+
+        top, left = ty0 * size, tx0 * size
+        bottom = min((ty1 + 1) * size, self._hypercube.num_rows)
+        right = min((tx1 + 1) * size, self._hypercube.num_cols)
+
+        mask = np.zeros((bottom - top, right - left), dtype=bool)
+        for key in keys:
+            (r0, r1), (c0, c1) = self._bounds(key)
+            mask[r0 - top:r1 - top, c0 - left:c1 - left] = tiles[key][1]
+
+        # Crop the tiles down to the bounding box of the region itself.
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        mask = mask[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        return SelectionMask(mask, top + int(rows[0]), left + int(cols[0]))
+
+    def _bounds(self, key: tuple[int, int]) -> tuple[tuple[int, int], tuple[int, int]]:
+        ty, tx = key
+        size = self._tile_size
+        return (
+            (ty * size, min((ty + 1) * size, self._hypercube.num_rows)),
+            (tx * size, min((tx + 1) * size, self._hypercube.num_cols)),
+        )
+
+    def _num_tiles(self) -> tuple[int, int]:
+        size = self._tile_size
+        return -(-self._hypercube.num_rows // size), -(-self._hypercube.num_cols // size)
@@ -0,0 +1,85 @@
+import numpy as np
+
+
+class Reservoir:
+    """
+    A uniform random sample of the spectra of a hypercube, drawn in a single streaming pass.
+
+    Blocks of pixels are fed to `update` in order, and each pixel seen so far has the same
+    chance of being in the sample, no matter how many pixels there are in total. The memory
+    needed is bounded by the size of the sample, which is stored in single precision by default,
+    since that represents the samples of integer hypercubes exactly. Pixels with non-finite
+    values are skipped.
+
+    Parameters
+    ----------
+    size : int
+        The maximum number of sampled spectra.
+    num_bands : int
+        The number of bands of the spectra.
+    seed : int or np.random.Generator, optional
+        The seed of the random number generator, for reproducible samples.
+    dtype : np.dtype, optional
+        The data type in which the sampled spectra are stored, by default float32.
+    """
+
+    def __init__(self,
+                 size: int,
+                 num_bands: int,
+                 seed: int | np.random.Generator | None = None,
+                 dtype: np.dtype = np.float32):
+        self._samples = np.empty((size, num_bands), dtype=dtype)
+        self._positions = np.empty((size, 2), dtype=np.int64)
+        self._count = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def count(self) -> int:
+        """The number of spectra seen so far."""
+        return self._count
+
+    @property
+    def samples(self) -> np.ndarray:
+        """The sampled spectra of shape (samples, bands)."""
+        return self._samples[:min(self._count, len(self._samples))]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """The (row, column) positions of the sampled spectra of shape (samples, 2)."""
+        return self._positions[:min(self._count, len(self._samples))]
+
+    def update(self, block: np.ndarray, row: int = 0, col: int = 0):
+        """
+        Consider a block of pixels for the sample.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            The pixels of shape (rows, columns, bands).
+        row : int, optional
+            The row of the hypercube at which the block starts, by default 0.
+        col : int, optional
+            The column of the hypercube at which the block starts, by default 0.
+        """
+        size = len(self._samples)
+        pixels = block.reshape(-1, block.shape[-1])
+        indices = np.flatnonzero(np.isfinite(pixels).all(axis=1))
+
+        # Fill the reservoir first, then let the n-th spectrum replace a random
+        # entry with probability size / n, which keeps the sample uniform.
+        fill = min(len(indices), max(0, size - self._count))
+        slots = np.arange(self._count, self._count + fill)
+
+        positions = self._count + np.arange(fill, len(indices))
+        drawn = self._rng.integers(0, positions + 1)
+        replaced = np.flatnonzero(drawn < size)
+
+        # Later spectra overwrite earlier ones drawing the same slot, as if sequentially.
+        unique, last = np.unique(drawn[replaced][::-1], return_index=True)
+        slots = np.concatenate([slots, unique])
+        chosen = indices[np.concatenate([np.arange(fill), fill + replaced[::-1][last]])]
+
+        self._samples[slots] = pixels[chosen]
+        self._positions[slots, 0] = row + chosen // block.shape[1]
+        self._positions[slots, 1] = col + chosen % block.shape[1]
+        self._count += len(indices)
@@ -0,0 +1,265 @@
+import math
+from collections.abc import Iterator
+
+import numpy as np
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QImage, QPainter, QPolygonF
+
+from suspectral.model.hypercube import Hypercube
+
+
+class SelectionMask:
+    """
+    An arbitrarily shaped selection of pixels within a hypercube.
+
+    The selection is stored as a boolean mask over its bounding box, which is all that
+    needs to be read from the hypercube. Spectra of the selected pixels are gathered in
+    blocks of rows, so that neither the bounding box nor the selection have to fit into
+    memory at once unless explicitly requested.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        Boolean array of shape (rows, columns) marking the selected pixels within the bounding box.
+    top : int
+        Row index of the top edge of the bounding box.
+    left : int
+        Column index of the left edge of the bounding box.
+    """
+
+    BLOCK_BYTES = 32 * 1024 ** 2
+    """Upper bound on the size of a single block of rows read from the hypercube."""
+
+    SPARSE_RATIO = 64
+    """Blocks with fewer selected pixels than this fraction of their area are gathered pixel by pixel."""
+
+    def __init__(self, mask: np.ndarray, top: int = 0, left: int = 0):
+        self._mask = np.asarray(mask, dtype=bool)
+        self._top = top
+        self._left = left
+
+    @classmethod
+    def from_polygon(cls, points: list[QPointF], num_rows: int, num_cols: int) -> "SelectionMask":
+        """
+        Rasterize a polygon given in image coordinates into a selection mask.
+
+        A pixel is selected if its center lies within the polygon. Self-intersecting
+        outlines, such as those drawn freehand, are filled using the non-zero winding rule.
+
+        Parameters
+        ----------
+        points : list of QPointF
+            The vertices of the polygon, in the coordinate system of the image.
+        num_rows : int
+            The number of rows of the image, used to clip the polygon.
+        num_cols : int
+            The number of columns of the image, used to clip the polygon.
+
+        Returns
+        -------
+        SelectionMask
+            The mask of the pixels within the polygon.
+        """
+        polygon = QPolygonF(points)
+        bounds = polygon.boundingRect()
+
+        top = max(0, math.floor(bounds.top()))
+        left = max(0, math.floor(bounds.left()))
+        bottom = min(num_rows, math.ceil(bounds.bottom()))
+        right = min(num_cols, math.ceil(bounds.right()))
+
+        if bottom <= top or right <= left:
+            return cls(np.zeros((0, 0), dtype=bool), top, left)
+
+        image = QImage(right - left, bottom - top, QImage.Format.Format_Grayscale8)
+        image.fill(0)
+
+        painter = QPainter(image)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(Qt.GlobalColor.white)
+        painter.translate(-left, -top)
+        painter.drawPolygon(polygon, Qt.FillRule.WindingFill)
+        painter.end()
+
+        # Scan lines of the image are padded to a multiple of 4 bytes.
+        pixels = np.frombuffer(image.constBits(), dtype=np.uint8)
+        pixels = pixels.reshape(image.height(), image.bytesPerLine())[:, :image.width()]
+
+        return cls(pixels > 0, top, left)
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean array of shape (rows, columns) marking the selected pixels within the bounding box."""
+        return self._mask
+
+    @property
+    def top(self) -> int:
+        """Row index of the top edge of the bounding box."""
+        return self._top
+
+    @property
+    def left(self) -> int:
+        """Column index of the left edge of the bounding box."""
+        return self._left
+
+    @property
+    def rows(self) -> tuple[int, int]:
+        """Start and end row indices (inclusive, exclusive) of the bounding box."""
+        return self._top, self._top + self._mask.shape[0]
+
+    @property
+    def cols(self) -> tuple[int, int]:
+        """Start and end column indices (inclusive, exclusive) of the bounding box."""
+        return self._left, self._left + self._mask.shape[1]
+
+    @property
+    def count(self) -> int:
+        """Number of selected pixels."""
+        return int(np.count_nonzero(self._mask))
+
+    def coordinates(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the image coordinates of the selected pixels, in row-major order.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The x and y coordinates of the selected pixels.
+        """
+        ys, xs = np.nonzero(self._mask)
+        return xs + self._left, ys + self._top
+
+    def thin(self, limit: int) -> "SelectionMask":
+        """
+        Returns a selection of at most `limit` pixels spread evenly across this one.
+
+        Parameters
+        ----------
+        limit : int
+            The maximum number of pixels to keep.
+
+        Returns
+        -------
+        SelectionMask
+            This selection if it is small enough, or an evenly thinned copy otherwise.
+        """
+        count = self.count
+        if count <= limit:
+            return self
+
+        indices = np.flatnonzero(self._mask)
+        keep = indices[np.linspace(0, count - 1, limit).astype(int)]
+
+        mask = np.zeros_like(self._mask)
+        mask.flat[keep] = True
+        return SelectionMask(mask, self._top, self._left)
+
+    def iter_spectra(self, hypercube: Hypercube) -> Iterator[np.ndarray]:
+        """
+        Read the spectra of the selected pixels in blocks of consecutive rows.
+
+        Each block only covers the rows and columns of the bounding box that
+        contain selected pixels; blocks without any are skipped entirely. Sparse
+        blocks, such as those of thinned selections, are not read whole: only
+        their selected pixels are gathered, in file order.
+
+        Parameters
+        ----------
+        hypercube : Hypercube
+            The hyperspectral data cube to read from.
+
+        Yields
+        ------
+        np.ndarray
+            Spectra of the selected pixels within the block, of shape (pixels, bands),
+            in row-major order.
+        """
+        row_bytes = self._mask.shape[1] * hypercube.num_bands * hypercube.bytes_per_sample
+        block_rows = max(1, self.BLOCK_BYTES // max(1, row_bytes))
+
+        for start in range(0, self._mask.shape[0], block_rows):
+            block_mask = self._mask[start:start + block_rows]
+
+            cols = np.flatnonzero(block_mask.any(axis=0))
+            if cols.size == 0: continue
+
+            rows = np.flatnonzero(block_mask.any(axis=1))
+            row_start, row_end = start + rows[0], start + rows[-1] + 1
+            col_start, col_end = cols[0], cols[-1] + 1
+
+            count = np.count_nonzero(block_mask)
+            if count * self.SPARSE_RATIO <= (row_end - row_start) * (col_end - col_start):
+                ys, xs = np.nonzero(block_mask)
+                points = zip((ys + start + self._top).tolist(), (xs + self._left).tolist())
+                yield hypercube.read_pixels(list(points))
+                continue
+
+            block = hypercube.read_subregion(
+                (self._top + row_start, self._top + row_end),
+                (self._left + col_start, self._left + col_end),
+            )
+
+            yield block[self._mask[row_start:row_end, col_start:col_end]]
+
+    def read_spectra(self, hypercube: Hypercube) -> np.ndarray:
+        """
+        Read the spectra of all selected pixels.
+
+        Parameters
+        ----------
+        hypercube : Hypercube
+            The hyperspectral data cube to read from.
+
+        Returns
+        -------
+        np.ndarray
+            Spectra of the selected pixels of shape (pixels, bands), in row-major order.
+        """
+        blocks = list(self.iter_spectra(hypercube))
+        if not blocks:
+            return np.empty((0, hypercube.num_bands))
+
+        return np.concatenate(blocks)
+
+    def statistics(self, hypercube: Hypercube) -> np.ndarray:
+        """
+        Compute per-band statistics of the selected pixels in a single streaming pass.
+
+        Parameters
+        ----------
+        hypercube : Hypercube
+            The hyperspectral data cube to read from.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (4, bands) holding the mean, standard deviation, minimum
+            and maximum of each band, in that order. Values are NaN if nothing is selected.
+        """
+        num_bands = hypercube.num_bands
+        count = 0
+        mean = np.zeros(num_bands)
+        m2 = np.zeros(num_bands)
+        lo = np.full(num_bands, np.inf)
+        hi = np.full(num_bands, -np.inf)
+
+        for spectra in self.iter_spectra(hypercube):
+            spectra = spectra.astype(np.float64, copy=False)
+            block_count = spectra.shape[0]
+            block_mean = spectra.mean(axis=0)
+            block_m2 = ((spectra - block_mean) ** 2).sum(axis=0)
+
+            # Combine the moments of the block with the running ones (Chan et al.).
+            total = count + block_count
+            delta = block_mean - mean
+            mean += delta * (block_count / total)
+            m2 += block_m2 + delta ** 2 * (count * block_count / total)
+            count = total
+
+            np.minimum(lo, spectra.min(axis=0), out=lo)
+            np.maximum(hi, spectra.max(axis=0), out=hi)
+
+        if count == 0:
+            return np.full((4, num_bands), np.nan)
+
+        return np.stack((mean, np.sqrt(m2 / count), lo, hi))
@@ -0,0 +1,294 @@
+import os
+from pathlib import Path
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from suspectral.model.hypercube import Hypercube
+
+
+class SpectralIndex:
+    """
+    Approximate nearest-neighbour index over the spectral angles between pixels of a hypercube.
+
+    Pixel spectra are scaled to unit length, so that the Euclidean distance between them grows
+    monotonically with their spectral angle, and then projected onto their leading principal
+    components. A k-d tree over the projections yields candidate matches, which are re-ranked
+    by their exact spectral angle. Since the projection never increases distances, radius
+    queries find every pixel within the angle; nearest-neighbour queries oversample candidates
+    to make up for the approximation.
+
+    To keep the index small, pixel ids are only stored when some pixels are left out, and then
+    as 32-bit integers where they fit. Once the tree is built, it holds the only copy of the
+    projections.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The number of rows and columns of the indexed hypercube.
+    mean : np.ndarray
+        The mean of the unit-length spectra, of shape (bands,).
+    components : np.ndarray
+        The principal components as columns of an array of shape (bands, components).
+    pixels : np.ndarray or None
+        Flat indices of the indexed pixels, which excludes pixels that have no direction.
+        None if every pixel is indexed, in which case the indices are implied.
+    scores : np.ndarray
+        Projections of the indexed pixels of shape (pixels, components).
+    """
+
+    SUFFIX = ".index.npz"
+    OVERSAMPLING = 4
+
+    def __init__(self,
+                 shape: tuple[int, int],
+                 mean: np.ndarray,
+                 components: np.ndarray,
+                 pixels: np.ndarray | None,
+                 scores: np.ndarray):
+        if pixels is not None and len(pixels) == shape[0] * shape[1]:
+            pixels = None
+
+        self._shape = shape
+        self._mean = mean
+        self._components = components
+        self._pixels = self.compact_ids(pixels) if pixels is not None else None
+        self._scores: np.ndarray | None = scores
+        self._num_pixels = len(scores)
+        self._tree: cKDTree | None = None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The number of rows and columns of the indexed hypercube."""
+        return self._shape
+
+    @property
+    def num_pixels(self) -> int:
+        """The number of indexed pixels."""
+        return self._num_pixels
+
+    @property
+    def num_bands(self) -> int:
+        """The number of bands of the indexed hypercube."""
+        return self._components.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate number of bytes taken up by the index, once its tree is built."""
+        # The tree holds the projections as float64, and a permutation of the pixels.
+        num_components = self._components.shape[1]
+        size = self._num_pixels * (num_components * 8 + np.dtype(np.intp).itemsize)
+        size += self._mean.nbytes + self._components.nbytes
+        if self._pixels is not None:
+            size += self._pixels.nbytes
+
+        return size
+
+    @property
+    def tree(self) -> cKDTree:
+        """The k-d tree over the projected pixels, built on first access."""
+        if self._tree is None:
+            self._tree = cKDTree(self._scores, balanced_tree=False, compact_nodes=False)
+            self._scores = None
+
+        return self._tree
+
+    @staticmethod
+    def compact_ids(pixels: np.ndarray) -> np.ndarray:
+        """Store flat pixel indices as 32-bit integers if they fit, which halves their size."""
+        if len(pixels) == 0 or pixels.max() <= np.iinfo(np.int32).max:
+            return pixels.astype(np.int32, copy=False)
+
+        return pixels
+
+    @staticmethod
+    def normalize(spectra: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Scale spectra to unit length.
+
+        Parameters
+        ----------
+        spectra : np.ndarray
+            Spectra of shape (..., bands).
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The scaled spectra of shape (pixels, bands) as float32, and a boolean array
+            of shape (pixels,) marking those which have a direction at all.
+        """
+        spectra = spectra.reshape(-1, spectra.shape[-1]).astype(np.float32)
+        norms = np.sqrt(np.einsum("ij,ij->i", spectra, spectra))
+
+        valid = np.isfinite(norms) & (norms > 0)
+        spectra[valid] /= norms[valid, None]
+        return spectra, valid
+
+    def project(self, unit_spectra: np.ndarray) -> np.ndarray:
+        """
+        Project unit-length spectra onto the principal components.
+
+        Parameters
+        ----------
+        unit_spectra : np.ndarray
+            Spectra of shape (pixels, bands), as returned by `normalize`.
+
+        Returns
+        -------
+        np.ndarray
+            Projections of shape (pixels, components) as float32.
+        """
+        return ((unit_spectra - self._mean) @ self._components).astype(np.float32)
+
+    def nearest(self, hypercube: Hypercube, target: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the pixels with the smallest spectral angle to the target.
+
+        Parameters
+        ----------
+        hypercube : Hypercube
+            The indexed hypercube, from which candidates are read for re-ranking.
+        target : np.ndarray
+            The spectrum to match, of shape (bands,).
+        k : int
+            The number of pixels to find.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Flat indices of the matching pixels, and their spectral angles in radians,
+            both sorted by increasing angle.
+        """
+        k = min(k, self._num_pixels)
+        if k == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+        query = self._project_target(target)
+        _, candidates = self.tree.query(query, k=min(k * self.OVERSAMPLING, self._num_pixels))
+
+        pixels, angles = self._rerank(hypercube, target, np.atleast_1d(candidates))
+        return pixels[:k], angles[:k]
+
+    def within(self, hypercube: Hypercube, target: np.ndarray, angle: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find all pixels within the given spectral angle of the target.
+
+        Parameters
+        ----------
+        hypercube : Hypercube
+            The indexed hypercube, from which candidates are read for re-ranking.
+        target : np.ndarray
+            The spectrum to match, of shape (bands,).
+        angle : float
+            The largest spectral angle in radians.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Flat indices of the matching pixels, and their spectral angles in radians,
+            both sorted by increasing angle.
+        """
+        query = self._project_target(target)
+
+        # The distance between unit vectors separated by the angle.
+        chord = 2 * np.sin(min(angle, np.pi) / 2)
+        candidates = np.asarray(self.tree.query_ball_point(query, chord), dtype=np.intp)
+
+        pixels, angles = self._rerank(hypercube, target, candidates)
+        keep = angles <= angle
+        return pixels[keep], angles[keep]
+
+    def save(self, path: str | Path, key: tuple):
+        """
+        Write the index to a file.
+
+        Parameters
+        ----------
+        path : str or Path
+            The destination file.
+        key : tuple
+            Identifies the version of the hypercube the index was built from (see `key_of`).
+        """
+        scores = self._scores if self._scores is not None else self._tree.data.astype(np.float32)
+        arrays = {} if self._pixels is None else {"pixels": self._pixels}
+
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                key=np.array(key),
+                shape=np.array(self._shape),
+                mean=self._mean,
+                components=self._components,
+                scores=scores,
+                **arrays,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path, key: tuple) -> "SpectralIndex | None":
+        """
+        Read an index from a file, provided it was built from the same version of the hypercube.
+
+        Parameters
+        ----------
+        path : str or Path
+            The source file.
+        key : tuple
+            Identifies the current version of the hypercube (see `key_of`).
+
+        Returns
+        -------
+        SpectralIndex or None
+            The index, or None if the file is missing, unreadable, or stale.
+        """
+        try:
+            with np.load(path) as data:
+                if not np.array_equal(data["key"], np.array(key)):
+                    return None
+
+                return cls(
+                    tuple(data["shape"].tolist()),
+                    data["mean"],
+                    data["components"],
+                    data["pixels"] if "pixels" in data else None,
+                    data["scores"],
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+
+    @classmethod
+    def path_of(cls, hypercube: Hypercube) -> Path:
+        """The path of the index file kept beside the given hypercube."""
+        path = Path(hypercube.path)
+        return path.with_name(path.stem + cls.SUFFIX)
+
+    @staticmethod
+    def key_of(hypercube: Hypercube) -> tuple:
+        """A key which changes whenever the data or the layout of the hypercube changes."""
+        stat = os.stat(hypercube.data_path)
+        return *hypercube.shape, stat.st_size, stat.st_mtime_ns
+
+    def _project_target(self, target: np.ndarray) -> np.ndarray:
+        unit, _ = self.normalize(np.asarray(target))
+        return self.project(unit)[0]
+
+    def _rerank(self, hypercube: Hypercube, target: np.ndarray, candidates: np.ndarray):
+        pixels = candidates if self._pixels is None else self._pixels[candidates]
+        pixels = pixels.astype(np.intp)
+        if pixels.size == 0:
+            return pixels, np.empty(0, dtype=np.float32)
+
+        # Reading the candidates in the order they are stored turns scattered reads into a sweep.
+        pixels.sort()
+        rows, cols = np.unravel_index(pixels, self._shape)
+        spectra = hypercube.read_pixels(np.column_stack((rows, cols)))
+
+        # Double precision keeps small angles accurate, which matters most for the best matches.
+        spectra = np.asarray(spectra, dtype=np.float64).reshape(len(pixels), -1)
+        target = np.asarray(target, dtype=np.float64).ravel()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosines = spectra @ target / (np.linalg.norm(spectra, axis=1) * np.linalg.norm(target))
+
+        angles = np.arccos(np.clip(cosines, -1.0, 1.0)).astype(np.float32)
+
+        order = np.argsort(angles, kind="stable")
+        return pixels[order], angles[order]
@@ -0,0 +1,145 @@
+import os
+
+import numpy as np
+
+
+class SpectralLibrary:
+    """
+    A collection of named reference spectra sampled at known wavelengths.
+
+    Parameters
+    ----------
+    names : list of str
+        The names of the reference spectra.
+    wavelengths : list of np.ndarray
+        The wavelengths at which each spectrum is sampled, in increasing order.
+    spectra : list of np.ndarray
+        The values of each spectrum at its wavelengths.
+    """
+
+    def __init__(self, names: list[str], wavelengths: list[np.ndarray], spectra: list[np.ndarray]):
+        self._names = names
+        self._wavelengths = wavelengths
+        self._spectra = spectra
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def names(self) -> list[str]:
+        """The names of the reference spectra."""
+        return list(self._names)
+
+    @classmethod
+    def load(cls, directory: str) -> "SpectralLibrary":
+        """
+        Read every CSV file in a directory as reference spectra.
+
+        Each file must have a header with a "Wavelength" column and at least one other column,
+        in the same format as the files accepted by `SpectralSelector`. Every other column is
+        a separate spectrum, named after the file, followed by the column if there are several.
+
+        Parameters
+        ----------
+        directory : str
+            The directory containing the CSV files.
+
+        Returns
+        -------
+        SpectralLibrary
+            The library of all spectra, ordered by file name.
+
+        Raises
+        ------
+        ValueError
+            If a file is malformed, or if the directory contains no spectra.
+        """
+        names, wavelengths, spectra = [], [], []
+        for file in sorted(os.listdir(directory)):
+            if os.path.splitext(file)[1].lower() != ".csv":
+                continue
+
+            library = cls.load_file(os.path.join(directory, file))
+            names.extend(library._names)
+            wavelengths.extend(library._wavelengths)
+            spectra.extend(library._spectra)
+
+        if not names:
+            raise ValueError(f"Directory '{directory}' contains no spectra.")
+
+        return cls(names, wavelengths, spectra)
+
+    @classmethod
+    def load_file(cls, path: str) -> "SpectralLibrary":
+        """
+        Read a single CSV file as reference spectra, in the same format as `load`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the CSV file.
+
+        Returns
+        -------
+        SpectralLibrary
+            The library of the spectra in the file, ordered by column.
+
+        Raises
+        ------
+        ValueError
+            If the file is malformed.
+        """
+        file = os.path.basename(path)
+        stem = os.path.splitext(file)[0]
+
+        data = np.atleast_1d(np.genfromtxt(path, delimiter=",", names=True))
+        columns = [it for it in data.dtype.names or () if it != "Wavelength"]
+        if "Wavelength" not in (data.dtype.names or ()) or not columns:
+            raise ValueError(f"File '{file}' must have a 'Wavelength' column and at least one other column.")
+
+        for column in data.dtype.names:
+            if np.isnan(data[column]).any():
+                raise ValueError(f"Column '{column}' of file '{file}' contains non-numeric or missing values.")
+
+        order = np.argsort(data["Wavelength"])
+        names = [stem if len(columns) == 1 else f"{stem} ({column})" for column in columns]
+        wavelengths = [data["Wavelength"][order] for _ in columns]
+        spectra = [data[column][order] for column in columns]
+        return cls(names, wavelengths, spectra)
+
+    def resample(self, wavelengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Resample the spectra onto the given wavelengths by linear interpolation.
+
+        Only wavelengths covered by every spectrum in the library are kept, so that
+        no spectrum is extrapolated.
+
+        Parameters
+        ----------
+        wavelengths : np.ndarray
+            The target wavelengths, typically those of the bands of a hypercube.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The resampled spectra of shape (spectra, kept wavelengths), and a boolean
+            array marking the kept wavelengths.
+
+        Raises
+        ------
+        ValueError
+            If the library does not cover at least two of the wavelengths.
+        """
+        lo = max(it[0] for it in self._wavelengths)
+        hi = min(it[-1] for it in self._wavelengths)
+
+        mask = (wavelengths >= lo) & (wavelengths <= hi)
+        if np.count_nonzero(mask) < 2:
+            raise ValueError("The spectral library does not cover the wavelengths of the hypercube.")
+
+        resampled = np.array([
+            np.interp(wavelengths[mask], x, y)
+            for x, y in zip(self._wavelengths, self._spectra)
+        ])
+
+        return resampled, mask
@@ -0,0 +1,187 @@
+import numpy as np
+
+
+class Unmixing:
+    """
+    Linear spectral unmixing of pixels into abundances of a few endmember spectra.
+
+    Every pixel is modelled as a linear combination of the endmembers, whose weights are
+    found by least squares. Everything which depends only on the endmembers is factorized
+    once up front, so that unmixing a block of pixels takes a single matrix product:
+
+    - `UNCONSTRAINED` applies the pseudo-inverse of the endmembers.
+    - `SUM_TO_ONE` additionally corrects the unconstrained solution along the direction
+      derived from the KKT conditions of the equality constraint, so that the abundances
+      of every pixel sum up to one.
+    - `NON_NEGATIVE` starts from the unconstrained solution as well, and only pixels with
+      negative abundances go through an active-set solver. The solver works on all of
+      them at once, grouping pixels with the same set of active endmembers, so that each
+      group needs a single small solve regardless of the number of pixels in it.
+
+    Parameters
+    ----------
+    endmembers : np.ndarray
+        The endmember spectra of shape (endmembers, bands).
+    constraint : str, optional
+        One of `UNCONSTRAINED`, `SUM_TO_ONE` or `NON_NEGATIVE`, by default `UNCONSTRAINED`.
+
+    Raises
+    ------
+    ValueError
+        If the constraint is unknown, or if there are more than `MAX_ENDMEMBERS` endmembers
+        or they are not linearly independent.
+    """
+
+    UNCONSTRAINED = "unconstrained"
+    SUM_TO_ONE = "sum-to-one"
+    NON_NEGATIVE = "non-negative"
+
+    CONSTRAINTS = {
+        UNCONSTRAINED: "Unconstrained",
+        SUM_TO_ONE: "Sum-to-One",
+        NON_NEGATIVE: "Non-Negative",
+    }
+    """Supported constraints and their display names."""
+
+    MAX_ENDMEMBERS = 63
+    """Maximum number of endmembers, since their active sets are encoded as 64-bit integers."""
+
+    TOLERANCE = 1e-9
+    """Tolerance of the optimality conditions of the active-set solver, relative to the scale of each pixel."""
+
+    def __init__(self, endmembers: np.ndarray, constraint: str = UNCONSTRAINED):
+        if constraint not in self.CONSTRAINTS:
+            raise ValueError(f"Unknown unmixing constraint: {constraint}.")
+
+        endmembers = np.atleast_2d(np.asarray(endmembers, dtype=np.float64))
+        if len(endmembers) > self.MAX_ENDMEMBERS:
+            raise ValueError(f"At most {self.MAX_ENDMEMBERS} endmembers are supported, got {len(endmembers)}.")
+        if np.linalg.matrix_rank(endmembers) < len(endmembers):
+            raise ValueError("The endmembers must be linearly independent.")
+
+        self._endmembers = endmembers
+        self._constraint = constraint
+
+        self._gram = endmembers @ endmembers.T
+        self._pinv = np.linalg.pinv(endmembers.T)
+
+        # The sum-to-one solution is the unconstrained one shifted along inv(G) @ 1.
+        direction = np.linalg.solve(self._gram, np.ones(len(endmembers)))
+        self._direction = direction / direction.sum()
+
+        self._pinv32 = self._pinv.T.astype(np.float32)
+
+    @property
+    def num_endmembers(self) -> int:
+        """The number of endmembers."""
+        return len(self._endmembers)
+
+    @property
+    def constraint(self) -> str:
+        """The constraint imposed on the abundances."""
+        return self._constraint
+
+    def unmix(self, pixels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Estimate the abundances of the endmembers in every pixel.
+
+        Parameters
+        ----------
+        pixels : np.ndarray
+            The spectra of shape (..., bands).
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The abundances of shape (..., endmembers) and the root-mean-square error of the
+            reconstruction of shape (...), both as float32. Pixels with non-finite values
+            are NaN.
+        """
+        shape = pixels.shape[:-1]
+        pixels = pixels.reshape(-1, pixels.shape[-1]).astype(np.float32)
+        valid = np.isfinite(pixels).all(axis=1)
+        pixels[~valid] = 0
+
+        abundances = pixels @ self._pinv32
+
+        if self._constraint == self.SUM_TO_ONE:
+            abundances += np.outer(1 - abundances.sum(axis=1), self._direction).astype(np.float32)
+
+        elif self._constraint == self.NON_NEGATIVE:
+            violating = np.flatnonzero((abundances < 0).any(axis=1) & valid)
+            if len(violating):
+                solution = self._solve_non_negative(pixels[violating].astype(np.float64), abundances[violating])
+                abundances[violating] = solution
+
+        residuals = pixels - abundances @ self._endmembers.astype(np.float32)
+        errors = np.sqrt(np.einsum("ij,ij->i", residuals, residuals) / pixels.shape[1])
+
+        abundances[~valid] = np.nan
+        errors[~valid] = np.nan
+        return abundances.reshape(*shape, -1), errors.reshape(shape)
+
+    def _solve_non_negative(self, pixels: np.ndarray, initial: np.ndarray) -> np.ndarray:
+        # Fast combinatorial NNLS (Van Benthem & Keenan, 2004): Lawson–Hanson's active-set
+        # method run for all pixels at once, on the normal equations of the endmembers.
+        gram = self._gram
+        cross = pixels @ self._endmembers.T
+        tolerance = self.TOLERANCE * np.maximum(np.abs(cross).max(axis=1), np.finfo(float).tiny)
+
+        passive = initial > 0
+        solution = self._solve_passive(cross, passive)
+        feasible = np.where(passive, np.maximum(solution, 0), 0)
+
+        pending = np.arange(len(pixels))
+        for _ in range(3 * gram.shape[0]):
+            # Step back from infeasible solutions towards the last feasible ones, dropping
+            # the endmembers which reach zero first, until all of them are feasible again.
+            infeasible = pending[(solution[pending] < 0).any(axis=1)]
+            while len(infeasible):
+                old, new = feasible[infeasible], solution[infeasible]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    steps = np.where(new < 0, old / (old - new), np.inf)
+
+                step = steps.min(axis=1, keepdims=True)
+                feasible[infeasible] = old + step * (new - old)
+                passive[infeasible] &= steps > step
+                passive[infeasible, steps.argmin(axis=1)] = False
+
+                solution[infeasible] = self._solve_passive(cross[infeasible], passive[infeasible])
+                infeasible = infeasible[(solution[infeasible] < 0).any(axis=1)]
+
+            feasible[pending] = solution[pending]
+
+            # Pixels are optimal once no inactive endmember would reduce the error.
+            gradient = cross[pending] - solution[pending] @ gram
+            gradient[passive[pending]] = -np.inf
+            candidates = gradient.argmax(axis=1)
+            improvable = gradient[np.arange(len(pending)), candidates] > tolerance[pending]
+
+            pending, candidates = pending[improvable], candidates[improvable]
+            if not len(pending):
+                break
+
+            passive[pending, candidates] = True
+            solution[pending] = self._solve_passive(cross[pending], passive[pending])
+
+        return np.maximum(feasible, 0).astype(np.float32)
+
+    def _solve_passive(self, cross: np.ndarray, passive: np.ndarray) -> np.ndarray:
+        # Solve the normal equations restricted to the passive endmembers of each pixel,
+        # once for every distinct set of passive endmembers.
+        solution = np.zeros(passive.shape)
+
+        # Encode every set as an integer, so that pixels can be grouped by a single sort.
+        codes = passive @ (1 << np.arange(passive.shape[1], dtype=np.int64))
+        order = np.argsort(codes, kind="stable")
+        _, starts = np.unique(codes[order], return_index=True)
+
+        for members, first in zip(np.split(order, starts[1:]), starts):
+            subset = passive[order[first]]
+            if not subset.any():
+                continue
+
+            gram = self._gram[np.ix_(subset, subset)]
+            solution[np.ix_(members, subset)] = np.linalg.solve(gram, cross[np.ix_(members, subset)].T).T
+
+        return solution
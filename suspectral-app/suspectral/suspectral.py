@@ -2,6 +2,7 @@ from PySide6.QtCore import Slot
 from PySide6.QtGui import (
     Qt,
     QAction,
+    QCloseEvent,
     QDragEnterEvent,
     QDragMoveEvent,
     QDropEvent,
@@ -12,16 +13,19 @@ from PySide6.QtWidgets import (
     QDockWidget,
     QFileDialog,
     QMainWindow,
-    QWidget, QMessageBox,
+    QWidget, QMessageBox, QProgressDialog,
 )
 
 from suspectral.about import AboutDialog
+from suspectral.controller.cross_section_controller import CrossSectionController
 from suspectral.controller.image_controller import ImageController
 from suspectral.controller.metadata_controller import MetadataController
+from suspectral.controller.overlay_controller import OverlayController
 from suspectral.controller.selection_controller import SelectionController
 from suspectral.controller.spectral_controller import SpectralController
 from suspectral.controller.status_controller import StatusController
 from suspectral.controller.toolbar_controller import ToolbarController
+from suspectral.controller.workspace_controller import WorkspaceController
 from suspectral.exporter.exporter import Exporter
 from suspectral.exporter.formatter_csv import CsvFormatter
 from suspectral.exporter.formatter_matlab import MatlabFormatter
@@ -34,14 +38,18 @@ from suspectral.model.hypercube import Hypercube, HypercubeDataMissing, Hypercub
 from suspectral.model.hypercube_container import HypercubeContainer
 from suspectral.tool.manager import ToolManager
 from suspectral.tool.tool import Tool
+from suspectral.view.cross_section.cross_section_view import CrossSectionView
 from suspectral.view.image.image_controls_view import ImageControlsView
 from suspectral.view.image.image_view import ImageView
 from suspectral.view.metadata.metadata_view import MetadataView
+from suspectral.view.overlay.overlay_view import OverlayView
 from suspectral.view.selection.selection_view import SelectionView
 from suspectral.view.spectral.spectral_view import SpectralView
 from suspectral.view.status.status_view import StatusView
 from suspectral.view.toolbar.toolbar_view import ToolbarView
+from suspectral.view.workspace.workspace_view import WorkspaceView
 from suspectral.theme_icon import ThemeIcon
+from suspectral.worker.worker import join_workers
 
 
 class Suspectral(QMainWindow):
@@ -53,8 +61,13 @@ class Suspectral(QMainWindow):
         self.resize(1600, 900)
 
         self._model = HypercubeContainer()
+        self._model.opening.connect(self._handle_hypercube_opening)
         self._model.opened.connect(self._handle_hypercube_opened)
+        self._model.failed.connect(self._handle_hypercube_failed)
         self._model.closed.connect(self._handle_hypercube_closed)
+        self._model.loadFailed.connect(self._handle_load_failed)
+        self._model.calibrationFailed.connect(self._handle_calibration_failed)
+        self._progress_dialog: QProgressDialog | None = None
 
         exporters = [
             Exporter(
@@ -132,6 +145,14 @@ class Suspectral(QMainWindow):
             model=self._model,
             parent=self,
         )
+        self._image_controls_view.spectraChanged.connect(self._spectral_controller.show_spectra)
+
+        self._workspace_view = WorkspaceView(self)
+        self._workspace_controller = WorkspaceController(
+            view=self._workspace_view,
+            model=self._model,
+            parent=self,
+        )
 
         self._metadata_view = MetadataView(self)
         self._metadata_controller = MetadataController(
@@ -140,6 +161,23 @@ class Suspectral(QMainWindow):
             parent=self,
         )
 
+        self._overlay_view = OverlayView(self)
+        self._overlay_controller = OverlayController(
+            view=self._overlay_view,
+            image_view=self._image_view,
+            tools=self._tools,
+            model=self._model,
+            parent=self,
+        )
+
+        self._cross_section_view = CrossSectionView(self)
+        self._cross_section_controller = CrossSectionController(
+            view=self._cross_section_view,
+            tools=self._tools,
+            model=self._model,
+            parent=self,
+        )
+
         self._create_menubar()
         self._create_docks()
 
@@ -152,6 +190,14 @@ class Suspectral(QMainWindow):
         self.centralWidget().dragMoveEvent = self._handle_drag_move
         self.centralWidget().dropEvent = self._handle_drop
 
+    def closeEvent(self, event: QCloseEvent):
+        # A hypercube still being opened, loaded or calibrated must not outlive the window.
+        self._model.cancel()
+        self._model.cancel_loading()
+        self._model.cancel_calibration()
+        join_workers(self._model)
+        super().closeEvent(event)
+
     def _create_menubar(self):
         menu_bar = self.menuBar()
 
@@ -173,6 +219,22 @@ class Suspectral(QMainWindow):
 
             menu.addSeparator()
 
+            self._load_memory_action = menu.addAction("Load into Memory")
+            self._load_memory_action.setIcon(ThemeIcon("database.svg"))
+            self._load_memory_action.setCheckable(True)
+            self._load_memory_action.triggered.connect(self._handle_load_memory)
+            self._load_memory_action.setEnabled(False)
+            self._model.opened.connect(self._update_load_memory_action)
+            self._model.closed.connect(self._update_load_memory_action)
+            self._model.residencyChanged.connect(self._update_load_memory_action)
+
+            auto_load_action = menu.addAction("Load into Memory Automatically")
+            auto_load_action.setCheckable(True)
+            auto_load_action.setChecked(self._model.auto_load)
+            auto_load_action.toggled.connect(lambda checked: setattr(self._model, "auto_load", checked))
+
+            menu.addSeparator()
+
             copy_image_action = menu.addAction("Copy Image")
             copy_image_action.setIcon(ThemeIcon("copy.svg"))
             copy_image_action.triggered.connect(lambda: self._image_controller.copy_image())
@@ -262,6 +324,11 @@ class Suspectral(QMainWindow):
             QMainWindow.DockOption.AllowNestedDocks |
             QMainWindow.DockOption.AllowTabbedDocks)
 
+        self._create_dock(
+            name="Workspace",
+            view=self._workspace_view,
+            area=Qt.DockWidgetArea.LeftDockWidgetArea,
+        )
         self._create_dock(
             name="Metadata",
             view=self._metadata_view,
@@ -282,6 +349,16 @@ class Suspectral(QMainWindow):
             view=self._image_controls_view,
             area=Qt.DockWidgetArea.RightDockWidgetArea,
         )
+        self._create_dock(
+            name="Overlay",
+            view=self._overlay_view,
+            area=Qt.DockWidgetArea.RightDockWidgetArea,
+        )
+        self._create_dock(
+            name="Cross-Section",
+            view=self._cross_section_view,
+            area=Qt.DockWidgetArea.RightDockWidgetArea,
+        )
 
     def _create_dock(self, name: str, view: QWidget, area: Qt.DockWidgetArea):
         dock = QDockWidget(name, self)
@@ -316,7 +393,7 @@ class Suspectral(QMainWindow):
         path, _ = QFileDialog.getOpenFileName(
             self,
             caption="Load Hypercube",
-            filter="ENVI (*.hdr)"
+            filter=Hypercube.file_filter()
         )
 
         if path:
@@ -326,10 +403,85 @@ class Suspectral(QMainWindow):
     def _handle_close(self):
         self._model.close()
 
+    @Slot()
+    def _handle_load_memory(self, checked: bool):
+        if checked:
+            self._model.load_into_memory()
+        else:
+            self._model.release_memory()
+
+    @Slot()
+    def _update_load_memory_action(self):
+        hypercube = self._model.hypercube
+        self._load_memory_action.setEnabled(hypercube is not None)
+        self._load_memory_action.setChecked(
+            hypercube is not None and (hypercube.resident or self._model.is_loading_into_memory(hypercube))
+        )
+
+    @Slot()
+    def _handle_load_failed(self, hypercube: Hypercube, error: Exception):
+        QMessageBox.warning(
+            self,
+            "Not Loaded into Memory",
+            f"Could not load {hypercube.name} into memory, so it is still read from its file: {error}"
+        )
+
+    @Slot()
+    def _handle_calibration_failed(self, hypercube: Hypercube, error: Exception):
+        QMessageBox.warning(
+            self,
+            "Not Calibrated",
+            f"Could not calibrate {hypercube.name}, so its raw data is still read: {error}"
+        )
+
+    @Slot()
+    def _handle_hypercube_opening(self):
+        self._close_progress_dialog()
+
+        # Opening is usually quick, so the dialog only appears if it takes a while.
+        self._progress_dialog = QProgressDialog(self)
+        self._progress_dialog.setWindowTitle("Opening...")
+        self._progress_dialog.setModal(True)
+        self._progress_dialog.setLabelText(
+            "Please, wait while the hypercube is being opened. This may take a while..."
+        )
+        self._progress_dialog.setRange(0, 0)
+        self._progress_dialog.setMinimumDuration(500)
+        self._progress_dialog.setValue(0)
+        self._progress_dialog.canceled.connect(self._model.cancel)
+
     @Slot()
     def _handle_hypercube_opened(self, hypercube: Hypercube):
+        self._close_progress_dialog()
         self.setWindowTitle(f"Suspectral - {hypercube.name}")
 
+    @Slot()
+    def _handle_hypercube_failed(self, error: Exception):
+        self._close_progress_dialog()
+
+        if isinstance(error, HypercubeDataMissing):
+            QMessageBox.critical(
+                self,
+                "Missing Data",
+                "The data file associated with the selected header does not exist. "
+                "Please, ensure that it is located in the same directory as the header "
+                "and has either .raw, .img., or .dat extension."
+            )
+        elif isinstance(error, HypercubeHeaderInvalid):
+            QMessageBox.critical(
+                self,
+                "Invalid Header",
+                "The selected file does not follow the standard of its format. Please, "
+                "ensure that the contents  of ENVI header files contain all necessary fields.\n\n"
+                f"{error}"
+            )
+        else:
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Could not open the hypercube: {error}"
+            )
+
     @Slot()
     def _handle_hypercube_closed(self):
         self.setWindowTitle("Suspectral")
@@ -338,7 +490,7 @@ class Suspectral(QMainWindow):
     def _handle_drag_enter(event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             path = event.mimeData().urls()[0].toLocalFile()
-            if path.lower().endswith(".hdr"):
+            if Hypercube.supports(path):
                 event.accept()
 
     @staticmethod
@@ -352,20 +504,12 @@ class Suspectral(QMainWindow):
             self._load_hypercube(path)
 
     def _load_hypercube(self, path: str):
-        try:
-            self._model.open(path)
-        except HypercubeDataMissing:
-            QMessageBox.critical(
-                self,
-                "Missing Data",
-                "The data file associated with the selected header does not exist. "
-                "Please, ensure that it is located in the same directory as the header "
-                "and has either .raw, .img., or .dat extension."
-            )
-        except HypercubeHeaderInvalid:
-            QMessageBox.critical(
-                self,
-                "Invalid Header",
-                "The selected header does not follow the standard ENVI format. Please, "
-                "ensure that the contents  of the header file contain all necessary fields."
-            )
+        self._model.open_async(path)
+
+    def _close_progress_dialog(self):
+        if self._progress_dialog is not None:
+            # Closing the dialog must not cancel the hypercube which has just been opened.
+            self._progress_dialog.canceled.disconnect(self._model.cancel)
+            self._progress_dialog.close()
+            self._progress_dialog.deleteLater()
+            self._progress_dialog = None
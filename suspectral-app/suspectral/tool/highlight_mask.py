@@ -0,0 +1,33 @@
+import numpy as np
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QGraphicsPixmapItem, QGraphicsItem
+
+from suspectral.model.selection_mask import SelectionMask
+
+
+class MaskHighlight(QGraphicsPixmapItem):
+    """
+    A graphics item used to highlight the pixels of a selection mask on a scene.
+
+    This highlight is rendered in the same color as `AreaHighlight`, as a semi-transparent
+    pixmap covering the bounding box of the mask, so that its cost does not depend on how
+    ragged the outline of the selection is.
+
+    Parameters
+    ----------
+    mask : SelectionMask
+        The selection whose pixels are highlighted.
+    parent : QGraphicsItem or None, optional
+        The parent item, by default None.
+    """
+
+    def __init__(self, mask: SelectionMask, parent: QGraphicsItem | None = None):
+        super().__init__(parent)
+        r, g, b = 78, 155, 207
+
+        pixels = np.zeros((*mask.mask.shape, 4), dtype=np.uint8)
+        pixels[mask.mask] = (r, g, b, 120)
+
+        height, width = mask.mask.shape
+        image = QImage(pixels.data, width, height, 4 * width, QImage.Format.Format_RGBA8888)
+        self.setPixmap(QPixmap.fromImage(image))
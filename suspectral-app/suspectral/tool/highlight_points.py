@@ -0,0 +1,67 @@
+import numpy as np
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QPainter, QPainterPath, QPen
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem, QWidget
+
+from suspectral.colors import NUM_COLORS, get_color
+
+
+class PointsHighlight(QGraphicsItem):
+    """
+    A visual indicator for highlighting many points on an image view with a single graphics item.
+
+    Each point is outlined as a pixel, colored by its index in the same palette as the
+    individual highlights. The outlines are collected into one path per palette color
+    when the item is created, so painting costs a handful of calls regardless of the
+    number of points. Sparse sets of points are additionally circled, in the style of
+    `PointHighlight`; dense ones are not, since the circles would only clutter the view.
+
+    Parameters
+    ----------
+    xs : np.ndarray
+        The x coordinates of the points to be highlighted.
+    ys : np.ndarray
+        The y coordinates of the points to be highlighted.
+    parent : QGraphicsItem or None, optional
+        The parent item, by default None.
+    """
+
+    CIRCLE_LIMIT = 100
+    CIRCLE_RADIUS = 10
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, parent: QGraphicsItem | None = None):
+        super().__init__(parent)
+        self._count = len(xs)
+        self._paths = [QPainterPath() for _ in range(min(self._count, NUM_COLORS))]
+
+        circled = self._count <= self.CIRCLE_LIMIT
+        radius = self.CIRCLE_RADIUS / 2
+        for index, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+            path = self._paths[index % NUM_COLORS]
+            path.addRect(x, y, 1, 1)
+            if circled:
+                path.addEllipse(x - radius + 0.5, y - radius + 0.5, 2 * radius, 2 * radius)
+
+        self._bounds = QRectF()
+        for path in self._paths:
+            self._bounds = self._bounds.united(path.boundingRect())
+
+        # Leave room for the width of the cosmetic pen.
+        self._bounds.adjust(-radius, -radius, radius, radius)
+
+    @property
+    def count(self) -> int:
+        """Number of highlighted points."""
+        return self._count
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget | None = None):
+        for index, path in enumerate(self._paths):
+            pen = QPen(get_color(index))
+            pen.setWidth(3 if self._count <= self.CIRCLE_LIMIT else 1)
+            pen.setCosmetic(True)
+
+            painter.setPen(pen)
+            painter.drawPath(path)
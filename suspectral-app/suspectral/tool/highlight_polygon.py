@@ -0,0 +1,28 @@
+from PySide6.QtGui import QColor, QPen, QBrush
+from PySide6.QtWidgets import QGraphicsPolygonItem, QWidget
+
+
+class PolygonHighlight(QGraphicsPolygonItem):
+    """
+    A graphics item used to highlight a polygonal area on a scene.
+
+    This highlight is rendered in the same style as `AreaHighlight`, as a semi-transparent
+    filled polygon with a faint border, used for marking irregular regions of interest.
+
+    Parameters
+    ----------
+    parent : QWidget or None, optional
+        The parent widget, by default None.
+    """
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        r, g, b = 78, 155, 207
+
+        pen = QPen(QColor(r, g, b, 200))
+        pen.setCosmetic(True)
+        pen.setWidth(1)
+        self.setPen(pen)
+
+        brush = QBrush(QColor(r, g, b, 75))
+        self.setBrush(brush)
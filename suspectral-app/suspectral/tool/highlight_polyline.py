@@ -0,0 +1,38 @@
+from PySide6.QtGui import QColor, QPen, QPainterPath, QPolygonF
+from PySide6.QtWidgets import QGraphicsPathItem, QWidget
+
+
+class PolylineHighlight(QGraphicsPathItem):
+    """
+    A graphics item used to highlight an open polyline on a scene.
+
+    This highlight is rendered in the same color as `PolygonHighlight`, but without
+    a fill and with a thicker outline, since a polyline does not enclose an area.
+
+    Parameters
+    ----------
+    parent : QWidget or None, optional
+        The parent widget, by default None.
+    """
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        r, g, b = 78, 155, 207
+
+        pen = QPen(QColor(r, g, b, 220))
+        pen.setCosmetic(True)
+        pen.setWidth(2)
+        self.setPen(pen)
+
+    def setPolyline(self, polyline: QPolygonF):
+        """
+        Set the vertices of the highlighted polyline.
+
+        Parameters
+        ----------
+        polyline : QPolygonF
+            The vertices of the polyline, in scene coordinates.
+        """
+        path = QPainterPath()
+        path.addPolygon(polyline)
+        self.setPath(path)
@@ -4,7 +4,10 @@ from suspectral.exporter.exporter import Exporter
 from suspectral.model.hypercube_container import HypercubeContainer
 from suspectral.tool.tool import Tool
 from suspectral.tool.tool_area import AreaTool
+from suspectral.tool.tool_cross_section import CrossSectionTool
 from suspectral.tool.tool_pan import PanTool
+from suspectral.tool.tool_polygon import PolygonTool
+from suspectral.tool.tool_wand import WandTool
 from suspectral.tool.tool_inspect import InspectTool
 from suspectral.tool.tool_none import NoneTool
 from suspectral.tool.tool_zoom import ZoomTool
@@ -48,7 +51,10 @@ class ToolManager(QObject):
         self._pan = PanTool(view)
         self._zoom = ZoomTool(view)
         self._area = AreaTool(view, model, exporters)
+        self._polygon = PolygonTool(view, model, exporters)
+        self._wand = WandTool(view, model, exporters)
         self._inspect = InspectTool(view, model, exporters)
+        self._cross_section = CrossSectionTool(view, model)
 
         self._active_tool = self._none
         self._model.opened.connect(lambda: self._active_tool.activate())
@@ -89,7 +95,22 @@ class ToolManager(QObject):
         """The tool for selecting and inspecting rectangular areas."""
         return self._area
 
+    @property
+    def polygon(self) -> PolygonTool:
+        """The tool for selecting and inspecting polygonal and freehand areas."""
+        return self._polygon
+
+    @property
+    def wand(self) -> WandTool:
+        """The tool for selecting regions of spectrally similar pixels."""
+        return self._wand
+
     @property
     def inspect(self) -> InspectTool:
         """The tool for pixel-level inspection and selection."""
         return self._inspect
+
+    @property
+    def cross_section(self) -> CrossSectionTool:
+        """The tool for drawing lines to take a cross-section of the spectra along."""
+        return self._cross_section
@@ -1,16 +1,14 @@
 from typing import cast
 
-import itertools
 import numpy as np
 from PySide6.QtCore import Signal, QPoint, QRect, QEvent, Qt, QPointF, QRectF, QObject, Slot
 from PySide6.QtGui import QMouseEvent, QAction
 from PySide6.QtWidgets import QMenu
 
-from suspectral.colors import get_color
 from suspectral.exporter.exporter import Exporter
 from suspectral.model.hypercube_container import HypercubeContainer
 from suspectral.tool.highlight_area import AreaHighlight
-from suspectral.tool.highlight_point import PointHighlight
+from suspectral.tool.highlight_points import PointsHighlight
 from suspectral.tool.tool import Tool
 from suspectral.view.image.image_view import ImageView
 
@@ -22,6 +20,8 @@ class AreaTool(Tool):
     This tool allows the user to click and drag to select a rectangular region
     on the image. It visually highlights the selection area, provides sampling points,
     and supports exporting the spectral data within the selected region or sample points.
+    The sampling points form a regular grid over the selection, the size of which can be
+    changed from the context menu.
 
     Signals
     -------
@@ -33,6 +33,9 @@ class AreaTool(Tool):
         Emitted when the user finishes the selection drag.
     selectionSampled : np.ndarray, np.ndarray
         Emitted when sampling points within the selected area are computed.
+    selectionResampled : None
+        Emitted when the sampling grid of a finished selection changes, right before
+        its new sampling points are emitted.
     selectionEnded : None
         Emitted when the selection is reset or cleared.
 
@@ -50,8 +53,14 @@ class AreaTool(Tool):
     selectionMoved = Signal(QRect)
     selectionStopped = Signal(QRect)
     selectionSampled = Signal(np.ndarray, np.ndarray)
+    selectionResampled = Signal()
     selectionEnded = Signal()
 
+    GRID_SIZES = (3, 5, 10, 25, 50, 100)
+    """Sampling grid sizes offered in the context menu."""
+
+    MAX_GRID_SIZE = 100
+
     def __init__(self, view: ImageView, container: HypercubeContainer, exporters: list[Exporter]):
         super().__init__(view)
         self._container = container
@@ -64,10 +73,28 @@ class AreaTool(Tool):
         self._selection_moved = False
 
         self._highlight: AreaHighlight | None = None
-        self._samples: list[PointHighlight] = []
+        self._grid_size = 3
+        self._samples: PointsHighlight | None = None
         self._sample_xs: np.ndarray | None = None
         self._sample_ys: np.ndarray | None = None
 
+    @property
+    def grid_size(self) -> int:
+        """Number of sampling points along each side of the selection."""
+        return self._grid_size
+
+    @grid_size.setter
+    def grid_size(self, size: int):
+        if not 1 <= size <= self.MAX_GRID_SIZE:
+            raise ValueError(f"Grid size must be between 1 and {self.MAX_GRID_SIZE}, got {size}.")
+
+        self._grid_size = size
+
+        if self._sample_xs is not None:
+            self._remove_samples()
+            self.selectionResampled.emit()
+            self._sample_selection()
+
     def activate(self):
         super().activate()
         self._view.contextMenuRequested.connect(self._handle_context_menu)
@@ -141,6 +168,15 @@ class AreaTool(Tool):
             action.setEnabled(bool(self._selection_rect))
             menu_points.addAction(action)
 
+        menu_points.addSeparator()
+        menu_grid = menu_points.addMenu("Sampling Grid")
+        for size in self.GRID_SIZES:
+            action = QAction(f"{size} × {size}", self)
+            action.setCheckable(True)
+            action.setChecked(size == self._grid_size)
+            action.triggered.connect(lambda _, it=size: setattr(self, "grid_size", it))
+            menu_grid.addAction(action)
+
     def _export_selection_area(self, exporter: Exporter):
         tl = self._selection_rect.topLeft()
         br = self._selection_rect.bottomRight()
@@ -153,7 +189,9 @@ class AreaTool(Tool):
 
     def _export_selection_points(self, exporter: Exporter):
         hypercube = self._container.hypercube
-        spectra = hypercube.read_pixels([(x, y) for y, x in itertools.product(self._sample_ys, self._sample_xs)])
+        spectra = hypercube.read_subimage(self._sample_ys, self._sample_xs)
+        spectra = spectra.reshape(-1, spectra.shape[-1])
+
         exporter.export(hypercube.name, spectra, hypercube.wavelengths)
 
     def _start_selection(self, event: QMouseEvent):
@@ -197,13 +235,12 @@ class AreaTool(Tool):
         tl = self._selection_rect.topLeft()
         br = self._selection_rect.bottomRight()
 
-        self._sample_xs = np.unique(np.linspace(start=tl.x(), stop=br.x() - 1, num=3).astype(int))
-        self._sample_ys = np.unique(np.linspace(start=tl.y(), stop=br.y() - 1, num=3).astype(int))
+        self._sample_xs = np.unique(np.linspace(start=tl.x(), stop=br.x() - 1, num=self._grid_size).astype(int))
+        self._sample_ys = np.unique(np.linspace(start=tl.y(), stop=br.y() - 1, num=self._grid_size).astype(int))
 
-        for y, x in itertools.product(self._sample_ys, self._sample_xs):
-            sample = PointHighlight(self._view, QPoint(x, y), get_color(len(self._samples)))
-            self._samples.append(sample)
-            self._view.scene().addItem(sample)
+        grid_xs, grid_ys = np.meshgrid(self._sample_xs, self._sample_ys)
+        self._samples = PointsHighlight(grid_xs.ravel(), grid_ys.ravel())
+        self._view.scene().addItem(self._samples)
 
         self.selectionSampled.emit(self._sample_xs, self._sample_ys)
 
@@ -222,10 +259,10 @@ class AreaTool(Tool):
             self._highlight = None
 
     def _remove_samples(self):
-        for sample in self._samples:
-            self._view.scene().removeItem(sample)
+        if self._samples is not None:
+            self._view.scene().removeItem(self._samples)
+            self._samples = None
 
-        self._samples.clear()
         self._sample_xs = None
         self._sample_ys = None
 
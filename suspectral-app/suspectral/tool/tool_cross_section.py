@@ -0,0 +1,226 @@
+import math
+from typing import cast
+
+from PySide6.QtCore import Signal, QEvent, Qt, QPointF, QObject
+from PySide6.QtGui import QMouseEvent, QPolygonF
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.tool.highlight_polyline import PolylineHighlight
+from suspectral.tool.tool import Tool
+from suspectral.view.image.image_view import ImageView
+
+
+class CrossSectionTool(Tool):
+    """
+    Tool to draw a polyline across an image view, along which a cross-section of the spectra is taken.
+
+    Pressing and dragging draws a straight line, which is finished when the button is
+    released. Clicking instead places the vertices of a polyline one by one, which is
+    finished by double-clicking. Holding Shift snaps the segment being drawn to the
+    horizontal or vertical direction, whichever is closer. A finished line can be moved
+    around by dragging it. The line is reported on every change, including while it is
+    being drawn or moved, so that the cross-section follows the mouse.
+
+    Signals
+    -------
+    sectionChanged : QPolygonF
+        Emitted with the vertices of the line in image coordinates whenever it changes.
+    sectionEnded : None
+        Emitted when the line is cleared.
+
+    Parameters
+    ----------
+    view : ImageView
+        The image view widget where interaction occurs.
+    container : HypercubeContainer
+        The hypercube model containing spectral data.
+    """
+
+    sectionChanged = Signal(QPolygonF)
+    sectionEnded = Signal()
+
+    GRAB_DISTANCE = 6
+    """Distance in screen pixels from a finished line within which pressing starts moving it."""
+
+    def __init__(self, view: ImageView, container: HypercubeContainer):
+        super().__init__(view)
+        self._container = container
+
+        self._drawing = False
+        self._dragging = False
+        self._moving: QPointF | None = None
+        self._points: list[QPointF] = []
+        self._cursor: QPointF | None = None
+
+        self._highlight: PolylineHighlight | None = None
+
+    @property
+    def polyline(self) -> QPolygonF:
+        """The vertices of the current line in image coordinates, including the one being placed."""
+        return QPolygonF(self._points if self._cursor is None else [*self._points, self._cursor])
+
+    def deactivate(self):
+        self.sectionEnded.emit()
+        self._reset()
+        self._view.unsetCursor()
+        super().deactivate()
+
+    def _reset(self):
+        self._drawing = False
+        self._dragging = False
+        self._moving = None
+        self._points = []
+        self._cursor = None
+        self._remove_highlight()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Enter:
+            return self._handle_enter(event)
+        if event.type() == QEvent.Type.Leave:
+            return self._handle_leave(event)
+        if event.type() == QEvent.Type.MouseButtonPress:
+            return self._handle_mouse_press(cast(QMouseEvent, event))
+        if event.type() == QEvent.Type.MouseMove:
+            return self._handle_mouse_move(cast(QMouseEvent, event))
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            return self._handle_mouse_release(cast(QMouseEvent, event))
+        if event.type() == QEvent.Type.MouseButtonDblClick:
+            return self._handle_mouse_double_click(cast(QMouseEvent, event))
+
+        return super().eventFilter(watched, event)
+
+    def _handle_enter(self, _: QEvent) -> bool:
+        self._view.setCursor(Qt.CursorShape.CrossCursor)
+        return False
+
+    def _handle_leave(self, _: QEvent) -> bool:
+        self._view.unsetCursor()
+        return False
+
+    def _handle_mouse_press(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        if self._drawing:
+            self._points.append(self._get_snapped_point(event))
+            self._cursor = None
+            self._changed()
+        elif self._is_near_line(event):
+            self._moving = self._get_image_point(event)
+        else:
+            self._reset()
+            self._drawing = True
+            self._points = [self._get_image_point(event)]
+            self._changed()
+
+        self._dragging = True
+        return False
+
+    def _handle_mouse_move(self, event: QMouseEvent) -> bool:
+        if self._moving is not None:
+            point = self._get_image_point(event)
+            delta = point - self._moving
+            self._moving = point
+            self._points = [vertex + delta for vertex in self._points]
+            self._changed()
+        elif self._drawing:
+            self._cursor = self._get_snapped_point(event)
+            self._changed()
+
+        return False
+
+    def _handle_mouse_release(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        self._dragging = False
+        self._moving = None
+
+        # Releasing away from where the line was started draws a single straight line.
+        if self._drawing and len(self._points) == 1 and self._cursor is not None \
+                and self._cursor != self._points[0]:
+            self._points.append(self._cursor)
+            self._finish()
+
+        return False
+
+    def _handle_mouse_double_click(self, event: QMouseEvent) -> bool:
+        if event.button() == Qt.MouseButton.LeftButton and self._drawing:
+            self._finish()
+
+        return False
+
+    def _finish(self):
+        self._drawing = False
+        self._cursor = None
+
+        # The press of a double-click places a duplicate of the last vertex.
+        points = [self._points[0]]
+        for point in self._points[1:]:
+            if point != points[-1]:
+                points.append(point)
+
+        if len(points) < 2:
+            self._reset()
+            self.sectionEnded.emit()
+            return
+
+        self._points = points
+        self._changed()
+
+    def _changed(self):
+        self._update_highlight()
+        self.sectionChanged.emit(self.polyline)
+
+    def _update_highlight(self):
+        if self._highlight is None:
+            self._highlight = PolylineHighlight()
+            self._view.scene().addItem(self._highlight)
+
+        self._highlight.setPolyline(self._view.image.mapToScene(self.polyline))
+
+    def _remove_highlight(self):
+        if self._highlight is not None:
+            self._view.scene().removeItem(self._highlight)
+            self._highlight = None
+
+    def _is_near_line(self, event: QMouseEvent) -> bool:
+        if len(self._points) < 2:
+            return False
+
+        position = event.position()
+        vertices = [QPointF(self._view.mapFromScene(self._view.image.mapToScene(point))) for point in self._points]
+        for start, end in zip(vertices, vertices[1:]):
+            if self._distance_to_segment(position, start, end) <= self.GRAB_DISTANCE:
+                return True
+
+        return False
+
+    @staticmethod
+    def _distance_to_segment(point: QPointF, start: QPointF, end: QPointF) -> float:
+        dx, dy = end.x() - start.x(), end.y() - start.y()
+        length = dx * dx + dy * dy
+        t = 0.0 if length == 0 else ((point.x() - start.x()) * dx + (point.y() - start.y()) * dy) / length
+        t = max(0.0, min(1.0, t))
+        return math.hypot(point.x() - start.x() - t * dx, point.y() - start.y() - t * dy)
+
+    def _get_snapped_point(self, event: QMouseEvent) -> QPointF:
+        point = self._get_image_point(event)
+        if not event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+            return point
+
+        last = self._points[-1]
+        if abs(point.x() - last.x()) >= abs(point.y() - last.y()):
+            return QPointF(point.x(), last.y())
+
+        return QPointF(last.x(), point.y())
+
+    def _get_image_point(self, event: QMouseEvent) -> QPointF:
+        hypercube = self._container.hypercube
+
+        scene_position = self._view.mapToScene(event.position().toPoint())
+        point = self._view.image.mapFromScene(scene_position)
+        return QPointF(
+            max(0.0, min(point.x(), hypercube.num_cols)),
+            max(0.0, min(point.y(), hypercube.num_rows)),
+        )
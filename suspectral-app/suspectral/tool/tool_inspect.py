@@ -11,6 +11,7 @@ from suspectral.tool.highlight_pixel import PixelHighlight
 from suspectral.tool.highlight_point import PointHighlight
 from suspectral.tool.tool import Tool
 from suspectral.view.image.image_view import ImageView
+from suspectral.worker.worker_similarity import SimilarityWorker
 
 
 class InspectTool(Tool):
@@ -20,7 +21,8 @@ class InspectTool(Tool):
     This tool allows users to click on pixels to select them, optionally selecting
     multiple pixels with the Control key. It provides visual feedback such as a
     crosshair overlay and pixel highlight. Selected spectra can be exported using
-    a context menu with registered exporters.
+    a context menu with registered exporters, which also offers to find pixels
+    similar to the most recently selected one.
 
     Signals
     -------
@@ -28,6 +30,12 @@ class InspectTool(Tool):
         Emitted when a new pixel is selected by the user.
     pixelCleared : None
         Emitted when the current selection is cleared.
+    similarityRequested : QPoint, str
+        Emitted when the user asks to find pixels similar to the given one,
+        along with the key of the metric to use (see `SimilarityWorker.METRICS`).
+    neighboursRequested : QPoint
+        Emitted when the user asks to find the pixels most similar to the given
+        one with the spectral index of the hypercube.
 
     Parameters
     ----------
@@ -41,6 +49,8 @@ class InspectTool(Tool):
 
     pixelClicked = Signal(QPoint)
     pixelCleared = Signal()
+    similarityRequested = Signal(QPoint, str)
+    neighboursRequested = Signal(QPoint)
 
     def __init__(self, view: ImageView, container: HypercubeContainer, exporters: list[Exporter]):
         super().__init__(view)
@@ -108,6 +118,19 @@ class InspectTool(Tool):
             action.setEnabled(bool(self._points))
             menu.addAction(action)
 
+        menu.addSeparator()
+        menu_similar = menu.addMenu("Find Similar")
+        menu_similar.setEnabled(bool(self._points))
+        for metric, label in SimilarityWorker.METRICS.items():
+            action = QAction(f"By {label}", self)
+            action.triggered.connect(lambda _, it=metric: self.similarityRequested.emit(self._points[-1], it))
+            menu_similar.addAction(action)
+
+        menu_similar.addSeparator()
+        action = QAction("Nearest Pixels (Indexed)", self)
+        action.triggered.connect(lambda: self.neighboursRequested.emit(self._points[-1]))
+        menu_similar.addAction(action)
+
     def _export_selection(self, exporter: Exporter):
         hypercube = self._container.hypercube
         spectra = hypercube.read_pixels([(p.y(), p.x()) for p in self._points])
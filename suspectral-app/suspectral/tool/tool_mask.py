@@ -0,0 +1,64 @@
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QMenu
+
+from suspectral.exporter.exporter import Exporter
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.tool.tool import Tool
+from suspectral.view.image.image_view import ImageView
+
+
+class MaskTool(Tool):
+    """
+    Base class for tools whose selections are rasterized into a `SelectionMask`.
+
+    Provides the last selected mask, and the context menu actions that export the
+    pixels of the mask along with their per-band statistics.
+
+    Parameters
+    ----------
+    view : ImageView
+        The image view widget where interaction occurs.
+    container : HypercubeContainer
+        The hypercube model containing spectral data.
+    exporters : list[Exporter]
+        Exporters instances available for exporting selected pixel spectra.
+    """
+
+    SAMPLE_LIMIT = 10_000
+    """Maximum number of pixels sampled from a selection for plotting and listing."""
+
+    def __init__(self, view: ImageView, container: HypercubeContainer, exporters: list[Exporter]):
+        super().__init__(view)
+        self._container = container
+        self._exporters = exporters
+        self._mask: SelectionMask | None = None
+
+    @property
+    def mask(self) -> SelectionMask | None:
+        """The mask of the last completed selection, if any."""
+        return self._mask
+
+    def _add_export_actions(self, menu: QMenu):
+        for exporter in self._exporters:
+            action = QAction(f"Export All to {exporter.label}", self)
+            action.triggered.connect(lambda _, it=exporter: self._export_selection(it))
+            action.setEnabled(self._mask is not None)
+            menu.addAction(action)
+
+        menu.addSeparator()
+        for exporter in self._exporters:
+            action = QAction(f"Export Statistics to {exporter.label}", self)
+            action.triggered.connect(lambda _, it=exporter: self._export_statistics(it))
+            action.setEnabled(self._mask is not None)
+            menu.addAction(action)
+
+    def _export_selection(self, exporter: Exporter):
+        hypercube = self._container.hypercube
+        spectra = self._mask.read_spectra(hypercube)
+        exporter.export(hypercube.name, spectra, hypercube.wavelengths)
+
+    def _export_statistics(self, exporter: Exporter):
+        hypercube = self._container.hypercube
+        statistics = self._mask.statistics(hypercube)
+        exporter.export(f"{hypercube.name} (Statistics)", statistics, hypercube.wavelengths)
@@ -0,0 +1,236 @@
+from typing import cast
+
+from PySide6.QtCore import Signal, QEvent, Qt, QPoint, QPointF, QObject, Slot, QLineF
+from PySide6.QtGui import QMouseEvent, QPolygonF
+from PySide6.QtWidgets import QApplication, QMenu
+
+from suspectral.exporter.exporter import Exporter
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.tool.highlight_polygon import PolygonHighlight
+from suspectral.tool.tool_mask import MaskTool
+from suspectral.view.image.image_view import ImageView
+
+
+class PolygonTool(MaskTool):
+    """
+    Tool to select and inspect irregular areas within an image view.
+
+    The user can either click to place the vertices of a polygon, closing it by
+    double-clicking or by clicking near its first vertex, or press and drag to
+    draw a freehand lasso, which is closed when the button is released. The shape
+    is rasterized into a `SelectionMask`, whose pixels can be exported along with
+    their per-band statistics.
+
+    Signals
+    -------
+    selectionStarted : QPointF
+        Emitted when the user places the first vertex of a new selection.
+    selectionMoved : QPolygonF
+        Emitted when the outline of the selection changes while drawing.
+    selectionMasked : SelectionMask
+        Emitted when the selection is closed and rasterized into a mask.
+    selectionSampled : SelectionMask
+        Emitted right after `selectionMasked` with an evenly thinned mask of
+        at most `SAMPLE_LIMIT` pixels, meant for plotting and listing.
+    selectionEnded : None
+        Emitted when the selection is reset or cleared.
+
+    Parameters
+    ----------
+    view : ImageView
+        The image view widget where interaction occurs.
+    container : HypercubeContainer
+        The hypercube model containing spectral data.
+    exporters : list[Exporter]
+        Exporters instances available for exporting selected pixel spectra.
+    """
+
+    selectionStarted = Signal(QPointF)
+    selectionMoved = Signal(QPolygonF)
+    selectionMasked = Signal(SelectionMask)
+    selectionSampled = Signal(SelectionMask)
+    selectionEnded = Signal()
+
+    CLOSE_DISTANCE = 8
+    """Distance in screen pixels from the first vertex within which a click closes the polygon."""
+
+    def __init__(self, view: ImageView, container: HypercubeContainer, exporters: list[Exporter]):
+        super().__init__(view, container, exporters)
+
+        self._drawing = False
+        self._dragging = False
+        self._press_position = QPoint()
+        self._lasso = False
+        self._points: list[QPointF] = []
+        self._cursor: QPointF | None = None
+
+        self._highlight: PolygonHighlight | None = None
+
+    def activate(self):
+        super().activate()
+        self._view.contextMenuRequested.connect(self._handle_context_menu)
+
+    def deactivate(self):
+        self._view.contextMenuRequested.disconnect(self._handle_context_menu)
+        self.selectionEnded.emit()
+        self._reset()
+        self._view.unsetCursor()
+        super().deactivate()
+
+    def _reset(self):
+        self._drawing = False
+        self._dragging = False
+        self._lasso = False
+        self._points = []
+        self._cursor = None
+        self._mask = None
+        self._remove_highlight()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Enter:
+            return self._handle_enter(event)
+        if event.type() == QEvent.Type.Leave:
+            return self._handle_leave(event)
+        if event.type() == QEvent.Type.MouseButtonPress:
+            return self._handle_mouse_press(cast(QMouseEvent, event))
+        if event.type() == QEvent.Type.MouseMove:
+            return self._handle_mouse_move(cast(QMouseEvent, event))
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            return self._handle_mouse_release(cast(QMouseEvent, event))
+        if event.type() == QEvent.Type.MouseButtonDblClick:
+            return self._handle_mouse_double_click(cast(QMouseEvent, event))
+
+        return super().eventFilter(watched, event)
+
+    def _handle_enter(self, _: QEvent) -> bool:
+        self._view.setCursor(Qt.CursorShape.CrossCursor)
+        return False
+
+    def _handle_leave(self, _: QEvent) -> bool:
+        self._view.unsetCursor()
+        return False
+
+    def _handle_mouse_press(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        if not self._drawing:
+            self._start_selection(event)
+        elif self._is_near_first_vertex(event):
+            self._close_selection()
+            return False
+        else:
+            self._add_vertex(self._get_image_point(event))
+
+        self._dragging = True
+        self._press_position = event.position().toPoint()
+        return False
+
+    def _handle_mouse_move(self, event: QMouseEvent) -> bool:
+        if not self._drawing:
+            return False
+
+        point = self._get_image_point(event)
+        if self._dragging:
+            # Dragging with the button held draws a freehand outline, but a slight jitter
+            # while clicking a vertex must not turn the polygon into one.
+            distance = (event.position().toPoint() - self._press_position).manhattanLength()
+            if not self._lasso and distance < QApplication.startDragDistance():
+                return False
+
+            self._lasso = True
+            if point != self._points[-1]:
+                self._add_vertex(point)
+        else:
+            self._cursor = point
+            self._update_highlight()
+
+        return False
+
+    def _handle_mouse_release(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        self._dragging = False
+        if self._drawing and self._lasso:
+            self._close_selection()
+
+        return False
+
+    def _handle_mouse_double_click(self, event: QMouseEvent) -> bool:
+        if event.button() == Qt.MouseButton.LeftButton and self._drawing:
+            self._close_selection()
+
+        return False
+
+    @Slot()
+    def _handle_context_menu(self, menu: QMenu):
+        menu_polygon = menu.addMenu("Selection Polygon")
+        self._add_export_actions(menu_polygon)
+
+    def _start_selection(self, event: QMouseEvent):
+        self._reset()
+
+        point = self._get_image_point(event)
+        self._drawing = True
+        self._points = [point]
+        self.selectionStarted.emit(point)
+        self._update_highlight()
+
+    def _add_vertex(self, point: QPointF):
+        self._points.append(point)
+        self._cursor = None
+        self.selectionMoved.emit(QPolygonF(self._points))
+        self._update_highlight()
+
+    def _close_selection(self):
+        self._drawing = False
+        self._dragging = False
+        self._lasso = False
+        self._cursor = None
+
+        mask = None
+        if len(self._points) >= 3:
+            hypercube = self._container.hypercube
+            mask = SelectionMask.from_polygon(self._points, hypercube.num_rows, hypercube.num_cols)
+
+        if mask is None or mask.count == 0:
+            self._reset()
+            self.selectionEnded.emit()
+            return
+
+        self._mask = mask
+        self._update_highlight()
+        self.selectionMasked.emit(mask)
+        self.selectionSampled.emit(mask.thin(self.SAMPLE_LIMIT))
+
+    def _update_highlight(self):
+        if self._highlight is None:
+            self._highlight = PolygonHighlight()
+            self._view.scene().addItem(self._highlight)
+
+        points = self._points if self._cursor is None else [*self._points, self._cursor]
+        self._highlight.setPolygon(self._view.image.mapToScene(QPolygonF(points)))
+
+    def _remove_highlight(self):
+        if self._highlight is not None:
+            self._view.scene().removeItem(self._highlight)
+            self._highlight = None
+
+    def _is_near_first_vertex(self, event: QMouseEvent) -> bool:
+        if len(self._points) < 3:
+            return False
+
+        first = self._view.mapFromScene(self._view.image.mapToScene(self._points[0]))
+        return QLineF(QPointF(first), event.position()).length() <= self.CLOSE_DISTANCE
+
+    def _get_image_point(self, event: QMouseEvent) -> QPointF:
+        hypercube = self._container.hypercube
+
+        scene_position = self._view.mapToScene(event.position().toPoint())
+        point = self._view.image.mapFromScene(scene_position)
+        return QPointF(
+            max(0.0, min(point.x(), hypercube.num_cols)),
+            max(0.0, min(point.y(), hypercube.num_rows)),
+        )
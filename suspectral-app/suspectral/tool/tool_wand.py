@@ -0,0 +1,201 @@
+import math
+from typing import cast
+
+from PySide6.QtCore import Signal, QEvent, Qt, QPointF, QObject, Slot
+from PySide6.QtGui import QMouseEvent, QAction
+from PySide6.QtWidgets import QMenu
+
+from suspectral.exporter.exporter import Exporter
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.region_growing import RegionGrowing
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.tool.highlight_mask import MaskHighlight
+from suspectral.tool.tool_mask import MaskTool
+from suspectral.view.image.image_view import ImageView
+from suspectral.worker.worker import start_worker, join_workers
+from suspectral.worker.worker_region import RegionWorker
+
+
+class WandTool(MaskTool):
+    """
+    Tool to select regions of spectrally similar pixels within an image view.
+
+    Clicking a pixel grows a region of connected pixels whose spectra are similar
+    to that of the clicked one, using `RegionGrowing` in the background. Clicking
+    again before it is done abandons the previous region. The tolerance of the similarity
+    can be changed from the context menu, which grows the region anew from the same
+    pixel. Just like with other selections, the pixels of the resulting `SelectionMask`
+    can be exported along with their per-band statistics.
+
+    Signals
+    -------
+    selectionStarted : QPointF
+        Emitted when the user clicks the seed pixel of a new selection.
+    selectionMasked : SelectionMask
+        Emitted when the region has been grown into a mask.
+    selectionSampled : SelectionMask
+        Emitted right after `selectionMasked` with an evenly thinned mask of
+        at most `SAMPLE_LIMIT` pixels, meant for plotting and listing.
+    selectionEnded : None
+        Emitted when the selection is reset or cleared.
+
+    Parameters
+    ----------
+    view : ImageView
+        The image view widget where interaction occurs.
+    container : HypercubeContainer
+        The hypercube model containing spectral data.
+    exporters : list[Exporter]
+        Exporters instances available for exporting selected pixel spectra.
+    """
+
+    selectionStarted = Signal(QPointF)
+    selectionMasked = Signal(SelectionMask)
+    selectionSampled = Signal(SelectionMask)
+    selectionEnded = Signal()
+
+    TOLERANCES = (1.0, 2.0, 5.0, 10.0, 20.0)
+    """Spectral angles in degrees which the tolerance can be set to from the context menu."""
+
+    def __init__(self, view: ImageView, container: HypercubeContainer, exporters: list[Exporter]):
+        super().__init__(view, container, exporters)
+
+        self._tolerance = RegionGrowing.TOLERANCE
+        self._seed: tuple[int, int] | None = None
+        self._worker: RegionWorker | None = None
+
+        self._highlight: MaskHighlight | None = None
+
+    @property
+    def tolerance(self) -> float:
+        """The maximum spectral angle between the pixels of a region and its seed, in degrees."""
+        return self._tolerance
+
+    def set_tolerance(self, tolerance: float):
+        """
+        Set the tolerance of the similarity, growing the current selection anew if there is one.
+
+        Parameters
+        ----------
+        tolerance : float
+            The maximum spectral angle between the pixels of a region and its seed, in degrees.
+        """
+        self._tolerance = tolerance
+        if self._seed is not None:
+            self._select(*self._seed)
+
+    def activate(self):
+        super().activate()
+        self._view.contextMenuRequested.connect(self._handle_context_menu)
+
+    def deactivate(self):
+        self._view.contextMenuRequested.disconnect(self._handle_context_menu)
+        self.selectionEnded.emit()
+        self._reset()
+        join_workers(self)
+        self._view.unsetCursor()
+        super().deactivate()
+
+    def _reset(self):
+        self._stop_worker()
+        self._seed = None
+        self._mask = None
+        self._remove_highlight()
+
+    def _stop_worker(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+            self._view.setCursor(Qt.CursorShape.CrossCursor)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Enter:
+            return self._handle_enter(event)
+        if event.type() == QEvent.Type.Leave:
+            return self._handle_leave(event)
+        if event.type() == QEvent.Type.MouseButtonPress:
+            return self._handle_mouse_press(cast(QMouseEvent, event))
+
+        return super().eventFilter(watched, event)
+
+    def _handle_enter(self, _: QEvent) -> bool:
+        self._view.setCursor(Qt.CursorShape.CrossCursor)
+        return False
+
+    def _handle_leave(self, _: QEvent) -> bool:
+        self._view.unsetCursor()
+        return False
+
+    def _handle_mouse_press(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        hypercube = self._container.hypercube
+        point = self._get_image_point(event)
+        row, col = math.floor(point.y()), math.floor(point.x())
+        if 0 <= row < hypercube.num_rows and 0 <= col < hypercube.num_cols:
+            self._select(row, col)
+
+        return False
+
+    @Slot()
+    def _handle_context_menu(self, menu: QMenu):
+        menu_wand = menu.addMenu("Selection Wand")
+
+        menu_tolerance = menu_wand.addMenu("Tolerance")
+        for tolerance in self.TOLERANCES:
+            action = QAction(f"{tolerance:g}°", self)
+            action.setCheckable(True)
+            action.setChecked(tolerance == self._tolerance)
+            action.triggered.connect(lambda _, it=tolerance: self.set_tolerance(it))
+            menu_tolerance.addAction(action)
+
+        menu_wand.addSeparator()
+        self._add_export_actions(menu_wand)
+
+    def _select(self, row: int, col: int):
+        self._reset()
+        self._seed = row, col
+        self.selectionStarted.emit(QPointF(col, row))
+
+        self._view.setCursor(Qt.CursorShape.BusyCursor)
+        self._worker = RegionWorker(self._container.hypercube, row, col, self._tolerance)
+        self._worker.grown.connect(self._handle_region_grown)
+        self._worker.finished.connect(self._handle_worker_finished)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_region_grown(self, mask: SelectionMask):
+        if self.sender() is not self._worker:
+            return
+
+        if mask.count == 0:
+            self._reset()
+            self.selectionEnded.emit()
+            return
+
+        self._mask = mask
+        self._update_highlight()
+        self.selectionMasked.emit(mask)
+        self.selectionSampled.emit(mask.thin(self.SAMPLE_LIMIT))
+
+    @Slot()
+    def _handle_worker_finished(self):
+        if self.sender() is self._worker:
+            self._stop_worker()
+
+    def _update_highlight(self):
+        self._remove_highlight()
+
+        self._highlight = MaskHighlight(self._mask)
+        self._highlight.setPos(self._view.image.mapToScene(QPointF(self._mask.left, self._mask.top)))
+        self._view.scene().addItem(self._highlight)
+
+    def _remove_highlight(self):
+        if self._highlight is not None:
+            self._view.scene().removeItem(self._highlight)
+            self._highlight = None
+
+    def _get_image_point(self, event: QMouseEvent) -> QPointF:
+        scene_position = self._view.mapToScene(event.position().toPoint())
+        return self._view.image.mapFromScene(scene_position)
@@ -0,0 +1,111 @@
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import Qt, Slot, QRectF
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QLabel, QStackedWidget, QWidget
+
+from suspectral.colors import get_colormap_lut
+
+
+class CrossSectionView(QStackedWidget):
+    """
+    A widget displaying the spectra along a line drawn over the image as a heat map.
+
+    The horizontal axis is the position of each pixel along the line, and the vertical
+    axis is the wavelength or band number, so that every column of the heat map is the
+    spectrum of one pixel. The contrast is stretched between the 2nd and 98th percentiles
+    of the values, so that a few extreme pixels do not wash out the rest. Shows a
+    placeholder message while no line is drawn.
+
+    Parameters
+    ----------
+    parent : QWidget or None, optional
+        The parent widget, by default None.
+    """
+
+    COLORMAP = "viridis"
+    PERCENTILES = (2, 98)
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._wavelengths: np.ndarray | None = None
+
+        self.setAutoFillBackground(True)
+        self.setBackgroundRole(QPalette.ColorRole.Base)
+
+        self._placeholder = QLabel("Draw a line over the image with the cross-section tool "
+                                   "to display the spectra along it.")
+        self._placeholder.setForegroundRole(QPalette.ColorRole.PlaceholderText)
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self._placeholder.setContentsMargins(4, 4, 4, 4)
+        self._placeholder.setWordWrap(True)
+
+        self._image = pg.ImageItem()
+        self._image.setLookupTable(get_colormap_lut(self.COLORMAP))
+
+        self._plot = pg.PlotWidget()
+        self._plot.addItem(self._image)
+        self._plot.getViewBox().setMenuEnabled(False)
+        self._plot.getViewBox().setMouseEnabled(x=False, y=False)
+        self._plot.getPlotItem().setContentsMargins(10, 20, 20, 10)
+        self._plot.setLabel("bottom", "Position (px)")
+        self._plot.setLabel("left", "Band Number")
+        self._plot.setMinimumHeight(200)
+
+        self.addWidget(self._placeholder)
+        self.addWidget(self._plot)
+
+    @property
+    def image(self) -> pg.ImageItem:
+        """The image item displaying the heat map."""
+        return self._image
+
+    @Slot()
+    def set_wavelengths(self, wavelengths: np.ndarray, unit: str | None = None):
+        """
+        Set the vertical axis to use the specified wavelength values.
+
+        Parameters
+        ----------
+        wavelengths : np.ndarray
+            Array of wavelength values corresponding to spectral bands.
+        unit : str, optional
+            Unit of the wavelength values (e.g., 'nm', 'µm').
+        """
+        self._wavelengths = wavelengths
+        self._plot.setLabel("left", f"Wavelength ({unit})" if unit else "Wavelength")
+
+    @Slot()
+    def set_band_numbers(self):
+        """Set the vertical axis to display band indices instead of wavelengths."""
+        self._wavelengths = None
+        self._plot.setLabel("left", "Band Number")
+
+    @Slot()
+    def display(self, spectra: np.ndarray):
+        """
+        Display the spectra along a line.
+
+        Parameters
+        ----------
+        spectra : np.ndarray
+            The spectra of the pixels along the line of shape (positions, bands), in order.
+        """
+        num_positions, num_bands = spectra.shape
+        y = self._wavelengths if self._wavelengths is not None else np.arange(num_bands)
+        y_step = (y[-1] - y[0]) / max(num_bands - 1, 1) or 1.0
+
+        finite = spectra[np.isfinite(spectra)]
+        lo, hi = np.percentile(finite, self.PERCENTILES) if finite.size else (0.0, 1.0)
+
+        self._image.setImage(spectra, levels=(float(lo), float(hi) if hi > lo else float(lo) + 1.0))
+        self._image.setRect(QRectF(0, y[0] - y_step / 2, num_positions, y_step * num_bands))
+        self._plot.setXRange(0, num_positions, padding=0)
+        self._plot.setYRange(y[0] - y_step / 2, y[-1] + y_step / 2, padding=0)
+        self.setCurrentWidget(self._plot)
+
+    @Slot()
+    def clear(self):
+        """Remove the heat map and show the placeholder message."""
+        self._image.clear()
+        self.setCurrentWidget(self._placeholder)
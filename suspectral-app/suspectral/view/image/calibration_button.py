@@ -0,0 +1,83 @@
+from PySide6.QtCore import Slot
+from PySide6.QtWidgets import QPushButton, QSizePolicy, QWidget
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.spectral_reference import SpectralReference
+
+
+class CalibrationButton(QPushButton):
+    """
+    A button which calibrates the current hypercube into reflectance with the selected references.
+
+    Calibration runs in the background (see `HypercubeContainer.calibrate`), during which
+    the button shows the progress and cancels it when clicked. Once the hypercube is
+    calibrated, all tools read reflectance, and the button removes the calibration instead.
+
+    Parameters
+    ----------
+    model : HypercubeContainer
+        The container providing access to the current hypercube.
+    white_ref_select : SpectralReference
+        The selector of the white reference pixel.
+    black_ref_select : SpectralReference
+        The selector of the black reference pixel.
+    parent : QWidget or None, optional
+        The parent QWidget of this widget, by default None.
+    """
+
+    def __init__(self,
+                 model: HypercubeContainer,
+                 white_ref_select: SpectralReference,
+                 black_ref_select: SpectralReference,
+                 parent: QWidget | None = None):
+        super().__init__(parent)
+        self._model = model
+        self._white_ref_select = white_ref_select
+        self._black_ref_select = black_ref_select
+
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setToolTip(
+            "Calibrates the hypercube into reflectance with the selected white and black references\n"
+            "once, so that its spectra, exports, and synthesized images are all calibrated."
+        )
+        self.clicked.connect(self._handle_clicked)
+
+        self._model.opened.connect(self._update)
+        self._model.calibrationChanged.connect(self._handle_calibration_changed)
+        self._model.calibrationProgress.connect(self._handle_calibration_progress)
+        self._update()
+
+    @Slot()
+    def _handle_clicked(self):
+        if self._model.hypercube is None:
+            return
+
+        if self._model.hypercube.calibrated or self._model.is_calibrating():
+            self._model.remove_calibration()
+            return
+
+        white_ref = self._white_ref_select.get()
+        black_ref = self._black_ref_select.get()
+        if white_ref is not None or black_ref is not None:
+            self._model.calibrate(white_ref, black_ref)
+
+    @Slot()
+    def _handle_calibration_changed(self, hypercube: Hypercube):
+        if hypercube is self._model.hypercube:
+            self._update()
+
+    @Slot()
+    def _handle_calibration_progress(self, hypercube: Hypercube, percent: int):
+        if hypercube is self._model.hypercube:
+            self.setText(f"Cancel Calibration ({percent}%)")
+
+    @Slot()
+    def _update(self):
+        hypercube = self._model.hypercube
+        if hypercube is not None and self._model.is_calibrating():
+            self.setText("Cancel Calibration")
+        elif hypercube is not None and hypercube.calibrated:
+            self.setText("Remove Calibration")
+        else:
+            self.setText("Calibrate Reflectance")
@@ -18,6 +18,9 @@ class ColoringMode(QWidget):
     imageChanged = Signal(np.ndarray)
     statusChanged = Signal(bool)
 
+    PREVIEW_BINNING = 4
+    """Number of rows and columns of the hypercube averaged into each pixel of a preview."""
+
     def activate(self):
         """
         Activates the coloring mode.
@@ -35,3 +38,25 @@ class ColoringMode(QWidget):
         any functionality when the coloring mode is no longer active.
         """
         pass
+
+    @staticmethod
+    def enlarge_preview(image: np.ndarray, shape: tuple[int, int], binning: int) -> np.ndarray:
+        """
+        Enlarges an image synthesized from a binned view back to the size of the hypercube.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            The image synthesized from the view, with one pixel per block of `binning` × `binning` pixels.
+        shape : tuple of int
+            The number of rows and columns of the hypercube.
+        binning : int
+            The number of rows and columns averaged into each pixel of the image.
+
+        Returns
+        -------
+        np.ndarray
+            The image, with each of its pixels repeated over the block it was averaged from.
+        """
+        image = np.repeat(np.repeat(image, binning, axis=0), binning, axis=1)
+        return image[:shape[0], :shape[1]]
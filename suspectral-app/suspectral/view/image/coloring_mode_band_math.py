@@ -0,0 +1,208 @@
+import numpy as np
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QProgressDialog,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from suspectral.colors import COLORMAPS, apply_colormap
+from suspectral.model.band_expression import BandExpression
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.coloring_mode import ColoringMode
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_band_math import BandMathWorker
+
+
+class ColoringModeBandMath(ColoringMode):
+    """
+    A coloring mode which displays an arithmetic expression over bands, such as a spectral index.
+
+    The expression is validated as it is typed, and evaluated asynchronously when requested,
+    reading only the bands it references. The resulting values are stretched between robust
+    percentiles and displayed with a color map, which can be changed without evaluating the
+    expression again.
+
+    Signals
+    -------
+    imageChanged : Signal(np.ndarray)
+        Emitted when a new image is generated.
+    statusChanged : Signal(bool)
+        Indicates whether this mode is enabled for this hypercube.
+
+    Parameters
+    ----------
+    model : HypercubeContainer
+        The container providing access to the current hypercube.
+    parent : QWidget or None, optional
+        The parent QWidget of this widget, by default None.
+    """
+
+    STRETCH_PERCENTILES = (2.0, 98.0)
+    """Percentiles of the values mapped to the first and last colors of the color map."""
+
+    STRETCH_SAMPLES = 1_000_000
+    """Upper bound on the number of pixels sampled to estimate the stretch."""
+
+    def __init__(self, model: HypercubeContainer, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._model = model
+        self._model.opened.connect(self._handle_hypercube_opened)
+
+        self._expression: BandExpression | None = None
+        self._worker: BandMathWorker | None = None
+        self._values: np.ndarray | None = None
+        self._range: tuple[float, float] = (0.0, 1.0)
+
+        self._expression_field = QLineEdit(self)
+        self._expression_field.setPlaceholderText("(b[80] - b[55]) / (b[80] + b[55])")
+        self._expression_field.setToolTip(
+            "An arithmetic expression over bands, referenced by index as b[80], or by wavelength\n"
+            "as w[860] for the closest band. Supports +, -, *, /, ** and the functions "
+            f"{', '.join(BandExpression.FUNCTIONS)}."
+        )
+        self._expression_field.textChanged.connect(self._handle_expression_changed)
+        self._expression_field.returnPressed.connect(self._handle_evaluation)
+
+        expression_layout = QHBoxLayout()
+        expression_layout.addWidget(QLabel("Expression:"), stretch=0)
+        expression_layout.addWidget(self._expression_field, stretch=1)
+
+        self._message = QLabel(self)
+        self._message.setForegroundRole(QPalette.ColorRole.PlaceholderText)
+        self._message.setWordWrap(True)
+
+        self._colormap_dropdown = QComboBox(self)
+        self._colormap_dropdown.addItems(COLORMAPS)
+        self._colormap_dropdown.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._colormap_dropdown.currentTextChanged.connect(self._render)
+
+        colormap_layout = QHBoxLayout()
+        colormap_layout.addWidget(QLabel("Color Map:"), stretch=0)
+        colormap_layout.addWidget(self._colormap_dropdown, stretch=1)
+
+        self._evaluate = QPushButton("Evaluate", parent=self)
+        self._evaluate.clicked.connect(self._handle_evaluation)
+        self._evaluate.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._evaluate.setToolTip("Evaluates the expression for every pixel.")
+        self._evaluate.setEnabled(False)
+
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        layout.addLayout(expression_layout)
+        layout.addWidget(self._message)
+        layout.addLayout(colormap_layout)
+        layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        layout.addWidget(self._evaluate)
+
+    def activate(self):
+        self._render()
+
+    def deactivate(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    def set_values(self, values: np.ndarray):
+        """
+        Display the values of an expression.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values of shape (rows, columns).
+        """
+        # Estimate the stretch from a regular subsample, since percentiles need a full sort.
+        step = max(1, int(np.sqrt(values.size / self.STRETCH_SAMPLES)))
+        sample = values[::step, ::step]
+        sample = sample[np.isfinite(sample)]
+
+        self._values = values
+        if sample.size:
+            lo, hi = np.percentile(sample, self.STRETCH_PERCENTILES)
+            self._range = (float(lo), float(hi))
+            self._message.setText(f"Displayed range: {lo:.4g} to {hi:.4g}")
+        else:
+            self._range = (0.0, 1.0)
+            self._message.setText("The expression has no finite values.")
+
+        self._render()
+
+    @Slot()
+    def _handle_hypercube_opened(self, hypercube: Hypercube):
+        self._values = None
+        self._handle_expression_changed(self._expression_field.text())
+        self.statusChanged.emit(True)
+
+    @Slot()
+    def _handle_expression_changed(self, text: str):
+        self._expression = None
+        hypercube = self._model.hypercube
+        if not text.strip() or hypercube is None:
+            self._message.clear()
+            self._evaluate.setEnabled(False)
+            return
+
+        try:
+            self._expression = BandExpression(text, hypercube.num_bands, hypercube.wavelengths)
+            self._message.setText(f"Reads bands {', '.join(map(str, self._expression.bands))}.")
+        except ValueError as error:
+            self._message.setText(str(error))
+
+        self._evaluate.setEnabled(self._expression is not None)
+
+    @Slot()
+    def _handle_evaluation(self):
+        if self._expression is None:
+            return
+
+        self._progress_dialog = QProgressDialog(self)
+        self._progress_dialog.setWindowTitle("Evaluating...")
+        self._progress_dialog.setModal(True)
+        self._progress_dialog.setLabelText(
+            "Please, wait while the expression is being evaluated. This may take a while..."
+        )
+
+        self._worker = BandMathWorker(self._model.hypercube, self._expression)
+        self._worker.progress.connect(self._progress_dialog.setValue)
+        self._worker.finished.connect(self._progress_dialog.close)
+        self._worker.finished.connect(self._handle_finished)
+        self._worker.computed.connect(self._handle_computed)
+
+        self._progress_dialog.show()
+        self._progress_dialog.canceled.connect(self._handle_cancel)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_cancel(self):
+        if self._worker:
+            self._worker.stop()
+
+    @Slot()
+    def _handle_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    @Slot()
+    def _handle_computed(self, values: np.ndarray):
+        if self.sender() is self._worker:
+            self.set_values(values)
+
+    @Slot()
+    def _render(self):
+        if self._values is None:
+            return
+
+        colors = apply_colormap(self._values, *self._range, self._colormap_dropdown.currentText())
+        self.imageChanged.emit(colors / 255.0)
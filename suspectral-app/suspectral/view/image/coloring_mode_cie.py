@@ -18,6 +18,7 @@ from PySide6.QtWidgets import (
 
 from suspectral.model.hypercube import Hypercube
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.calibration_button import CalibrationButton
 from suspectral.view.image.coloring_mode import ColoringMode
 from suspectral.view.image.spectral_reference import SpectralReference
 from suspectral.view.image.spectral_selector import SpectralSelector
@@ -118,6 +119,17 @@ class ColoringModeCIE(ColoringMode):
             "normalized by subtracting its minimum value and dividing by its maximum value."
         )
 
+        self._preview_checkbox = QCheckBox(self)
+        self._preview_checkbox.setChecked(False)
+        self._preview_checkbox.setText("Preview at reduced resolution")
+        self._preview_checkbox.setToolTip(
+            f"If enabled, the image will be synthesized from averages of {self.PREVIEW_BINNING}×{self.PREVIEW_BINNING} pixels,\n"
+            "which is much faster, to preview the result before generating it in full."
+        )
+        self._preview_shape: tuple[int, int] | None = None
+
+        self._calibrate = CalibrationButton(model, self._white_ref_select, self._black_ref_select, parent=self)
+
         self._generate = QPushButton("Generate", parent=self)
         self._generate.clicked.connect(self._handle_synthesis)
         self._generate.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -132,7 +144,9 @@ class ColoringModeCIE(ColoringMode):
         layout.addWidget(self._srgb_checkbox)
         layout.addWidget(self._gamma_checkbox)
         layout.addWidget(self._contrast_checkbox)
+        layout.addWidget(self._preview_checkbox)
         layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        layout.addWidget(self._calibrate)
         layout.addWidget(self._generate)
         layout.setSpacing(8)
 
@@ -157,6 +171,18 @@ class ColoringModeCIE(ColoringMode):
         self._white_ref_select.add(point)
         self._black_ref_select.add(point)
 
+    def add_reference_points(self, points: list[QPoint]):
+        """
+        Adds multiple pixel positions as candidates for both white and black reference spectra.
+
+        Parameters
+        ----------
+        points : list of QPoint
+            The image coordinates to consider as references.
+        """
+        self._white_ref_select.extend(points)
+        self._black_ref_select.extend(points)
+
     @Slot()
     def _handle_hypercube_opened(self, hypercube: Hypercube):
         self.statusChanged.emit(hypercube.wavelengths is not None)
@@ -170,10 +196,16 @@ class ColoringModeCIE(ColoringMode):
             "Please, wait while the image is being synthesized. This may take a while..."
         )
 
+        hypercube = self._model.hypercube
+        self._preview_shape = None
+        if self._preview_checkbox.isChecked():
+            self._preview_shape = hypercube.num_rows, hypercube.num_cols
+            hypercube = hypercube.view(binning=(self.PREVIEW_BINNING, self.PREVIEW_BINNING, 1))
+
         self._worker = SynthesizerCIE(
             cmf=self._cmf,
             spd=self._spd_field.data_,
-            hypercube=self._model.hypercube,
+            hypercube=hypercube,
             white_ref=self._white_ref_select.get(),
             black_ref=self._black_ref_select.get(),
             apply_srgb_transform=self._srgb_checkbox.isChecked(),
@@ -190,12 +222,19 @@ class ColoringModeCIE(ColoringMode):
         self._worker.finished.connect(self._progress_dialog.close)
         self._worker.finished.connect(self._worker.deleteLater)
         self._worker.finished.connect(self._thread.quit)
-        self._worker.produced.connect(self.imageChanged.emit)
+        self._worker.produced.connect(self._handle_produced)
 
         self._progress_dialog.canceled.connect(self._handle_cancel)
         self._progress_dialog.show()
         self._thread.start()
 
+    @Slot(np.ndarray)
+    def _handle_produced(self, image: np.ndarray):
+        if self._preview_shape is not None:
+            image = self.enlarge_preview(image, self._preview_shape, self.PREVIEW_BINNING)
+
+        self.imageChanged.emit(image)
+
     @Slot()
     def _handle_cancel(self):
         if self._worker:
@@ -0,0 +1,198 @@
+import numpy as np
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtGui import QBrush
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QProgressDialog,
+    QPushButton,
+    QSizePolicy,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from suspectral.colors import get_label_color, get_label_palette
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.coloring_mode import ColoringMode
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_clustering import ClusteringWorker
+
+
+class ColoringModeClustering(ColoringMode):
+    """
+    A classification coloring mode which segments the image into clusters of similar spectra.
+
+    Pixels are grouped with mini-batch k-means, which needs no reference spectra. The
+    resulting label image is displayed along with a legend listing the number of pixels
+    in each cluster, and the centroid of each cluster is published so that it can be
+    plotted and exported like any other spectrum. Clustering is performed asynchronously
+    to avoid blocking the UI.
+
+    Signals
+    -------
+    imageChanged : Signal(np.ndarray)
+        Emitted when a new label image is generated.
+    statusChanged : Signal(bool)
+        Indicates whether this mode is enabled for this hypercube.
+    centroidsChanged : Signal(np.ndarray)
+        Emitted with the centroid spectra of shape (clusters, bands) once they are computed.
+
+    Parameters
+    ----------
+    model : HypercubeContainer
+        The container providing access to the current hypercube.
+    parent : QWidget or None, optional
+        The parent QWidget of this widget, by default None.
+    """
+
+    centroidsChanged = Signal(np.ndarray)
+
+    UNCLASSIFIED = "Unclassified"
+
+    MAX_CLUSTERS = 64
+
+    def __init__(self, model: HypercubeContainer, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._model = model
+        self._model.opened.connect(self._handle_hypercube_opened)
+
+        self._worker: ClusteringWorker | None = None
+        self._image: np.ndarray | None = None
+        self._centroids: np.ndarray | None = None
+
+        self._clusters = QSpinBox(self)
+        self._clusters.setRange(2, self.MAX_CLUSTERS)
+        self._clusters.setValue(ClusteringWorker.NUM_CLUSTERS)
+        self._clusters.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._clusters.setToolTip("The number of clusters to group the pixels into.")
+
+        clusters_layout = QHBoxLayout()
+        clusters_layout.addWidget(QLabel("Clusters:"), stretch=0)
+        clusters_layout.addWidget(self._clusters, stretch=1)
+
+        self._legend = QTableWidget(0, 3, self)
+        self._legend.setHorizontalHeaderLabels(["Legend", "Cluster", "Pixels"])
+        self._legend.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._legend.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._legend.verticalHeader().setVisible(False)
+        self._legend.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+
+        self._generate = QPushButton("Generate", parent=self)
+        self._generate.clicked.connect(self._handle_clustering)
+        self._generate.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._generate.setToolTip("Starts the clustering process.")
+
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        layout.addLayout(clusters_layout)
+        layout.addWidget(self._legend, stretch=1)
+        layout.addWidget(self._generate)
+
+    def activate(self):
+        if self._image is not None:
+            self.imageChanged.emit(self._image)
+            self.centroidsChanged.emit(self._centroids)
+
+    def deactivate(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    def set_clusters(self, labels: np.ndarray, centroids: np.ndarray):
+        """
+        Display the clusters the pixels have been assigned to.
+
+        Parameters
+        ----------
+        labels : np.ndarray
+            The map of labels of shape (rows, columns), holding the index of the cluster of
+            each pixel or -1 for pixels which have not been assigned to any.
+        centroids : np.ndarray
+            The centroid spectra of shape (clusters, bands).
+        """
+        num_clusters = len(centroids)
+
+        # Unassigned pixels are labelled -1 and index the trailing black entry.
+        palette = np.vstack([get_label_palette(num_clusters), np.zeros((1, 3))])
+        self._image = palette[labels]
+        self._centroids = centroids
+        self.imageChanged.emit(self._image)
+        self.centroidsChanged.emit(self._centroids)
+
+        counts = np.bincount(labels.ravel() + 1, minlength=num_clusters + 1)
+        self._update_legend(counts[1:], counts[0])
+
+    @Slot()
+    def _handle_hypercube_opened(self, hypercube: Hypercube):
+        self._image = None
+        self._centroids = None
+        self._legend.setRowCount(0)
+        self.statusChanged.emit(True)
+
+    @Slot()
+    def _handle_clustering(self):
+        self._progress_dialog = QProgressDialog(self)
+        self._progress_dialog.setWindowTitle("Clustering...")
+        self._progress_dialog.setModal(True)
+        self._progress_dialog.setLabelText(
+            "Please, wait while the pixels are being clustered. This may take a while..."
+        )
+
+        self._worker = ClusteringWorker(
+            hypercube=self._model.hypercube,
+            num_clusters=self._clusters.value(),
+        )
+
+        self._worker.progress.connect(self._progress_dialog.setValue)
+        self._worker.finished.connect(self._progress_dialog.close)
+        self._worker.finished.connect(self._handle_finished)
+        self._worker.clustered.connect(self._handle_clustered)
+
+        self._progress_dialog.show()
+        self._progress_dialog.canceled.connect(self._handle_cancel)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_cancel(self):
+        if self._worker:
+            self._worker.stop()
+
+    @Slot()
+    def _handle_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    @Slot()
+    def _handle_clustered(self, labels: np.ndarray, centroids: np.ndarray):
+        if self.sender() is self._worker:
+            self.set_clusters(labels, centroids)
+
+    def _update_legend(self, counts: np.ndarray, unclassified: int):
+        self._legend.setRowCount(0)
+
+        for index, count in enumerate(counts):
+            self._add_legend_row(f"Cluster {index + 1}", int(count), QBrush(get_label_color(index)))
+
+        if unclassified:
+            self._add_legend_row(self.UNCLASSIFIED, int(unclassified), QBrush(Qt.GlobalColor.black))
+
+    def _add_legend_row(self, name: str, count: int, brush: QBrush):
+        row = self._legend.rowCount()
+        self._legend.insertRow(row)
+
+        legend = QTableWidgetItem()
+        legend.setBackground(brush)
+        self._legend.setItem(row, 0, legend)
+        self._legend.setItem(row, 1, QTableWidgetItem(name))
+
+        count_item = QTableWidgetItem(str(count))
+        count_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self._legend.setItem(row, 2, count_item)
@@ -0,0 +1,238 @@
+import numpy as np
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QProgressDialog,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from suspectral.model.covariance import Covariance
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.coloring_mode import ColoringMode
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_components import ComponentsWorker
+
+
+class ColoringModeComponents(ColoringMode):
+    """
+    A false coloring mode which maps principal or noise-adjusted components of the spectra to RGB.
+
+    Once generated, the projections of all pixels onto the leading components are kept in
+    memory, along with the statistics they were derived from. Assigning other components
+    to the color channels only re-renders the image, and switching between the transforms
+    only needs to project the hypercube again. Each channel is stretched between robust
+    percentiles of its component, so that a few outliers do not wash out the image.
+
+    Signals
+    -------
+    imageChanged : Signal(np.ndarray)
+        Emitted when a new RGB image is generated.
+    statusChanged : Signal(bool)
+        Indicates whether this mode is enabled for this hypercube.
+
+    Parameters
+    ----------
+    model : HypercubeContainer
+        The container providing access to the current hypercube.
+    parent : QWidget or None, optional
+        The parent QWidget of this widget, by default None.
+    """
+
+    STRETCH_PERCENTILES = (2.0, 98.0)
+    """Percentiles of each component mapped to the darkest and brightest values of its channel."""
+
+    STRETCH_SAMPLES = 1_000_000
+    """Upper bound on the number of pixels sampled to estimate the stretch of each component."""
+
+    def __init__(self, model: HypercubeContainer, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._model = model
+        self._model.opened.connect(self._handle_hypercube_opened)
+
+        self._worker: ComponentsWorker | None = None
+        self._covariance: Covariance | None = None
+        self._noise: Covariance | None = None
+        self._results: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+        self._transform_dropdown = QComboBox(self)
+        for key, label in ComponentsWorker.TRANSFORMS.items():
+            self._transform_dropdown.addItem(label, key)
+        self._transform_dropdown.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._transform_dropdown.currentIndexChanged.connect(self._handle_transform_changed)
+
+        transform_layout = QHBoxLayout()
+        transform_layout.addWidget(QLabel("Transform:"), stretch=0)
+        transform_layout.addWidget(self._transform_dropdown, stretch=1)
+
+        channels_layout = QVBoxLayout()
+        channels_layout.setSpacing(8)
+
+        self._channels: list[QComboBox] = []
+        for name in "RGB":
+            channel = QComboBox(self)
+            channel.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            channel.currentIndexChanged.connect(self._render)
+            self._channels.append(channel)
+
+            channel_layout = QHBoxLayout()
+            channel_layout.addWidget(QLabel(f"{name}:"), stretch=0)
+            channel_layout.addWidget(channel, stretch=1)
+            channels_layout.addLayout(channel_layout)
+
+        self._generate = QPushButton("Generate", parent=self)
+        self._generate.clicked.connect(self._handle_generation)
+        self._generate.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._generate.setToolTip("Computes the components of the spectra.")
+
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        layout.addLayout(transform_layout)
+        layout.addLayout(channels_layout)
+        layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        layout.addWidget(self._generate)
+
+        self._reset_channels()
+
+    def activate(self):
+        self._render()
+
+    def deactivate(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    def set_components(self, transform: str, scores: np.ndarray, weights: np.ndarray):
+        """
+        Display the projections of the pixels onto the components of the given transform.
+
+        Parameters
+        ----------
+        transform : str
+            The transform the components belong to (see `ComponentsWorker.TRANSFORMS`).
+        scores : np.ndarray
+            The projections of shape (rows, columns, components).
+        weights : np.ndarray
+            The variance or signal-to-noise ratio of each component.
+        """
+        # Estimate the stretch from a regular subsample, since percentiles need a full sort.
+        step = max(1, int(np.sqrt(scores.shape[0] * scores.shape[1] / self.STRETCH_SAMPLES)))
+        sample = scores[::step, ::step].reshape(-1, scores.shape[-1])
+        lo, hi = np.nanpercentile(sample, self.STRETCH_PERCENTILES, axis=0)
+
+        self._results[transform] = (scores, weights, np.stack([lo, hi]))
+        if transform == self._transform:
+            self._reset_channels()
+            self._render()
+
+    @property
+    def _transform(self) -> str:
+        return self._transform_dropdown.currentData()
+
+    @Slot()
+    def _handle_hypercube_opened(self, hypercube: Hypercube):
+        self._covariance = None
+        self._noise = None
+        self._results.clear()
+        self._reset_channels()
+        self.statusChanged.emit(True)
+
+    @Slot()
+    def _handle_transform_changed(self):
+        self._reset_channels()
+        self._render()
+
+    @Slot()
+    def _handle_generation(self):
+        self._progress_dialog = QProgressDialog(self)
+        self._progress_dialog.setWindowTitle("Generating...")
+        self._progress_dialog.setModal(True)
+        self._progress_dialog.setLabelText(
+            "Please, wait while the components are being computed. This may take a while..."
+        )
+
+        self._worker = ComponentsWorker(
+            hypercube=self._model.hypercube,
+            transform=self._transform,
+            covariance=self._covariance,
+            noise=self._noise,
+        )
+
+        self._worker.progress.connect(self._progress_dialog.setValue)
+        self._worker.finished.connect(self._progress_dialog.close)
+        self._worker.finished.connect(self._handle_finished)
+        self._worker.computed.connect(self._handle_computed)
+
+        self._progress_dialog.show()
+        self._progress_dialog.canceled.connect(self._handle_cancel)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_cancel(self):
+        if self._worker:
+            self._worker.stop()
+
+    @Slot()
+    def _handle_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    @Slot()
+    def _handle_computed(self, scores: np.ndarray, weights: np.ndarray):
+        worker = self.sender()
+        if worker is not self._worker:
+            return
+
+        self._covariance = worker.covariance
+        self._noise = worker.noise
+        self.set_components(worker.transform, scores, weights)
+
+    def _reset_channels(self):
+        result = self._results.get(self._transform)
+
+        labels = []
+        if result is not None:
+            _, weights, _ = result
+            if self._transform == ComponentsWorker.PCA:
+                # Fractions of the total variance are only known for the kept components.
+                fractions = weights / self._covariance_total()
+                labels = [f"PC {it + 1} ({fraction:.1%})" for it, fraction in enumerate(fractions)]
+            else:
+                labels = [f"MNF {it + 1} (SNR {ratio:.3g})" for it, ratio in enumerate(weights)]
+
+        for index, channel in enumerate(self._channels):
+            channel.blockSignals(True)
+            channel.clear()
+            channel.addItems(labels)
+            channel.setCurrentIndex(min(index, len(labels) - 1))
+            channel.setEnabled(bool(labels))
+            channel.blockSignals(False)
+
+    def _covariance_total(self) -> float:
+        if self._covariance is None:
+            return float(sum(self._results[ComponentsWorker.PCA][1]))
+
+        return max(float(np.trace(self._covariance.covariance)), np.finfo(float).tiny)
+
+    @Slot()
+    def _render(self):
+        result = self._results.get(self._transform)
+        if result is None:
+            return
+
+        scores, _, (lo, hi) = result
+        indices = [channel.currentIndex() for channel in self._channels]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            image = (scores[..., indices] - lo[indices]) / np.maximum(hi[indices] - lo[indices], 1e-12)
+
+        image = np.nan_to_num(np.clip(image, 0.0, 1.0), nan=0.0)
+        self.imageChanged.emit(image)
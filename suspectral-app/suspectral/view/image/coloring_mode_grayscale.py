@@ -1,5 +1,6 @@
 import numpy as np
 from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -13,6 +14,8 @@ from suspectral.model.hypercube import Hypercube
 from suspectral.model.hypercube_container import HypercubeContainer
 from suspectral.view.image.band_color_channel import BandColorChannel
 from suspectral.view.image.coloring_mode import ColoringMode
+from suspectral.worker.worker import join_workers, start_worker
+from suspectral.worker.worker_bands import BandsWorker
 
 
 class ColoringModeGrayscale(ColoringMode):
@@ -44,6 +47,7 @@ class ColoringModeGrayscale(ColoringMode):
         self._indexing = "Band Number"
         self._wavelengths = np.array([])
         self._num_bands = None
+        self._worker: BandsWorker | None = None
 
         self._band = None
         self._channel = BandColorChannel(parent=self)
@@ -74,6 +78,14 @@ class ColoringModeGrayscale(ColoringMode):
     def activate(self):
         self._on_band_changed(self._band)
 
+    def deactivate(self):
+        self._stop_render()
+        join_workers(self)
+
+    def closeEvent(self, event: QCloseEvent):
+        self.deactivate()
+        super().closeEvent(event)
+
     @Slot()
     def _handle_hypercube_opened(self, hypercube: Hypercube):
         self._num_bands = hypercube.num_bands
@@ -95,7 +107,36 @@ class ColoringModeGrayscale(ColoringMode):
 
     def _on_band_changed(self, value: int):
         self._band = self._get_band_index(value)
-        self.imageChanged.emit(self._model.hypercube.get_grayscale(self._band))
+        self._render((self._band, self._band, self._band))
+
+    def _render(self, bands: tuple[int, int, int]):
+        # Bands are read in the background, superseding any render still in progress.
+        self._stop_render()
+
+        image = self._model.hypercube.get_cached(BandsWorker.cache_key(bands))
+        if image is not None:
+            self.imageChanged.emit(image)
+            return
+
+        self._worker = BandsWorker(self._model.hypercube, bands)
+        self._worker.computed.connect(self._handle_rendered)
+        self._worker.finished.connect(self._handle_render_finished)
+        start_worker(self._worker, self)
+
+    def _stop_render(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    @Slot()
+    def _handle_rendered(self, image: np.ndarray):
+        if self.sender() is self._worker:
+            self.imageChanged.emit(image)
+
+    @Slot()
+    def _handle_render_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
 
     def _get_band_index(self, value: int):
         if self._indexing == "Wavelength":
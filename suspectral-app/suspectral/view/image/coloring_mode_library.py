@@ -0,0 +1,243 @@
+import os
+
+import numpy as np
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QBrush
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QMessageBox,
+    QProgressDialog,
+    QPushButton,
+    QSizePolicy,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from suspectral.colors import get_label_color, get_label_palette
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.spectral_library import SpectralLibrary
+from suspectral.view.image.coloring_mode import ColoringMode
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_classification import ClassificationWorker
+
+
+class ColoringModeLibrary(ColoringMode):
+    """
+    A classification coloring mode which labels every pixel by its best match in a spectral library.
+
+    The library is a directory of CSV files in the same format as the ones accepted by
+    `SpectralSelector`. It is resampled onto the wavelengths of the hypercube once, after
+    which every pixel is assigned to the reference spectrum it matches best. The resulting
+    label image is displayed along with a legend listing the number of pixels in each class.
+    Classification is performed asynchronously to avoid blocking the UI.
+
+    Signals
+    -------
+    imageChanged : Signal(np.ndarray)
+        Emitted when a new label image is generated.
+    statusChanged : Signal(bool)
+        Indicates whether this mode is enabled for this hypercube.
+
+    Parameters
+    ----------
+    model : HypercubeContainer
+        The container providing access to the current hypercube.
+    parent : QWidget or None, optional
+        The parent QWidget of this widget, by default None.
+    """
+
+    UNCLASSIFIED = "Unclassified"
+
+    def __init__(self, model: HypercubeContainer, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._model = model
+        self._model.opened.connect(self._handle_hypercube_opened)
+
+        self._library: SpectralLibrary | None = None
+        self._references: np.ndarray | None = None
+        self._bands: np.ndarray | None = None
+        self._worker: ClassificationWorker | None = None
+        self._image: np.ndarray | None = None
+
+        self._library_field = QLineEdit(self)
+        self._library_field.setReadOnly(True)
+        self._library_field.setPlaceholderText("Select...")
+        self._library_field.setToolTip(
+            "(Required) A directory of CSV files with a 'Wavelength' column, whose other\n"
+            "columns are the reference spectra that pixels will be classified into."
+        )
+
+        self._library_button = QPushButton("...", self)
+        self._library_button.setFixedWidth(30)
+        self._library_button.clicked.connect(self._browse)
+
+        library_layout = QHBoxLayout()
+        library_layout.addWidget(QLabel("Library:"), stretch=0)
+        library_layout.addWidget(self._library_field, stretch=1)
+        library_layout.addWidget(self._library_button, stretch=0)
+
+        self._metric_dropdown = QComboBox(self)
+        for key, label in ClassificationWorker.METRICS.items():
+            self._metric_dropdown.addItem(label, key)
+        self._metric_dropdown.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+        metric_layout = QHBoxLayout()
+        metric_layout.addWidget(QLabel("Match by:"), stretch=0)
+        metric_layout.addWidget(self._metric_dropdown, stretch=1)
+
+        self._legend = QTableWidget(0, 3, self)
+        self._legend.setHorizontalHeaderLabels(["Legend", "Class", "Pixels"])
+        self._legend.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._legend.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._legend.verticalHeader().setVisible(False)
+        self._legend.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+
+        self._generate = QPushButton("Generate", parent=self)
+        self._generate.clicked.connect(self._handle_classification)
+        self._generate.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._generate.setToolTip("Starts the classification process.")
+        self._generate.setEnabled(False)
+
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        layout.addLayout(library_layout)
+        layout.addLayout(metric_layout)
+        layout.addWidget(self._legend, stretch=1)
+        layout.addWidget(self._generate)
+
+    def activate(self):
+        if self._image is not None:
+            self.imageChanged.emit(self._image)
+
+    def deactivate(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    def set_library(self, directory: str) -> bool:
+        """
+        Load the spectral library from a directory and resample it onto the current hypercube.
+
+        Parameters
+        ----------
+        directory : str
+            The directory containing the CSV files of the library.
+
+        Returns
+        -------
+        bool
+            Whether the library could be used, otherwise an error is shown to the user.
+        """
+        try:
+            library = SpectralLibrary.load(directory)
+            references, bands = library.resample(self._model.hypercube.wavelengths)
+        except (OSError, ValueError) as error:
+            QMessageBox.critical(self, "Invalid Library", f"Could not use the selected library. {error}")
+            return False
+
+        self._library = library
+        self._references = references
+        self._bands = bands
+        self._library_field.setText(os.path.basename(os.path.normpath(directory)))
+        self._generate.setEnabled(True)
+        return True
+
+    def _browse(self):
+        directory = QFileDialog.getExistingDirectory(self, caption="Select Spectral Library")
+        if directory:
+            self.set_library(directory)
+
+    @Slot()
+    def _handle_hypercube_opened(self, hypercube: Hypercube):
+        self._library = None
+        self._references = None
+        self._bands = None
+        self._image = None
+        self._library_field.clear()
+        self._legend.setRowCount(0)
+        self._generate.setEnabled(False)
+        self.statusChanged.emit(hypercube.wavelengths is not None)
+
+    @Slot()
+    def _handle_classification(self):
+        self._progress_dialog = QProgressDialog(self)
+        self._progress_dialog.setWindowTitle("Classifying...")
+        self._progress_dialog.setModal(True)
+        self._progress_dialog.setLabelText(
+            "Please, wait while the pixels are being classified. This may take a while..."
+        )
+
+        self._worker = ClassificationWorker(
+            hypercube=self._model.hypercube,
+            references=self._references,
+            bands=self._bands,
+            metric=self._metric_dropdown.currentData(),
+        )
+
+        self._worker.progress.connect(self._progress_dialog.setValue)
+        self._worker.finished.connect(self._progress_dialog.close)
+        self._worker.finished.connect(self._handle_finished)
+        self._worker.classified.connect(self._handle_classified)
+
+        self._progress_dialog.show()
+        self._progress_dialog.canceled.connect(self._handle_cancel)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_cancel(self):
+        if self._worker:
+            self._worker.stop()
+
+    @Slot()
+    def _handle_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    @Slot()
+    def _handle_classified(self, labels: np.ndarray, _scores: np.ndarray):
+        if self.sender() is not self._worker:
+            return
+
+        num_classes = len(self._library)
+
+        # Unclassified pixels are labelled -1 and index the trailing black entry.
+        palette = np.vstack([get_label_palette(num_classes), np.zeros((1, 3))])
+        self._image = palette[labels]
+        self.imageChanged.emit(self._image)
+
+        counts = np.bincount(labels.ravel() + 1, minlength=num_classes + 1)
+        self._update_legend(counts[1:], counts[0])
+
+    def _update_legend(self, counts: np.ndarray, unclassified: int):
+        names = self._library.names
+        self._legend.setRowCount(0)
+
+        for index, (name, count) in enumerate(zip(names, counts)):
+            self._add_legend_row(name, int(count), QBrush(get_label_color(index)))
+
+        if unclassified:
+            self._add_legend_row(self.UNCLASSIFIED, int(unclassified), QBrush(Qt.GlobalColor.black))
+
+    def _add_legend_row(self, name: str, count: int, brush: QBrush):
+        row = self._legend.rowCount()
+        self._legend.insertRow(row)
+
+        legend = QTableWidgetItem()
+        legend.setBackground(brush)
+        self._legend.setItem(row, 0, legend)
+        self._legend.setItem(row, 1, QTableWidgetItem(name))
+
+        count_item = QTableWidgetItem(str(count))
+        count_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self._legend.setItem(row, 2, count_item)
@@ -1,3 +1,4 @@
+import numpy as np
 from PySide6.QtCore import QThread, Slot, QPoint
 from PySide6.QtGui import Qt
 from PySide6.QtWidgets import (
@@ -14,6 +15,7 @@ from PySide6.QtWidgets import (
 
 from suspectral.model.hypercube import Hypercube
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.calibration_button import CalibrationButton
 from suspectral.view.image.coloring_mode import ColoringMode
 from suspectral.view.image.spectral_reference import SpectralReference
 from suspectral.view.image.spectral_selector import SpectralSelector
@@ -110,6 +112,17 @@ class ColoringModeSRF(ColoringMode):
         black_ref_layout.addWidget(QLabel("Black:"), stretch=0)
         black_ref_layout.addWidget(self._black_ref_select, stretch=1)
 
+        self._preview_checkbox = QCheckBox(self)
+        self._preview_checkbox.setChecked(False)
+        self._preview_checkbox.setText("Preview at reduced resolution")
+        self._preview_checkbox.setToolTip(
+            f"If enabled, the image will be synthesized from averages of {self.PREVIEW_BINNING}×{self.PREVIEW_BINNING} pixels,\n"
+            "which is much faster, to preview the result before generating it in full."
+        )
+        self._preview_shape: tuple[int, int] | None = None
+
+        self._calibrate = CalibrationButton(model, self._white_ref_select, self._black_ref_select, parent=self)
+
         self._generate = QPushButton("Generate", parent=self)
         self._generate.clicked.connect(self._handle_synthesis)
         self._generate.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -128,7 +141,9 @@ class ColoringModeSRF(ColoringMode):
         layout.addLayout(white_ref_layout)
         layout.addLayout(black_ref_layout)
         layout.addWidget(self._contrast_checkbox)
+        layout.addWidget(self._preview_checkbox)
         layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        layout.addWidget(self._calibrate)
         layout.addWidget(self._generate)
 
     def deactivate(self):
@@ -153,6 +168,18 @@ class ColoringModeSRF(ColoringMode):
         self._white_ref_select.add(point)
         self._black_ref_select.add(point)
 
+    def add_reference_points(self, points: list[QPoint]):
+        """
+        Adds multiple pixel positions as candidates for both white and black reference spectra.
+
+        Parameters
+        ----------
+        points : list of QPoint
+            The image coordinates to consider as references.
+        """
+        self._white_ref_select.extend(points)
+        self._black_ref_select.extend(points)
+
     @Slot()
     def _handle_hypercube_opened(self, hypercube: Hypercube):
         self.statusChanged.emit(hypercube.wavelengths is not None)
@@ -166,10 +193,16 @@ class ColoringModeSRF(ColoringMode):
             "Please, wait while the image is being synthesized. This may take a while..."
         )
 
+        hypercube = self._model.hypercube
+        self._preview_shape = None
+        if self._preview_checkbox.isChecked():
+            self._preview_shape = hypercube.num_rows, hypercube.num_cols
+            hypercube = hypercube.view(binning=(self.PREVIEW_BINNING, self.PREVIEW_BINNING, 1))
+
         self._worker = SynthesizerSRF(
             srf=self._srf_field.data_,
             spd=self._spd_field.data_,
-            hypercube=self._model.hypercube,
+            hypercube=hypercube,
             white_ref=self._white_ref_select.get(),
             black_ref=self._black_ref_select.get(),
             apply_per_channel_contrast=self._contrast_checkbox.isChecked(),
@@ -184,12 +217,19 @@ class ColoringModeSRF(ColoringMode):
         self._worker.finished.connect(self._progress_dialog.close)
         self._worker.finished.connect(self._worker.deleteLater)
         self._worker.finished.connect(self._thread.quit)
-        self._worker.produced.connect(self.imageChanged.emit)
+        self._worker.produced.connect(self._handle_produced)
 
         self._progress_dialog.show()
         self._progress_dialog.canceled.connect(self._handle_cancel)
         self._thread.start()
 
+    @Slot(np.ndarray)
+    def _handle_produced(self, image: np.ndarray):
+        if self._preview_shape is not None:
+            image = self.enlarge_preview(image, self._preview_shape, self.PREVIEW_BINNING)
+
+        self.imageChanged.emit(image)
+
     @Slot()
     def _handle_cancel(self):
         if self._worker:
@@ -0,0 +1,446 @@
+import os
+
+import numpy as np
+from PySide6.QtCore import QPoint, Qt, Signal, Slot
+from PySide6.QtGui import QIcon, QPalette, QPixmap
+from PySide6.QtWidgets import (
+    QComboBox,
+    QFileDialog,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QMessageBox,
+    QProgressDialog,
+    QPushButton,
+    QSizePolicy,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from suspectral.colors import COLORMAPS, apply_colormap, get_label_color
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.spectral_library import SpectralLibrary
+from suspectral.model.unmixing import Unmixing
+from suspectral.view.image.coloring_mode import ColoringMode
+from suspectral.view.image.spectral_reference import SpectralReference
+from suspectral.worker.worker import start_worker
+from suspectral.worker.worker_endmembers import EndmemberWorker
+from suspectral.worker.worker_unmixing import UnmixingWorker
+
+
+class ColoringModeUnmixing(ColoringMode):
+    """
+    A coloring mode which displays the abundances of a few endmembers in every pixel.
+
+    Endmembers are either picked from the image, among the pixels selected with the tools,
+    extracted automatically from the purest pixels of the hypercube, or loaded from a CSV
+    file in the same format as the ones accepted by `SpectralSelector`, in which case they
+    are resampled onto the wavelengths of the hypercube. Endmembers are only compared with
+    pixels on the bands they all cover. Once the pixels are unmixed, the abundance map of
+    any endmember, or the error of the reconstruction, can be displayed with a color map
+    without unmixing the pixels again.
+
+    Signals
+    -------
+    imageChanged : Signal(np.ndarray)
+        Emitted when a new image is generated.
+    statusChanged : Signal(bool)
+        Indicates whether this mode is enabled for this hypercube.
+    endmembersExtracted : Signal(np.ndarray, np.ndarray, np.ndarray)
+        Emitted with the spectra of automatically extracted endmembers of shape
+        (endmembers, bands), along with the x and y coordinates of their pixels.
+
+    Parameters
+    ----------
+    model : HypercubeContainer
+        The container providing access to the current hypercube.
+    parent : QWidget or None, optional
+        The parent QWidget of this widget, by default None.
+    """
+
+    endmembersExtracted = Signal(np.ndarray, np.ndarray, np.ndarray)
+
+    ERROR = "Reconstruction Error"
+
+    STRETCH_PERCENTILE = 98.0
+    """Percentile of the reconstruction error mapped to the last color of the color map."""
+
+    def __init__(self, model: HypercubeContainer, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._model = model
+        self._model.opened.connect(self._handle_hypercube_opened)
+
+        self._names: list[str] = []
+        self._endmembers: list[np.ndarray] = []
+        self._worker: UnmixingWorker | None = None
+        self._extraction_worker: EndmemberWorker | None = None
+        self._abundances: np.ndarray | None = None
+        self._errors: np.ndarray | None = None
+        self._error_range: float = 1.0
+
+        self._pixel_select = SpectralReference(model, parent=self)
+        self._pixel_select.setToolTip("A pixel selected with the tools, whose spectrum will be used as an endmember.")
+
+        self._pixel_button = QPushButton("Add", self)
+        self._pixel_button.clicked.connect(self._add_pixel)
+
+        pixel_layout = QHBoxLayout()
+        pixel_layout.addWidget(QLabel("Pixel:"), stretch=0)
+        pixel_layout.addWidget(self._pixel_select, stretch=1)
+        pixel_layout.addWidget(self._pixel_button, stretch=0)
+
+        self._library_button = QPushButton("Load from CSV...", self)
+        self._library_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._library_button.setToolTip(
+            "A CSV file with a 'Wavelength' column, whose other columns are endmember spectra."
+        )
+        self._library_button.clicked.connect(self._browse)
+
+        self._extract_count = QSpinBox(self)
+        self._extract_count.setRange(2, 20)
+        self._extract_count.setValue(EndmemberWorker.NUM_ENDMEMBERS)
+        self._extract_count.setToolTip("The number of endmembers to extract.")
+
+        self._extract_button = QPushButton("Extract", self)
+        self._extract_button.setToolTip("Finds the purest pixels of the image to use as endmembers.")
+        self._extract_button.clicked.connect(self._handle_extraction)
+
+        extract_layout = QHBoxLayout()
+        extract_layout.addWidget(QLabel("Extract:"), stretch=0)
+        extract_layout.addWidget(self._extract_count, stretch=1)
+        extract_layout.addWidget(self._extract_button, stretch=0)
+
+        self._endmember_list = QListWidget(self)
+        self._endmember_list.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+        self._remove_button = QPushButton("Remove", self)
+        self._remove_button.clicked.connect(self._remove_endmember)
+
+        self._clear_button = QPushButton("Clear", self)
+        self._clear_button.clicked.connect(self.clear_endmembers)
+
+        list_buttons_layout = QHBoxLayout()
+        list_buttons_layout.addWidget(self._remove_button)
+        list_buttons_layout.addWidget(self._clear_button)
+
+        self._constraint_dropdown = QComboBox(self)
+        for key, label in Unmixing.CONSTRAINTS.items():
+            self._constraint_dropdown.addItem(label, key)
+        self._constraint_dropdown.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+        constraint_layout = QHBoxLayout()
+        constraint_layout.addWidget(QLabel("Constraint:"), stretch=0)
+        constraint_layout.addWidget(self._constraint_dropdown, stretch=1)
+
+        self._display_dropdown = QComboBox(self)
+        self._display_dropdown.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._display_dropdown.currentIndexChanged.connect(self._render)
+        self._display_dropdown.setEnabled(False)
+
+        display_layout = QHBoxLayout()
+        display_layout.addWidget(QLabel("Display:"), stretch=0)
+        display_layout.addWidget(self._display_dropdown, stretch=1)
+
+        self._colormap_dropdown = QComboBox(self)
+        self._colormap_dropdown.addItems(COLORMAPS)
+        self._colormap_dropdown.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._colormap_dropdown.currentTextChanged.connect(self._render)
+
+        colormap_layout = QHBoxLayout()
+        colormap_layout.addWidget(QLabel("Color Map:"), stretch=0)
+        colormap_layout.addWidget(self._colormap_dropdown, stretch=1)
+
+        self._message = QLabel(self)
+        self._message.setForegroundRole(QPalette.ColorRole.PlaceholderText)
+        self._message.setWordWrap(True)
+
+        self._unmix = QPushButton("Unmix", parent=self)
+        self._unmix.clicked.connect(self._handle_unmixing)
+        self._unmix.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._unmix.setToolTip("Estimates the abundances of the endmembers in every pixel.")
+        self._unmix.setEnabled(False)
+
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        layout.addLayout(pixel_layout)
+        layout.addLayout(extract_layout)
+        layout.addWidget(self._library_button)
+        layout.addWidget(self._endmember_list, stretch=1)
+        layout.addLayout(list_buttons_layout)
+        layout.addLayout(constraint_layout)
+        layout.addLayout(display_layout)
+        layout.addLayout(colormap_layout)
+        layout.addWidget(self._message)
+        layout.addWidget(self._unmix)
+
+    def activate(self):
+        self._render()
+
+    def deactivate(self):
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+        if self._extraction_worker is not None:
+            self._extraction_worker.stop()
+            self._extraction_worker = None
+
+    def clear_reference_points(self):
+        """Clears any previously added candidate endmember pixels."""
+        self._pixel_select.clear()
+
+    def add_reference_point(self, point: QPoint):
+        """
+        Adds a pixel position as a candidate endmember.
+
+        Parameters
+        ----------
+        point : QPoint
+            The image coordinate to consider as an endmember.
+        """
+        self._pixel_select.add(point)
+
+    def add_reference_points(self, points: list[QPoint]):
+        """
+        Adds multiple pixel positions as candidate endmembers.
+
+        Parameters
+        ----------
+        points : list of QPoint
+            The image coordinates to consider as endmembers.
+        """
+        self._pixel_select.extend(points)
+
+    def add_endmember(self, name: str, spectrum: np.ndarray):
+        """
+        Add an endmember to unmix the pixels into.
+
+        Parameters
+        ----------
+        name : str
+            The name under which the endmember is listed.
+        spectrum : np.ndarray
+            The spectrum of the endmember at every band, with NaN at bands it does not cover.
+        """
+        self._names.append(name)
+        self._endmembers.append(np.asarray(spectrum, dtype=np.float64))
+
+        item = QListWidgetItem(self._get_color_icon(len(self._names) - 1), name)
+        self._endmember_list.addItem(item)
+        self._unmix.setEnabled(True)
+
+    @Slot()
+    def clear_endmembers(self):
+        """Remove all endmembers."""
+        self._names.clear()
+        self._endmembers.clear()
+        self._endmember_list.clear()
+        self._unmix.setEnabled(False)
+
+    def add_library(self, path: str) -> bool:
+        """
+        Add every spectrum of a CSV file as an endmember, resampled onto the current hypercube.
+
+        Parameters
+        ----------
+        path : str
+            The path of the CSV file.
+
+        Returns
+        -------
+        bool
+            Whether the spectra could be used, otherwise an error is shown to the user.
+        """
+        try:
+            library = SpectralLibrary.load_file(path)
+            references, bands = library.resample(self._model.hypercube.wavelengths)
+        except (OSError, ValueError) as error:
+            QMessageBox.critical(self, "Invalid Endmembers", f"Could not use the selected file. {error}")
+            return False
+
+        for name, reference in zip(library.names, references):
+            spectrum = np.full(len(bands), np.nan)
+            spectrum[bands] = reference
+            self.add_endmember(name, spectrum)
+
+        return True
+
+    def set_abundances(self, abundances: np.ndarray, errors: np.ndarray):
+        """
+        Display the abundances of the endmembers.
+
+        Parameters
+        ----------
+        abundances : np.ndarray
+            The abundances of shape (rows, columns, endmembers).
+        errors : np.ndarray
+            The root-mean-square error of the reconstruction of shape (rows, columns).
+        """
+        self._abundances = abundances
+        self._errors = errors
+
+        finite = errors[np.isfinite(errors)]
+        self._error_range = float(np.percentile(finite, self.STRETCH_PERCENTILE)) if finite.size else 1.0
+
+        self._display_dropdown.blockSignals(True)
+        self._display_dropdown.clear()
+        self._display_dropdown.addItems([*self._names[:abundances.shape[-1]], self.ERROR])
+        self._display_dropdown.setEnabled(True)
+        self._display_dropdown.blockSignals(False)
+        self._render()
+
+    def _browse(self):
+        path, _ = QFileDialog.getOpenFileName(self, caption="Select Endmembers", filter="CSV (*.csv)")
+        if path:
+            self.add_library(path)
+
+    @Slot()
+    def _add_pixel(self):
+        point = self._pixel_select.point()
+        if point is not None:
+            self.add_endmember(f"Pixel ({point.x()}, {point.y()})", self._pixel_select.get())
+
+    @Slot()
+    def _remove_endmember(self):
+        row = self._endmember_list.currentRow()
+        if row < 0:
+            return
+
+        names, endmembers = self._names, self._endmembers
+        del names[row], endmembers[row]
+
+        # Relist the remaining endmembers, so that their colors stay in order.
+        self._names, self._endmembers = [], []
+        self._endmember_list.clear()
+        self._unmix.setEnabled(False)
+        for name, endmember in zip(names, endmembers):
+            self.add_endmember(name, endmember)
+
+    @Slot()
+    def _handle_hypercube_opened(self, hypercube: Hypercube):
+        self._abundances = None
+        self._errors = None
+        self.clear_endmembers()
+        self.clear_reference_points()
+        self._display_dropdown.clear()
+        self._display_dropdown.setEnabled(False)
+        self._library_button.setEnabled(hypercube.wavelengths is not None)
+        self._message.clear()
+        self.statusChanged.emit(True)
+
+    @Slot()
+    def _handle_unmixing(self):
+        endmembers = np.array(self._endmembers)
+        bands = np.isfinite(endmembers).all(axis=0)
+
+        try:
+            unmixing = Unmixing(endmembers[:, bands], self._constraint_dropdown.currentData())
+        except ValueError as error:
+            QMessageBox.critical(self, "Invalid Endmembers", f"Could not unmix the pixels. {error}")
+            return
+
+        self._progress_dialog = QProgressDialog(self)
+        self._progress_dialog.setWindowTitle("Unmixing...")
+        self._progress_dialog.setModal(True)
+        self._progress_dialog.setLabelText(
+            "Please, wait while the pixels are being unmixed. This may take a while..."
+        )
+
+        self._worker = UnmixingWorker(
+            hypercube=self._model.hypercube,
+            unmixing=unmixing,
+            bands=bands,
+        )
+
+        self._worker.progress.connect(self._progress_dialog.setValue)
+        self._worker.finished.connect(self._progress_dialog.close)
+        self._worker.finished.connect(self._handle_finished)
+        self._worker.computed.connect(self._handle_computed)
+
+        self._progress_dialog.show()
+        self._progress_dialog.canceled.connect(self._handle_cancel)
+        start_worker(self._worker, self)
+
+    @Slot()
+    def _handle_extraction(self):
+        self._progress_dialog = QProgressDialog(self)
+        self._progress_dialog.setWindowTitle("Extracting...")
+        self._progress_dialog.setModal(True)
+        self._progress_dialog.setLabelText(
+            "Please, wait while the endmembers are being extracted. This may take a while..."
+        )
+
+        self._extraction_worker = EndmemberWorker(
+            hypercube=self._model.hypercube,
+            num_endmembers=min(self._extract_count.value(), self._model.hypercube.num_bands),
+        )
+
+        self._extraction_worker.progress.connect(self._progress_dialog.setValue)
+        self._extraction_worker.finished.connect(self._progress_dialog.close)
+        self._extraction_worker.finished.connect(self._handle_extraction_finished)
+        self._extraction_worker.extracted.connect(self._handle_extracted)
+
+        self._progress_dialog.show()
+        self._progress_dialog.canceled.connect(self._handle_extraction_cancel)
+        start_worker(self._extraction_worker, self)
+
+    @Slot()
+    def _handle_extraction_cancel(self):
+        if self._extraction_worker:
+            self._extraction_worker.stop()
+
+    @Slot()
+    def _handle_extraction_finished(self):
+        if self.sender() is self._extraction_worker:
+            self._extraction_worker = None
+
+    @Slot()
+    def _handle_extracted(self, spectra: np.ndarray, positions: np.ndarray):
+        if self.sender() is not self._extraction_worker:
+            return
+
+        for spectrum, (row, col) in zip(spectra, positions.tolist()):
+            self.add_endmember(f"Pixel ({col}, {row})", spectrum)
+
+        self.endmembersExtracted.emit(spectra, positions[:, 1], positions[:, 0])
+
+    @Slot()
+    def _handle_cancel(self):
+        if self._worker:
+            self._worker.stop()
+
+    @Slot()
+    def _handle_finished(self):
+        if self.sender() is self._worker:
+            self._worker = None
+
+    @Slot()
+    def _handle_computed(self, abundances: np.ndarray, errors: np.ndarray):
+        if self.sender() is self._worker:
+            self.set_abundances(abundances, errors)
+
+    @Slot()
+    def _render(self):
+        if self._abundances is None:
+            return
+
+        index = self._display_dropdown.currentIndex()
+        if index < self._abundances.shape[-1]:
+            values, lo, hi = self._abundances[..., index], 0.0, 1.0
+        else:
+            values, lo, hi = self._errors, 0.0, self._error_range
+
+        self._message.setText(f"Displayed range: {lo:.4g} to {hi:.4g}")
+        colors = apply_colormap(values, lo, hi, self._colormap_dropdown.currentText())
+        self.imageChanged.emit(colors / 255.0)
+
+    @staticmethod
+    def _get_color_icon(index: int, size: int = 12) -> QIcon:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(get_label_color(index))
+        return QIcon(pixmap)
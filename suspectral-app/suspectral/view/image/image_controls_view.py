@@ -14,10 +14,15 @@ from PySide6.QtWidgets import (
 
 from suspectral.model.hypercube_container import HypercubeContainer
 from suspectral.view.image.coloring_mode import ColoringMode
+from suspectral.view.image.coloring_mode_band_math import ColoringModeBandMath
 from suspectral.view.image.coloring_mode_cie import ColoringModeCIE
+from suspectral.view.image.coloring_mode_clustering import ColoringModeClustering
+from suspectral.view.image.coloring_mode_components import ColoringModeComponents
 from suspectral.view.image.coloring_mode_grayscale import ColoringModeGrayscale
+from suspectral.view.image.coloring_mode_library import ColoringModeLibrary
 from suspectral.view.image.coloring_mode_rgb import ColoringModeRGB
 from suspectral.view.image.coloring_mode_srf import ColoringModeSRF
+from suspectral.view.image.coloring_mode_unmixing import ColoringModeUnmixing
 
 
 class ImageControlsView(QStackedWidget):
@@ -28,6 +33,12 @@ class ImageControlsView(QStackedWidget):
     -------
     imagedChanged(np.ndarray)
         Emitted when a new RGB image should be rendered.
+    spectraChanged(np.ndarray)
+        Emitted with spectra of shape (spectra, bands) derived by a coloring mode, such as
+        the centroids of clusters, which should be plotted.
+    pointsHighlighted(np.ndarray, np.ndarray)
+        Emitted with the x and y coordinates of pixels found by a coloring mode, such as
+        extracted endmembers, which should be highlighted on the image.
 
     Parameters
     ----------
@@ -38,6 +49,8 @@ class ImageControlsView(QStackedWidget):
     """
 
     imagedChanged = Signal(np.ndarray)
+    spectraChanged = Signal(np.ndarray)
+    pointsHighlighted = Signal(np.ndarray, np.ndarray)
 
     def __init__(self,
                  model: HypercubeContainer,
@@ -95,6 +108,28 @@ class ImageControlsView(QStackedWidget):
         self._true_coloring_srf.imageChanged.connect(self.imagedChanged.emit)
         self._add_mode("True Coloring (SRF)", self._true_coloring_srf)
 
+        self._false_coloring_components = ColoringModeComponents(model, self)
+        self._false_coloring_components.imageChanged.connect(self.imagedChanged.emit)
+        self._add_mode("False Coloring (Components)", self._false_coloring_components)
+
+        self._band_math = ColoringModeBandMath(model, self)
+        self._band_math.imageChanged.connect(self.imagedChanged.emit)
+        self._add_mode("Band Math (Expression)", self._band_math)
+
+        self._classification_library = ColoringModeLibrary(model, self)
+        self._classification_library.imageChanged.connect(self.imagedChanged.emit)
+        self._add_mode("Classification (Library)", self._classification_library)
+
+        self._classification_clustering = ColoringModeClustering(model, self)
+        self._classification_clustering.imageChanged.connect(self.imagedChanged.emit)
+        self._classification_clustering.centroidsChanged.connect(self.spectraChanged.emit)
+        self._add_mode("Classification (K-Means)", self._classification_clustering)
+
+        self._unmixing = ColoringModeUnmixing(model, self)
+        self._unmixing.imageChanged.connect(self.imagedChanged.emit)
+        self._unmixing.endmembersExtracted.connect(self._handle_endmembers_extracted)
+        self._add_mode("Unmixing (Endmembers)", self._unmixing)
+
         self._mode_dropdown.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self._mode_dropdown.currentIndexChanged.connect(self._handle_mode_changed)
 
@@ -102,6 +137,7 @@ class ImageControlsView(QStackedWidget):
         """Clear all spectral reference points from coloring modes that support them."""
         self._true_coloring_srf.clear_reference_points()
         self._true_coloring_cie.clear_reference_points()
+        self._unmixing.clear_reference_points()
 
     def add_reference_points(self, point: QPoint):
         """
@@ -114,6 +150,20 @@ class ImageControlsView(QStackedWidget):
         """
         self._true_coloring_srf.add_reference_point(point)
         self._true_coloring_cie.add_reference_point(point)
+        self._unmixing.add_reference_point(point)
+
+    def extend_reference_points(self, points: list[QPoint]):
+        """
+        Add multiple spectral reference points to coloring modes that support them.
+
+        Parameters
+        ----------
+        points : list of QPoint
+            The image coordinates to use as reference points.
+        """
+        self._true_coloring_srf.add_reference_points(points)
+        self._true_coloring_cie.add_reference_points(points)
+        self._unmixing.add_reference_points(points)
 
     @Slot()
     def activate(self):
@@ -144,6 +194,11 @@ class ImageControlsView(QStackedWidget):
                 .item(index).setEnabled(enabled)
         )
 
+    @Slot()
+    def _handle_endmembers_extracted(self, spectra: np.ndarray, xs: np.ndarray, ys: np.ndarray):
+        self.spectraChanged.emit(spectra)
+        self.pointsHighlighted.emit(xs, ys)
+
     @Slot()
     def _handle_mode_changed(self, index: int):
         self._mode_controls.setCurrentWidget(self._modes[index])
@@ -56,6 +56,9 @@ class ImageView(QGraphicsView):
         self.setScene(QGraphicsScene(self))
         self._image = self.scene().addPixmap(QPixmap())
 
+        # Added right after the image, so that it covers the image but not any highlights.
+        self._overlay = self.scene().addPixmap(QPixmap())
+
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
@@ -75,11 +78,27 @@ class ImageView(QGraphicsView):
     def reset(self):
         """Clear the currently displayed image and reset zoom and transformations."""
         self.image.setPixmap(QPixmap())
+        self.overlay.setPixmap(QPixmap())
         self.setSceneRect(QRectF(0, 0, 1, 1))
 
         self.resetTransform()
         self._zoom = 1.0
 
+    def set_overlay(self, pixmap: QPixmap):
+        """
+        Display the given QPixmap on top of the image, such as a map highlighting certain pixels.
+
+        Parameters
+        ----------
+        pixmap : QPixmap
+            The overlay to display, typically partially transparent and of the same size as the image.
+        """
+        self.overlay.setPixmap(pixmap)
+
+    def clear_overlay(self):
+        """Remove the overlay displayed on top of the image."""
+        self.overlay.setPixmap(QPixmap())
+
     def rotate_left(self):
         """Rotate the image 90 degrees counterclockwise."""
         self.rotate(-90.0)
@@ -129,6 +148,11 @@ class ImageView(QGraphicsView):
         """The scene graphics item displaying the image."""
         return self._image
 
+    @property
+    def overlay(self) -> QGraphicsPixmapItem:
+        """The scene graphics item displaying the overlay on top of the image."""
+        return self._overlay
+
     def mouseMoveEvent(self, event: QMouseEvent):
         scene_position: QPointF = self.mapToScene(event.position().toPoint())
         local_position: QPointF = self.image.mapFromScene(scene_position)
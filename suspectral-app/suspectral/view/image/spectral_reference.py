@@ -1,10 +1,9 @@
 import numpy as np
 from PySide6.QtCore import QPoint
-from PySide6.QtGui import QColor, QPixmap, QIcon
-from PySide6.QtWidgets import QComboBox, QWidget, QVBoxLayout
+from PySide6.QtWidgets import QComboBox, QListView, QWidget, QVBoxLayout
 
-from suspectral.colors import get_color
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.spectral_reference_model import SpectralReferenceModel
 
 
 class SpectralReference(QWidget):
@@ -22,9 +21,15 @@ class SpectralReference(QWidget):
     def __init__(self, model: HypercubeContainer, parent: QWidget | None = None):
         super().__init__(parent)
         self._model = model
-        self._points: list[QPoint] = []
+        self._references = SpectralReferenceModel(self)
+
+        # Selections may add thousands of points, which the list only lays out as needed.
+        view = QListView(self)
+        view.setUniformItemSizes(True)
+
         self._select = QComboBox(self)
-        self._select.addItem("Select...")
+        self._select.setView(view)
+        self._select.setModel(self._references)
 
         layout = QVBoxLayout(self)
         layout.addWidget(self._select)
@@ -32,9 +37,7 @@ class SpectralReference(QWidget):
 
     def clear(self):
         """Clears all reference points and resets the selection dropdown."""
-        self._points.clear()
-        self._select.clear()
-        self._select.addItem("Select...")
+        self._references.clear()
 
     def add(self, point: QPoint):
         """
@@ -45,10 +48,18 @@ class SpectralReference(QWidget):
         point : QPoint
             The (x, y) coordinates of the point to be added.
         """
-        self._points.append(point)
-        index = len(self._points) - 1
-        color = self._mk_color_icon(get_color(index))
-        self._select.addItem(color, f"Selection ({index + 1})")
+        self.extend([point])
+
+    def extend(self, points: list[QPoint]):
+        """
+        Adds multiple reference points and updates the dropdown menu at once.
+
+        Parameters
+        ----------
+        points : list of QPoint
+            The (x, y) coordinates of the points to be added.
+        """
+        self._references.extend(points)
 
     def get(self) -> np.ndarray | None:
         """
@@ -60,16 +71,22 @@ class SpectralReference(QWidget):
             The spectral data at the selected point as a 1D NumPy array, or None
             if no selection is made.
         """
-        if self._select.currentIndex() == 0:
+        point = self.point()
+        if point is None:
             return None
 
-        index = self._select.currentIndex() - 1
-        point = self._points[index]
-
         return self._model.hypercube.read_pixel(point.y(), point.x())
 
-    @staticmethod
-    def _mk_color_icon(color: QColor, size: int = 12):
-        pixmap = QPixmap(size, size)
-        pixmap.fill(color)
-        return QIcon(pixmap)
+    def point(self) -> QPoint | None:
+        """
+        Retrieves the currently selected reference point.
+
+        Returns
+        -------
+        QPoint or None
+            The (x, y) coordinates of the selected point, or None if no selection is made.
+        """
+        if self._select.currentIndex() <= 0:
+            return None
+
+        return self._references.points[self._select.currentIndex() - 1]
@@ -0,0 +1,88 @@
+from typing import Any
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, QPoint, Qt
+from PySide6.QtGui import QColor, QIcon, QPixmap
+from PySide6.QtWidgets import QWidget
+
+from suspectral.colors import NUM_COLORS, get_color
+
+
+class SpectralReferenceModel(QAbstractListModel):
+    """
+    A list model of reference points, preceded by a placeholder entry.
+
+    Entries are produced on demand, so that adding thousands of points sampled from a
+    selection is a single insertion rather than one insertion per point.
+
+    Parameters
+    ----------
+    parent : QWidget or None, optional
+        The parent object of the model, by default None.
+    """
+
+    PLACEHOLDER = "Select..."
+
+    _icons: list[QIcon] = []
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._points: list[QPoint] = []
+
+    @property
+    def points(self) -> list[QPoint]:
+        """The reference points, in the order in which they were added."""
+        return self._points
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._points) + 1
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.PLACEHOLDER if row == 0 else f"Selection ({row})"
+        if role == Qt.ItemDataRole.DecorationRole and row > 0:
+            return self._get_color_icon(row - 1)
+
+        return None
+
+    def extend(self, points: list[QPoint]):
+        """
+        Append reference points to the end of the list.
+
+        Parameters
+        ----------
+        points : list of QPoint
+            The (x, y) coordinates of the points to be added.
+        """
+        if not points: return
+
+        first = len(self._points) + 1
+        self.beginInsertRows(QModelIndex(), first, first + len(points) - 1)
+        self._points.extend(points)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all reference points, keeping only the placeholder."""
+        self.beginResetModel()
+        self._points = []
+        self.endResetModel()
+
+    @staticmethod
+    def _get_color_icon(index: int) -> QIcon:
+        # The palette is small, so each of its icons is only ever painted once.
+        if not SpectralReferenceModel._icons:
+            SpectralReferenceModel._icons = [
+                SpectralReferenceModel._mk_color_icon(get_color(color))
+                for color in range(NUM_COLORS)
+            ]
+
+        return SpectralReferenceModel._icons[index % NUM_COLORS]
+
+    @staticmethod
+    def _mk_color_icon(color: QColor, size: int = 12):
+        pixmap = QPixmap(size, size)
+        pixmap.fill(color)
+        return QIcon(pixmap)
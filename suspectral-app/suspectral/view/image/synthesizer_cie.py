@@ -53,6 +53,9 @@ class SynthesizerCIE(QObject):
     produced = Signal(np.ndarray)
     finished = Signal()
 
+    BLOCK_BYTES = 4 * 1024 ** 2
+    """Upper bound on the size of a block of rows read at once, which is processed in double precision."""
+
     def __init__(self,
                  cmf: np.ndarray,
                  hypercube: Hypercube,
@@ -114,14 +117,14 @@ class SynthesizerCIE(QObject):
         # Load the integration argument from the hypercube.
         w = self._hypercube.wavelengths[self._mask]
 
-        # Generate the image row-by-row (interruptable from other threads).
+        # Generate the image block-by-block (interruptable from other threads),
+        # while the next block is read ahead in the background.
         image = np.zeros((num_rows, num_cols, 3))
-        for row in range(num_rows):
+        blocks = self._hypercube.iter_blocks(target_bytes=self.BLOCK_BYTES)
+        for rows, spectra in blocks:
             # Stop prematurely if requested; the image won't be produced.
             if not self._running: break
 
-            # Load the next row of spectra from the hypercube.
-            spectra = self._hypercube.read_row(row)
             spectra = spectra[:, :, self._mask].astype(np.float64)
 
             # Make the darkest pixels appear black (optional).
@@ -134,11 +137,11 @@ class SynthesizerCIE(QObject):
                 spectra /= self._white_ref
                 spectra[spectra > 1] = 1
 
-            # Sum up the contributions of the image components for this row.
-            image[row, :, 0] = simpson(spectra * self._cmf_x * self._spd, w)
-            image[row, :, 1] = simpson(spectra * self._cmf_y * self._spd, w)
-            image[row, :, 2] = simpson(spectra * self._cmf_z * self._spd, w)
-            self.progress.emit(int(row / (num_rows - 1) * 100))
+            # Sum up the contributions of the image components for these rows.
+            image[rows, :, 0] = simpson(spectra * self._cmf_x * self._spd, w)
+            image[rows, :, 1] = simpson(spectra * self._cmf_y * self._spd, w)
+            image[rows, :, 2] = simpson(spectra * self._cmf_z * self._spd, w)
+            self.progress.emit(int(rows.stop / num_rows * 100))
         else:
             if self._apply_srgb_transform:
                 # Apply the standard XYZ to sRGB transformation matrix.
@@ -168,7 +171,8 @@ class SynthesizerCIE(QObject):
             # Emit the image for display.
             self.produced.emit(image)
 
-        # Notify other threads of completion.
+        # Stop reading ahead, in case of an early stop, and notify other threads of completion.
+        blocks.close()
         self.finished.emit()
 
     @Slot()
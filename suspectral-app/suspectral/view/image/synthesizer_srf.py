@@ -47,6 +47,9 @@ class SynthesizerSRF(QObject):
     produced = Signal(np.ndarray)
     finished = Signal()
 
+    BLOCK_BYTES = 4 * 1024 ** 2
+    """Upper bound on the size of a block of rows read at once, which is processed in double precision."""
+
     def __init__(self,
                  srf: np.ndarray,
                  hypercube: Hypercube,
@@ -104,14 +107,14 @@ class SynthesizerSRF(QObject):
         # Load the integration argument from the hypercube.
         w = self._hypercube.wavelengths[self._mask]
 
-        # Generate the image row-by-row (interruptable from other threads).
+        # Generate the image block-by-block (interruptable from other threads),
+        # while the next block is read ahead in the background.
         image = np.zeros((num_rows, num_cols, 3))
-        for row in range(num_rows):
+        blocks = self._hypercube.iter_blocks(target_bytes=self.BLOCK_BYTES)
+        for rows, spectra in blocks:
             # Stop prematurely if requested; the image won't be produced.
             if not self._running: break
 
-            # Load the next row of spectra from the hypercube.
-            spectra = self._hypercube.read_row(row)
             spectra = spectra[:, :, self._mask]
 
             # Make the darkest pixels appear black (optional).
@@ -125,12 +128,12 @@ class SynthesizerSRF(QObject):
                 spectra[spectra > 1] = 1
 
             # Sum up the contributions of all the image components.
-            image[row, :, 0] = simpson(spectra * self._srf_r * self._spd, w)
-            image[row, :, 1] = simpson(spectra * self._srf_g * self._spd, w)
-            image[row, :, 2] = simpson(spectra * self._srf_b * self._spd, w)
+            image[rows, :, 0] = simpson(spectra * self._srf_r * self._spd, w)
+            image[rows, :, 1] = simpson(spectra * self._srf_g * self._spd, w)
+            image[rows, :, 2] = simpson(spectra * self._srf_b * self._spd, w)
 
             # Emit a progress update in percents.
-            self.progress.emit(int(row / (num_rows - 1) * 100))
+            self.progress.emit(int(rows.stop / num_rows * 100))
         else:
             # Apply contrast (either per-channel or globally).
             if self._apply_per_channel_contrast:
@@ -143,7 +146,8 @@ class SynthesizerSRF(QObject):
             # Emit the image for display.
             self.produced.emit(image)
 
-        # Notify other threads of completion.
+        # Stop reading ahead, in case of an early stop, and notify other threads of completion.
+        blocks.close()
         self.finished.emit()
 
     @Slot()
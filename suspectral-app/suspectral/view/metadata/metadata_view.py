@@ -1,3 +1,4 @@
+import numpy as np
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPalette
 from PySide6.QtWidgets import (
@@ -55,7 +56,10 @@ class MetadataView(QStackedWidget):
 
         self._table.setRowCount(len(metadata))
         for row, (key, value) in enumerate(metadata.items()):
-            if isinstance(value, list):
+            if isinstance(value, np.ndarray):
+                # Numeric lists are already parsed, so they only need to be joined.
+                value = "{" + ", ".join(map(str, value.tolist())) + "}"
+            elif isinstance(value, list):
                 value = [self._stringify(v) for v in value]
                 value = "{" + ", ".join(map(str, value)) + "}"
 
@@ -0,0 +1,236 @@
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import (
+    QComboBox,
+    QFormLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QProgressBar,
+    QPushButton,
+    QSlider,
+    QSpinBox,
+    QStackedWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+
+class OverlayView(QStackedWidget):
+    """
+    A widget to control the overlay of per-pixel scores displayed on top of the image.
+
+    Shows a placeholder message and the controls of the anomaly detector when no overlay is
+    displayed. Otherwise, shows the name of the overlay, the progress of its computation and,
+    once computed, a slider to choose the threshold which separates highlighted pixels from
+    the rest.
+
+    Signals
+    -------
+    thresholdChanged(float)
+        Emitted when the user moves the threshold slider.
+    clearRequested()
+        Emitted when the user asks to remove the overlay.
+    anomaliesRequested(int, int)
+        Emitted when the user asks to detect anomalous pixels, with the sizes of the background
+        and guard windows. A background window of size 0 means the whole image.
+
+    Parameters
+    ----------
+    parent : QWidget or None, optional
+        The parent widget, by default None.
+    """
+
+    thresholdChanged = Signal(float)
+    clearRequested = Signal()
+    anomaliesRequested = Signal(int, int)
+
+    SLIDER_STEPS = 1000
+
+    GLOBAL = "Global"
+    LOCAL = "Local"
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._lo = 0.0
+        self._hi = 1.0
+
+        self.setAutoFillBackground(True)
+        self.setBackgroundRole(QPalette.ColorRole.Base)
+
+        message = QLabel("Find pixels similar to an inspected one, or detect anomalous pixels, "
+                         "to display them as an overlay.")
+        message.setForegroundRole(QPalette.ColorRole.PlaceholderText)
+        message.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        message.setContentsMargins(4, 4, 4, 4)
+        message.setWordWrap(True)
+
+        self._background = QComboBox()
+        self._background.addItems([self.GLOBAL, self.LOCAL])
+        self._background.setToolTip(
+            "Whether pixels are compared against the whole image (Global),\n"
+            "or against a window of pixels around each of them (Local)."
+        )
+        self._background.currentTextChanged.connect(self._handle_background_changed)
+
+        self._window = QSpinBox()
+        self._window.setRange(3, 201)
+        self._window.setSingleStep(2)
+        self._window.setValue(15)
+        self._window.setSuffix(" px")
+        self._window.setToolTip("The size of the window of pixels each pixel is compared against.")
+
+        self._guard = QSpinBox()
+        self._guard.setRange(0, 199)
+        self._guard.setSingleStep(2)
+        self._guard.setValue(5)
+        self._guard.setSuffix(" px")
+        self._guard.setSpecialValueText("None")
+        self._guard.setToolTip("The size of the window around each pixel excluded from the comparison.")
+
+        self._detect = QPushButton("Detect Anomalies")
+        self._detect.clicked.connect(self._handle_detect)
+        self._detect.setEnabled(False)
+
+        detection = QGroupBox("Anomaly Detection (RX)")
+        detection_layout = QFormLayout(detection)
+        detection_layout.addRow("Background:", self._background)
+        detection_layout.addRow("Window:", self._window)
+        detection_layout.addRow("Guard:", self._guard)
+        detection_layout.addRow(self._detect)
+        self._handle_background_changed(self._background.currentText())
+
+        self._placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(self._placeholder)
+        placeholder_layout.addWidget(message)
+        placeholder_layout.addWidget(detection)
+        placeholder_layout.addStretch(1)
+
+        self._title = QLabel()
+        self._progress = QProgressBar()
+        self._progress.setRange(0, 100)
+
+        self._slider = QSlider(Qt.Orientation.Horizontal)
+        self._slider.setRange(0, self.SLIDER_STEPS)
+        self._slider.valueChanged.connect(self._handle_slider_changed)
+
+        self._value = QLabel()
+        self._value.setMinimumWidth(64)
+        self._value.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        self._clear = QPushButton("Clear")
+        self._clear.clicked.connect(self.clearRequested.emit)
+
+        threshold = QHBoxLayout()
+        threshold.addWidget(QLabel("Threshold"))
+        threshold.addWidget(self._slider, 1)
+        threshold.addWidget(self._value)
+
+        self._panel = QWidget()
+        layout = QVBoxLayout(self._panel)
+        layout.addWidget(self._title)
+        layout.addWidget(self._progress)
+        layout.addLayout(threshold)
+        layout.addWidget(self._clear, 0, Qt.AlignmentFlag.AlignRight)
+        layout.addStretch(1)
+
+        self.addWidget(self._placeholder)
+        self.addWidget(self._panel)
+
+    @property
+    def threshold(self) -> float:
+        """The threshold currently selected with the slider."""
+        return self._lo + (self._hi - self._lo) * self._slider.value() / self.SLIDER_STEPS
+
+    @Slot()
+    def start(self, name: str):
+        """
+        Show that an overlay with the given name is being computed.
+
+        Parameters
+        ----------
+        name : str
+            The display name of the overlay.
+        """
+        self._title.setText(name)
+        self._progress.setValue(0)
+        self._progress.setVisible(True)
+        self._slider.setEnabled(False)
+        self._value.clear()
+        self.setCurrentWidget(self._panel)
+
+    @Slot()
+    def set_progress(self, percent: int):
+        """
+        Update the progress of the computation of the overlay.
+
+        Parameters
+        ----------
+        percent : int
+            The progress in percent (0–100).
+        """
+        self._progress.setValue(percent)
+
+    def set_range(self, lo: float, hi: float, threshold: float):
+        """
+        Enable the threshold slider over the given range of scores.
+
+        Parameters
+        ----------
+        lo : float
+            The lowest score, at the left end of the slider.
+        hi : float
+            The highest score, at the right end of the slider.
+        threshold : float
+            The initially selected threshold.
+        """
+        self._lo = lo
+        self._hi = hi if hi > lo else lo + 1.0
+
+        self._progress.setVisible(False)
+        self._slider.setEnabled(True)
+        self._slider.blockSignals(True)
+        self._slider.setValue(round((threshold - self._lo) / (self._hi - self._lo) * self.SLIDER_STEPS))
+        self._slider.blockSignals(False)
+        self._update_value()
+
+    @Slot()
+    def clear(self):
+        """Hide the overlay controls and show the placeholder message."""
+        self.setCurrentWidget(self._placeholder)
+
+    def set_detection_enabled(self, enabled: bool):
+        """
+        Enable or disable the controls of the anomaly detector.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether anomalies can be detected, such as when a hypercube is open.
+        """
+        self._detect.setEnabled(enabled)
+
+    @Slot()
+    def _handle_background_changed(self, background: str):
+        local = background == self.LOCAL
+        self._window.setEnabled(local)
+        self._guard.setEnabled(local)
+
+    @Slot()
+    def _handle_detect(self):
+        if self._background.currentText() == self.GLOBAL:
+            self.anomaliesRequested.emit(0, 0)
+            return
+
+        # Both windows are centered on the pixel, so their sizes must be odd.
+        window = self._window.value() | 1
+        guard = self._guard.value() | 1 if self._guard.value() else 0
+        self.anomaliesRequested.emit(window, min(guard, window - 2))
+
+    @Slot()
+    def _handle_slider_changed(self):
+        self._update_value()
+        self.thresholdChanged.emit(self.threshold)
+
+    def _update_value(self):
+        self._value.setText(f"{self.threshold:.4g}")
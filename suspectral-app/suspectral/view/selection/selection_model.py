@@ -0,0 +1,89 @@
+from typing import Any
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtWidgets import QWidget
+
+from suspectral.colors import get_color
+
+
+class SelectionModel(QAbstractTableModel):
+    """
+    A table model of selected pixel coordinates with a color-coded legend.
+
+    The coordinates are kept in NumPy arrays and cells are produced on demand, so that
+    the table stays responsive even when many thousands of points are selected at once.
+
+    Parameters
+    ----------
+    parent : QWidget or None, optional
+        The parent object of the model, by default None.
+    """
+
+    HEADERS = ["Legend", "X", "Y"]
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._xs = np.empty(0, dtype=int)
+        self._ys = np.empty(0, dtype=int)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._xs)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        if column == 0:
+            return get_color(row) if role == Qt.ItemDataRole.BackgroundRole else None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(self._xs[row] if column == 1 else self._ys[row])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self.HEADERS[section]
+            return str(section + 1)
+
+        return None
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        if index.column() == 0:
+            return Qt.ItemFlag.ItemIsEnabled
+
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def append(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Append pixel coordinates to the end of the table.
+
+        Parameters
+        ----------
+        xs : np.ndarray
+            The x coordinates of the pixels.
+        ys : np.ndarray
+            The y coordinates of the pixels, matching `xs` in length.
+        """
+        if len(xs) == 0: return
+
+        first = len(self._xs)
+        self.beginInsertRows(QModelIndex(), first, first + len(xs) - 1)
+        self._xs = np.concatenate((self._xs, np.asarray(xs, dtype=int)))
+        self._ys = np.concatenate((self._ys, np.asarray(ys, dtype=int)))
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all coordinates from the table."""
+        self.beginResetModel()
+        self._xs = np.empty(0, dtype=int)
+        self._ys = np.empty(0, dtype=int)
+        self.endResetModel()
@@ -1,15 +1,15 @@
+import numpy as np
 from PySide6.QtCore import Qt, QPoint, Slot
 from PySide6.QtGui import QPalette
 from PySide6.QtWidgets import (
     QHeaderView,
     QLabel,
     QStackedWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QWidget,
 )
 
-from suspectral.colors import get_color
+from suspectral.view.selection.selection_model import SelectionModel
 
 
 class SelectionView(QStackedWidget):
@@ -36,10 +36,14 @@ class SelectionView(QStackedWidget):
         self._placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
         self._placeholder.setContentsMargins(4, 4, 4, 4)
 
-        self._table = QTableWidget(self)
-        self._table.setColumnCount(3)
+        self._model = SelectionModel(self)
+
+        self._table = QTableView(self)
+        self._table.setModel(self._model)
         self._table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self._table.setHorizontalHeaderLabels(["Legend", "X", "Y"])
+
+        # Rows are uniform, which spares the header from measuring each of them.
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         self.addWidget(self._placeholder)
         self.addWidget(self._table)
@@ -54,8 +58,7 @@ class SelectionView(QStackedWidget):
         point : QPoint
             The pixel coordinate to add.
         """
-        self.setCurrentWidget(self._table)
-        self._append(point)
+        self.add_coordinates(np.array([point.x()]), np.array([point.y()]))
 
     @Slot()
     def add_points(self, points: list[QPoint]):
@@ -67,32 +70,28 @@ class SelectionView(QStackedWidget):
         points : list of QPoint
             A list of pixel coordinates to add.
         """
+        self.add_coordinates(
+            np.array([point.x() for point in points], dtype=int),
+            np.array([point.y() for point in points], dtype=int),
+        )
+
+    @Slot()
+    def add_coordinates(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Add pixel coordinates given as arrays to the selection table, switching to the table view.
+
+        Parameters
+        ----------
+        xs : np.ndarray
+            The x coordinates of the pixels.
+        ys : np.ndarray
+            The y coordinates of the pixels, matching `xs` in length.
+        """
         self.setCurrentWidget(self._table)
-        for point in points:
-            self._append(point)
+        self._model.append(xs, ys)
 
     @Slot()
     def clear(self):
         """Clear all selected points and show the placeholder message."""
-        self._table.clearContents()
-        self._table.setRowCount(0)
+        self._model.clear()
         self.setCurrentWidget(self._placeholder)
-
-    def _append(self, point: QPoint):
-        row = self._table.rowCount()
-        self._table.insertRow(row)
-
-        item_color = QTableWidgetItem()
-        item_color.setBackground(get_color(row))
-        item_color.setFlags(item_color.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-        item_color.setFlags(item_color.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-        item_pos_x = QTableWidgetItem(str(point.x()))
-        item_pos_x.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        item_pos_y = QTableWidgetItem(str(point.y()))
-        item_pos_y.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self._table.setItem(row, 0, item_color)
-        self._table.setItem(row, 1, item_pos_x)
-        self._table.setItem(row, 2, item_pos_y)
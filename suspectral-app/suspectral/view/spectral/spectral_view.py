@@ -1,10 +1,12 @@
+import math
+
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import Slot, Signal
+from PySide6.QtCore import Slot, Signal, QTimer, QRectF
 from PySide6.QtGui import QContextMenuEvent
 from PySide6.QtWidgets import QMenu, QWidget
 
-from suspectral.colors import get_color
+from suspectral.colors import NUM_COLORS, get_color
 from suspectral.model.hypercube_container import HypercubeContainer
 
 
@@ -16,6 +18,18 @@ class SpectralView(pg.PlotWidget):
     either against wavelength values or band indices. It allows dynamic updates,
     clearing of plots, and emits a signal for a custom context menu.
 
+    Spectra are kept in a single preallocated array which grows geometrically,
+    and are drawn in batches: all spectra sharing a palette color are rendered
+    by one NaN-separated plot item, so the number of graphics items is bounded
+    by the palette size regardless of how many spectra are displayed. The bands
+    are decimated to the visible range and to the width of the plot in pixels,
+    keeping the minimum and maximum of each bucket of bands so that narrow
+    absorption and emission peaks are not lost.
+
+    In density mode, the individual spectra are hidden in favor of a single image
+    which shows how many spectra pass through each (band, value) cell, using a
+    logarithmic color scale. This keeps very large selections readable.
+
     Signals
     -------
     contextMenuRequested(menu: QMenu)
@@ -32,15 +46,31 @@ class SpectralView(pg.PlotWidget):
 
     contextMenuRequested = Signal(QMenu)
 
+    ANTIALIAS_LIMIT = 64
+    """Maximum number of spectra which are still drawn with antialiasing."""
+
     def __init__(self, *,
                  model: HypercubeContainer,
                  parent: QWidget | None = None):
         super().__init__(parent)
         self._model = model
 
-        self._spectra: list[np.ndarray] = []
+        self._spectra: np.ndarray = np.empty((0, 0))
+        self._count: int = 0
+        self._curves: dict[int, pg.PlotDataItem] = {}
         self._wavelengths: np.ndarray | None = None
 
+        self._density_mode = False
+        self._density: pg.ImageItem | None = None
+        self._density_lut = pg.colormap.get("viridis").getLookupTable(nPts=256, alpha=True)
+        self._density_lut[0, 3] = 0  # Cells without any spectra are transparent.
+
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._redraw)
+
+        self.getViewBox().sigXRangeChanged.connect(lambda *_: self._redraw_timer.start())
+        self.getViewBox().sigResized.connect(lambda *_: self._redraw_timer.start())
         self.getViewBox().setMenuEnabled(False)
         self.getViewBox().setMouseEnabled(x=False, y=False)
         self.getPlotItem().setContentsMargins(10, 20, 20, 10)
@@ -92,20 +122,92 @@ class SpectralView(pg.PlotWidget):
         spectrum : np.ndarray
             1D array containing spectral intensity values.
         """
-        pen = pg.mkPen(get_color(len(self._spectra)))
-        self.plot(x=self._wavelengths, y=spectrum, pen=pen, antialias=True)
-        self._spectra.append(spectrum)
+        self.add_spectra(np.asarray(spectrum)[np.newaxis, :])
+
+    @Slot()
+    def add_spectra(self, spectra: np.ndarray):
+        """
+        Add multiple spectra to the plot at once.
+
+        Parameters
+        ----------
+        spectra : np.ndarray of shape (number of samples, number of bands)
+            2D array containing a spectrum in each row.
+        """
+        spectra = np.asarray(spectra)
+        if spectra.ndim != 2 or len(spectra) == 0:
+            return
+
+        self._reserve(self._count + len(spectra), spectra)
+        self._spectra[self._count:self._count + len(spectra)] = spectra
+        self._count += len(spectra)
+        self._redraw()
 
     @Slot()
     def clear_spectra(self):
         """Remove all spectra from the plot."""
         self.clear()
-        self._spectra.clear()
+        self._curves.clear()
+        self._density = None
+        self._count = 0
+
+    @Slot()
+    def set_density_mode(self, enabled: bool):
+        """
+        Switch between plotting individual spectra and plotting their density.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether the density of spectra should be displayed instead of the spectra.
+        """
+        self._density_mode = enabled
+        for curve in self._curves.values():
+            curve.setVisible(not enabled)
+
+        if not enabled:
+            self.clear_density()
+
+    @Slot()
+    def set_density(self, counts: np.ndarray, lo: float, hi: float):
+        """
+        Display the density of spectra as an image with a logarithmic color scale.
+
+        Parameters
+        ----------
+        counts : np.ndarray of shape (number of bands, number of bins)
+            Number of spectra falling into each value bin of each band.
+        lo : float
+            The lower bound of the value range covered by the bins.
+        hi : float
+            The upper bound of the value range covered by the bins.
+        """
+        if self._density is None:
+            self._density = pg.ImageItem()
+            self._density.setLookupTable(self._density_lut)
+            self.addItem(self._density)
+
+        num_bands = counts.shape[0]
+        x = self._wavelengths if self._wavelengths is not None else np.arange(num_bands)
+        x_step = (x[-1] - x[0]) / max(num_bands - 1, 1) or 1.0
+
+        image = np.log1p(counts, dtype=np.float32)
+        self._density.setImage(image, levels=(0, max(float(image.max()), 1e-6)))
+        self._density.setRect(QRectF(x[0] - x_step / 2, lo, x_step * num_bands, hi - lo))
+
+    @Slot()
+    def clear_density(self):
+        """Remove the density image from the plot."""
+        if self._density is not None:
+            self.removeItem(self._density)
+            self._density = None
 
     @Slot()
     def reset(self):
         """Reset the plot view to its initial state."""
         self.clear_spectra()
+        self.set_density_mode(False)
+        self._spectra = np.empty((0, 0))
         self.setYRange(0, 1)
         self.setXRange(0, 1)
         self.getPlotItem().enableAutoRange(True, True)
@@ -114,8 +216,15 @@ class SpectralView(pg.PlotWidget):
 
     @property
     def spectra(self) -> np.ndarray:
-        """List of spectra currently displayed."""
-        return np.array(self._spectra)
+        """Read-only array of spectra currently displayed, one spectrum per row."""
+        spectra = self._spectra[:self._count]
+        spectra.flags.writeable = False
+        return spectra
+
+    @property
+    def density_mode(self) -> bool:
+        """Whether the density of spectra is displayed instead of the spectra."""
+        return self._density_mode
 
     @property
     def wavelengths(self) -> np.ndarray | None:
@@ -123,7 +232,94 @@ class SpectralView(pg.PlotWidget):
         return self._wavelengths
 
     def contextMenuEvent(self, event: QContextMenuEvent):
-        if self._spectra:
+        if self._count or self._density is not None:
             menu = QMenu(self)
             self.contextMenuRequested.emit(menu)
             menu.exec(event.globalPos())
+
+    def _reserve(self, count: int, spectra: np.ndarray):
+        num_bands = spectra.shape[1]
+        dtype = spectra.dtype if self._count == 0 else \
+            np.result_type(self._spectra.dtype, spectra.dtype)
+
+        capacity, allocated_bands = self._spectra.shape
+        if count <= capacity and num_bands == allocated_bands and dtype == self._spectra.dtype:
+            return
+
+        if self._count and num_bands != allocated_bands:
+            raise ValueError(f"Expected spectra with {allocated_bands} bands, got {num_bands}.")
+
+        # Grow geometrically, so that adding spectra one by one stays amortized O(1).
+        capacity = max(count, 2 * capacity, 16)
+        buffer = np.empty((capacity, num_bands), dtype=dtype)
+        if self._count:
+            buffer[:self._count] = self._spectra[:self._count]
+
+        self._spectra = buffer
+
+    def _redraw(self):
+        if not self._count:
+            return
+
+        num_bands = self._spectra.shape[1]
+        x = self._wavelengths if self._wavelengths is not None else np.arange(num_bands)
+        lo, hi, stride = self._get_visible_bands(x)
+
+        for color in range(min(self._count, NUM_COLORS)):
+            spectra = self._spectra[color:self._count:NUM_COLORS]
+            bands, values = self._decimate(spectra, lo, hi, stride)
+
+            # Separate consecutive spectra with NaN, so each color is drawn as a single path.
+            xs = np.full((len(spectra), bands.shape[1] + 1), np.nan)
+            xs[:, :-1] = x[bands]
+            ys = np.full((len(spectra), bands.shape[1] + 1), np.nan)
+            ys[:, :-1] = values
+
+            curve = self._curves.get(color)
+            if curve is None:
+                curve = self.plot(pen=pg.mkPen(get_color(color)))
+                curve.setVisible(not self._density_mode)
+                self._curves[color] = curve
+
+            curve.setData(
+                x=xs.ravel(),
+                y=ys.ravel(),
+                connect="finite",
+                antialias=self._count <= self.ANTIALIAS_LIMIT,
+            )
+
+    def _get_visible_bands(self, x: np.ndarray) -> tuple[int, int, int]:
+        (x_min, x_max), _ = self.getViewBox().viewRange()
+        lo = max(int(np.searchsorted(x, x_min, side="right")) - 1, 0)
+        hi = min(int(np.searchsorted(x, x_max, side="left")) + 1, len(x))
+        if hi - lo < 2:
+            lo, hi = 0, len(x)
+
+        # Keep roughly two points per horizontal pixel.
+        width = int(self.getViewBox().width())
+        stride = max(1, math.ceil(2 * (hi - lo) / width)) if width > 0 else 1
+        return lo, hi, stride
+
+    @staticmethod
+    def _decimate(spectra: np.ndarray, lo: int, hi: int, stride: int) -> tuple[np.ndarray, np.ndarray]:
+        if stride <= 2:
+            bands = np.broadcast_to(np.arange(lo, hi), (len(spectra), hi - lo))
+            return bands, spectra[:, lo:hi]
+
+        # Each bucket of bands is reduced to its minimum and maximum, in the order in which
+        # they occur, so that narrow peaks survive. The last bucket is padded with its last
+        # band, which changes neither extreme.
+        num_buckets = math.ceil((hi - lo) / stride)
+        buckets = np.minimum(lo + np.arange(num_buckets * stride), hi - 1).reshape(num_buckets, stride)
+        values = spectra[:, buckets]
+
+        lows, highs = values.argmin(axis=2), values.argmax(axis=2)
+        extremes = np.stack([np.minimum(lows, highs), np.maximum(lows, highs)], axis=2)
+
+        bands = buckets[np.arange(num_buckets)[:, np.newaxis], extremes]
+        values = np.take_along_axis(values, extremes, axis=2)
+
+        # Always end at the last visible band, so the curves span the whole view.
+        bands = np.concatenate([bands.reshape(len(spectra), -1), np.full((len(spectra), 1), hi - 1)], axis=1)
+        values = np.concatenate([values.reshape(len(spectra), -1), spectra[:, hi - 1:hi]], axis=1)
+        return bands, values
@@ -8,6 +8,9 @@ class MemoryStatus(StatusViewItem):
     """
     A status widget that displays memory usage in a human-readable format.
 
+    Shows the size of the hypercube on disk, along with how much of it is held in memory
+    once it has been loaded into memory, or the progress of loading it.
+
     Parameters
     ----------
     parent : QWidget or None, optional
@@ -17,7 +20,7 @@ class MemoryStatus(StatusViewItem):
     def __init__(self, parent: QWidget | None = None):
         super().__init__(ThemePixmap("database.svg"), parent)
 
-    def set(self, num_bytes: int):
+    def set(self, num_bytes: int, resident_bytes: int = 0):
         """
         Update the label text to reflect the given memory size.
 
@@ -25,8 +28,31 @@ class MemoryStatus(StatusViewItem):
         ----------
         num_bytes : int
             The number of bytes to display; must be non-negative.
+        resident_bytes : int, optional
+            The number of those bytes held in memory, if any.
         """
-        self._label.setText(self._stringify(num_bytes))
+        text = self._stringify(num_bytes)
+        if resident_bytes:
+            self._label.setText(f"{self._stringify(resident_bytes)} / {text}")
+        else:
+            self._label.setText(text)
+
+        self.setToolTip(f"In memory: {self._stringify(resident_bytes)}\nOn disk: {text}")
+
+    def set_progress(self, percent: int):
+        """
+        Show the progress of loading the hypercube into memory.
+
+        Parameters
+        ----------
+        percent : int
+            The progress in percent (0–100).
+        """
+        self._label.setText(f"Loading {percent}%")
+
+    def clear(self):
+        super().clear()
+        self.setToolTip("")
 
     @staticmethod
     def _stringify(num_bytes: int) -> str:
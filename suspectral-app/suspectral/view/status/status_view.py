@@ -42,7 +42,7 @@ class StatusView(QStatusBar):
         self.addPermanentWidget(self._wavelength_status)
 
         self._memory_status = MemoryStatus(self)
-        self._memory_status.setFixedWidth(120)
+        self._memory_status.setFixedWidth(170)
         self.addPermanentWidget(self._memory_status)
 
     @Slot()
@@ -60,9 +60,7 @@ class StatusView(QStatusBar):
             hypercube.num_rows,
             hypercube.num_bands,
         )
-        self._memory_status.set(
-            hypercube.num_bytes,
-        )
+        self.update_memory(hypercube)
 
         if hypercube.wavelengths is None:
             self._wavelength_status.clear()
@@ -73,6 +71,33 @@ class StatusView(QStatusBar):
             hypercube.wavelengths_unit,
         )
 
+    @Slot()
+    def update_memory(self, hypercube: Hypercube):
+        """
+        Update the displayed size of the hypercube on disk and in memory.
+
+        Parameters
+        ----------
+        hypercube : Hypercube
+            The hypercube whose size to display.
+        """
+        self._memory_status.set(
+            hypercube.num_bytes,
+            hypercube.resident_bytes,
+        )
+
+    @Slot()
+    def update_loading(self, percent: int):
+        """
+        Update the displayed progress of loading the hypercube into memory.
+
+        Parameters
+        ----------
+        percent : int
+            The progress in percent (0–100).
+        """
+        self._memory_status.set_progress(percent)
+
     @Slot()
     def update_cursor(self, position: QPoint):
         """
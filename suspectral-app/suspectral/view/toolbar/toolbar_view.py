@@ -75,6 +75,21 @@ class ToolbarView(QToolBar):
             icon="select.svg",
             tool=self._tools.area,
         )
+        self._add_tool(
+            name="Select Polygon",
+            icon="polygon.svg",
+            tool=self._tools.polygon,
+        )
+        self._add_tool(
+            name="Select Similar",
+            icon="wand.svg",
+            tool=self._tools.wand,
+        )
+        self._add_tool(
+            name="Cross-Section",
+            icon="line.svg",
+            tool=self._tools.cross_section,
+        )
         self._add_tool(
             name="Zoom",
             icon="zoom.svg",
@@ -0,0 +1,97 @@
+from PySide6.QtCore import Qt, QPoint, Signal, Slot
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import (
+    QLabel,
+    QListWidget,
+    QMenu,
+    QStackedWidget,
+    QWidget,
+)
+
+from suspectral.theme_icon import ThemeIcon
+
+
+class WorkspaceView(QStackedWidget):
+    """
+    A widget to list the open hypercubes, from which one is selected as the current one.
+
+    Shows a placeholder message when no hypercubes are open, and switches to a list of
+    their names otherwise. Clicking a hypercube selects it, and its context menu closes it.
+
+    Signals
+    -------
+    hypercubeSelected(int)
+        Emitted with the position of the hypercube the user selected in the list.
+    hypercubeClosed(int)
+        Emitted with the position of the hypercube the user chose to close.
+
+    Parameters
+    ----------
+    parent : QWidget or None, optional
+        The parent widget, by default None.
+    """
+
+    hypercubeSelected = Signal(int)
+    hypercubeClosed = Signal(int)
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+
+        self.setAutoFillBackground(True)
+        self.setBackgroundRole(QPalette.ColorRole.Base)
+
+        self._placeholder = QLabel("Load hypercubes to switch between them.")
+        self._placeholder.setForegroundRole(QPalette.ColorRole.PlaceholderText)
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self._placeholder.setContentsMargins(4, 4, 4, 4)
+
+        self._list = QListWidget(self)
+        self._list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._list.customContextMenuRequested.connect(self._handle_context_menu)
+        self._list.itemClicked.connect(lambda item: self.hypercubeSelected.emit(self._list.row(item)))
+
+        self.addWidget(self._placeholder)
+        self.addWidget(self._list)
+
+    def set(self, names: list[str], current: int | None):
+        """
+        List the open hypercubes, switching to the list view if there are any.
+
+        Parameters
+        ----------
+        names : list of str
+            The names of the open hypercubes, in order.
+        current : int or None
+            The position of the current hypercube, if any.
+        """
+        if not names:
+            self.clear()
+            return
+
+        self._list.blockSignals(True)
+        self._list.clear()
+        self._list.addItems(names)
+        if current is not None:
+            self._list.setCurrentRow(current)
+        self._list.blockSignals(False)
+
+        self.setCurrentWidget(self._list)
+
+    def clear(self):
+        """Clear the list and show the placeholder message."""
+        self._list.clear()
+        self.setCurrentWidget(self._placeholder)
+
+    @Slot()
+    def _handle_context_menu(self, position: QPoint):
+        item = self._list.itemAt(position)
+        if item is None:
+            return
+
+        row = self._list.row(item)
+
+        menu = QMenu(self)
+        close_action = menu.addAction("Close")
+        close_action.setIcon(ThemeIcon("trash.svg"))
+        close_action.triggered.connect(lambda: self.hypercubeClosed.emit(row))
+        menu.exec(self._list.viewport().mapToGlobal(position))
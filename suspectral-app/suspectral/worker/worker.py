@@ -0,0 +1,168 @@
+from collections.abc import Iterator
+from contextlib import closing
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QObject, QThread, Signal, Slot
+
+from suspectral.model import block_iterator
+from suspectral.model.hypercube import Hypercube
+
+
+class Worker(QObject):
+    """
+    Base class for background jobs which stream through a hypercube in blocks of rows.
+
+    Subclasses implement `_work`, typically by iterating over `_read_blocks`, which reads
+    the hypercube in blocks bounded by `BLOCK_BYTES` so that the memory footprint stays
+    constant regardless of the size of the hypercube, reading `PREFETCH` blocks ahead
+    in the background (see `iter_blocks`). The job is meant to be moved to a
+    `QThread` (see `start_worker`) and can be interrupted from other threads via `stop`.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube or None
+        The hyperspectral data cube to process, or None for jobs which produce one.
+    """
+
+    progress = Signal(int)
+    finished = Signal()
+
+    BLOCK_BYTES = block_iterator.BLOCK_BYTES
+    """Upper bound on the size of a single block of rows read from the hypercube."""
+
+    PREFETCH = 1
+    """Number of blocks read ahead in the background while a block is processed."""
+
+    def __init__(self, hypercube: Hypercube | None):
+        super().__init__()
+        self._running = True
+        self._hypercube = hypercube
+
+    @property
+    def running(self) -> bool:
+        """Whether the job has not been requested to stop."""
+        return self._running
+
+    @Slot()
+    def run(self):
+        """Starts the job."""
+        try:
+            self._work()
+        finally:
+            # Hand the worker back to the main thread, so that it is only deleted
+            # after the signals it has already queued for the main thread.
+            self.moveToThread(QCoreApplication.instance().thread())
+
+            # Notify other threads of completion.
+            self.finished.emit()
+
+    @Slot()
+    def stop(self):
+        """Requests that the job ends early."""
+        self._running = False
+
+    def _work(self):
+        raise NotImplementedError
+
+    def _read_blocks(self,
+                     rows: tuple[int, int] | None = None,
+                     cols: tuple[int, int] | None = None,
+                     bands=None,
+                     progress: tuple[int, int] = (0, 100)) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Read a region of the hypercube in blocks of consecutive rows.
+
+        Progress is reported after each block, and iteration ends early if
+        the job has been requested to stop.
+
+        Parameters
+        ----------
+        rows : tuple of int, optional
+            Start and end row indices (inclusive, exclusive). Defaults to all rows.
+        cols : tuple of int, optional
+            Start and end column indices (inclusive, exclusive). Defaults to all columns.
+        bands : list or tuple or range, optional
+            Bands to read. If None, reads all bands.
+        progress : tuple of int, optional
+            The range of progress reported while reading, for jobs which make several passes.
+
+        Yields
+        ------
+        tuple of (int, np.ndarray)
+            The index of the first row in the block, and the block of shape
+            (rows, columns, bands).
+        """
+        row_start, row_end = rows if rows is not None else (0, self._hypercube.num_rows)
+        blocks = block_iterator.iter_blocks(self._hypercube, target_bytes=self.BLOCK_BYTES, bands=bands,
+                                            prefetch=self.PREFETCH, rows=(row_start, row_end), cols=cols)
+
+        # Closing the blocks stops reading ahead as soon as the job stops.
+        with closing(blocks):
+            for block, data in blocks:
+                # Stop prematurely if requested.
+                if not self._running: return
+
+                yield block.start, data
+                fraction = (block.stop - row_start) / (row_end - row_start)
+                self.progress.emit(int(progress[0] + fraction * (progress[1] - progress[0])))
+
+
+def start_worker(worker: Worker, parent: QObject) -> QThread:
+    """
+    Run the worker on a new thread, disposing of both once the job is finished.
+
+    Parameters
+    ----------
+    worker : Worker
+        The job to run.
+    parent : QObject
+        The parent object of the thread.
+
+    Returns
+    -------
+    QThread
+        The thread on which the job is running.
+    """
+    thread = QThread(parent)
+    thread.started.connect(worker.run)
+
+    # The worker is owned by Python, so it would be deleted as soon as the caller drops it,
+    # even while running. The thread keeps it alive instead, until both are disposed of.
+    thread.worker = worker
+    thread.finished.connect(thread.deleteLater)
+
+    worker.moveToThread(thread)
+    worker.finished.connect(thread.quit)
+
+    # The worker is only deleted once the thread has ended, since `run` may still be
+    # unwinding on the thread right after `finished` has been emitted.
+    thread.finished.connect(worker.deleteLater)
+
+    thread.start()
+    return thread
+
+
+def join_workers(parent: QObject):
+    """
+    Wait for all the threads started by `start_worker` for the parent to end.
+
+    Threads must not outlive their parent, so objects which may be destroyed while their
+    jobs are still running must call this first, after requesting the jobs to stop.
+
+    Parameters
+    ----------
+    parent : QObject
+        The parent object passed to `start_worker`.
+    """
+    for thread in parent.findChildren(QThread):
+        # The thread is normally quit once the job is finished, but that request is queued
+        # for the event loop of the parent, which is blocked while waiting here.
+        thread.quit()
+        thread.wait()
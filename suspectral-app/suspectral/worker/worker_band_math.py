@@ -0,0 +1,45 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.band_expression import BandExpression
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class BandMathWorker(Worker):
+    """
+    Evaluates a band expression for every pixel of a hypercube.
+
+    Only the bands referenced by the expression are read from the hypercube, so that blocks
+    span many more rows than when reading whole spectra.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    computed(np.ndarray)
+        Emitted with the map of values of shape (rows, columns) as float32.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    expression : BandExpression
+        The expression to evaluate.
+    """
+
+    computed = Signal(np.ndarray)
+
+    def __init__(self, hypercube: Hypercube, expression: BandExpression):
+        super().__init__(hypercube)
+        self._expression = expression
+
+    def _work(self):
+        values = np.empty((self._hypercube.num_rows, self._hypercube.num_cols), dtype=np.float32)
+        for start, block in self._read_blocks(bands=self._expression.bands):
+            values[start:start + block.shape[0]] = self._expression.evaluate(block)
+
+        if self._running:
+            self.computed.emit(values)
@@ -0,0 +1,62 @@
+import numpy as np
+from PySide6.QtCore import Signal
+from spectral import get_rgb
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class BandsWorker(Worker):
+    """
+    Renders an RGB image from three bands of a hypercube in the background.
+
+    Each distinct band is read only once, in blocks of rows, so that the job can be stopped
+    early when other bands are requested before it is done. The bands are then stretched
+    into colors in the same way as `Hypercube.get_rgb` does, so the resulting images match.
+    The image is kept in the memory cache of the hypercube under `cache_key(bands)`, so that
+    it need not be rendered again when the same bands of the hypercube are shown later.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    computed(np.ndarray)
+        Emitted with the RGB image of shape (rows, columns, 3), with values between 0 and 1.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to render.
+    bands : tuple of int
+        The bands displayed in the red, green and blue channels. Repeating a single band
+        renders a grayscale image.
+    """
+
+    computed = Signal(np.ndarray)
+
+    def __init__(self, hypercube: Hypercube, bands: tuple[int, int, int]):
+        super().__init__(hypercube)
+        self._bands = bands
+
+    @staticmethod
+    def cache_key(bands: tuple[int, int, int]) -> tuple:
+        """The key under which the image of the given bands is cached by the hypercube."""
+        return "bands", tuple(int(band) for band in bands)
+
+    def _work(self):
+        unique, channels = np.unique(self._bands, return_inverse=True)
+
+        data = None
+        for start, block in self._read_blocks(bands=unique.tolist()):
+            if data is None:
+                shape = (self._hypercube.num_rows, self._hypercube.num_cols, len(unique))
+                data = np.empty(shape, dtype=block.dtype)
+
+            data[start:start + block.shape[0]] = block
+
+        if self._running and data is not None:
+            image = get_rgb(data, channels.tolist())
+            self._hypercube.set_cached(self.cache_key(self._bands), image)
+            self.computed.emit(image)
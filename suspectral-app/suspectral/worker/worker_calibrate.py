@@ -0,0 +1,122 @@
+import tempfile
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class CalibrateWorker(Worker):
+    """
+    Calibrates a whole hypercube into reflectance in the background, using white and black references.
+
+    The references amount to a per-band affine transform of the raw data, which is applied
+    block by block, clipped in place, and streamed into a float32 cube memory-mapped from
+    a temporary file, so that the calibrated cube does not have to fit into memory. The file
+    is removed once the cube is no longer referenced. The hypercube itself is left as it is;
+    the cube is handed over to be read from (see `Hypercube.calibrate`) on the thread which
+    receives it.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    calibrated(np.ndarray)
+        Emitted with the calibrated cube, of shape (rows, columns, bands).
+    failed(Exception)
+        Emitted with the error which prevented the hypercube from being calibrated.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to calibrate.
+    white_ref : np.ndarray, optional
+        The spectrum of a white reference, which becomes a reflectance of 1.
+    black_ref : np.ndarray, optional
+        The spectrum of a black reference, which becomes a reflectance of 0.
+    """
+
+    calibrated = Signal(np.ndarray)
+    failed = Signal(object)
+
+    DTYPE = np.dtype(np.float32)
+    """The data type of the calibrated cube."""
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 white_ref: np.ndarray | None = None,
+                 black_ref: np.ndarray | None = None):
+        super().__init__(hypercube)
+        self._white_ref = white_ref
+        self._black_ref = black_ref
+        self._scale, self._offset, self._upper = self.transform(white_ref, black_ref)
+
+    @property
+    def hypercube(self) -> Hypercube:
+        """The hypercube being calibrated."""
+        return self._hypercube
+
+    @property
+    def white_ref(self) -> np.ndarray | None:
+        """The spectrum of the white reference."""
+        return self._white_ref
+
+    @property
+    def black_ref(self) -> np.ndarray | None:
+        """The spectrum of the black reference."""
+        return self._black_ref
+
+    @classmethod
+    def transform(cls,
+                  white_ref: np.ndarray | None,
+                  black_ref: np.ndarray | None) -> tuple[np.ndarray, np.ndarray, float | None]:
+        """
+        Express the calibration by the references as a per-band affine transform.
+
+        The black reference is subtracted, and the result divided by the white reference
+        less the black one, so that reflectance is `raw * scale + offset`. Reflectance is
+        then clipped to be non-negative and, if there is a white reference, at most 1.
+
+        Parameters
+        ----------
+        white_ref : np.ndarray, optional
+            The spectrum of a white reference.
+        black_ref : np.ndarray, optional
+            The spectrum of a black reference.
+
+        Returns
+        -------
+        tuple of (np.ndarray, np.ndarray, float or None)
+            The scale and offset per band, and the upper bound of reflectance, if any.
+        """
+        black = np.zeros(1) if black_ref is None else np.asarray(black_ref, dtype=np.float64)
+        white = np.ones(1) if white_ref is None else np.asarray(white_ref, dtype=np.float64) - black
+
+        with np.errstate(divide="ignore"):
+            scale = np.where(white != 0, 1.0 / white, 0.0)
+
+        offset = -black * scale
+        upper = 1.0 if white_ref is not None else None
+        return scale.astype(cls.DTYPE), offset.astype(cls.DTYPE), upper
+
+    def _work(self):
+        try:
+            # The mapping outlives the file, which has no name, so its storage is freed once the cube is dropped.
+            with tempfile.TemporaryFile(prefix="suspectral-calibrated-") as file:
+                data = np.memmap(file, dtype=self.DTYPE, mode="w+", shape=self._hypercube.shape)
+
+            for start, block in self._read_blocks():
+                out = data[start:start + block.shape[0]]
+                np.multiply(block, self._scale, out=out, casting="unsafe")
+                out += self._offset
+                np.clip(out, 0.0, self._upper, out=out)
+        except (MemoryError, OSError, ValueError) as e:
+            if self._running:
+                self.failed.emit(e)
+            return
+
+        if self._running:
+            self.calibrated.emit(data)
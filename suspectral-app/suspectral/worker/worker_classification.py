@@ -0,0 +1,119 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class ClassificationWorker(Worker):
+    """
+    Assigns every pixel of a hypercube to the reference spectrum it matches best.
+
+    References are normalized once up front, so that scoring a block of pixels against
+    every reference takes a single matrix product. As in `SimilarityWorker`, blocks are
+    read sequentially on the worker's own thread and scored on a pool of threads.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    classified(np.ndarray, np.ndarray)
+        Emitted with the map of labels of shape (rows, columns), holding the index of the
+        best-matching reference or -1 for pixels which cannot be classified, along with
+        the map of the scores of the best matches.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    references : np.ndarray
+        The reference spectra of shape (references, bands), sampled at the selected bands.
+    bands : np.ndarray, optional
+        Boolean array marking the bands of the hypercube the references are sampled at.
+        Defaults to all bands.
+    metric : str, optional
+        Either `ANGLE` to match by the smallest spectral angle in radians, or `CORRELATION`
+        to match by the largest Pearson correlation, by default `ANGLE`.
+    num_threads : int, optional
+        The number of threads used for scoring. Defaults to the number of CPUs.
+    """
+
+    classified = Signal(np.ndarray, np.ndarray)
+
+    ANGLE = "angle"
+    CORRELATION = "correlation"
+
+    METRICS = {
+        ANGLE: "Spectral Angle",
+        CORRELATION: "Correlation",
+    }
+    """Supported metrics and their display names."""
+
+    BLOCK_BYTES = 8 * 1024 ** 2
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 references: np.ndarray,
+                 bands: np.ndarray | None = None,
+                 metric: str = ANGLE,
+                 num_threads: int | None = None):
+        super().__init__(hypercube)
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown classification metric: {metric}.")
+
+        self._bands = None if bands is None or bands.all() else np.flatnonzero(bands).tolist()
+        self._metric = metric
+        self._references = self._normalize(np.asarray(references, dtype=np.float32))[0].T.copy()
+        self._num_threads = num_threads or os.cpu_count() or 1
+
+    def _work(self):
+        shape = (self._hypercube.num_rows, self._hypercube.num_cols)
+        labels = np.empty(shape, dtype=np.int32)
+        scores = np.empty(shape, dtype=np.float32)
+
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            pending = deque()
+            for start, block in self._read_blocks(bands=self._bands):
+                end = start + block.shape[0]
+                pending.append(pool.submit(self._classify, block, labels[start:end], scores[start:end]))
+
+                # Wait for the oldest blocks before reading further, to bound memory use.
+                while len(pending) >= 2 * self._num_threads:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+
+        if self._running:
+            self.classified.emit(labels, scores)
+
+    def _normalize(self, spectra: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        spectra = spectra.astype(np.float32)
+        if self._metric == self.CORRELATION:
+            spectra -= spectra.mean(axis=-1, keepdims=True)
+
+        norms = np.sqrt(np.einsum("ij,ij->i", spectra, spectra))
+        valid = np.isfinite(norms) & (norms > 0)
+        spectra[valid] /= norms[valid, None]
+        return spectra, valid
+
+    def _classify(self, block: np.ndarray, labels: np.ndarray, scores: np.ndarray):
+        pixels, valid = self._normalize(block.reshape(-1, block.shape[-1]))
+
+        similarities = pixels @ self._references
+        best = similarities.argmax(axis=1)
+        best_similarities = np.take_along_axis(similarities, best[:, None], axis=1)[:, 0]
+
+        if self._metric == self.ANGLE:
+            best_scores = np.arccos(np.clip(best_similarities, -1.0, 1.0))
+        else:
+            best_scores = best_similarities
+
+        labels[...] = np.where(valid, best, -1).reshape(labels.shape)
+        scores[...] = np.where(valid, best_scores, np.nan).reshape(scores.shape)
@@ -0,0 +1,181 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.reservoir import Reservoir
+from suspectral.worker.worker import Worker
+
+
+class ClusteringWorker(Worker):
+    """
+    Groups the pixels of a hypercube into clusters of similar spectra with mini-batch k-means.
+
+    The first streaming pass draws a uniform sample of the spectra with a `Reservoir`, so
+    that the memory needed is bounded by the size of the sample rather than that of the
+    hypercube. The centroids are then fitted to the sample with mini-batch k-means, seeded
+    with k-means++. The second streaming pass assigns every pixel to its nearest centroid,
+    with blocks read sequentially on the worker's own thread and assigned on a pool of threads.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    clustered(np.ndarray, np.ndarray)
+        Emitted with the map of labels of shape (rows, columns), holding the index of the
+        nearest centroid or -1 for pixels with non-finite values, along with the centroids
+        of shape (clusters, bands).
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    num_clusters : int, optional
+        The number of clusters.
+    sample_size : int, optional
+        The maximum number of spectra sampled to fit the centroids.
+    batch_size : int, optional
+        The number of sampled spectra used in each iteration of mini-batch k-means.
+    num_iterations : int, optional
+        The maximum number of iterations of mini-batch k-means.
+    num_threads : int, optional
+        The number of threads used for assignment. Defaults to the number of CPUs.
+    seed : int, optional
+        The seed of the random number generator, for reproducible results.
+    """
+
+    clustered = Signal(np.ndarray, np.ndarray)
+
+    NUM_CLUSTERS = 6
+    SAMPLE_SIZE = 20_000
+    BATCH_SIZE = 1024
+    NUM_ITERATIONS = 200
+
+    TOLERANCE = 1e-4
+    """Shift of the centroids, relative to the spread of the sample, below which iteration ends early."""
+
+    BLOCK_BYTES = 8 * 1024 ** 2
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 num_clusters: int = NUM_CLUSTERS,
+                 sample_size: int = SAMPLE_SIZE,
+                 batch_size: int = BATCH_SIZE,
+                 num_iterations: int = NUM_ITERATIONS,
+                 num_threads: int | None = None,
+                 seed: int | None = None):
+        super().__init__(hypercube)
+        if num_clusters < 1:
+            raise ValueError(f"Number of clusters must be positive, got {num_clusters}.")
+
+        self._num_clusters = num_clusters
+        self._sample_size = max(sample_size, num_clusters)
+        self._batch_size = batch_size
+        self._num_iterations = num_iterations
+        self._num_threads = num_threads or os.cpu_count() or 1
+        self._rng = np.random.default_rng(seed)
+
+    def _work(self):
+        sample = self._sample()
+        if not self._running: return
+
+        centroids = self._fit(sample)
+        if not self._running: return
+
+        self.progress.emit(50)
+        labels = np.empty((self._hypercube.num_rows, self._hypercube.num_cols), dtype=np.int32)
+
+        centroids32 = centroids.astype(np.float32)
+        norms = np.einsum("ij,ij->i", centroids32, centroids32)
+
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            pending = deque()
+            for start, block in self._read_blocks(progress=(50, 100)):
+                out = labels[start:start + block.shape[0]]
+                pending.append(pool.submit(self._assign, block, centroids32, norms, out))
+
+                # Wait for the oldest blocks before reading further, to bound memory use.
+                while len(pending) >= 2 * self._num_threads:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+
+        if self._running:
+            self.clustered.emit(labels, centroids32)
+
+    def _sample(self) -> np.ndarray:
+        reservoir = Reservoir(self._sample_size, self._hypercube.num_bands, self._rng)
+        for start, block in self._read_blocks(progress=(0, 40)):
+            reservoir.update(block, start)
+
+        return reservoir.samples
+
+    def _fit(self, sample: np.ndarray) -> np.ndarray:
+        num_clusters = min(self._num_clusters, len(sample))
+        if num_clusters == 0:
+            return np.zeros((0, self._hypercube.num_bands))
+
+        centroids = self._seed(sample, num_clusters)
+        counts = np.zeros(num_clusters)
+        tolerance = self.TOLERANCE * max(float(sample.var(axis=0).sum()), np.finfo(float).tiny)
+
+        for _ in range(self._num_iterations):
+            if not self._running: break
+
+            batch = sample[self._rng.integers(0, len(sample), size=min(self._batch_size, len(sample)))]
+            nearest = self._nearest(batch, centroids)
+
+            # Move each centroid towards the mean of its members, with a learning
+            # rate that decays with the number of spectra it has absorbed so far.
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, nearest, batch)
+            members = np.bincount(nearest, minlength=num_clusters)
+            counts += members
+
+            updated = members > 0
+            previous = centroids.copy()
+            centroids[updated] += (sums[updated] - members[updated, None] * centroids[updated]) \
+                / counts[updated, None]
+
+            if np.sum((centroids - previous) ** 2) / num_clusters < tolerance:
+                break
+
+        return centroids
+
+    def _seed(self, sample: np.ndarray, num_clusters: int) -> np.ndarray:
+        # k-means++: each further centroid is drawn with probability proportional to
+        # the squared distance of the spectrum from the nearest centroid so far.
+        centroids = [sample[self._rng.integers(len(sample))]]
+        distances = np.sum((sample - centroids[0]) ** 2, axis=1)
+
+        for _ in range(1, num_clusters):
+            total = distances.sum()
+            index = self._rng.choice(len(sample), p=distances / total) if total > 0 \
+                else self._rng.integers(len(sample))
+
+            centroids.append(sample[index])
+            distances = np.minimum(distances, np.sum((sample - sample[index]) ** 2, axis=1))
+
+        return np.array(centroids, dtype=np.float64)
+
+    @staticmethod
+    def _nearest(pixels: np.ndarray, centroids: np.ndarray, norms: np.ndarray | None = None) -> np.ndarray:
+        # The squared norms of the pixels do not affect which centroid is nearest.
+        if norms is None:
+            norms = np.einsum("ij,ij->i", centroids, centroids)
+
+        return np.argmin(norms - 2 * pixels @ centroids.T, axis=1)
+
+    def _assign(self, block: np.ndarray, centroids: np.ndarray, norms: np.ndarray, out: np.ndarray):
+        pixels = block.reshape(-1, block.shape[-1]).astype(np.float32)
+        valid = np.isfinite(pixels).all(axis=1)
+        pixels[~valid] = 0
+
+        labels = self._nearest(pixels, centroids, norms) if len(centroids) else np.zeros(len(pixels))
+        out[...] = np.where(valid, labels, -1).reshape(out.shape)
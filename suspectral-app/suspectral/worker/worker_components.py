@@ -0,0 +1,121 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.covariance import Covariance
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class ComponentsWorker(Worker):
+    """
+    Projects every pixel of a hypercube onto its leading principal or noise-adjusted components.
+
+    The first streaming pass accumulates the covariance of the spectra, along with that of the
+    differences between horizontally adjacent pixels as an estimate of the noise. The second
+    pass projects the spectra onto the leading components. The statistics of the first pass
+    can be passed back in to skip it, for example to switch between the transforms.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    computed(np.ndarray, np.ndarray)
+        Emitted with the projections of shape (rows, columns, components) as float32, with NaN
+        for pixels with non-finite values, along with the variance (for `PCA`) or relative
+        signal-to-noise ratio (for `MNF`) of each component.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    transform : str, optional
+        Either `PCA` for principal components or `MNF` for the minimum noise fraction
+        transform, by default `PCA`.
+    num_components : int, optional
+        The number of leading components to project onto.
+    covariance : Covariance, optional
+        The covariance of the spectra from a previous run.
+    noise : Covariance, optional
+        The covariance of the noise from a previous run.
+    """
+
+    computed = Signal(np.ndarray, np.ndarray)
+
+    PCA = "pca"
+    MNF = "mnf"
+
+    TRANSFORMS = {
+        PCA: "Principal Components (PCA)",
+        MNF: "Minimum Noise Fraction (MNF)",
+    }
+    """Supported transforms and their display names."""
+
+    NUM_COMPONENTS = 6
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 transform: str = PCA,
+                 num_components: int = NUM_COMPONENTS,
+                 covariance: Covariance | None = None,
+                 noise: Covariance | None = None):
+        super().__init__(hypercube)
+        if transform not in self.TRANSFORMS:
+            raise ValueError(f"Unknown transform: {transform}.")
+
+        self._transform = transform
+        self._num_components = min(num_components, hypercube.num_bands)
+        self._covariance = covariance
+        self._noise = noise
+
+    @property
+    def transform(self) -> str:
+        """The transform whose components the pixels are projected onto."""
+        return self._transform
+
+    @property
+    def covariance(self) -> Covariance | None:
+        """The covariance of the spectra, once accumulated."""
+        return self._covariance
+
+    @property
+    def noise(self) -> Covariance | None:
+        """The covariance of the noise, once accumulated."""
+        return self._noise
+
+    def _work(self):
+        projection = (0, 100)
+        if self._covariance is None or self._noise is None:
+            if not self._accumulate(): return
+            projection = (50, 100)
+
+        if self._transform == self.PCA:
+            weights, components = self._covariance.principal_components(self._num_components)
+        else:
+            weights, components = self._covariance.noise_adjusted_components(self._noise, self._num_components)
+
+        mean = self._covariance.mean
+        shape = (self._hypercube.num_rows, self._hypercube.num_cols, components.shape[1])
+        scores = np.empty(shape, dtype=np.float32)
+
+        for start, block in self._read_blocks(progress=projection):
+            scores[start:start + block.shape[0]] = (block - mean) @ components
+
+        if self._running:
+            self.computed.emit(scores, weights)
+
+    def _accumulate(self) -> bool:
+        covariance = Covariance(self._hypercube.num_bands)
+        noise = Covariance(self._hypercube.num_bands)
+
+        for _, block in self._read_blocks(progress=(0, 50)):
+            covariance.update(block)
+            noise.update(np.diff(block.astype(np.float64), axis=1))
+
+        if not self._running:
+            return False
+
+        self._covariance = covariance
+        self._noise = noise
+        return True
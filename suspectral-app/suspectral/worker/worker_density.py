@@ -0,0 +1,125 @@
+import time
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.worker.worker import Worker
+
+
+class DensityWorker(Worker):
+    """
+    Accumulates the spectral density of a region of a hypercube.
+
+    The density is a 2D histogram which counts, for every band, how many pixels fall
+    into each of the value bins. It is accumulated incrementally as blocks of rows are
+    streamed from the hypercube, so that its memory footprint depends only on the number
+    of bands and bins rather than on the size of the region. The value range of the bins
+    is estimated up front from a few evenly spaced rows; outliers fall into the edge bins.
+    The region is either a rectangle or the bounding box of a mask, in which case only the
+    masked pixels are counted.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    accumulated(np.ndarray, float, float)
+        Emitted with a snapshot of the counts of shape (bands, bins), as well as
+        the lower and upper bounds of the value range covered by the bins.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    rows : tuple of int, optional
+        Start and end row indices (inclusive, exclusive). Defaults to all rows.
+    cols : tuple of int, optional
+        Start and end column indices (inclusive, exclusive). Defaults to all columns.
+    mask : SelectionMask, optional
+        Restricts the region to the selected pixels. Takes precedence over `rows` and `cols`.
+    num_bins : int, optional
+        The number of value bins per band.
+    """
+
+    accumulated = Signal(np.ndarray, float, float)
+
+    NUM_BINS = 256
+    NUM_PROBE_ROWS = 32
+    EMIT_INTERVAL = 0.2
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 rows: tuple[int, int] | None = None,
+                 cols: tuple[int, int] | None = None,
+                 mask: SelectionMask | None = None,
+                 num_bins: int = NUM_BINS):
+        super().__init__(hypercube)
+        if mask is not None:
+            rows, cols = mask.rows, mask.cols
+
+        self._rows = rows if rows is not None else (0, hypercube.num_rows)
+        self._cols = cols if cols is not None else (0, hypercube.num_cols)
+        self._mask = mask
+        self._num_bins = num_bins
+
+    def _work(self):
+        lo, hi = self._estimate_range()
+        num_bands = self._hypercube.num_bands
+
+        counts = np.zeros(num_bands * self._num_bins, dtype=np.int64)
+        emitted = 0.0
+
+        for start, block in self._read_blocks(self._rows, self._cols):
+            if self._mask is not None:
+                offset = start - self._mask.top
+                block = block[self._mask.mask[offset:offset + block.shape[0]]]
+
+            counts += self._histogram(block, lo, hi)
+
+            # Throttle the snapshots, since each one is rendered on the GUI thread.
+            if time.monotonic() - emitted >= self.EMIT_INTERVAL:
+                self.accumulated.emit(counts.reshape(num_bands, -1).copy(), lo, hi)
+                emitted = time.monotonic()
+
+        if self._running:
+            self.accumulated.emit(counts.reshape(num_bands, -1).copy(), lo, hi)
+
+    def _estimate_range(self) -> tuple[float, float]:
+        row_start, row_end = self._rows
+        num_probes = min(self.NUM_PROBE_ROWS, row_end - row_start)
+        probes = np.linspace(row_start, row_end - 1, num_probes).astype(int)
+
+        values = np.concatenate([
+            self._hypercube.read_subregion((row, row + 1), self._cols).ravel()
+            for row in np.unique(probes)
+        ]).astype(np.float64)
+
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return 0.0, 1.0
+
+        lo, hi = np.percentile(values, [0.1, 99.9])
+        if hi <= lo:
+            hi = lo + 1.0
+
+        return float(lo), float(hi)
+
+    def _histogram(self, block: np.ndarray, lo: float, hi: float) -> np.ndarray:
+        num_bands = block.shape[-1]
+        num_cells = num_bands * self._num_bins
+        values = block.reshape(-1, num_bands)
+
+        bins = (values - np.float32(lo)) * np.float32(self._num_bins / (hi - lo))
+        invalid = ~np.isfinite(bins)
+        bins[invalid] = 0
+        np.clip(bins, 0, self._num_bins - 1, out=bins)
+
+        # Flatten (band, bin) pairs into cell indices; invalid values go to a spare cell.
+        indices = bins.astype(np.intp)
+        indices += np.arange(num_bands, dtype=np.intp) * self._num_bins
+        indices[invalid] = num_cells
+
+        return np.bincount(indices.ravel(), minlength=num_cells + 1)[:num_cells]
@@ -0,0 +1,117 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.covariance import Covariance
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.reservoir import Reservoir
+from suspectral.worker.worker import Worker
+
+
+class EndmemberWorker(Worker):
+    """
+    Extracts the purest spectra of a hypercube with vertex component analysis (VCA).
+
+    The hypercube is read once, drawing a uniform sample of its spectra with a `Reservoir`.
+    The statistics of the sample determine the subspace which the spectra are projected
+    onto: with a high signal-to-noise ratio, the leading eigenvectors of their correlation
+    matrix and a projective projection, otherwise the leading principal components. VCA
+    then repeatedly projects the sample onto a random direction orthogonal to the endmembers
+    found so far, and takes the most extreme spectrum as the next endmember. Since the
+    sample is bounded in size, extraction takes about as long as reading the hypercube.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    extracted(np.ndarray, np.ndarray)
+        Emitted with the spectra of the endmembers of shape (endmembers, bands), along with
+        the (row, column) positions of the pixels they were taken from of shape (endmembers, 2).
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    num_endmembers : int, optional
+        The number of endmembers to extract.
+    sample_size : int, optional
+        The maximum number of spectra sampled to extract the endmembers from.
+    seed : int, optional
+        The seed of the random number generator, for reproducible results.
+    """
+
+    extracted = Signal(np.ndarray, np.ndarray)
+
+    NUM_ENDMEMBERS = 4
+    SAMPLE_SIZE = 100_000
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 num_endmembers: int = NUM_ENDMEMBERS,
+                 sample_size: int = SAMPLE_SIZE,
+                 seed: int | None = None):
+        super().__init__(hypercube)
+        if not 1 <= num_endmembers <= hypercube.num_bands:
+            raise ValueError(f"Number of endmembers must be between 1 and the number of bands, got {num_endmembers}.")
+
+        self._num_endmembers = num_endmembers
+        self._sample_size = max(sample_size, num_endmembers)
+        self._rng = np.random.default_rng(seed)
+
+    def _work(self):
+        reservoir = Reservoir(self._sample_size, self._hypercube.num_bands, self._rng)
+        for start, block in self._read_blocks():
+            reservoir.update(block, start)
+
+        if not self._running or len(reservoir.samples) < self._num_endmembers:
+            return
+
+        indices = self._extract(reservoir.samples)
+        self.extracted.emit(reservoir.samples[indices], reservoir.positions[indices])
+
+    def _extract(self, samples: np.ndarray) -> np.ndarray:
+        count = self._num_endmembers
+        projected = self._project(samples)
+
+        # The first endmember is sought along the direction of the constant last coordinate.
+        basis = np.zeros((count, count))
+        basis[-1, 0] = 1
+
+        indices = np.empty(count, dtype=np.int64)
+        for index in range(count):
+            direction = self._rng.normal(size=count)
+            direction -= basis @ (np.linalg.pinv(basis) @ direction)
+            direction /= max(np.linalg.norm(direction), np.finfo(float).tiny)
+
+            indices[index] = np.argmax(np.abs(projected @ direction))
+            basis[:, index] = projected[indices[index]]
+
+        return indices
+
+    def _project(self, samples: np.ndarray) -> np.ndarray:
+        count, num_bands = self._num_endmembers, samples.shape[1]
+
+        statistics = Covariance(num_bands)
+        statistics.update(samples)
+        mean = statistics.mean
+        correlation = statistics.covariance + np.outer(mean, mean)
+
+        # Estimate the signal-to-noise ratio from the power kept in the signal subspace.
+        values, vectors = np.linalg.eigh(correlation)
+        vectors = vectors[:, ::-1][:, :count]
+        total, signal = np.trace(correlation), values[::-1][:count].sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            snr = 10 * np.log10((signal - count / num_bands * total) / (total - signal))
+
+        if snr > 15 + 10 * np.log10(count):
+            # Project onto the simplex by scaling every spectrum along its own direction.
+            projected = samples @ vectors
+            scale = projected @ projected.mean(axis=0)
+            scale[np.abs(scale) < np.finfo(float).tiny] = np.finfo(float).tiny
+            return projected / scale[:, None]
+
+        _, components = statistics.principal_components(count - 1)
+        projected = (samples - mean) @ components
+        norms = np.linalg.norm(projected, axis=1)
+        return np.hstack([projected, np.full((len(samples), 1), norms.max(initial=0))])
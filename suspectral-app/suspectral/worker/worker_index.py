@@ -0,0 +1,89 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.covariance import Covariance
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.spectral_index import SpectralIndex
+from suspectral.worker.worker import Worker
+
+
+class IndexWorker(Worker):
+    """
+    Provides a `SpectralIndex` of a hypercube, reusing the one stored beside it if it is up to date.
+
+    Otherwise, the index is built in two streaming passes over the hypercube: the first
+    accumulates the covariance of the unit-length spectra, the second projects them onto
+    their leading principal components. The new index is then stored beside the hypercube,
+    if its directory is writable.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    indexed(SpectralIndex)
+        Emitted with the index, ready to be queried.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to index.
+    num_components : int, optional
+        The number of principal components to keep.
+    """
+
+    indexed = Signal(SpectralIndex)
+
+    NUM_COMPONENTS = 8
+
+    def __init__(self, hypercube: Hypercube, num_components: int = NUM_COMPONENTS):
+        super().__init__(hypercube)
+        self._num_components = num_components
+
+    def _work(self):
+        path = SpectralIndex.path_of(self._hypercube)
+        key = SpectralIndex.key_of(self._hypercube)
+
+        index = SpectralIndex.load(path, key)
+        if index is None:
+            index = self._build()
+            if index is None: return
+
+            try:
+                index.save(path, key)
+            except OSError:
+                pass
+
+        # Build the tree up front, so that the first query is fast too.
+        _ = index.tree
+        self.indexed.emit(index)
+
+    def _build(self) -> SpectralIndex | None:
+        hypercube = self._hypercube
+        num_components = min(self._num_components, hypercube.num_bands)
+
+        covariance = Covariance(hypercube.num_bands)
+        for _, block in self._read_blocks(progress=(0, 50)):
+            unit, valid = SpectralIndex.normalize(block)
+            covariance.update(unit[valid])
+
+        mean = covariance.mean
+        _, components = covariance.principal_components(num_components)
+
+        pixels, scores = [], []
+        for start, block in self._read_blocks(progress=(50, 100)):
+            unit, valid = SpectralIndex.normalize(block)
+            pixels.append(start * hypercube.num_cols + np.flatnonzero(valid))
+            scores.append(((unit[valid] - mean) @ components).astype(np.float32))
+
+        if not self.running:
+            return None
+
+        return SpectralIndex(
+            (hypercube.num_rows, hypercube.num_cols),
+            mean,
+            components,
+            np.concatenate(pixels),
+            np.concatenate(scores),
+        )
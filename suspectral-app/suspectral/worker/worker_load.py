@@ -0,0 +1,53 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class LoadWorker(Worker):
+    """
+    Loads a whole hypercube into one contiguous array in memory in the background.
+
+    The array is allocated up front and filled in blocks of rows, so that progress is
+    reported as the data is read and the job can be stopped early. The hypercube itself
+    is left as it is; the array is handed over to be made resident (see `Hypercube.make_resident`)
+    on the thread which receives it.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    loaded(np.ndarray)
+        Emitted with the data of the hypercube, of shape (rows, columns, bands).
+    failed(Exception)
+        Emitted with the error which prevented the hypercube from being loaded.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to load.
+    """
+
+    loaded = Signal(np.ndarray)
+    failed = Signal(object)
+
+    @property
+    def hypercube(self) -> Hypercube:
+        """The hypercube being loaded."""
+        return self._hypercube
+
+    def _work(self):
+        try:
+            data = np.empty(self._hypercube.shape, dtype=self._hypercube.dtype)
+            for start, block in self._read_blocks():
+                data[start:start + block.shape[0]] = block
+        except (MemoryError, OSError) as e:
+            if self._running:
+                self.failed.emit(e)
+            return
+
+        if self._running:
+            self.loaded.emit(data)
@@ -0,0 +1,57 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.spectral_index import SpectralIndex
+from suspectral.worker.worker import Worker
+
+
+class NeighboursWorker(Worker):
+    """
+    Queries a spectral index for the pixels nearest to the spectrum of a given pixel.
+
+    The query reads and re-ranks every candidate returned by the index, which takes
+    long enough on large hypercubes that it is kept off the GUI thread.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    found(np.ndarray, np.ndarray)
+        Emitted with the flat indices of the nearest pixels and their spectral angles
+        in radians, both sorted by increasing angle.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The indexed hypercube.
+    index : SpectralIndex
+        The spectral index of the hypercube.
+    row : int
+        The row of the pixel whose spectrum to match.
+    col : int
+        The column of the pixel whose spectrum to match.
+    k : int
+        The number of pixels to find.
+    """
+
+    found = Signal(np.ndarray, np.ndarray)
+
+    def __init__(self, hypercube: Hypercube, index: SpectralIndex, row: int, col: int, k: int):
+        super().__init__(hypercube)
+        self._index = index
+        self._row = row
+        self._col = col
+        self._k = k
+
+    def _work(self):
+        target = self._hypercube.read_pixel(self._row, self._col)
+        pixels, angles = self._index.nearest(self._hypercube, target, self._k)
+
+        # Stop prematurely if requested.
+        if not self._running: return
+
+        self.progress.emit(100)
+        self.found.emit(pixels, angles)
@@ -0,0 +1,55 @@
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class OpenWorker(Worker):
+    """
+    Opens a hypercube in the background, parsing its header and opening its data file.
+
+    Both may take a while for headers with thousands of wavelengths or for files on network
+    shares. Opening is a single blocking call which cannot be interrupted, so stopping the
+    job only discards its result: neither `opened` nor `failed` is emitted afterwards.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    opened(Hypercube)
+        Emitted with the hypercube once it has been opened.
+    failed(Exception)
+        Emitted with the error which prevented the hypercube from being opened.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    path : str
+        Path to the hypercube file, such as the ENVI header file.
+    """
+
+    opened = Signal(Hypercube)
+    failed = Signal(object)
+
+    def __init__(self, path: str):
+        super().__init__(None)
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        """Path to the hypercube file, such as the ENVI header file."""
+        return self._path
+
+    def _work(self):
+        self.progress.emit(0)
+        try:
+            hypercube = Hypercube(self._path)
+        except Exception as e:
+            if self._running:
+                self.failed.emit(e)
+            return
+
+        if self._running:
+            self.progress.emit(100)
+            self.opened.emit(hypercube)
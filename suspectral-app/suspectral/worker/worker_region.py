@@ -0,0 +1,54 @@
+from PySide6.QtCore import Signal, Slot
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.region_growing import RegionGrowing
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.worker.worker import Worker
+
+
+class RegionWorker(Worker):
+    """
+    Grows a region of spectrally similar pixels from a seed pixel with `RegionGrowing`.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    grown(SelectionMask)
+        Emitted with the mask of the region once it has been fully grown.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to select from.
+    row : int
+        The row of the seed pixel.
+    col : int
+        The column of the seed pixel.
+    tolerance : float, optional
+        The maximum spectral angle between a pixel and the seed, in degrees.
+    """
+
+    grown = Signal(SelectionMask)
+
+    def __init__(self, hypercube: Hypercube, row: int, col: int, tolerance: float = RegionGrowing.TOLERANCE):
+        super().__init__(hypercube)
+        self._row = row
+        self._col = col
+        self._region_growing = RegionGrowing(hypercube, tolerance)
+
+    @Slot()
+    def stop(self):
+        super().stop()
+        self._region_growing.stop()
+
+    def _work(self):
+        mask = self._region_growing.grow(self._row, self._col)
+
+        # Stop prematurely if requested.
+        if not self._running: return
+
+        self.progress.emit(100)
+        self.grown.emit(mask)
@@ -0,0 +1,223 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.linalg
+from PySide6.QtCore import Signal
+
+from suspectral.model.covariance import Covariance
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class RXWorker(Worker):
+    """
+    Scores how anomalous every pixel of a hypercube is with the Reed–Xiaoli (RX) detector.
+
+    The score of a pixel is its Mahalanobis distance from the background. The global detector
+    takes the whole image as the background: its mean and covariance are accumulated in one
+    streaming pass, the covariance is inverted once, and pixels are scored in a second pass on
+    a pool of threads. The local detector takes a square window around each pixel as its
+    background, excluding an inner guard window which may contain the anomaly itself. To keep
+    this tractable, spectra are first reduced to their leading principal components, and the
+    window statistics are read off integral images of the first and second moments, so that
+    their cost does not depend on the size of the window. The image is scored in strips of
+    rows as it is read, keeping only the rows within reach of the windows in memory.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    computed(np.ndarray)
+        Emitted with the map of scores of shape (rows, columns) as float32, where higher scores
+        mean more anomalous pixels. Pixels which cannot be scored are NaN.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    window : int, optional
+        The odd size of the background window of the local detector, or 0 for the global
+        detector, by default 0.
+    guard : int, optional
+        The odd size of the guard window of the local detector, or 0 for none, by default 0.
+    num_components : int, optional
+        The number of principal components the local detector works with.
+    num_threads : int, optional
+        The number of threads used for scoring. Defaults to the number of CPUs.
+    """
+
+    computed = Signal(np.ndarray)
+
+    NUM_COMPONENTS = 4
+
+    BLOCK_BYTES = 8 * 1024 ** 2
+
+    RIDGE = 1e-6
+    """Regularization of the covariance, relative to its average variance."""
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 window: int = 0,
+                 guard: int = 0,
+                 num_components: int = NUM_COMPONENTS,
+                 num_threads: int | None = None):
+        super().__init__(hypercube)
+        if window != 0 and (window < 3 or window % 2 == 0):
+            raise ValueError(f"Window size must be 0 or an odd number of at least 3, got {window}.")
+        if guard != 0 and (guard % 2 == 0 or guard >= window):
+            raise ValueError(f"Guard size must be 0 or an odd number smaller than the window, got {guard}.")
+
+        self._window = window
+        self._guard = guard
+        self._num_components = min(num_components, hypercube.num_bands)
+        self._num_threads = num_threads or os.cpu_count() or 1
+
+    def _work(self):
+        covariance = Covariance(self._hypercube.num_bands)
+        for _, block in self._read_blocks(progress=(0, 50)):
+            covariance.update(block)
+
+        if not self._running: return
+
+        if self._window == 0:
+            scores = self._score_global(covariance)
+        else:
+            scores = self._score_local(covariance)
+
+        if self._running:
+            self.computed.emit(scores)
+
+    def _score_global(self, covariance: Covariance) -> np.ndarray:
+        mean = covariance.mean
+        inverse = scipy.linalg.pinvh(self._regularize(covariance.covariance))
+
+        scores = np.empty((self._hypercube.num_rows, self._hypercube.num_cols), dtype=np.float32)
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            pending = deque()
+            for start, block in self._read_blocks(progress=(50, 100)):
+                out = scores[start:start + block.shape[0]]
+                pending.append(pool.submit(self._mahalanobis, block, mean, inverse, out))
+
+                # Wait for the oldest blocks before reading further, to bound memory use.
+                while len(pending) >= 2 * self._num_threads:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+
+        return scores
+
+    @staticmethod
+    def _mahalanobis(block: np.ndarray, mean: np.ndarray, inverse: np.ndarray, out: np.ndarray):
+        centered = block.reshape(-1, block.shape[-1]) - mean
+        distances = np.einsum("ij,ij->i", centered @ inverse, centered)
+        out[...] = distances.reshape(out.shape)
+
+    def _score_local(self, covariance: Covariance) -> np.ndarray:
+        num_rows, num_cols = self._hypercube.num_rows, self._hypercube.num_cols
+        mean = covariance.mean
+        _, components = covariance.principal_components(self._num_components)
+        radius = self._window // 2
+
+        # Rows are scored in strips, each of which only needs the rows within one window radius
+        # of it, so that neither the projected image nor its integrals are ever held in full.
+        size = components.shape[1]
+        strip_rows = max(1, self.BLOCK_BYTES // max(1, num_cols * size * size * 8))
+
+        scores = np.empty((num_rows, num_cols), dtype=np.float32)
+        buffer = np.empty((0, num_cols, size), dtype=np.float32)
+        buffer_start = 0
+        strip_start = 0
+
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            pending = deque()
+            for _, block in self._read_blocks(progress=(50, 100)):
+                reduced = ((block - mean) @ components).astype(np.float32)
+                buffer = np.concatenate((buffer, reduced))
+
+                # Score every strip whose surrounding rows have all been read.
+                while strip_start < num_rows:
+                    strip_end = min(strip_start + strip_rows, num_rows)
+                    halo_start = max(strip_start - radius, 0)
+                    halo_end = min(strip_end + radius, num_rows)
+                    if buffer_start + len(buffer) < halo_end:
+                        break
+
+                    halo = buffer[halo_start - buffer_start:halo_end - buffer_start]
+                    out = scores[strip_start:strip_end]
+                    pending.append(pool.submit(self._score_strip, halo, strip_start - halo_start, out))
+                    strip_start = strip_end
+
+                # Drop the rows that no remaining strip needs.
+                drop = max(strip_start - radius, 0) - buffer_start
+                buffer = buffer[drop:]
+                buffer_start += drop
+
+                # Wait for the oldest strips before reading further, to bound memory use.
+                while len(pending) >= 2 * self._num_threads:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+
+        return scores
+
+    def _score_strip(self, halo: np.ndarray, offset: int, out: np.ndarray):
+        valid = np.isfinite(halo).all(axis=-1)
+        reduced = np.where(valid[..., None], halo, 0).astype(np.float64)
+
+        counts = self._integrate(valid.astype(np.float64))
+        sums = self._integrate(reduced)
+        products = self._integrate(reduced[..., :, None] * reduced[..., None, :])
+
+        rows = np.arange(offset, offset + out.shape[0])
+        cols = np.arange(reduced.shape[1])
+
+        def background(integral: np.ndarray) -> np.ndarray:
+            total = self._box_sum(integral, rows, cols, self._window // 2)
+            if self._guard:
+                total -= self._box_sum(integral, rows, cols, self._guard // 2)
+            return total
+
+        count = background(counts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = background(sums) / count[..., None]
+            scatter = background(products) / count[..., None, None]
+
+        local_covariance = self._regularize(scatter - mean[..., :, None] * mean[..., None, :])
+        centered = reduced[rows] - mean
+
+        # Windows with too few pixels have no meaningful covariance; score them as NaN.
+        enough = count > reduced.shape[-1]
+        local_covariance[~enough] = np.eye(reduced.shape[-1])
+        centered[~enough] = 0
+
+        solved = np.linalg.solve(local_covariance, centered[..., None])[..., 0]
+        scores = np.einsum("...i,...i->...", centered, solved)
+        out[...] = np.where(enough & valid[rows], scores, np.nan)
+
+    @staticmethod
+    def _integrate(values: np.ndarray) -> np.ndarray:
+        integral = np.zeros((values.shape[0] + 1, values.shape[1] + 1, *values.shape[2:]))
+        np.cumsum(values, axis=0, out=integral[1:, 1:])
+        np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+        return integral
+
+    @staticmethod
+    def _box_sum(integral: np.ndarray, rows: np.ndarray, cols: np.ndarray, radius: int) -> np.ndarray:
+        num_rows, num_cols = integral.shape[0] - 1, integral.shape[1] - 1
+        r0 = np.clip(rows - radius, 0, num_rows)[:, None]
+        r1 = np.clip(rows + radius + 1, 0, num_rows)[:, None]
+        c0 = np.clip(cols - radius, 0, num_cols)[None, :]
+        c1 = np.clip(cols + radius + 1, 0, num_cols)[None, :]
+        return integral[r1, c1] - integral[r0, c1] - integral[r1, c0] + integral[r0, c0]
+
+    def _regularize(self, covariance: np.ndarray) -> np.ndarray:
+        size = covariance.shape[-1]
+        scale = np.trace(covariance, axis1=-2, axis2=-1) / size
+        ridge = self.RIDGE * np.maximum(np.nan_to_num(scale), np.finfo(float).tiny)
+        return covariance + ridge[..., None, None] * np.eye(size)
@@ -0,0 +1,56 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.cross_section import CrossSection
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class SectionWorker(Worker):
+    """
+    Reads the spectra of the pixels along a cross-section, fetching the columns it needs.
+
+    The columns which the cross-section reads whole, but has not cached yet, are read one
+    by one into its cache, and then the spectra are gathered.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    loaded(np.ndarray)
+        Emitted with the spectra of the pixels of shape (pixels, bands), in order.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to read from.
+    section : CrossSection
+        The cross-section of the hypercube whose cache the columns are read into.
+    rows : np.ndarray
+        The rows of the pixels.
+    cols : np.ndarray
+        The columns of the pixels.
+    """
+
+    loaded = Signal(np.ndarray)
+
+    def __init__(self, hypercube: Hypercube, section: CrossSection, rows: np.ndarray, cols: np.ndarray):
+        super().__init__(hypercube)
+        self._section = section
+        self._rows = rows
+        self._cols = cols
+
+    def _work(self):
+        columns = self._section.missing_columns(self._rows, self._cols)
+        for index, col in enumerate(columns):
+            # Stop prematurely if requested.
+            if not self._running: return
+
+            self._section.fetch_column(col)
+            self.progress.emit(int(100 * (index + 1) / len(columns)))
+
+        spectra = self._section.read(self._rows, self._cols)
+        if self._running:
+            self.loaded.emit(spectra)
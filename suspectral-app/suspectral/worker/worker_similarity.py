@@ -0,0 +1,105 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.worker.worker import Worker
+
+
+class SimilarityWorker(Worker):
+    """
+    Computes how similar every pixel of a hypercube is to a target spectrum.
+
+    Blocks of rows are read sequentially on the worker's own thread and scored on a pool
+    of threads, which overlaps reading with computation. The number of blocks in flight
+    is bounded, so that memory use stays proportional to the number of threads rather
+    than to the size of the hypercube. Scores are written straight into the resulting
+    map; lower scores always mean more similar spectra.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    computed(np.ndarray)
+        Emitted with the map of scores of shape (rows, columns) once every pixel is scored.
+        Pixels which cannot be scored, such as those with all-zero spectra, are NaN.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    target : np.ndarray
+        The spectrum to compare every pixel against, of shape (bands,).
+    metric : str, optional
+        Either `ANGLE` for the spectral angle in radians, or `EUCLIDEAN` for the
+        Euclidean distance, by default `ANGLE`.
+    num_threads : int, optional
+        The number of threads used for scoring. Defaults to the number of CPUs.
+    """
+
+    computed = Signal(np.ndarray)
+
+    ANGLE = "angle"
+    EUCLIDEAN = "euclidean"
+
+    METRICS = {
+        ANGLE: "Spectral Angle",
+        EUCLIDEAN: "Euclidean Distance",
+    }
+    """Supported metrics and their display names."""
+
+    BLOCK_BYTES = 8 * 1024 ** 2
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 target: np.ndarray,
+                 metric: str = ANGLE,
+                 num_threads: int | None = None):
+        super().__init__(hypercube)
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown similarity metric: {metric}.")
+
+        self._target = np.asarray(target, dtype=np.float32).ravel()
+        self._metric = metric
+        self._num_threads = num_threads or os.cpu_count() or 1
+
+    def _work(self):
+        scores = np.empty((self._hypercube.num_rows, self._hypercube.num_cols), dtype=np.float32)
+
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            pending = deque()
+            for start, block in self._read_blocks():
+                out = scores[start:start + block.shape[0]]
+                pending.append(pool.submit(self._score, block, out))
+
+                # Wait for the oldest blocks before reading further, to bound memory use.
+                while len(pending) >= 2 * self._num_threads:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+
+        if self._running:
+            self.computed.emit(scores)
+
+    def _score(self, block: np.ndarray, out: np.ndarray):
+        pixels = block.reshape(-1, block.shape[-1]).astype(np.float32, copy=False)
+        target = self._target
+
+        dots = pixels @ target
+        norms = np.einsum("ij,ij->i", pixels, pixels)
+        target_norm = np.float32(target @ target)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self._metric == self.ANGLE:
+                cosines = dots / np.sqrt(norms * target_norm)
+                result = np.arccos(np.clip(cosines, -1.0, 1.0))
+            else:
+                result = np.sqrt(np.maximum(norms - 2 * dots + target_norm, 0.0))
+
+        out[...] = result.reshape(out.shape)
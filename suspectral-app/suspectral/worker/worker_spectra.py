@@ -0,0 +1,50 @@
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.worker.worker import Worker
+
+
+class SpectraWorker(Worker):
+    """
+    Reads the spectra of the pixels of a selection mask in the background.
+
+    The spectra are emitted block by block as they are read, so that they can be displayed
+    progressively instead of only once the whole selection has been read.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    loaded(np.ndarray)
+        Emitted with the spectra of shape (pixels, bands) of each block of selected pixels,
+        in row-major order.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to read from.
+    mask : SelectionMask
+        The selected pixels to read.
+    """
+
+    loaded = Signal(np.ndarray)
+
+    def __init__(self, hypercube: Hypercube, mask: SelectionMask):
+        super().__init__(hypercube)
+        self._mask = mask
+
+    def _work(self):
+        total = max(1, self._mask.count)
+        done = 0
+
+        for spectra in self._mask.iter_spectra(self._hypercube):
+            # Stop prematurely if requested.
+            if not self._running: return
+
+            done += len(spectra)
+            self.loaded.emit(spectra)
+            self.progress.emit(int(100 * done / total))
@@ -0,0 +1,80 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.unmixing import Unmixing
+from suspectral.worker.worker import Worker
+
+
+class UnmixingWorker(Worker):
+    """
+    Estimates the abundances of a few endmembers in every pixel of a hypercube.
+
+    As in `ClassificationWorker`, blocks are read sequentially on the worker's own thread
+    and unmixed on a pool of threads, with all of the work per block done by `Unmixing`.
+
+    Signals
+    -------
+    progress(int)
+        Emitted to report progress in percent (0–100).
+    computed(np.ndarray, np.ndarray)
+        Emitted with the abundances of shape (rows, columns, endmembers) and the
+        root-mean-square error of the reconstruction of shape (rows, columns), both as
+        float32, with NaN for pixels with non-finite values.
+    finished()
+        Emitted when the job has ended, whether normally or prematurely.
+
+    Parameters
+    ----------
+    hypercube : Hypercube
+        The hyperspectral data cube to process.
+    unmixing : Unmixing
+        The endmembers, sampled at the selected bands, and the constraint on the abundances.
+    bands : np.ndarray, optional
+        Boolean array marking the bands of the hypercube the endmembers are sampled at.
+        Defaults to all bands.
+    num_threads : int, optional
+        The number of threads used for unmixing. Defaults to the number of CPUs.
+    """
+
+    computed = Signal(np.ndarray, np.ndarray)
+
+    BLOCK_BYTES = 8 * 1024 ** 2
+
+    def __init__(self,
+                 hypercube: Hypercube,
+                 unmixing: Unmixing,
+                 bands: np.ndarray | None = None,
+                 num_threads: int | None = None):
+        super().__init__(hypercube)
+        self._unmixing = unmixing
+        self._bands = None if bands is None or bands.all() else np.flatnonzero(bands).tolist()
+        self._num_threads = num_threads or os.cpu_count() or 1
+
+    def _work(self):
+        shape = (self._hypercube.num_rows, self._hypercube.num_cols)
+        abundances = np.empty((*shape, self._unmixing.num_endmembers), dtype=np.float32)
+        errors = np.empty(shape, dtype=np.float32)
+
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            pending = deque()
+            for start, block in self._read_blocks(bands=self._bands):
+                end = start + block.shape[0]
+                pending.append(pool.submit(self._unmix, block, abundances[start:end], errors[start:end]))
+
+                # Wait for the oldest blocks before reading further, to bound memory use.
+                while len(pending) >= 2 * self._num_threads:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+
+        if self._running:
+            self.computed.emit(abundances, errors)
+
+    def _unmix(self, block: np.ndarray, abundances: np.ndarray, errors: np.ndarray):
+        abundances[...], errors[...] = self._unmixing.unmix(block)
@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPointF, QObject, Signal
+from PySide6.QtGui import QPolygonF
+
+from suspectral.controller.cross_section_controller import CrossSectionController
+from suspectral.model.hypercube import Hypercube
+from suspectral.tool.manager import ToolManager
+from suspectral.view.cross_section.cross_section_view import CrossSectionView
+from suspectral.worker.worker import join_workers
+
+
+class DummyModel(QObject):
+    opened = Signal(object)
+    closed = Signal()
+
+    hypercube = None
+
+
+@pytest.fixture
+def data():
+    return np.arange(30 * 20 * 3, dtype=np.float32).reshape(30, 20, 3)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock(spec=Hypercube)
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.dtype = data.dtype
+    mock.wavelengths = np.array([400.0, 500.0, 600.0])
+    mock.wavelengths_unit = "nm"
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    mock.read_col.side_effect = lambda col, bands=None: data[:, col:col + 1]
+    return mock
+
+
+@pytest.fixture
+def model(hypercube):
+    model = DummyModel()
+    model.hypercube = hypercube
+    return model
+
+
+@pytest.fixture
+def victim(qtbot, model, hypercube):
+    controller = CrossSectionController(
+        view=MagicMock(spec=CrossSectionView),
+        tools=MagicMock(spec=ToolManager),
+        model=model,
+    )
+    model.opened.emit(hypercube)
+    yield controller
+    join_workers(controller)
+
+
+def test_opened_sets_wavelengths(victim):
+    victim._view.set_wavelengths.assert_called_once()
+    victim._view.clear.assert_called()
+
+
+def test_section_changes_are_coalesced(victim, qtbot, data):
+    victim._handle_section_changed(QPolygonF([QPointF(0, 0), QPointF(5, 0)]))
+    victim._handle_section_changed(QPolygonF([QPointF(2, 3), QPointF(5, 3)]))
+
+    qtbot.waitUntil(lambda: victim._view.display.called)
+    qtbot.wait(10)
+
+    victim._view.display.assert_called_once()
+    np.testing.assert_array_equal(victim._view.display.call_args.args[0], data[3, 2:6])
+
+
+def test_missing_columns_are_read_in_background(victim, qtbot, data):
+    victim._handle_section_changed(QPolygonF([QPointF(2, 3), QPointF(2, 12)]))
+
+    qtbot.waitUntil(lambda: victim._view.display.call_count == 2, timeout=1000)
+
+    partial, complete = [call.args[0] for call in victim._view.display.call_args_list]
+    assert np.isnan(partial).all()
+    np.testing.assert_array_equal(complete, data[3:13, 2])
+
+
+def test_section_ended_clears_view(victim):
+    victim._handle_section_changed(QPolygonF([QPointF(0, 0), QPointF(5, 0)]))
+    victim._view.clear.reset_mock()
+
+    victim._handle_section_ended()
+
+    victim._view.clear.assert_called_once()
+    assert not victim._timer.isActive()
+
+
+def test_closed_clears_view(victim, model):
+    model.closed.emit()
+
+    assert victim._section is None
+    victim._view.clear.assert_called()
@@ -7,6 +7,7 @@ from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QMenu
 
 from suspectral.controller.image_controller import ImageController
+from suspectral.model.selection_mask import SelectionMask
 from suspectral.tool.manager import ToolManager
 
 
@@ -115,9 +116,18 @@ def test_handle_selection_sampled_adds_reference_points(victim, mock_image_optio
     victim._handle_selection_sampled(xs, ys)
 
     expected_points = [QPoint(x, y) for y in ys for x in xs]
-    calls = [call.args[0] for call in mock_image_options_view.add_reference_points.call_args_list]
+    mock_image_options_view.extend_reference_points.assert_called_once_with(expected_points)
 
-    assert calls == expected_points
+
+def test_handle_selection_masked_caps_reference_points(victim, mock_image_options_view):
+    mask = np.ones((100, 50), dtype=bool)
+
+    victim._handle_selection_masked(SelectionMask(mask))
+
+    points = mock_image_options_view.extend_reference_points.call_args.args[0]
+    assert len(points) == victim.REFERENCE_LIMIT
+    assert points[0] == QPoint(0, 0)
+    assert points[-1] == QPoint(49, 99)
 
 
 def test_handle_pixel_clicked_adds_reference_point(victim, mock_image_options_view):
@@ -136,3 +146,25 @@ def test_menu_context(qtbot, victim):
     victim._handle_context_menu(menu)
     labels = [action.text() for action in menu.actions() if not action.isSeparator()]
     assert labels == ["Copy Image", "Save Image As..."]
+
+
+def test_points_highlighted(victim, mock_image_display_view):
+    scene = mock_image_display_view.scene.return_value
+
+    victim._handle_points_highlighted(np.array([1, 2]), np.array([3, 4]))
+    highlight = scene.addItem.call_args.args[0]
+    assert highlight.count == 2
+
+    victim._handle_tool_changed()
+    scene.removeItem.assert_called_once_with(highlight)
+
+
+def test_points_highlighted_replaces_previous(victim, mock_image_display_view):
+    scene = mock_image_display_view.scene.return_value
+
+    victim._handle_points_highlighted(np.array([1]), np.array([3]))
+    first = scene.addItem.call_args.args[0]
+    victim._handle_points_highlighted(np.array([2]), np.array([4]))
+
+    scene.removeItem.assert_called_once_with(first)
+    assert scene.addItem.call_count == 2
@@ -0,0 +1,231 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPoint
+
+from suspectral.controller.overlay_controller import OverlayController
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.tool.manager import ToolManager
+from suspectral.view.image.image_view import ImageView
+from suspectral.view.overlay.overlay_view import OverlayView
+from suspectral.worker.worker import join_workers
+from suspectral.worker.worker_similarity import SimilarityWorker
+
+
+@pytest.fixture
+def victim(qtbot):
+    return OverlayController(
+        view=MagicMock(spec=OverlayView),
+        image_view=MagicMock(spec=ImageView),
+        tools=MagicMock(spec=ToolManager),
+        model=MagicMock(spec=HypercubeContainer),
+    )
+
+
+def get_overlay_alpha(victim):
+    pixmap = victim._image_view.set_overlay.call_args.args[0]
+    image = pixmap.toImage()
+    return np.array([
+        [image.pixelColor(x, y).alpha() for x in range(image.width())]
+        for y in range(image.height())
+    ])
+
+
+def test_show_scores_highlights_low_scores(victim):
+    scores = np.arange(100, dtype=np.float32).reshape(10, 10)
+    victim.show_scores(scores)
+
+    lo, hi, threshold = victim._view.set_range.call_args.args
+    assert (lo, hi) == (0.0, 99.0)
+    assert threshold == pytest.approx(0.99)
+
+    alpha = get_overlay_alpha(victim)
+    assert alpha[0, 0] == OverlayController.COLOR.alpha()
+    assert np.count_nonzero(alpha) == 1
+
+
+def test_show_scores_highlights_high_scores(victim):
+    scores = np.arange(100, dtype=np.float32).reshape(10, 10)
+    victim.show_scores(scores, higher_matches=True)
+
+    alpha = get_overlay_alpha(victim)
+    assert alpha[9, 9] > 0
+    assert np.count_nonzero(alpha) == 1
+
+
+def test_threshold_change_rerenders(victim):
+    scores = np.arange(100, dtype=np.float32).reshape(10, 10)
+    victim.show_scores(scores)
+
+    victim._handle_threshold_changed(49.5)
+
+    assert np.count_nonzero(get_overlay_alpha(victim)) == 50
+
+
+def test_nan_scores_never_match(victim):
+    scores = np.full((4, 4), np.nan, dtype=np.float32)
+    scores[0, 0] = 1.0
+    victim.show_scores(scores)
+
+    victim._handle_threshold_changed(10.0)
+
+    assert np.count_nonzero(get_overlay_alpha(victim)) == 1
+
+
+def test_threshold_change_without_scores_is_ignored(victim):
+    victim._handle_threshold_changed(1.0)
+    victim._image_view.set_overlay.assert_not_called()
+
+
+def test_similarity_request_starts_worker(victim, mocker):
+    worker = mocker.patch("suspectral.controller.overlay_controller.SimilarityWorker")
+    worker.METRICS = SimilarityWorker.METRICS
+    start = mocker.patch("suspectral.controller.overlay_controller.start_worker")
+
+    victim._handle_similarity_requested(QPoint(3, 7), SimilarityWorker.ANGLE)
+
+    victim._model.hypercube.read_pixel.assert_called_once_with(7, 3)
+    victim._view.start.assert_called_once_with("Spectral Angle to (3, 7)")
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_clear_stops_worker(victim, mocker):
+    worker = MagicMock()
+    mocker.patch("suspectral.controller.overlay_controller.start_worker")
+
+    victim.compute("Overlay", worker)
+    victim.clear()
+
+    worker.stop.assert_called_once()
+    victim._image_view.clear_overlay.assert_called()
+    victim._view.clear.assert_called()
+
+
+def test_hypercube_closed_clears_overlay(victim):
+    victim.show_scores(np.zeros((2, 2), dtype=np.float32))
+    victim._handle_hypercube_changed()
+
+    assert victim._scores is None
+    victim._image_view.clear_overlay.assert_called()
+
+
+def test_show_scores_with_threshold(victim):
+    scores = np.arange(100, dtype=np.float32).reshape(10, 10)
+    victim.show_scores(scores, threshold=9.0)
+
+    _, _, threshold = victim._view.set_range.call_args.args
+    assert threshold == 9.0
+    assert np.count_nonzero(get_overlay_alpha(victim)) == 10
+
+
+def test_neighbours_request_starts_index_worker(victim, mocker):
+    worker = mocker.patch("suspectral.controller.overlay_controller.IndexWorker")
+    start = mocker.patch("suspectral.controller.overlay_controller.start_worker")
+
+    victim._handle_neighbours_requested(QPoint(3, 7))
+
+    worker.assert_called_once_with(victim._model.hypercube)
+    start.assert_called_once_with(worker.return_value, victim)
+    victim._view.start.assert_called_once_with("Indexing Spectra...")
+
+
+def test_neighbours_request_queries_index(victim, qtbot):
+    index = MagicMock()
+    index.shape = (4, 5)
+    index.num_pixels = 20
+    index.nearest.return_value = (np.array([7, 3]), np.array([0.0, 0.25], dtype=np.float32))
+    victim._index = index
+
+    victim._handle_neighbours_requested(QPoint(2, 1))
+    qtbot.waitUntil(lambda: victim._worker is None, timeout=1000)
+    join_workers(victim)
+
+    target = victim._model.hypercube.read_pixel.return_value
+    victim._model.hypercube.read_pixel.assert_called_once_with(1, 2)
+    index.nearest.assert_called_once_with(victim._model.hypercube, target, 20)
+    victim._view.start.assert_called_once_with("Nearest 20 Pixels to (2, 1)")
+
+    assert victim._scores[1, 2] == 0.0
+    assert victim._scores[0, 3] == 0.25
+    assert np.count_nonzero(np.isfinite(victim._scores)) == 2
+    assert np.count_nonzero(get_overlay_alpha(victim)) == 2
+
+
+def test_hypercube_changed_drops_index(victim):
+    victim._index = MagicMock()
+    victim._model.hypercube.get_cached.return_value = None
+    victim._handle_hypercube_changed()
+    assert victim._index is None
+
+
+def test_hypercube_changed_restores_cached_index(victim):
+    index = MagicMock()
+    victim._model.hypercube.get_cached.return_value = index
+
+    victim._handle_hypercube_changed()
+
+    victim._model.hypercube.get_cached.assert_called_once_with("spectral index")
+    assert victim._index is index
+
+
+def test_index_ready_is_cached(victim, mocker):
+    mocker.patch("suspectral.controller.overlay_controller.IndexWorker")
+    mocker.patch("suspectral.controller.overlay_controller.start_worker")
+    query = mocker.patch.object(victim, "_query_neighbours")
+    victim._handle_neighbours_requested(QPoint(3, 7))
+
+    index = MagicMock()
+    mocker.patch.object(victim, "sender", return_value=victim._index_worker)
+    victim._handle_index_ready(index)
+
+    victim._model.hypercube.set_cached.assert_called_once_with("spectral index", index)
+    query.assert_called_once_with(QPoint(3, 7))
+
+
+def test_anomalies_request_starts_worker(victim, mocker):
+    worker = mocker.patch("suspectral.controller.overlay_controller.RXWorker")
+    start = mocker.patch("suspectral.controller.overlay_controller.start_worker")
+
+    victim._handle_anomalies_requested(15, 5)
+
+    worker.assert_called_once_with(victim._model.hypercube, 15, 5)
+    victim._view.start.assert_called_once_with("Local RX Anomalies (15 × 15 px)")
+    start.assert_called_once_with(worker.return_value, victim)
+    assert victim._higher_matches
+    assert victim._heatmap
+
+
+def test_global_anomalies_request_name(victim, mocker):
+    mocker.patch("suspectral.controller.overlay_controller.RXWorker")
+    mocker.patch("suspectral.controller.overlay_controller.start_worker")
+
+    victim._handle_anomalies_requested(0, 0)
+
+    victim._view.start.assert_called_once_with("Global RX Anomalies")
+
+
+def test_show_scores_as_heatmap(victim):
+    scores = np.arange(100, dtype=np.float32).reshape(10, 10)
+    victim.show_scores(scores, higher_matches=True, threshold=89.5, heatmap=True)
+
+    pixmap = victim._image_view.set_overlay.call_args.args[0]
+    image = pixmap.toImage()
+    lowest, highest = image.pixelColor(0, 9), image.pixelColor(9, 9)
+
+    assert highest.alpha() > 0 and image.pixelColor(0, 0).alpha() == 0
+    assert (highest.red(), highest.green(), highest.blue()) != (lowest.red(), lowest.green(), lowest.blue())
+
+    # Moving the threshold keeps the colors of the pixels.
+    victim._handle_threshold_changed(0.0)
+    assert victim._image_view.set_overlay.call_args.args[0].toImage().pixelColor(9, 9) == highest
+
+
+def test_hypercube_changed_toggles_detection(victim):
+    victim._model.hypercube = None
+    victim._handle_hypercube_changed()
+    victim._view.set_detection_enabled.assert_called_with(False)
+
+    victim._model.hypercube = MagicMock()
+    victim._handle_hypercube_changed()
+    victim._view.set_detection_enabled.assert_called_with(True)
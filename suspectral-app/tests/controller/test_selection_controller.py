@@ -6,6 +6,7 @@ from PySide6.QtCore import QPoint
 
 from suspectral.controller.selection_controller import SelectionController
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
 from suspectral.tool.manager import ToolManager
 from suspectral.view.selection.selection_view import SelectionView
 
@@ -43,12 +44,21 @@ def test_handle_selection_sampled(victim, qtbot):
     xs = np.array([1, 2])
     ys = np.array([3, 4])
     victim._handle_selection_sampled(xs, ys)
-    victim._view.add_points.assert_called_once_with([
-        QPoint(1, 3),
-        QPoint(2, 3),
-        QPoint(1, 4),
-        QPoint(2, 4),
-    ])
+    victim._view.add_coordinates.assert_called_once()
+
+    grid_xs, grid_ys = victim._view.add_coordinates.call_args.args
+    np.testing.assert_array_equal(grid_xs, [1, 2, 1, 2])
+    np.testing.assert_array_equal(grid_ys, [3, 3, 4, 4])
+
+
+def test_handle_selection_masked(victim, qtbot):
+    mask = np.zeros((3, 3), dtype=bool)
+    mask[0, 2] = mask[2, 1] = True
+    victim._handle_selection_masked(SelectionMask(mask, top=10, left=20))
+
+    xs, ys = victim._view.add_coordinates.call_args.args
+    np.testing.assert_array_equal(xs, [22, 21])
+    np.testing.assert_array_equal(ys, [10, 12])
 
 
 def test_handle_pixel_clicked(victim, qtbot):
@@ -66,14 +76,18 @@ def test_boundary_value_for_selection_sampled(victim, qtbot):
     xs = np.array([0])
     ys = np.array([0])
     victim._handle_selection_sampled(xs, ys)
-    victim._view.add_points.assert_called_once_with([QPoint(0, 0)])
+    grid_xs, grid_ys = victim._view.add_coordinates.call_args.args
+    np.testing.assert_array_equal(grid_xs, [0])
+    np.testing.assert_array_equal(grid_ys, [0])
 
 
 def test_empty_selection_sampled(victim, qtbot):
     xs = np.array([])
     ys = np.array([])
     victim._handle_selection_sampled(xs, ys)
-    victim._view.add_points.assert_called_once_with([])
+    grid_xs, grid_ys = victim._view.add_coordinates.call_args.args
+    assert len(grid_xs) == 0
+    assert len(grid_ys) == 0
 
 
 @pytest.mark.parametrize("point", [
@@ -2,12 +2,14 @@ from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
-from PySide6.QtCore import QPoint
+from PySide6.QtCore import QPoint, QRect
 from PySide6.QtWidgets import QMenu
 
 import resources
 from suspectral.controller.spectral_controller import SpectralController
 from suspectral.exporter.exporter import Exporter
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.worker.worker import join_workers
 
 assert resources
 
@@ -119,22 +121,111 @@ def test_handle_selection_sampled(victim, mock_view, mock_model):
 
     victim._handle_selection_sampled(xs, ys)
 
-    expected_spectra = spectra.reshape(-1, 2)
-    calls = [((spectrum,),) for spectrum in expected_spectra]
+    mock_view.add_spectra.assert_called_once()
+    assert np.allclose(mock_view.add_spectra.call_args.args[0], spectra.reshape(-1, 2))
 
-    actual_calls = mock_view.add_spectrum.call_args_list
-    assert len(actual_calls) == len(expected_spectra)
 
-    for call, expected in zip(actual_calls, calls):
-        assert np.allclose(call.args[0], expected[0])
+def test_show_spectra_replaces_plotted_spectra(victim, mock_view):
+    spectra = np.array([[0.1, 0.2], [0.3, 0.4]])
+    victim._selection = QRect(0, 0, 2, 2)
+
+    victim.show_spectra(spectra)
+
+    mock_view.clear_spectra.assert_called_once()
+    mock_view.add_spectra.assert_called_once_with(spectra)
+    assert victim._selection is None
+
+
+def test_export_shown_spectra(victim, mock_view, mock_model):
+    mock_model.hypercube.name = "test_cube"
+    mock_view.spectra = np.array([[0.1, 0.2]])
+    victim.show_spectra(mock_view.spectra)
+
+    exporter = victim._exporters[0]
+    victim._export_spectra(exporter)
+
+    exporter.export.assert_called_once_with("test_cube", mock_view.spectra, mock_view.wavelengths)
+
+
+def test_selection_stopped_starts_density(victim, mock_view, mocker):
+    mock_view.density_mode = True
+    worker = mocker.patch("suspectral.controller.spectral_controller.DensityWorker")
+    start = mocker.patch("suspectral.controller.spectral_controller.start_worker")
+
+    victim._handle_selection_stopped(QRect(QPoint(1, 2), QPoint(5, 9)))
+
+    assert worker.call_args.kwargs == {"rows": (2, 9), "cols": (1, 5), "mask": None}
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_selection_masked_starts_density_over_mask(victim, mock_view, mocker):
+    mock_view.density_mode = True
+    worker = mocker.patch("suspectral.controller.spectral_controller.DensityWorker")
+    mocker.patch("suspectral.controller.spectral_controller.start_worker")
+
+    mask = SelectionMask(np.ones((3, 3), dtype=bool), top=4, left=2)
+    victim._handle_selection_stopped(mask)
+
+    assert worker.call_args.kwargs == {"rows": None, "cols": None, "mask": mask}
+
+
+def test_selection_masked_adds_spectra(victim, mock_view, mock_model, qtbot):
+    data = np.arange(5 * 4 * 2).reshape(5, 4, 2)
+    mock_model.hypercube.num_bands = 2
+    mock_model.hypercube.bytes_per_sample = 8
+    mock_model.hypercube.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+
+    mask = np.zeros((5, 4), dtype=bool)
+    mask[1, 2] = mask[3, 0] = True
+    victim._handle_selection_masked(SelectionMask(mask))
+
+    qtbot.waitUntil(lambda: victim._spectra_worker is None, timeout=1000)
+    join_workers(victim)
+
+    mock_view.add_spectra.assert_called_once()
+    np.testing.assert_array_equal(mock_view.add_spectra.call_args.args[0], [data[1, 2], data[3, 0]])
+
+
+def test_selection_changed_discards_pending_spectra(victim, mock_view, mock_model, mocker):
+    worker = mocker.patch("suspectral.controller.spectral_controller.SpectraWorker")
+    mocker.patch("suspectral.controller.spectral_controller.start_worker")
+
+    victim._handle_selection_masked(SelectionMask(np.ones((2, 2), dtype=bool)))
+    victim._handle_selection_changed()
+
+    worker.return_value.stop.assert_called_once()
+    assert victim._spectra_worker is None
+
+
+def test_selection_stopped_without_density(victim, mock_view, mocker):
+    mock_view.density_mode = False
+    start = mocker.patch("suspectral.controller.spectral_controller.start_worker")
+
+    victim._handle_selection_stopped(QRect(QPoint(1, 2), QPoint(5, 9)))
+    start.assert_not_called()
+
+
+def test_density_mode_stops_worker(victim, mock_view, mocker):
+    worker = mocker.patch("suspectral.controller.spectral_controller.DensityWorker")
+    mocker.patch("suspectral.controller.spectral_controller.start_worker")
+
+    victim._set_density_mode(True)
+    mock_view.set_density_mode.assert_called_with(True)
+    assert worker.call_args.kwargs == {"rows": None, "cols": None, "mask": None}
+
+    victim._set_density_mode(False)
+    mock_view.set_density_mode.assert_called_with(False)
+    worker.return_value.stop.assert_called_once()
 
 
 def test_menu_content(victim, qtbot):
+    victim._view.density_mode = False
     menu = QMenu()
     victim._handle_context_menu(menu)
 
     labels = [action.text() for action in menu.actions() if not action.isSeparator()]
-    assert labels == ["Copy Image", "Save Image As..."] + [
+    assert labels == ["Copy Image", "Save Image As...", "Density Plot"] + [
         f"Export to {exporter.label}" for exporter in victim._exporters
     ]
 
@@ -190,3 +281,23 @@ def test_save_plot_failure_shows_critical(victim, mocker):
     critical_mock = mocker.patch("suspectral.controller.spectral_controller.QMessageBox.critical")
     victim._save_plot()
     critical_mock.assert_called_once()
+
+
+def test_selection_resampled_clears_spectra_and_keeps_selection(victim, mock_view, mocker):
+    selection = QRect(QPoint(0, 0), QPoint(9, 9))
+    mock_view.density_mode = False
+    victim._handle_selection_stopped(selection)
+
+    victim._handle_selection_resampled()
+
+    mock_view.clear_spectra.assert_called_once()
+    assert victim._selection == selection
+
+
+def test_selection_resampled_recomputes_density(victim, mock_view, mocker):
+    start = mocker.patch.object(victim, "_start_density")
+    mock_view.density_mode = True
+
+    victim._handle_selection_resampled()
+
+    start.assert_called_once()
@@ -13,6 +13,9 @@ from suspectral.view.status.status_view import StatusView
 class DummyHypercube(QObject):
     opened = Signal(Hypercube)
     closed = Signal()
+    loadProgress = Signal(Hypercube, int)
+    residencyChanged = Signal(Hypercube)
+    hypercube = None
 
 
 @pytest.fixture
@@ -90,3 +93,21 @@ def test_cursor_inside_boundary(victim, qtbot):
 def test_cursor_outside_boundary(victim, qtbot):
     victim._handle_cursor_outside()
     victim._view.clear_cursor.assert_called_once()
+
+
+def test_load_progress_of_current_hypercube(victim, qtbot):
+    victim._model.hypercube = hypercube = MagicMock(Hypercube)
+
+    victim._model.loadProgress.emit(MagicMock(Hypercube), 10)
+    victim._model.loadProgress.emit(hypercube, 42)
+
+    victim._view.update_loading.assert_called_once_with(42)
+
+
+def test_residency_changed_of_current_hypercube(victim, qtbot):
+    victim._model.hypercube = hypercube = MagicMock(Hypercube)
+
+    victim._model.residencyChanged.emit(MagicMock(Hypercube))
+    victim._model.residencyChanged.emit(hypercube)
+
+    victim._view.update_memory.assert_called_once_with(hypercube)
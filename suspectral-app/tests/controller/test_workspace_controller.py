@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from suspectral.controller.workspace_controller import WorkspaceController
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.workspace.workspace_view import WorkspaceView
+
+
+@pytest.fixture
+def mock_view():
+    return MagicMock(spec=WorkspaceView)
+
+
+@pytest.fixture
+def model():
+    return HypercubeContainer()
+
+
+@pytest.fixture
+def hypercubes():
+    first, second = MagicMock(), MagicMock()
+    first.name, second.name = "first", "second"
+    return first, second
+
+
+@pytest.fixture
+def victim(mock_view, model, hypercubes, qtbot):
+    victim = WorkspaceController(view=mock_view, model=model)
+    with patch("suspectral.model.hypercube_container.Hypercube", side_effect=hypercubes):
+        model.open("dummy/path/first")
+        model.open("dummy/path/second")
+
+    return victim
+
+
+def test_workspace_changes_update_view(victim, mock_view, model, hypercubes):
+    mock_view.set.assert_called_with(["first", "second"], 1)
+
+    model.select(hypercubes[0])
+    mock_view.set.assert_called_with(["first", "second"], 0)
+
+
+def test_closing_all_clears_view(victim, mock_view, model):
+    model.close_all()
+    mock_view.clear.assert_called()
+
+
+def test_view_selection_selects_hypercube(victim, mock_view, model, hypercubes):
+    victim._handle_hypercube_selected(0)
+    assert model.hypercube is hypercubes[0]
+
+
+def test_view_close_closes_hypercube(victim, mock_view, model, hypercubes):
+    victim._handle_hypercube_closed(1)
+
+    assert model.hypercubes == [hypercubes[0]]
+    assert model.hypercube is hypercubes[0]
+    mock_view.set.assert_called_with(["first"], 0)
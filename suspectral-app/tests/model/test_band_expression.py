@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from suspectral.model.band_expression import BandExpression
+
+
+@pytest.fixture
+def planes():
+    rng = np.random.default_rng(0)
+    return rng.uniform(1, 2, size=(6, 5, 10)).astype(np.float32)
+
+
+def test_normalized_difference(planes):
+    victim = BandExpression("(b[8] - b[5]) / (b[8] + b[5])", 10)
+
+    assert victim.bands == [5, 8]
+
+    actual = victim.evaluate(planes[..., victim.bands])
+    expected = (planes[..., 8] - planes[..., 5]) / (planes[..., 8] + planes[..., 5])
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
+    assert actual.shape == (6, 5)
+    assert actual.dtype == np.float32
+
+
+def test_functions_constants_and_unary_operators(planes):
+    victim = BandExpression("-sqrt(b[1]) + 2 ** 3 * abs(b[0] - 4) + log(exp(b[2]))", 10)
+
+    actual = victim.evaluate(planes[..., victim.bands])
+    b = planes
+    expected = -np.sqrt(b[..., 1]) + 8 * np.abs(b[..., 0] - 4) + b[..., 2]
+    np.testing.assert_allclose(actual, expected, rtol=1e-5)
+
+
+def test_constant_on_the_left(planes):
+    victim = BandExpression("1 / b[3] - 1", 10)
+
+    actual = victim.evaluate(planes[..., victim.bands])
+    np.testing.assert_allclose(actual, 1 / planes[..., 3] - 1, rtol=1e-6)
+
+
+def test_repeated_band_is_read_once(planes):
+    victim = BandExpression("b[4] * b[4] - b[4]", 10)
+
+    assert victim.bands == [4]
+    actual = victim.evaluate(planes[..., victim.bands])
+    np.testing.assert_allclose(actual, planes[..., 4] ** 2 - planes[..., 4], rtol=1e-6)
+
+
+def test_wavelength_reference():
+    wavelengths = np.array([400.0, 500.0, 600.0, 700.0])
+    victim = BandExpression("w[590] - w[480]", 4, wavelengths)
+
+    assert victim.bands == [1, 2]
+
+
+def test_evaluates_in_chunks(planes):
+    victim = BandExpression("b[1] + b[2]", 10)
+    victim.CHUNK_PIXELS = 7
+
+    actual = victim.evaluate(planes[..., victim.bands])
+    np.testing.assert_allclose(actual, planes[..., 1] + planes[..., 2], rtol=1e-6)
+
+
+def test_division_by_zero():
+    victim = BandExpression("b[0] / b[1] + 1 / 0", 2)
+
+    actual = victim.evaluate(np.array([[1.0, 0.0], [0.0, 0.0]]))
+    assert np.isinf(actual[0])
+    assert not np.isfinite(actual[1])
+
+
+@pytest.mark.parametrize("text", [
+    "b[10]",
+    "b[-1]",
+    "b[1.5]",
+    "b[True]",
+    "x[1]",
+    "b[1] +",
+    "2 + 3",
+    "w[500]",
+    "__import__('os')",
+    "b[0].real",
+    "sqrt(b[0], b[1])",
+    "b[0] if b[1] else b[2]",
+    "b[0] // b[1]",
+])
+def test_invalid_expressions(text):
+    with pytest.raises(ValueError):
+        BandExpression(text, 10)
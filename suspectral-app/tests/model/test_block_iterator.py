@@ -0,0 +1,74 @@
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.block_iterator import block_rows, iter_blocks
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(30, 20, 12)).astype(np.int16)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        block = data[rows[0]:rows[1], cols[0]:cols[1]]
+        return block if bands is None else block[..., bands]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def test_block_rows(hypercube):
+    assert block_rows(hypercube, 20 * 12 * 2 * 4) == 4
+    assert block_rows(hypercube, 20 * 12 * 2 * 4, num_cols=10, num_bands=3) == 32
+    assert block_rows(hypercube, 1) == 1
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_reads_whole_hypercube(hypercube, data, prefetch):
+    blocks = list(iter_blocks(hypercube, rows_per_block=7, prefetch=prefetch))
+
+    assert [rows for rows, _ in blocks] == [slice(0, 7), slice(7, 14), slice(14, 21), slice(21, 28), slice(28, 30)]
+    np.testing.assert_array_equal(np.concatenate([block for _, block in blocks]), data)
+
+
+def test_block_size_follows_target_bytes(hypercube, data):
+    blocks = list(iter_blocks(hypercube, target_bytes=10 * 3 * 2 * 8, bands=[4, 1, 9], cols=(5, 15)))
+
+    assert [block.shape for _, block in blocks] == [(8, 10, 3)] * 3 + [(6, 10, 3)]
+    np.testing.assert_array_equal(np.concatenate([block for _, block in blocks]), data[:, 5:15][..., [4, 1, 9]])
+
+
+def test_reads_region(hypercube, data):
+    blocks = list(iter_blocks(hypercube, rows_per_block=4, rows=(3, 12), cols=(2, 6)))
+
+    assert [rows for rows, _ in blocks] == [slice(3, 7), slice(7, 11), slice(11, 12)]
+    np.testing.assert_array_equal(np.concatenate([block for _, block in blocks]), data[3:12, 2:6])
+
+
+def test_stops_reading_when_iteration_stops(hypercube):
+    blocks = iter_blocks(hypercube, rows_per_block=1, prefetch=2)
+    next(blocks)
+    blocks.close()
+
+    assert hypercube.read_subregion.call_count <= 4
+    assert not any(thread.name == "suspectral-read-ahead" for thread in threading.enumerate())
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_read_errors_are_raised(hypercube, data, prefetch):
+    hypercube.read_subregion.side_effect = [data[:10], OSError("unreachable")]
+    blocks = iter_blocks(hypercube, rows_per_block=10, prefetch=prefetch)
+
+    assert next(blocks)[0] == slice(0, 10)
+    with pytest.raises(OSError):
+        next(blocks)
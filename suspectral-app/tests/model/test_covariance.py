@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from suspectral.model.covariance import Covariance
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(200, 5)) @ rng.normal(size=(5, 5))
+
+
+def test_update_in_chunks_matches_numpy(data):
+    victim = Covariance(5)
+    for chunk in np.array_split(data, 7):
+        victim.update(chunk)
+
+    assert victim.count == 200
+    np.testing.assert_allclose(victim.mean, data.mean(axis=0))
+    np.testing.assert_allclose(victim.covariance, np.cov(data, rowvar=False))
+
+
+def test_update_skips_non_finite_spectra(data):
+    corrupted = data.copy()
+    corrupted[3, 1] = np.nan
+    corrupted[8, 4] = np.inf
+
+    victim = Covariance(5)
+    victim.update(corrupted)
+
+    expected = np.delete(data, [3, 8], axis=0)
+    assert victim.count == 198
+    np.testing.assert_allclose(victim.covariance, np.cov(expected, rowvar=False))
+
+
+def test_update_with_empty_chunk(data):
+    victim = Covariance(5)
+    victim.update(data[:0])
+    victim.update(data)
+
+    assert victim.count == 200
+    np.testing.assert_allclose(victim.mean, data.mean(axis=0))
+
+
+def test_principal_components(data):
+    victim = Covariance(5)
+    victim.update(data)
+
+    variances, components = victim.principal_components(2)
+
+    assert components.shape == (5, 2)
+    assert variances[0] >= variances[1]
+
+    expected = np.linalg.eigvalsh(np.cov(data, rowvar=False))[::-1][:2]
+    np.testing.assert_allclose(variances, expected)
+    np.testing.assert_allclose(components.T @ components, np.eye(2), atol=1e-10)
+
+
+def test_noise_adjusted_components():
+    rng = np.random.default_rng(1)
+    signal = rng.normal(size=(500, 1)) * np.array([[1.0, 1.0, 0.0, 0.0]])
+    noise = rng.normal(size=(500, 4)) * np.array([0.01, 0.01, 1.0, 1.0])
+
+    data = signal + noise
+    victim = Covariance(4)
+    victim.update(data)
+
+    noise_estimate = Covariance(4)
+    noise_estimate.update(rng.normal(size=(500, 4)) * np.array([0.01, 0.01, 1.0, 1.0]))
+
+    ratios, components = victim.noise_adjusted_components(noise_estimate, 1)
+
+    # The leading component follows the signal, even though the noisy bands have more variance.
+    scores = (data - victim.mean) @ components[:, 0]
+    assert ratios[0] > 100
+    assert abs(np.corrcoef(scores, signal[:, 0])[0, 1]) > 0.99
@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.cross_section import CrossSection
+
+
+@pytest.fixture
+def data():
+    return np.arange(30 * 20 * 3, dtype=np.int16).reshape(30, 20, 3)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.dtype = data.dtype
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    mock.read_col.side_effect = lambda col, bands=None: data[:, col:col + 1]
+    return mock
+
+
+def test_trace_horizontal_line():
+    rows, cols = CrossSection.trace(np.array([[2.5, 4.5], [7.5, 4.5]]), 10, 10)
+
+    np.testing.assert_array_equal(rows, [4, 4, 4, 4, 4, 4])
+    np.testing.assert_array_equal(cols, [2, 3, 4, 5, 6, 7])
+
+
+def test_trace_diagonal_line_is_connected():
+    rows, cols = CrossSection.trace(np.array([[0, 0], [9, 3]]), 10, 10)
+
+    assert len(rows) == 10
+    np.testing.assert_array_equal(cols, np.arange(10))
+    assert rows[0] == 0 and rows[-1] == 3
+    assert np.all(np.abs(np.diff(rows)) <= 1)
+
+
+def test_trace_polyline_does_not_repeat_vertices():
+    rows, cols = CrossSection.trace(np.array([[0, 0], [3, 0], [3, 3], [0, 3]]), 10, 10)
+
+    assert len(rows) == 10
+    assert np.all(np.abs(np.diff(rows)) + np.abs(np.diff(cols)) == 1)
+
+
+def test_trace_is_clipped_to_image():
+    rows, cols = CrossSection.trace(np.array([[-5, 2], [50, 2]]), 5, 8)
+
+    np.testing.assert_array_equal(cols, np.arange(8))
+    np.testing.assert_array_equal(rows, np.full(8, 2))
+
+
+def test_trace_clips_segments_rather_than_vertices():
+    rows, cols = CrossSection.trace(np.array([[-4, 2], [12, 10]]), 10, 10)
+
+    assert (rows[0], cols[0]) == (4, 0)
+    assert (rows[-1], cols[-1]) == (9, 9)
+    np.testing.assert_array_equal(cols, np.arange(10))
+    assert np.all(np.diff(rows) >= 0) and np.all(np.diff(rows) <= 1)
+
+
+def test_trace_drops_segments_outside_image():
+    rows, cols = CrossSection.trace(np.array([[-10, 5], [5, -10], [5, 5]]), 10, 10)
+
+    assert len(rows) > 0
+    assert rows.min() >= 0 and cols.min() >= 0
+    assert (rows[-1], cols[-1]) == (5, 5)
+    assert (rows[0], cols[0]) == (0, 5)
+
+
+def test_read_returns_spectra_in_line_order(hypercube, data):
+    rows, cols = np.array([5, 1, 5, 3]), np.array([2, 7, 2, 0])
+    spectra = CrossSection(hypercube).read(rows, cols)
+
+    assert spectra.dtype == np.int16
+    np.testing.assert_array_equal(spectra, data[rows, cols])
+
+
+def test_read_gathers_rows_in_offset_order(hypercube):
+    CrossSection(hypercube).read(np.array([9, 2, 9, 2]), np.array([1, 6, 4, 3]))
+
+    calls = [call.args for call in hypercube.read_subregion.call_args_list]
+    assert calls == [((2, 3), (3, 7)), ((9, 10), (1, 5))]
+    hypercube.read_col.assert_not_called()
+
+
+def test_read_caches_columns_along_line(hypercube, data):
+    victim = CrossSection(hypercube)
+    rows, cols = CrossSection.trace(np.array([[4, 0], [4, 29]]), 30, 20)
+
+    np.testing.assert_array_equal(victim.read(rows, cols), data[:, 4])
+    np.testing.assert_array_equal(victim.read(rows[5:9], cols[5:9]), data[5:9, 4])
+
+    hypercube.read_col.assert_called_once_with(4)
+    hypercube.read_subregion.assert_not_called()
+
+
+def test_read_evicts_least_recently_used_columns(hypercube, data):
+    column_bytes = data.shape[0] * data.shape[2] * data.itemsize
+    victim = CrossSection(hypercube, cache_bytes=2 * column_bytes)
+    rows = np.arange(30)
+
+    for col in [0, 1, 0, 2, 0, 1]:
+        victim.read(rows, np.full(30, col))
+
+    assert [call.args[0] for call in hypercube.read_col.call_args_list] == [0, 1, 2, 1]
+
+
+def test_read_available_skips_missing_columns(hypercube, data):
+    victim = CrossSection(hypercube)
+    rows = np.concatenate([np.arange(10), np.full(3, 20)])
+    cols = np.concatenate([np.full(10, 4), [7, 8, 9]])
+
+    assert victim.missing_columns(rows, cols) == [4]
+
+    spectra, available = victim.read_available(rows, cols)
+    np.testing.assert_array_equal(available, [False] * 10 + [True] * 3)
+    np.testing.assert_array_equal(spectra[available], data[20, 7:10])
+    hypercube.read_col.assert_not_called()
+
+    victim.fetch_column(4)
+    assert victim.missing_columns(rows, cols) == []
+
+    spectra, available = victim.read_available(rows, cols)
+    assert available.all()
+    np.testing.assert_array_equal(spectra, data[rows, cols])
@@ -0,0 +1,115 @@
+import os
+
+import numpy as np
+import pytest
+
+from suspectral.model.envi_header import EnviHeader, EnviHeaderInvalid
+
+CONTENT = """ENVI
+description = {
+  Acquired with, a test sensor}
+Samples = 341
+lines   = 256
+; bands = 7
+bands = 3
+map info = {UTM, 1.000, 1.000}
+wavelength = {
+  400.5, 410,
+  420.25 }
+bbl = {1, 0, 1}
+band names = {}
+"""
+
+
+@pytest.fixture
+def header(tmp_path):
+    path = tmp_path / "cube.hdr"
+    path.write_text(CONTENT)
+    return path
+
+
+def test_parse_scalar_fields():
+    fields = EnviHeader.parse(CONTENT)
+
+    assert fields["samples"] == "341"
+    assert fields["lines"] == "256"
+    assert fields["bands"] == "3"
+    assert fields["description"] == "Acquired with, a test sensor"
+
+
+def test_parse_lists():
+    fields = EnviHeader.parse(CONTENT)
+
+    assert fields["map info"] == ["UTM", "1.000", "1.000"]
+    assert fields["band names"] == []
+
+    assert fields["wavelength"].dtype == np.float64
+    np.testing.assert_array_equal(fields["wavelength"], [400.5, 410, 420.25])
+    assert fields["bbl"].dtype == np.int64
+    np.testing.assert_array_equal(fields["bbl"], [1, 0, 1])
+
+
+def test_parsed_arrays_are_read_only():
+    fields = EnviHeader.parse(CONTENT)
+
+    with pytest.raises(ValueError):
+        fields["wavelength"][0] = 0
+
+
+def test_parse_keeps_field_order():
+    fields = EnviHeader.parse(CONTENT)
+    assert list(fields) == ["description", "samples", "lines", "bands", "map info", "wavelength", "bbl", "band names"]
+
+
+@pytest.mark.parametrize("content", [b"samples = 1\n", b"", bytes(range(256))])
+def test_parse_rejects_other_files(content):
+    with pytest.raises(EnviHeaderInvalid):
+        EnviHeader.parse(content)
+
+
+def test_read_caches_parsed_header(header, mocker):
+    parse = mocker.spy(EnviHeader, "parse")
+
+    first = EnviHeader.read(header)
+    second = EnviHeader.read(header)
+
+    assert parse.call_count == 1
+    assert first == second
+    assert first is not second
+
+
+def test_read_returns_copies(header):
+    EnviHeader.read(header)["samples"] = "1"
+    assert EnviHeader.read(header)["samples"] == "341"
+
+
+def test_read_parses_modified_header(header, mocker):
+    EnviHeader.read(header)
+    parse = mocker.spy(EnviHeader, "parse")
+
+    header.write_text(CONTENT.replace("bands = 3", "bands = 4"))
+    stat = os.stat(header)
+    os.utime(header, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert EnviHeader.read(header)["bands"] == "4"
+    assert parse.call_count == 1
+
+
+def test_read_cache_is_bounded(tmp_path, mocker):
+    mocker.patch.object(EnviHeader, "CACHE_SIZE", 2)
+    paths = []
+    for index in range(3):
+        paths.append(tmp_path / f"cube{index}.hdr")
+        paths[-1].write_text(CONTENT)
+        EnviHeader.read(paths[-1])
+
+    parse = mocker.spy(EnviHeader, "parse")
+    EnviHeader.read(paths[2])
+    EnviHeader.read(paths[0])
+
+    assert parse.call_count == 1
+
+
+def test_read_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        EnviHeader.read(tmp_path / "missing.hdr")
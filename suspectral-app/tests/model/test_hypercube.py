@@ -1,176 +1,381 @@
-from unittest.mock import MagicMock, patch
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
-from spectral.io.envi import EnviDataFileNotFoundError, FileNotAnEnviHeader, EnviHeaderParsingError, \
-    MissingEnviHeaderParameter
-
-from suspectral.model.hypercube import Hypercube, HypercubeDataMissing, HypercubeHeaderInvalid
+import spectral
+from scipy.interpolate import CubicSpline
+
+from suspectral.model.hypercube import (
+    Hypercube,
+    HypercubeDataMissing,
+    HypercubeFormatUnsupported,
+    HypercubeHeaderInvalid,
+)
+from suspectral.model.reader_array import NpyReader
+from suspectral.model.reader_envi import EnviReader
+from suspectral.model.reader_png import PngStackReader
+
+INTERLEAVES = {
+    "bsq": (2, 0, 1),
+    "bil": (0, 2, 1),
+    "bip": (0, 1, 2),
+}
 
 
 @pytest.fixture
-def victim():
-    mock = MagicMock()
-    mock.metadata = {
-        "default bands": ["2", "1", "0"],
-        "wavelength unit": "nm"
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(-1000, 1000, size=(12, 9, 5)).astype(np.int16)
+
+
+def write_cube(directory, data, interleave="bip", byte_order=0, extension="img", **fields):
+    header = {
+        "samples": data.shape[1],
+        "lines": data.shape[0],
+        "bands": data.shape[2],
+        "header offset": 0,
+        "file type": "ENVI Standard",
+        "data type": 2,
+        "interleave": interleave,
+        "byte order": byte_order,
+        "wavelength": "{" + ", ".join(str(500 - 10 * band) for band in range(data.shape[2])) + "}",
+        "wavelength unit": "nm",
+        "default bands": "{3, 2, 1}",
+        **fields,
     }
-    mock.nrows = 100
-    mock.ncols = 200
-    mock.nbands = 10
-    mock.sample_size = 2
-    mock.shape = (100, 200, 10)
-    mock.bands.centers = list(range(10, 110, 10))
-    mock.read_pixel.return_value = np.array([1, 2, 3])
-    mock.read_subregion.return_value = np.ones((10, 10, 3))
-    mock.read_subimage.return_value = np.ones((10, 10, 3))
-    return mock
 
+    path = directory / "ipsum.hdr"
+    lines = ["ENVI"] + [f"{key} = {value}" for key, value in header.items() if value is not None]
+    path.write_text("\n".join(lines) + "\n")
+
+    dtype = np.dtype(np.int16).newbyteorder(">" if byte_order else "<")
+    (directory / f"ipsum.{extension}").write_bytes(data.transpose(INTERLEAVES[interleave]).astype(dtype).tobytes())
+    return path
+
+
+@pytest.fixture
+def victim(tmp_path, data):
+    return Hypercube(str(write_cube(tmp_path, data)))
+
+
+def test_init_properties(victim, tmp_path):
+    assert victim.name == "ipsum"
+    assert victim.path == str(tmp_path / "ipsum.hdr")
+    assert victim.data_path == str(tmp_path / "ipsum.img")
+    assert victim.metadata["interleave"] == "bip"
+    assert victim.num_rows == 12
+    assert victim.num_cols == 9
+    assert victim.num_bands == 5
+    assert victim.bytes_per_sample == 2
+    assert victim.dtype == np.dtype(np.int16)
+    assert victim.num_samples == 12 * 9 * 5
+    assert victim.num_bytes == 12 * 9 * 5 * 2
+    assert victim.shape == (12, 9, 5)
+    assert victim.wavelengths_unit == "nm"
+    assert victim.default_bands == (3, 2, 1)
+    np.testing.assert_array_equal(victim.wavelengths, [460, 470, 480, 490, 500])
+
+
+def test_data_file_is_opened_on_first_access(victim, data):
+    assert victim._reader._file is None
+
+    victim.read_row(0)
+
+    assert victim._reader._file is not None
+
+
+def test_wavelengths_fallback(tmp_path, data):
+    victim = Hypercube(str(write_cube(tmp_path, data, wavelength=None)))
+    assert victim.wavelengths is None
+    assert victim.wavelengths_unit is None
+
+
+def test_default_bands_fallback(tmp_path, data):
+    victim = Hypercube(str(write_cube(tmp_path, data, **{"default bands": None})))
+    assert victim.default_bands == (4, 2, 0)
+
+
+def test_get_rgb(victim, data):
+    expected = spectral.get_rgb(data, (1, 2, 3))
+    np.testing.assert_array_equal(victim.get_rgb(1, 2, 3), expected)
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_init_properties(mock_open, victim):
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/ipsum.hdr")
-
-    assert cube.name == "ipsum"
-    assert cube.metadata == victim.metadata
-    assert cube.num_rows == 100
-    assert cube.num_cols == 200
-    assert cube.num_bands == 10
-    assert cube.bytes_per_sample == 2
-    assert cube.num_samples == 100 * 200 * 10
-    assert cube.num_bytes == 100 * 200 * 10 * 2
-    assert cube.shape == (100, 200, 10)
-    assert cube.wavelengths_unit == "nm"
-    assert cube.default_bands == (2, 1, 0)
-    np.testing.assert_array_equal(cube.wavelengths, np.array(sorted(victim.bands.centers)))
 
+def test_get_grayscale(victim, data):
+    expected = spectral.get_rgb(data, (4, 4, 4))
+    np.testing.assert_array_equal(victim.get_grayscale(4), expected)
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_wavelengths_fallback(mock_open):
-    victim = MagicMock()
-    victim.bands.centers = None
 
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
-    assert cube.wavelengths is None
+def test_make_resident_and_release(victim, data):
+    source = victim._reader
+    assert not victim.resident
+    assert victim.resident_bytes == 0
 
+    victim.make_resident(victim.read_subregion((0, 12), (0, 9)))
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_default_bands_fallback(mock_open, victim):
-    del victim.metadata["default bands"]
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
+    assert victim.resident
+    assert victim.resident_bytes == data.nbytes
+    assert victim.name == "ipsum"
+    assert victim.default_bands == (3, 2, 1)
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4), [4, 1]), data[2:7, 1:4][..., [4, 1]])
+    np.testing.assert_array_equal(victim.read_pixels([(11, 8), (0, 0)]), [data[11, 8], data[0, 0]])
+    np.testing.assert_array_equal(victim.get_rgb(1, 2, 3), spectral.get_rgb(data, (1, 2, 3)))
 
-    assert cube.default_bands == (9, 5, 0)
+    assert victim.release() is source
+    assert not victim.resident
+    np.testing.assert_array_equal(victim.read_pixel(3, 4), data[3, 4])
 
 
-@patch("suspectral.model.hypercube.envi.open")
-@patch("suspectral.model.hypercube.get_rgb")
-def test_get_rgb(mock_get_rgb, mock_open, victim):
-    mock_open.return_value = victim
-    mock_get_rgb.return_value = np.ones((10, 10, 3))
-    cube = Hypercube("dummy/path/file.hdr")
+def test_make_resident_with_wrong_shape(victim, data):
+    with pytest.raises(ValueError):
+        victim.make_resident(data[:-1])
 
-    rgb = cube.get_rgb(1, 2, 3)
-    mock_get_rgb.assert_called_once_with(victim, (1, 2, 3))
-    np.testing.assert_array_equal(rgb, np.ones((10, 10, 3)))
+    assert not victim.resident
 
 
-@patch("suspectral.model.hypercube.envi.open")
-@patch("suspectral.model.hypercube.get_rgb")
-def test_get_grayscale(mock_get_rgb, mock_open, victim):
-    mock_open.return_value = victim
-    mock_get_rgb.return_value = np.ones((10, 10, 3))
-    cube = Hypercube("dummy/path/file.hdr")
+def test_iter_blocks(victim, data):
+    blocks = list(victim.iter_blocks(rows_per_block=5, bands=[4, 0]))
 
-    gray = cube.get_grayscale(5)
-    mock_get_rgb.assert_called_once_with(victim, (5, 5, 5))
-    np.testing.assert_array_equal(gray, np.ones((10, 10, 3)))
+    assert [rows for rows, _ in blocks] == [slice(0, 5), slice(5, 10), slice(10, 12)]
+    np.testing.assert_array_equal(np.concatenate([block for _, block in blocks]), data[..., [4, 0]])
 
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_read_pixel(mock_open, victim):
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
+def test_view(victim, data):
+    view = victim.view(rows=(1, 12), cols=(0, 8), binning=(2, 2, 1))
+    expected = data[1:12, :8].astype(np.float32)
+    expected = (expected[0:10:2] + expected[1:10:2]) / 2
+    expected = (expected[:, 0::2] + expected[:, 1::2]) / 2
 
-    pixel = cube.read_pixel(10, 20)
-    victim.read_pixel.assert_called_once_with(10, 20)
-    np.testing.assert_array_equal(pixel, np.array([1, 2, 3]))
+    assert isinstance(view, Hypercube)
+    assert view.name == "ipsum"
+    assert view.shape == (6, 4, 5)
+    assert view.default_bands == (3, 2, 1)
+    np.testing.assert_array_equal(view.wavelengths, victim.wavelengths)
+    np.testing.assert_allclose(view.read_subregion((0, 5), (0, 4)), expected)
+    np.testing.assert_allclose(view.read_row(5)[0, 2], data[11, 4:6].mean(axis=0))
 
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_read_pixels(mock_open, victim):
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
+def test_resample(victim, data):
+    wavelengths = np.array([465.0, 485.0])
+    resampled = victim.resample(wavelengths)
 
-    result = cube.read_pixels([(0, 0), (1, 1)])
-    assert victim.read_pixel.call_count == 2
-    assert result.shape == (2, 3)
+    np.testing.assert_array_equal(victim.band_wavelengths, [500.0, 490.0, 480.0, 470.0, 460.0])
+    assert isinstance(resampled, Hypercube)
+    assert resampled.shape == (12, 9, 2)
+    np.testing.assert_array_equal(resampled.wavelengths, wavelengths)
 
+    # The wavelengths of the cube descend with its bands, so its spectra are reversed.
+    spline = CubicSpline(victim.wavelengths, data[..., ::-1].astype(np.float64), axis=2)
+    np.testing.assert_allclose(resampled.read_subregion((0, 12), (0, 9)), spline(wavelengths), rtol=1e-5, atol=1e-3)
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_read_subregion(mock_open, victim):
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
 
-    result = cube.read_subregion((0, 10), (0, 10), bands=[1, 2, 3])
-    victim.read_subregion.assert_called_once_with((0, 10), (0, 10), [1, 2, 3])
-    assert result.shape == (10, 10, 3)
+def test_calibrate_and_remove_calibration(victim, data):
+    source = victim._reader
+    reflectance = np.random.default_rng(1).random(data.shape).astype(np.float32)
+    victim.make_resident(data.copy())
 
+    victim.calibrate(reflectance, white_ref=data[0, 0])
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_read_subimage(mock_open, victim):
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
+    assert victim.calibrated
+    assert not victim.resident
+    assert victim.dtype == np.dtype(np.float32)
+    assert victim.default_bands == (3, 2, 1)
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4)), reflectance[2:7, 1:4])
 
-    result = cube.read_subimage((0, 10), (0, 10), bands=[1, 2, 3])
-    victim.read_subimage.assert_called_once_with((0, 10), (0, 10), [1, 2, 3])
-    assert result.shape == (10, 10, 3)
+    victim.make_resident(reflectance.copy())
+    assert victim.calibrated
+    assert victim.resident
 
+    assert victim.remove_calibration() is source
+    assert not victim.calibrated
+    assert not victim.resident
+    np.testing.assert_array_equal(victim.read_pixel(3, 4), data[3, 4])
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_read_row(mock_open, victim):
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
 
-    result = cube.read_row(5, bands=[0, 1, 2])
-    victim.read_subregion.assert_called_once_with((5, 6), (0, victim.ncols), [0, 1, 2])
-    assert result.shape == (10, 10, 3)
+def test_calibrate_with_wrong_shape(victim, data):
+    with pytest.raises(ValueError):
+        victim.calibrate(data[:-1].astype(np.float32))
 
+    assert not victim.calibrated
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_read_col(mock_open, victim):
-    mock_open.return_value = victim
-    cube = Hypercube("dummy/path/file.hdr")
 
-    result = cube.read_col(7, bands=[3, 4])
-    victim.read_subregion.assert_called_once_with((0, victim.nrows), (7, 8), [3, 4])
-    assert result.shape == (10, 10, 3)
+def test_cached_results(victim, tmp_path, data):
+    other = Hypercube(str(tmp_path / "ipsum.hdr"))
+    image = victim.get_rgb(1, 2, 3)
 
+    victim.set_cached("image", image)
+
+    assert victim.get_cached("image") is image
+    assert other.get_cached("image") is None
+
+    victim.clear_cached()
+    assert victim.get_cached("image") is None
+
+
+@pytest.mark.parametrize("interleave", INTERLEAVES)
+@pytest.mark.parametrize("byte_order", [0, 1])
+def test_read_methods(tmp_path, data, interleave, byte_order):
+    victim = Hypercube(str(write_cube(tmp_path, data, interleave, byte_order)))
+
+    np.testing.assert_array_equal(victim.read_pixel(10, 2), data[10, 2])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4)), data[2:7, 1:4])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4), [0, 3]), data[2:7, 1:4][..., [0, 3]])
+    np.testing.assert_array_equal(victim.read_subimage([1, 5], [0, 8]), data[[1, 5]][:, [0, 8]])
+    np.testing.assert_array_equal(victim.read_row(5, [0, 1]), data[5:6, :, :2])
+    np.testing.assert_array_equal(victim.read_col(7, [3, 4]), data[:, 7:8, 3:])
+
+
+def test_read_pixels(victim, data):
+    result = victim.read_pixels([(11, 8), (0, 0), (6, 2)])
+
+    assert result.dtype == np.int16
+    np.testing.assert_array_equal(result, [data[11, 8], data[0, 0], data[6, 2]])
+
+
+def test_data_file_with_other_extension(tmp_path, data):
+    victim = Hypercube(str(write_cube(tmp_path, data, extension="dat")))
+
+    assert victim.data_path == str(tmp_path / "ipsum.dat")
+    np.testing.assert_array_equal(victim.read_pixel(1, 1), data[1, 1])
+
+
+def test_missing_data_exception(tmp_path, data):
+    path = write_cube(tmp_path, data)
+    (tmp_path / "ipsum.img").unlink()
 
-@patch("suspectral.model.hypercube.envi.open", side_effect=EnviDataFileNotFoundError("missing data"))
-def test_missing_data_exception(mock_open):
     with pytest.raises(HypercubeDataMissing):
-        Hypercube("dummy/path/file.hdr")
+        Hypercube(str(path))
+
+
+def test_file_not_an_envi_header(tmp_path):
+    path = tmp_path / "ipsum.hdr"
+    path.write_text("samples = 1\n")
+
+    with pytest.raises(HypercubeHeaderInvalid):
+        Hypercube(str(path))
+
 
+def test_binary_file_is_not_an_envi_header(tmp_path):
+    path = tmp_path / "ipsum.hdr"
+    path.write_bytes(bytes(range(256)))
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_file_not_an_envi_header(mock_open):
-    mock_open.side_effect = FileNotAnEnviHeader("not a valid header")
     with pytest.raises(HypercubeHeaderInvalid):
-        Hypercube("dummy/path/file.hdr")
+        Hypercube(str(path))
+
 
+def test_missing_envi_header_parameter(tmp_path, data):
+    path = write_cube(tmp_path, data, **{"byte order": None})
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_envi_header_parsing_error(mock_open):
-    mock_open.side_effect = EnviHeaderParsingError()
     with pytest.raises(HypercubeHeaderInvalid):
-        Hypercube("dummy/path/file.hdr")
+        Hypercube(str(path))
 
 
-@patch("suspectral.model.hypercube.envi.open")
-def test_missing_envi_header_parameter(mock_open):
-    mock_open.side_effect = MissingEnviHeaderParameter("missing parameter")
+def test_unsupported_data_type(tmp_path, data):
+    path = write_cube(tmp_path, data, **{"data type": 7})
+
     with pytest.raises(HypercubeHeaderInvalid):
-        Hypercube("dummy/path/file.hdr")
+        Hypercube(str(path))
+
+
+@pytest.mark.parametrize("name, reader", [
+    ("cube.hdr", EnviReader),
+    ("CUBE.HDR", EnviReader),
+    ("cube.npy", NpyReader),
+    ("cube_01.png", PngStackReader),
+])
+def test_reader_for(name, reader):
+    assert Hypercube.reader_for(name) is reader
+    assert Hypercube.supports(name)
+
+
+def test_reader_for_unsupported_extension():
+    assert not Hypercube.supports("cube.txt")
+
+    with pytest.raises(HypercubeFormatUnsupported):
+        Hypercube("cube.txt")
+
+
+def test_file_filter_lists_all_formats_first():
+    filters = Hypercube.file_filter().split(";;")
+
+    assert len(filters) == len(Hypercube.READERS) + 1
+    for reader in Hypercube.READERS:
+        for extension in reader.EXTENSIONS:
+            assert f"*{extension}" in filters[0]
+
+
+def test_open_npy(tmp_path, data):
+    path = tmp_path / "ipsum.npy"
+    np.save(path, data.transpose(2, 0, 1))
+
+    victim = Hypercube(str(path))
+
+    assert victim.name == "ipsum"
+    assert victim.shape == (12, 9, 5)
+    assert victim.wavelengths is None
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4)), data[2:7, 1:4])
+    np.testing.assert_array_equal(victim.read_pixels([(11, 8), (0, 0)]), [data[11, 8], data[0, 0]])
+    np.testing.assert_array_equal(victim.get_rgb(1, 2, 3), spectral.get_rgb(data, (1, 2, 3)))
+
+
+@pytest.mark.parametrize("interleave", INTERLEAVES)
+@pytest.mark.parametrize("gap_bytes", [0, 1 << 20])
+def test_read_runs_with_and_without_merging(tmp_path, data, interleave, gap_bytes, monkeypatch):
+    monkeypatch.setattr(EnviReader, "GAP_BYTES", gap_bytes)
+    victim = Hypercube(str(write_cube(tmp_path, data, interleave)))
+
+    np.testing.assert_array_equal(victim.read_subregion((0, 12), (0, 9)), data)
+    np.testing.assert_array_equal(victim.read_subregion((3, 10), (2, 3), [4, 1]), data[3:10, 2:3][..., [4, 1]])
+    np.testing.assert_array_equal(victim.read_subimage([9, 0, 9], [8, 2]), data[[9, 0, 9]][:, [8, 2]])
+
+
+def test_read_in_limited_requests(tmp_path, data, monkeypatch):
+    monkeypatch.setattr(EnviReader, "MAX_MERGED_BYTES", 7)
+    victim = Hypercube(str(write_cube(tmp_path, data, "bsq")))
+
+    np.testing.assert_array_equal(victim.read_subregion((0, 12), (0, 9)), data)
+
+
+def test_read_out_of_range(victim):
+    with pytest.raises(IndexError):
+        victim.read_subregion((0, 13), (0, 9))
+
+
+def test_reflectance_scale_factor(tmp_path, data):
+    victim = Hypercube(str(write_cube(tmp_path, data, **{"reflectance scale factor": 1000})))
+
+    assert victim.dtype == np.dtype(np.float64)
+    np.testing.assert_allclose(victim.read_pixel(3, 4), data[3, 4] / 1000)
+    np.testing.assert_allclose(victim.read_subregion((0, 2), (0, 2)), data[:2, :2] / 1000)
+    np.testing.assert_allclose(victim.read_pixels([(3, 4)]), [data[3, 4] / 1000])
+
+
+@pytest.mark.parametrize("interleave", INTERLEAVES)
+def test_concurrent_reads(tmp_path, interleave):
+    data = np.random.default_rng(1).integers(-1000, 1000, size=(64, 48, 24)).astype(np.int16)
+    victim = Hypercube(str(write_cube(tmp_path, data, interleave)))
+    barrier = threading.Barrier(16)
+
+    def hammer(seed):
+        barrier.wait()
+        rng = np.random.default_rng(seed)
+        for _ in range(100):
+            top, left = rng.integers(0, 60), rng.integers(0, 44)
+            bottom, right = top + rng.integers(1, 5), left + rng.integers(1, 5)
+            bands = rng.choice(24, size=rng.integers(1, 24), replace=False).tolist()
+            row, col = rng.integers(0, 64), rng.integers(0, 48)
+            points = rng.integers(0, [64, 48], size=(8, 2))
+
+            checks = [
+                (victim.read_subregion((top, bottom), (left, right), bands), data[top:bottom, left:right][..., bands]),
+                (victim.read_pixel(row, col), data[row, col]),
+                (victim.read_pixels(points), data[points[:, 0], points[:, 1]]),
+                (victim.read_col(col, bands), data[:, col:col + 1][..., bands]),
+            ]
+            if not all(np.array_equal(result, expected) for result, expected in checks):
+                return False
+
+        return True
+
+    with ThreadPoolExecutor(16) as executor:
+        assert all(executor.map(hammer, range(16)))
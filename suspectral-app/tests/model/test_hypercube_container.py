@@ -1,8 +1,10 @@
 from unittest.mock import patch, MagicMock
 
+import numpy as np
 import pytest
 
 from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.worker.worker import join_workers
 
 
 @pytest.fixture
@@ -37,13 +39,328 @@ def test_close_emits_closed_signal(mock_hypercube_class, mock_hypercube, qtbot):
 
 
 @patch("suspectral.model.hypercube_container.Hypercube")
-def test_open_closes_existing_first(mock_hypercube_class, mock_hypercube, qtbot):
-    mock_hypercube_class.return_value = mock_hypercube
+def test_open_switches_from_current(mock_hypercube_class, qtbot):
+    mock_hypercube_class.side_effect = first, second = MagicMock(), MagicMock()
 
     victim = HypercubeContainer()
     victim.open("dummy/path/first")
 
-    with qtbot.waitSignals([victim.closed, victim.opened], timeout=1000) as blockers:
+    with qtbot.waitSignals([victim.closed, victim.opened, victim.workspaceChanged], timeout=1000):
         victim.open("dummy/path/second")
 
+    assert victim.hypercube is second
+    assert victim.hypercubes == [first, second]
+
+
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_open_selects_already_open_path(mock_hypercube_class, qtbot):
+    mock_hypercube_class.side_effect = first, second = MagicMock(), MagicMock()
+
+    victim = HypercubeContainer()
+    victim.open("dummy/path/first")
+    victim.open("dummy/path/second")
+
+    assert victim.open("dummy/path/../path/first") is first
+    assert victim.hypercube is first
+    assert victim.hypercubes == [first, second]
+    assert mock_hypercube_class.call_count == 2
+
+
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_select_emits_closed_then_opened(mock_hypercube_class, qtbot):
+    mock_hypercube_class.side_effect = first, second = MagicMock(), MagicMock()
+
+    victim = HypercubeContainer()
+    victim.open("dummy/path/first")
+    victim.open("dummy/path/second")
+
+    with qtbot.waitSignals([victim.closed, victim.opened], order="strict", timeout=1000):
+        victim.select(first)
+
+    assert victim.hypercube is first
+
+
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_select_current_does_nothing(mock_hypercube_class, mock_hypercube, qtbot):
+    mock_hypercube_class.return_value = mock_hypercube
+
+    victim = HypercubeContainer()
+    victim.open("dummy/path")
+
+    with qtbot.assertNotEmitted(victim.closed):
+        victim.select(mock_hypercube)
+
+
+def test_select_unknown_hypercube_raises(mock_hypercube):
+    victim = HypercubeContainer()
+
+    with pytest.raises(ValueError):
+        victim.select(mock_hypercube)
+
+
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_close_current_selects_most_recent(mock_hypercube_class, qtbot):
+    mock_hypercube_class.side_effect = first, second, third = MagicMock(), MagicMock(), MagicMock()
+
+    victim = HypercubeContainer()
+    victim.open("dummy/path/first")
+    victim.open("dummy/path/second")
+    victim.open("dummy/path/third")
+    victim.select(first)
+
+    with qtbot.waitSignals([victim.closed, victim.opened], order="strict", timeout=1000):
+        victim.close()
+
+    assert victim.hypercube is third
+    assert victim.hypercubes == [second, third]
+    first.clear_cached.assert_called_once()
+
+
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_close_other_keeps_current(mock_hypercube_class, qtbot):
+    mock_hypercube_class.side_effect = first, second, _ = MagicMock(), MagicMock(), MagicMock()
+
+    victim = HypercubeContainer()
+    victim.open("dummy/path/first")
+    victim.open("dummy/path/second")
+
+    with qtbot.assertNotEmitted(victim.closed):
+        with qtbot.waitSignal(victim.workspaceChanged, timeout=1000):
+            victim.close(first)
+
+    assert victim.hypercube is second
+    assert victim.hypercubes == [second]
+
+    # The closed file is opened anew.
+    victim.open("dummy/path/first")
+    assert mock_hypercube_class.call_count == 3
+
+
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_close_all(mock_hypercube_class, qtbot):
+    mock_hypercube_class.side_effect = MagicMock(), MagicMock()
+
+    victim = HypercubeContainer()
+    victim.open("dummy/path/first")
+    victim.open("dummy/path/second")
+    victim.close_all()
+
+    assert victim.hypercube is None
+    assert victim.hypercubes == []
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+def test_open_async_emits_opening_then_opened(mock_hypercube_class, mock_hypercube, qtbot):
+    mock_hypercube_class.return_value = mock_hypercube
+
+    victim = HypercubeContainer()
+    with qtbot.waitSignal(victim.opening, timeout=1000) as opening:
+        with qtbot.waitSignal(victim.opened, timeout=1000) as opened:
+            victim.open_async("dummy/path")
+            assert victim.loading
+
+    join_workers(victim)
+
+    assert opening.args == ["dummy/path"]
+    assert opened.args == [mock_hypercube]
     assert victim.hypercube == mock_hypercube
+    assert not victim.loading
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+def test_open_async_emits_failed(mock_hypercube_class, qtbot):
+    error = OSError("unreachable")
+    mock_hypercube_class.side_effect = error
+
+    victim = HypercubeContainer()
+    with qtbot.assertNotEmitted(victim.opened):
+        with qtbot.waitSignal(victim.failed, timeout=1000) as blocker:
+            victim.open_async("dummy/path")
+
+    join_workers(victim)
+
+    assert blocker.args == [error]
+    assert victim.hypercube is None
+    assert not victim.loading
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+def test_cancel_discards_opened_hypercube(mock_hypercube_class, mock_hypercube, qtbot):
+    mock_hypercube_class.return_value = mock_hypercube
+
+    victim = HypercubeContainer()
+    with qtbot.assertNotEmitted(victim.opened, wait=200):
+        victim.open_async("dummy/path")
+        victim.cancel()
+
+    join_workers(victim)
+
+    assert victim.hypercube is None
+    assert not victim.loading
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_open_cancels_pending_open_async(mock_sync_class, mock_async_class, qtbot):
+    mock_sync_class.return_value = first = MagicMock()
+    mock_async_class.return_value = MagicMock()
+
+    victim = HypercubeContainer()
+    victim.open_async("dummy/path/slow")
+    victim.open("dummy/path/fast")
+
+    join_workers(victim)
+    qtbot.wait(100)
+    assert victim.hypercube is first
+    assert not victim.loading
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+@patch("suspectral.model.hypercube_container.Hypercube")
+def test_open_async_selects_already_open_path(mock_sync_class, mock_async_class, mock_hypercube, qtbot):
+    mock_sync_class.return_value = mock_hypercube
+
+    victim = HypercubeContainer()
+    victim.open("dummy/path")
+
+    with qtbot.assertNotEmitted(victim.opening):
+        victim.open_async("dummy/path")
+
+    assert not victim.loading
+    assert victim.hypercube is mock_hypercube
+    mock_async_class.assert_not_called()
+
+
+@pytest.fixture
+def npy_path(tmp_path):
+    path = tmp_path / "ipsum.npy"
+    np.save(path, np.arange(6 * 5 * 4, dtype=np.int16).reshape(6, 5, 4))
+    return str(path)
+
+
+def test_load_into_memory(npy_path, qtbot):
+    victim = HypercubeContainer()
+    hypercube = victim.open(npy_path)
+
+    with qtbot.waitSignal(victim.loadProgress, check_params_cb=lambda _, percent: percent == 100, timeout=1000):
+        with qtbot.waitSignal(victim.residencyChanged, timeout=1000):
+            victim.load_into_memory()
+        assert victim.is_loading_into_memory()
+
+    qtbot.waitUntil(lambda: hypercube.resident, timeout=1000)
+    join_workers(victim)
+
+    assert not victim.is_loading_into_memory()
+    assert hypercube.resident_bytes == 6 * 5 * 4 * 2
+
+    with qtbot.waitSignal(victim.residencyChanged, timeout=1000):
+        victim.release_memory()
+
+    assert not hypercube.resident
+
+
+def test_release_memory_stops_loading(npy_path, qtbot):
+    victim = HypercubeContainer()
+    hypercube = victim.open(npy_path)
+
+    victim.load_into_memory()
+    victim.release_memory()
+    join_workers(victim)
+    qtbot.wait(100)
+
+    assert not victim.is_loading_into_memory()
+    assert not hypercube.resident
+
+
+def test_load_failure_is_reported(npy_path, qtbot):
+    victim = HypercubeContainer()
+    hypercube = victim.open(npy_path)
+
+    error = OSError("unreachable")
+    with patch.object(hypercube, "read_subregion", side_effect=error):
+        with qtbot.waitSignal(victim.loadFailed, timeout=1000) as blocker:
+            victim.load_into_memory()
+
+        join_workers(victim)
+
+    assert blocker.args == [hypercube, error]
+    assert not victim.is_loading_into_memory()
+    assert not hypercube.resident
+
+
+@pytest.mark.parametrize("available,resident", [(10 ** 9, True), (100, False), (None, False)])
+def test_auto_load_when_hypercube_fits(npy_path, qtbot, available, resident):
+    victim = HypercubeContainer()
+    victim.auto_load = True
+
+    with patch("suspectral.model.hypercube_container.available_memory", return_value=available):
+        hypercube = victim.open(npy_path)
+
+    join_workers(victim)
+    qtbot.wait(50)
+    assert hypercube.resident == resident
+
+
+def test_calibrate(npy_path, qtbot):
+    victim = HypercubeContainer()
+    hypercube = victim.open(npy_path)
+    white_ref, black_ref = hypercube.read_pixel(5, 4), hypercube.read_pixel(0, 0)
+
+    with qtbot.waitSignal(victim.opened, timeout=1000):
+        with qtbot.waitSignal(victim.calibrationChanged, timeout=1000):
+            victim.calibrate(white_ref, black_ref)
+        assert victim.is_calibrating()
+
+    join_workers(victim)
+
+    assert hypercube.calibrated
+    assert not victim.is_calibrating()
+    np.testing.assert_allclose(hypercube.read_pixel(5, 4), 1.0)
+    np.testing.assert_allclose(hypercube.read_pixel(0, 0), 0.0)
+
+    with qtbot.waitSignal(victim.opened, timeout=1000):
+        victim.remove_calibration()
+
+    assert not hypercube.calibrated
+    np.testing.assert_array_equal(hypercube.read_pixel(5, 4), white_ref)
+
+
+def test_calibrate_releases_memory(npy_path, qtbot):
+    victim = HypercubeContainer()
+    hypercube = victim.open(npy_path)
+    hypercube.make_resident(hypercube.read_subregion((0, 6), (0, 5)).copy())
+
+    with qtbot.waitSignal(victim.residencyChanged, timeout=1000):
+        victim.calibrate(black_ref=np.zeros(4))
+
+    join_workers(victim)
+    assert hypercube.calibrated
+    assert not hypercube.resident
+
+
+def test_remove_calibration_stops_calibrating(npy_path, qtbot):
+    victim = HypercubeContainer()
+    hypercube = victim.open(npy_path)
+
+    victim.calibrate(white_ref=np.ones(4))
+    victim.remove_calibration()
+    join_workers(victim)
+    qtbot.wait(100)
+
+    assert not victim.is_calibrating()
+    assert not hypercube.calibrated
+
+
+def test_calibration_failure_is_reported(npy_path, qtbot):
+    victim = HypercubeContainer()
+    hypercube = victim.open(npy_path)
+
+    with qtbot.waitSignal(victim.calibrationFailed, timeout=1000) as blocker:
+        victim.calibrate(white_ref=np.ones(3))
+
+    join_workers(victim)
+
+    assert blocker.args[0] is hypercube
+    assert isinstance(blocker.args[1], ValueError)
+    assert not victim.is_calibrating()
+    assert not hypercube.calibrated
@@ -0,0 +1,129 @@
+import gc
+import threading
+
+import numpy as np
+import pytest
+
+from suspectral.model.memory_cache import MemoryCache
+
+
+class Owner:
+    pass
+
+
+@pytest.fixture
+def victim():
+    return MemoryCache(budget_bytes=100)
+
+
+def test_get_returns_stored_value(victim):
+    owner = Owner()
+    value = np.zeros(10, dtype=np.uint8)
+
+    victim.put(owner, "key", value)
+
+    assert victim.get(owner, "key") is value
+    assert victim.get(owner, "other") is None
+    assert victim.get(Owner(), "key") is None
+    assert victim.used == 10
+
+
+def test_put_replaces_value(victim):
+    owner = Owner()
+    victim.put(owner, "key", np.zeros(10, dtype=np.uint8))
+    victim.put(owner, "key", np.zeros(30, dtype=np.uint8))
+
+    assert len(victim.get(owner, "key")) == 30
+    assert victim.used == 30
+
+
+def test_put_with_explicit_size(victim):
+    owner = Owner()
+    victim.put(owner, "key", "value", num_bytes=40)
+
+    assert victim.get(owner, "key") == "value"
+    assert victim.used == 40
+
+
+def test_least_recently_used_entries_are_evicted_across_owners(victim):
+    first, second = Owner(), Owner()
+    victim.put(first, "a", np.zeros(40, dtype=np.uint8))
+    victim.put(second, "b", np.zeros(40, dtype=np.uint8))
+    victim.get(first, "a")
+
+    victim.put(second, "c", np.zeros(40, dtype=np.uint8))
+
+    assert victim.get(first, "a") is not None
+    assert victim.get(second, "b") is None
+    assert victim.get(second, "c") is not None
+    assert victim.used == 80
+
+
+def test_values_larger_than_budget_are_not_stored(victim):
+    owner = Owner()
+    victim.put(owner, "small", np.zeros(10, dtype=np.uint8))
+    victim.put(owner, "large", np.zeros(101, dtype=np.uint8))
+
+    assert victim.get(owner, "small") is not None
+    assert victim.get(owner, "large") is None
+    assert victim.used == 10
+
+
+def test_lowering_budget_evicts(victim):
+    owner = Owner()
+    victim.put(owner, "a", np.zeros(40, dtype=np.uint8))
+    victim.put(owner, "b", np.zeros(40, dtype=np.uint8))
+
+    victim.budget = 50
+
+    assert victim.get(owner, "a") is None
+    assert victim.get(owner, "b") is not None
+    assert victim.used == 40
+
+
+def test_discard_removes_entries_of_owner(victim):
+    first, second = Owner(), Owner()
+    victim.put(first, "a", np.zeros(10, dtype=np.uint8))
+    victim.put(second, "a", np.zeros(20, dtype=np.uint8))
+
+    victim.discard(first)
+    victim.discard(Owner())
+
+    assert victim.get(first, "a") is None
+    assert victim.get(second, "a") is not None
+    assert victim.used == 20
+
+
+def test_entries_are_removed_with_owner(victim):
+    owner = Owner()
+    victim.put(owner, "a", np.zeros(10, dtype=np.uint8))
+
+    del owner
+    gc.collect()
+
+    assert victim.used == 0
+
+
+def test_concurrent_use(victim):
+    owners = [Owner() for _ in range(4)]
+
+    def work(owner):
+        for index in range(500):
+            victim.put(owner, index % 7, np.zeros(index % 13, dtype=np.uint8))
+            victim.get(owner, index % 5)
+
+    threads = [threading.Thread(target=work, args=(owner,)) for owner in owners]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert victim.used <= victim.budget
+    assert victim.used == sum(
+        len(value) for owner in owners for key in range(7)
+        if (value := victim.get(owner, key)) is not None
+    )
+
+
+def test_shared_is_singleton():
+    assert MemoryCache.shared() is MemoryCache.shared()
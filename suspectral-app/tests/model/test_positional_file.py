@@ -0,0 +1,88 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from suspectral.model.positional_file import PositionalFile
+
+
+@pytest.fixture
+def content():
+    return np.random.default_rng(0).integers(0, 256, size=100_000, dtype=np.uint8)
+
+
+@pytest.fixture
+def path(tmp_path, content):
+    path = tmp_path / "ipsum.img"
+    path.write_bytes(content.tobytes())
+    return str(path)
+
+
+@pytest.fixture(params=["preadv", "pread", "handles"])
+def victim(request, path, monkeypatch):
+    # Each platform reads in a different way, so all of them are tried on this one.
+    if request.param in ("pread", "handles"):
+        monkeypatch.delattr(os, "preadv", raising=False)
+    if request.param == "handles":
+        monkeypatch.delattr(os, "pread", raising=False)
+    elif not hasattr(os, request.param):
+        pytest.skip(f"os.{request.param} is not available.")
+
+    return PositionalFile(path)
+
+
+def test_read_into(victim, content):
+    buffer = np.empty(1000, dtype=np.uint8)
+
+    victim.read_into(buffer, 500)
+
+    np.testing.assert_array_equal(buffer, content[500:1500])
+
+
+def test_read_into_typed_buffer(victim, content):
+    buffer = np.empty((10, 5), dtype=np.uint16)
+
+    victim.read_into(buffer, 2)
+
+    np.testing.assert_array_equal(buffer.ravel(), content[2:102].view(np.uint16))
+
+
+def test_read_in_several_requests(victim, content, monkeypatch):
+    monkeypatch.setattr(victim, "MAX_READ_BYTES", 7)
+    buffer = np.empty(100, dtype=np.uint8)
+
+    victim.read_into(buffer, 50)
+
+    np.testing.assert_array_equal(buffer, content[50:150])
+
+
+def test_read_past_end(victim, content):
+    with pytest.raises(OSError):
+        victim.read_into(np.empty(10, dtype=np.uint8), len(content) - 5)
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        PositionalFile(str(tmp_path / "missing.img"))
+
+
+def test_concurrent_reads(victim, content):
+    barrier = threading.Barrier(8)
+
+    def hammer(seed):
+        barrier.wait()
+        rng = np.random.default_rng(seed)
+        for _ in range(500):
+            offset = int(rng.integers(0, len(content) - 256))
+            size = int(rng.integers(1, 256))
+            buffer = np.empty(size, dtype=np.uint8)
+            victim.read_into(buffer, offset)
+            if not np.array_equal(buffer, content[offset:offset + size]):
+                return False
+
+        return True
+
+    with ThreadPoolExecutor(8) as executor:
+        assert all(executor.map(hammer, range(8)))
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from suspectral.model.reader import Reader
+
+
+class FakeReader(Reader):
+    def __init__(self, data, chunks=None):
+        super().__init__("/data/ipsum.fake")
+        self.data = data
+        self.regions = []
+        self._chunks = chunks
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    @property
+    def chunks(self):
+        return self._chunks
+
+    def read_subregion(self, rows, cols, bands=None):
+        self.regions.append((rows, cols))
+        region = self.data[rows[0]:rows[1], cols[0]:cols[1]]
+        return region if bands is None else region[..., list(bands)]
+
+
+@pytest.fixture
+def data():
+    return np.arange(8 * 6 * 4, dtype=np.int16).reshape(8, 6, 4)
+
+
+def test_defaults(data):
+    victim = FakeReader(data)
+
+    assert victim.name == "ipsum"
+    assert victim.path == victim.data_path == "/data/ipsum.fake"
+    assert victim.metadata == {}
+    assert victim.wavelengths is None
+    assert victim.default_bands is None
+
+
+def test_read_subimage(data):
+    victim = FakeReader(data)
+
+    result = victim.read_subimage([5, 1], [0, 4], [3, 0])
+
+    np.testing.assert_array_equal(result, data[[5, 1]][:, [0, 4]][..., [3, 0]])
+    assert victim.regions == [((1, 6), (0, 5))]
+
+
+def test_read_subimage_empty(data):
+    assert FakeReader(data).read_subimage([], [1, 2]).shape == (0, 2, 4)
+
+
+def test_read_pixel(data):
+    np.testing.assert_array_equal(FakeReader(data).read_pixel(3, 2), data[3, 2])
+
+
+def test_read_bands(data):
+    np.testing.assert_array_equal(FakeReader(data).read_bands([2]), data[..., [2]])
+
+
+@pytest.mark.parametrize("chunks, regions", [
+    (None, [((0, 1), (2, 5)), ((3, 4), (0, 1)), ((7, 8), (5, 6))]),
+    ((4, 6, 4), [((0, 4), (0, 5)), ((7, 8), (5, 6))]),
+])
+def test_read_pixels_in_strips_of_chunks(data, chunks, regions):
+    victim = FakeReader(data, chunks)
+    rows, cols = np.array([0, 0, 3, 7]), np.array([2, 4, 0, 5])
+
+    result = victim.read_pixels(rows, cols)
+
+    np.testing.assert_array_equal(result, data[rows, cols])
+    assert victim.regions == regions
+
+
+def test_read_pixels_empty(data):
+    assert FakeReader(data).read_pixels(np.array([], int), np.array([], int)).shape == (0, 4)
+
+
+@pytest.mark.parametrize("shape, num_wavelengths, expected", [
+    ((31, 512, 512), None, 0),
+    ((512, 512, 31), None, 2),
+    ((10, 10, 10), None, 2),
+    ((100, 40, 60), 60, 2),
+    ((100, 40, 60), 100, 0),
+    ((100, 40, 60), 7, 1),
+])
+def test_find_band_axis(shape, num_wavelengths, expected):
+    assert Reader.find_band_axis(shape, num_wavelengths) == expected
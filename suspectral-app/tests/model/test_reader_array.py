@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+import scipy.io
+
+from suspectral.model.reader import HypercubeHeaderInvalid
+from suspectral.model.reader_array import ArrayReader, MatReader, NpyReader
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(12, 9, 5)).astype(np.uint16)
+
+
+@pytest.mark.parametrize("axes", [(0, 1, 2), (2, 0, 1), (0, 2, 1)])
+def test_bands_along_any_axis(data, axes):
+    victim = ArrayReader("ipsum", data.transpose(axes))
+
+    assert victim.shape == (12, 9, 5)
+    np.testing.assert_array_equal(victim.read_subregion((0, 12), (0, 9)), data)
+
+
+def test_wavelengths_choose_band_axis(data):
+    victim = ArrayReader("ipsum", data, wavelengths=np.arange(9.0))
+
+    assert victim.shape == (12, 5, 9)
+    np.testing.assert_array_equal(victim.wavelengths, np.arange(9.0))
+
+
+def test_read_methods(data):
+    victim = ArrayReader("ipsum", data.transpose(2, 0, 1))
+
+    np.testing.assert_array_equal(victim.read_pixel(10, 2), data[10, 2])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4), [3, 0]), data[2:7, 1:4][..., [3, 0]])
+    np.testing.assert_array_equal(victim.read_subimage([5, 1], [0, 8]), data[[5, 1]][:, [0, 8]])
+    np.testing.assert_array_equal(victim.read_pixels(np.array([0, 11]), np.array([3, 8])), data[[0, 11], [3, 8]])
+
+
+def test_native_byte_order(data):
+    victim = ArrayReader("ipsum", data.astype(">u2"))
+
+    assert victim.dtype == np.dtype(np.uint16)
+    assert victim.read_pixel(0, 0).dtype == np.dtype(np.uint16)
+    np.testing.assert_array_equal(victim.read_pixel(3, 3), data[3, 3])
+
+
+def test_not_a_cube():
+    with pytest.raises(HypercubeHeaderInvalid):
+        ArrayReader("ipsum", np.zeros((4, 4)))
+
+
+def test_npy_is_memory_mapped(tmp_path, data):
+    path = tmp_path / "ipsum.npy"
+    np.save(path, data)
+
+    victim = NpyReader(str(path))
+
+    assert isinstance(victim._array, np.memmap)
+    assert victim.metadata["file type"] == "NumPy"
+    np.testing.assert_array_equal(victim.read_subregion((1, 3), (2, 4)), data[1:3, 2:4])
+
+
+def test_npy_invalid(tmp_path):
+    path = tmp_path / "ipsum.npy"
+    path.write_bytes(b"not a numpy file")
+
+    with pytest.raises(HypercubeHeaderInvalid):
+        NpyReader(str(path))
+
+
+def test_mat(tmp_path, data):
+    path = tmp_path / "ipsum.mat"
+    scipy.io.savemat(path, {"ref": data, "bands": np.arange(400.0, 450.0, 10.0), "mask": np.ones((12, 9))})
+
+    victim = MatReader.open(str(path))
+
+    assert isinstance(victim, MatReader)
+    assert victim.metadata["variable"] == "ref"
+    np.testing.assert_array_equal(victim.wavelengths, [400, 410, 420, 430, 440])
+    np.testing.assert_array_equal(victim.read_subregion((0, 12), (0, 9)), data)
+
+
+def test_mat_without_cube(tmp_path):
+    path = tmp_path / "ipsum.mat"
+    scipy.io.savemat(path, {"mask": np.ones((12, 9))})
+
+    with pytest.raises(HypercubeHeaderInvalid):
+        MatReader.open(str(path))
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from suspectral.model.reader_array import ArrayReader
+from suspectral.model.reader_calibrated import CalibratedReader
+
+
+@pytest.fixture
+def source():
+    data = np.arange(12 * 9 * 5, dtype=np.uint16).reshape(12, 9, 5)
+    return ArrayReader("path/to/ipsum.npy", data, wavelengths=np.arange(5.0), metadata={"key": "value"})
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random((12, 9, 5)).astype(np.float32)
+
+
+@pytest.fixture
+def victim(source, data):
+    return CalibratedReader(source, data.copy(), white_ref=np.full(5, 2.0))
+
+
+def test_describes_source(victim, source):
+    assert victim.source is source
+    assert victim.name == "ipsum"
+    assert victim.data_path == source.data_path
+    assert victim.shape == (12, 9, 5)
+    assert victim.dtype == np.dtype(np.float32)
+    assert victim.metadata["key"] == "value"
+    assert victim.metadata["calibration"] == "reflectance"
+    assert victim.metadata["white reference"] == [2.0] * 5
+    assert victim.metadata["black reference"] is None
+    np.testing.assert_array_equal(victim.wavelengths, np.arange(5.0))
+
+
+def test_read_methods(victim, data):
+    np.testing.assert_array_equal(victim.read_pixel(10, 2), data[10, 2])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4), [3, 0]), data[2:7, 1:4][..., [3, 0]])
+    np.testing.assert_array_equal(victim.read_subimage([5, 1], [0, 8], [1]), data[[5, 1]][:, [0, 8]][..., [1]])
+    np.testing.assert_array_equal(victim.read_pixels(np.array([0, 11]), np.array([3, 8])), data[[0, 11], [3, 8]])
+    assert not victim.read_subregion((0, 12), (0, 9)).flags.writeable
+
+
+def test_wrong_shape(source, data):
+    with pytest.raises(ValueError):
+        CalibratedReader(source, data[:-1])
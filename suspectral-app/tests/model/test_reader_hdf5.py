@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from suspectral.model import reader_hdf5
+from suspectral.model.reader import HypercubeFormatUnsupported, HypercubeHeaderInvalid
+from suspectral.model.reader_array import MatReader
+from suspectral.model.reader_hdf5 import Hdf5Reader
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(12, 9, 5)).astype(np.uint16)
+
+
+@pytest.fixture
+def h5py():
+    return pytest.importorskip("h5py")
+
+
+@pytest.fixture
+def victim(tmp_path, data, h5py):
+    path = tmp_path / "ipsum.h5"
+    with h5py.File(path, "w") as file:
+        file.create_dataset("cube", data=data.transpose(2, 0, 1), chunks=(5, 4, 3), compression="gzip")
+        file.create_dataset("meta/wavelength", data=np.arange(400.0, 450.0, 10.0))
+        file.create_dataset("mask", data=np.ones((12, 9)))
+
+    return Hdf5Reader(str(path))
+
+
+def test_init_properties(victim):
+    assert victim.shape == (12, 9, 5)
+    assert victim.dtype == np.dtype(np.uint16)
+    assert victim.chunks == (4, 3, 5)
+    assert victim.metadata["dataset"] == "/cube"
+    assert victim.metadata["compression"] == "gzip"
+    np.testing.assert_array_equal(victim.wavelengths, [400, 410, 420, 430, 440])
+
+
+def test_read_methods(victim, data):
+    np.testing.assert_array_equal(victim.read_pixel(10, 2), data[10, 2])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4)), data[2:7, 1:4])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4), [4, 0, 4]), data[2:7, 1:4][..., [4, 0, 4]])
+    np.testing.assert_array_equal(victim.read_subimage([5, 1], [0, 8]), data[[5, 1]][:, [0, 8]])
+    np.testing.assert_array_equal(victim.read_bands([1, 2]), data[..., 1:3])
+
+
+def test_read_pixels(victim, data):
+    rows, cols = np.array([0, 1, 6, 11]), np.array([8, 0, 4, 2])
+    np.testing.assert_array_equal(victim.read_pixels(rows, cols), data[rows, cols])
+
+
+def test_matlab_axes_are_reversed(tmp_path, data, h5py):
+    path = tmp_path / "ipsum.mat"
+    with h5py.File(path, "w", userblock_size=512) as file:
+        file.create_dataset("rad", data=data.T).attrs["MATLAB_class"] = b"uint16"
+        file.create_dataset("bands", data=np.arange(5.0)[:, np.newaxis])
+
+    victim = MatReader.open(str(path))
+
+    assert isinstance(victim, Hdf5Reader)
+    assert victim.metadata["file type"] == "MATLAB"
+    assert victim.shape == (12, 9, 5)
+    np.testing.assert_array_equal(victim.read_subregion((0, 12), (0, 9)), data)
+
+
+def test_no_cube(tmp_path, h5py):
+    path = tmp_path / "ipsum.h5"
+    with h5py.File(path, "w") as file:
+        file.create_dataset("mask", data=np.ones((12, 9)))
+
+    with pytest.raises(HypercubeHeaderInvalid):
+        Hdf5Reader(str(path))
+
+
+def test_not_hdf5(tmp_path, h5py):
+    path = tmp_path / "ipsum.h5"
+    path.write_bytes(b"not an hdf5 file")
+
+    with pytest.raises(HypercubeHeaderInvalid):
+        Hdf5Reader(str(path))
+
+
+def test_missing_h5py(tmp_path, monkeypatch):
+    monkeypatch.setattr(reader_hdf5, "h5py", None)
+
+    with pytest.raises(HypercubeFormatUnsupported):
+        Hdf5Reader(str(tmp_path / "ipsum.h5"))
+
+
+@pytest.mark.parametrize("offset, expected", [(0, True), (512, True), (1024, True), (100, False)])
+def test_is_hdf5(tmp_path, offset, expected):
+    path = tmp_path / "ipsum.mat"
+    path.write_bytes(bytes(offset) + Hdf5Reader.SIGNATURE + bytes(64))
+
+    assert Hdf5Reader.is_hdf5(str(path)) == expected
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from PySide6.QtGui import QImage
+
+from suspectral.model.memory_cache import MemoryCache
+from suspectral.model.reader import HypercubeHeaderInvalid
+from suspectral.model.reader_png import PngStackReader
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 65535, size=(12, 9, 3)).astype(np.uint16)
+
+
+def write_band(path, band):
+    band = np.ascontiguousarray(band)
+    formats = {np.uint8: QImage.Format.Format_Grayscale8, np.uint16: QImage.Format.Format_Grayscale16}
+    image = QImage(band.data, band.shape[1], band.shape[0], band.strides[0], formats[band.dtype.type])
+    assert image.save(str(path))
+
+
+@pytest.fixture
+def stack(tmp_path, data):
+    # The bands are numbered without padding, so they only sort correctly by their numbers.
+    for band in range(data.shape[2]):
+        write_band(tmp_path / f"ipsum_ms_{band * 5 + 1}.png", data[..., band])
+
+    write_band(tmp_path / "ipsum_rgb.png", data[..., 0])
+    write_band(tmp_path / "other_1.png", data[..., 0])
+    return tmp_path
+
+
+@pytest.fixture
+def victim(stack):
+    victim = PngStackReader(str(stack / "ipsum_ms_6.png"))
+    victim._cache = MemoryCache()
+    return victim
+
+
+def test_init_properties(victim):
+    assert victim.name == "ipsum_ms"
+    assert victim.shape == (12, 9, 3)
+    assert victim.dtype == np.dtype(np.uint16)
+    assert victim.chunks == (12, 9, 1)
+    assert victim.metadata["band names"] == ["ipsum_ms_1.png", "ipsum_ms_6.png", "ipsum_ms_11.png"]
+
+
+def test_bands_are_decoded_on_demand(victim, data):
+    assert victim._cache.used == 0
+
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4), [2]), data[2:7, 1:4, [2]])
+
+    assert victim._cache.used == data[..., 2].nbytes
+    assert victim._cache.get(victim, 2) is not None
+
+
+def test_read_methods(victim, data):
+    np.testing.assert_array_equal(victim.read_pixel(10, 2), data[10, 2])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4)), data[2:7, 1:4])
+    np.testing.assert_array_equal(victim.read_subimage([5, 1], [0, 8], [1]), data[[5, 1]][:, [0, 8]][..., [1]])
+    np.testing.assert_array_equal(victim.read_pixels(np.array([0, 11]), np.array([3, 8])), data[[0, 11], [3, 8]])
+
+
+def test_cache_is_limited(victim, data):
+    victim._cache.budget = 2 * data[..., 0].nbytes
+
+    victim.read_bands([0, 1, 2, 1])
+
+    assert [victim._cache.get(victim, band) is not None for band in range(3)] == [False, True, True]
+
+
+def test_eight_bit_images(tmp_path, data):
+    for band in range(2):
+        write_band(tmp_path / f"ipsum_{band}.png", (data[..., band] >> 8).astype(np.uint8))
+
+    victim = PngStackReader(str(tmp_path / "ipsum_0.png"))
+
+    assert victim.dtype == np.dtype(np.uint8)
+    np.testing.assert_array_equal(victim.read_pixel(3, 4), data[3, 4, :2] >> 8)
+
+
+def test_single_unnumbered_image(stack, data):
+    victim = PngStackReader(str(stack / "ipsum_rgb.png"))
+
+    assert victim.name == "ipsum_rgb"
+    assert victim.shape == (12, 9, 1)
+
+
+def test_images_differ_in_size(stack, data):
+    write_band(stack / "ipsum_ms_20.png", data[:5, :5, 0])
+
+    with pytest.raises(HypercubeHeaderInvalid):
+        PngStackReader(str(stack / "ipsum_ms_1.png"))
+
+
+def test_unreadable_image(stack):
+    (stack / "ipsum_ms_20.png").write_bytes(b"not an image")
+
+    with pytest.raises(HypercubeHeaderInvalid):
+        PngStackReader(str(stack / "ipsum_ms_1.png"))
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from scipy.interpolate import CubicSpline
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.reader_array import ArrayReader
+from suspectral.model.reader_resample import ResampleReader
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(8, 6, 9)).astype(np.uint16)
+
+
+@pytest.fixture
+def source_wavelengths():
+    return np.linspace(400.0, 720.0, 9)
+
+
+@pytest.fixture
+def parent(data, source_wavelengths):
+    reader = ArrayReader("path/to/ipsum.npy", data, wavelengths=source_wavelengths)
+    return Hypercube(reader.path, reader)
+
+
+@pytest.fixture
+def wavelengths():
+    return np.arange(405.0, 720.0, 15.0)
+
+
+@pytest.fixture
+def expected(data, source_wavelengths, wavelengths):
+    return CubicSpline(source_wavelengths, data.astype(np.float64), axis=2)(wavelengths)
+
+
+@pytest.fixture
+def victim(parent, wavelengths):
+    return ResampleReader(parent, wavelengths)
+
+
+def test_describes_resampled_cube(victim, wavelengths):
+    assert victim.name == "ipsum"
+    assert victim.shape == (8, 6, len(wavelengths))
+    assert victim.dtype == np.dtype(np.float32)
+    assert victim.metadata["bands"] == len(wavelengths)
+    np.testing.assert_array_equal(victim.wavelengths, wavelengths)
+
+
+def test_operator_matches_spline(source_wavelengths, wavelengths):
+    spectra = np.random.default_rng(1).random((4, len(source_wavelengths)))
+    operator = ResampleReader.operator(source_wavelengths, wavelengths)
+
+    assert operator.shape == (len(wavelengths), len(source_wavelengths))
+    np.testing.assert_allclose(spectra @ operator.T, CubicSpline(source_wavelengths, spectra, axis=1)(wavelengths))
+
+
+def test_read_methods(victim, expected):
+    np.testing.assert_allclose(victim.read_subregion((1, 7), (2, 5)), expected[1:7, 2:5], rtol=1e-5)
+    np.testing.assert_allclose(victim.read_subregion((0, 8), (0, 6), [20, 3]), expected[..., [20, 3]], rtol=1e-5)
+    np.testing.assert_allclose(victim.read_subimage([5, 0], [4, 1]), expected[[5, 0]][:, [4, 1]], rtol=1e-5)
+    np.testing.assert_allclose(victim.read_pixel(3, 2), expected[3, 2], rtol=1e-5)
+    np.testing.assert_allclose(victim.read_pixels(np.array([7, 0]), np.array([5, 1])), expected[[7, 0], [5, 1]], rtol=1e-5)
+
+
+def test_default_bands_are_nearest(parent, victim):
+    assert parent.default_bands == (8, 4, 0)
+    assert victim.default_bands == (20, 10, 0)
+
+
+def test_requires_wavelengths(data):
+    reader = ArrayReader("path/to/ipsum.npy", data)
+
+    with pytest.raises(ValueError):
+        ResampleReader(Hypercube(reader.path, reader), np.arange(400.0, 700.0))
+
+
+def test_requires_target_wavelengths(parent):
+    with pytest.raises(ValueError):
+        ResampleReader(parent, [])
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from suspectral.model.reader_array import ArrayReader
+from suspectral.model.reader_resident import ResidentReader
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(12, 9, 5)).astype(np.uint16)
+
+
+@pytest.fixture
+def source(data):
+    return ArrayReader("path/to/ipsum.npy", data, wavelengths=np.arange(5.0), metadata={"key": "value"})
+
+
+@pytest.fixture
+def victim(source, data):
+    return ResidentReader(source, data.copy())
+
+
+def test_describes_source(victim, source):
+    assert victim.source is source
+    assert victim.name == "ipsum"
+    assert victim.path == source.path
+    assert victim.data_path == source.data_path
+    assert victim.metadata is source.metadata
+    assert victim.shape == (12, 9, 5)
+    assert victim.dtype == np.dtype(np.uint16)
+    assert victim.nbytes == 12 * 9 * 5 * 2
+    np.testing.assert_array_equal(victim.wavelengths, np.arange(5.0))
+
+
+def test_read_methods(victim, data):
+    np.testing.assert_array_equal(victim.read_pixel(10, 2), data[10, 2])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4)), data[2:7, 1:4])
+    np.testing.assert_array_equal(victim.read_subregion((2, 7), (1, 4), [3, 0]), data[2:7, 1:4][..., [3, 0]])
+    np.testing.assert_array_equal(victim.read_subimage([5, 1], [0, 8], [1]), data[[5, 1]][:, [0, 8]][..., [1]])
+    np.testing.assert_array_equal(victim.read_pixels(np.array([0, 11]), np.array([3, 8])), data[[0, 11], [3, 8]])
+    np.testing.assert_array_equal(victim.read_bands([]), data[..., []])
+
+
+def test_contiguous_reads_are_read_only_views(victim):
+    region = victim.read_subregion((2, 7), (1, 4), range(1, 4))
+
+    assert np.shares_memory(region, victim._data)
+    assert not region.flags.writeable
+    with pytest.raises(ValueError):
+        region[0, 0, 0] = 1
+
+
+def test_shape_must_match(source, data):
+    with pytest.raises(ValueError):
+        ResidentReader(source, data[:-1])
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from suspectral.model.hypercube import Hypercube
+from suspectral.model.reader_array import ArrayReader
+from suspectral.model.reader_view import ViewReader
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(13, 10, 7)).astype(np.uint16)
+
+
+@pytest.fixture
+def parent(data):
+    reader = ArrayReader("path/to/ipsum.npy", data, wavelengths=np.arange(400.0, 470.0, 10.0))
+    return Hypercube(reader.path, reader)
+
+
+def bin_axis(data, axis, factor):
+    blocks = [np.take(data, range(start, min(start + factor, data.shape[axis])), axis=axis).mean(axis=axis)
+              for start in range(0, data.shape[axis], factor)]
+    return np.stack(blocks, axis=axis)
+
+
+def test_window_without_binning(parent, data):
+    victim = ViewReader(parent, rows=(2, 11), cols=slice(1, None, 3), bands=[6, 0, 3])
+    expected = data[2:11, 1::3][..., [6, 0, 3]]
+
+    assert victim.shape == (9, 3, 3)
+    assert victim.dtype == np.dtype(np.uint16)
+    assert victim.name == "ipsum"
+    assert victim.metadata["binning"] == [1, 1, 1]
+    np.testing.assert_array_equal(victim.wavelengths, [460.0, 400.0, 430.0])
+    np.testing.assert_array_equal(victim.read_subregion((0, 9), (0, 3)), expected)
+    np.testing.assert_array_equal(victim.read_subimage([8, 0], [2], [1]), expected[[8, 0]][:, [2]][..., [1]])
+
+
+def test_binning_averages_blocks(parent, data):
+    victim = ViewReader(parent, binning=(4, 3, 2))
+    expected = bin_axis(bin_axis(bin_axis(data.astype(np.float64), 0, 4), 1, 3), 2, 2)
+
+    assert victim.shape == (4, 4, 4)
+    assert victim.dtype == np.dtype(np.float32)
+    np.testing.assert_allclose(victim.wavelengths, [405.0, 425.0, 445.0, 460.0])
+    np.testing.assert_allclose(victim.read_subregion((0, 4), (0, 4)), expected, rtol=1e-6)
+    np.testing.assert_allclose(victim.read_subregion((1, 3), (3, 4), [3]), expected[1:3, 3:4][..., [3]], rtol=1e-6)
+    np.testing.assert_allclose(victim.read_subimage([3, 0], [2, 1]), expected[[3, 0]][:, [2, 1]], rtol=1e-6)
+
+
+def test_reads_parent_in_strips(parent, data, monkeypatch):
+    monkeypatch.setattr(ViewReader, "MAX_READ_BYTES", 1)
+    victim = ViewReader(parent, rows=(1, 13), binning=(2, 2, 1))
+    expected = bin_axis(bin_axis(data[1:].astype(np.float64), 0, 2), 1, 2)
+
+    np.testing.assert_allclose(victim.read_subregion((0, 6), (0, 5)), expected, rtol=1e-6)
+
+
+def test_views_compose(parent, data):
+    victim = parent.view(rows=(1, 13), binning=(3, 1, 1)).view(cols=(2, 8), binning=(2, 2, 1))
+    expected = bin_axis(bin_axis(bin_axis(data[1:].astype(np.float64), 0, 3), 0, 2)[:, 2:8], 1, 2)
+
+    assert victim.shape == (2, 3, 7)
+    np.testing.assert_allclose(victim.read_subregion((0, 2), (0, 3)), expected, rtol=1e-6)
+
+
+def test_default_bands_follow_selection(parent):
+    assert ViewReader(parent, bands=slice(None, None, -1)).default_bands == (0, 3, 6)
+    assert ViewReader(parent, binning=(1, 1, 2)).default_bands == (3, 1, 0)
+    assert ViewReader(parent, bands=[0, 1]).default_bands is None
+
+
+def test_read_out_of_range(parent):
+    victim = ViewReader(parent, binning=(4, 4, 1))
+
+    with pytest.raises(IndexError):
+        victim.read_subregion((0, 5), (0, 3))
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"rows": (0, 14)},
+    {"cols": (5, 4)},
+    {"bands": [7]},
+])
+def test_selection_out_of_range(parent, kwargs):
+    with pytest.raises(IndexError):
+        ViewReader(parent, **kwargs)
+
+
+@pytest.mark.parametrize("binning", [(0, 1, 1), (1, 2)])
+def test_invalid_binning(parent, binning):
+    with pytest.raises(ValueError):
+        ViewReader(parent, binning=binning)
@@ -0,0 +1,118 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import scipy.ndimage
+
+from suspectral.model.region_growing import RegionGrowing
+
+BACKGROUND = np.array([1.0, 0.2, 0.1, 0.4])
+TARGET = np.array([0.1, 0.8, 1.0, 0.3])
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    data = np.tile(BACKGROUND, (100, 120, 1))
+
+    # A U-shaped region spanning several tiles, and a similar but separate blob.
+    data[10:50, 10:14] = TARGET
+    data[46:50, 10:40] = TARGET
+    data[10:50, 36:40] = TARGET
+    data[80:90, 100:110] = TARGET
+
+    # Brightness should not affect the spectral angle.
+    data *= rng.uniform(0.5, 2.0, size=(100, 120, 1))
+    return data.astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.read_pixel.side_effect = lambda row, col: data[row, col]
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def test_grow_matches_connected_component(hypercube, data):
+    victim = RegionGrowing(hypercube, tolerance=1.0, tile_size=16)
+    mask = victim.grow(12, 11)
+
+    cosines = data @ TARGET / np.linalg.norm(data, axis=-1) / np.linalg.norm(TARGET)
+    labels, _ = scipy.ndimage.label(cosines > 0.999)
+    expected = labels == labels[12, 11]
+
+    assert mask.rows == (10, 50)
+    assert mask.cols == (10, 40)
+    assert mask.count == expected.sum()
+    np.testing.assert_array_equal(mask.mask, expected[10:50, 10:40])
+
+
+def test_grow_only_reads_tiles_reached_by_region(hypercube):
+    victim = RegionGrowing(hypercube, tolerance=1.0, tile_size=16)
+    victim.grow(12, 11)
+
+    # The region touches tiles in rows 0-3 and columns 0-2, plus their neighbours at most.
+    assert victim.tiles_read <= 4 * 3 + 7
+    assert victim.tiles_read < hypercube.num_rows // 16 * hypercube.num_cols // 16
+    assert hypercube.read_subregion.call_count == victim.tiles_read
+
+
+def test_grow_does_not_cross_to_separate_region(hypercube):
+    mask = RegionGrowing(hypercube, tolerance=1.0, tile_size=16).grow(85, 105)
+
+    assert mask.rows == (80, 90)
+    assert mask.cols == (100, 110)
+    assert mask.count == 100
+
+
+def test_grow_with_large_tolerance_selects_everything(hypercube, data):
+    mask = RegionGrowing(hypercube, tolerance=90.0, tile_size=32).grow(0, 0)
+    assert mask.count == data.shape[0] * data.shape[1]
+
+
+def test_grow_skips_invalid_pixels(hypercube, data):
+    data[48, 20] = np.nan
+    mask = RegionGrowing(hypercube, tolerance=1.0).grow(12, 11)
+
+    assert not mask.mask[48 - 10, 20 - 10]
+    assert mask.count == 40 * 4 * 2 + 22 * 4 - 1
+
+
+def test_grow_from_invalid_seed_is_empty(hypercube, data):
+    data[0, 0] = 0
+    mask = RegionGrowing(hypercube).grow(0, 0)
+
+    assert mask.count == 0
+    hypercube.read_subregion.assert_not_called()
+
+
+def test_invalid_parameters_raise():
+    with pytest.raises(ValueError):
+        RegionGrowing(MagicMock(), tolerance=-1.0)
+    with pytest.raises(ValueError):
+        RegionGrowing(MagicMock(), tile_size=0)
+
+
+def test_finished_tiles_drop_labels(hypercube, mocker):
+    victim = RegionGrowing(hypercube, tolerance=1.0, tile_size=16)
+    assemble = mocker.spy(victim, "_assemble")
+
+    victim.grow(12, 11)
+
+    tiles = assemble.call_args.args[0]
+    finished = [key for key, (labels, _) in tiles.items() if labels is None]
+    assert (0, 0) in finished
+    assert all(region.any() for key, (_, region) in tiles.items() if key in finished)
+
+
+def test_stopped_growing_reads_nothing(hypercube):
+    victim = RegionGrowing(hypercube, tolerance=1.0, tile_size=16)
+    victim.stop()
+
+    mask = victim.grow(12, 11)
+
+    assert mask.count == 0
+    assert victim.tiles_read == 0
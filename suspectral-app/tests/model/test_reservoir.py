@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from suspectral.model.reservoir import Reservoir
+
+
+@pytest.fixture
+def cube():
+    return np.arange(30 * 20 * 2, dtype=np.float32).reshape(30, 20, 2)
+
+
+def feed(victim, cube, block_rows=7):
+    for start in range(0, cube.shape[0], block_rows):
+        victim.update(cube[start:start + block_rows], start)
+
+
+def test_keeps_every_pixel_below_size(cube):
+    victim = Reservoir(1000, 2, seed=0)
+    feed(victim, cube)
+
+    assert victim.count == 600
+    np.testing.assert_array_equal(victim.samples, cube.reshape(-1, 2))
+
+
+def test_sample_is_bounded(cube):
+    victim = Reservoir(50, 2, seed=0)
+    feed(victim, cube)
+
+    assert victim.count == 600
+    assert victim.samples.shape == (50, 2)
+    assert len(np.unique(victim.samples, axis=0)) == 50
+
+
+def test_positions_match_samples(cube):
+    victim = Reservoir(50, 2, seed=0)
+    feed(victim, cube)
+
+    rows, cols = victim.positions.T
+    np.testing.assert_array_equal(victim.samples, cube[rows, cols])
+
+
+def test_positions_with_column_offset(cube):
+    victim = Reservoir(50, 2, seed=0)
+    victim.update(cube[10:15, 5:9], row=10, col=5)
+
+    rows, cols = victim.positions.T
+    np.testing.assert_array_equal(victim.samples, cube[rows, cols])
+
+
+def test_sample_is_uniform():
+    data = np.arange(1000, dtype=np.float32).reshape(100, 10, 1)
+
+    means = []
+    for seed in range(50):
+        victim = Reservoir(100, 1, seed=seed)
+        feed(victim, data)
+        means.append(victim.samples.mean())
+
+    assert np.mean(means) == pytest.approx(499.5, rel=0.03)
+
+
+def test_skips_non_finite_pixels(cube):
+    cube[0, 0, 1] = np.nan
+    victim = Reservoir(1000, 2, seed=0)
+    feed(victim, cube)
+
+    assert victim.count == 599
+    assert np.isfinite(victim.samples).all()
+
+
+def test_samples_are_stored_in_single_precision_by_default(cube):
+    victim = Reservoir(50, 2, seed=0)
+    feed(victim, cube)
+
+    assert victim.samples.dtype == np.float32
+
+
+def test_samples_are_stored_in_given_dtype():
+    cube = np.arange(30 * 20 * 2, dtype=np.int16).reshape(30, 20, 2)
+
+    victim = Reservoir(1000, 2, seed=0, dtype=np.int16)
+    feed(victim, cube)
+
+    assert victim.samples.dtype == np.int16
+    np.testing.assert_array_equal(victim.samples, cube.reshape(-1, 2))
@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPointF
+
+from suspectral.model.selection_mask import SelectionMask
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random((40, 30, 4)).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    mock.read_pixels.side_effect = lambda points: np.array([data[row, col] for row, col in points])
+    return mock
+
+
+def test_from_polygon_rectangle():
+    points = [QPointF(2, 3), QPointF(6, 3), QPointF(6, 5), QPointF(2, 5)]
+    victim = SelectionMask.from_polygon(points, num_rows=10, num_cols=10)
+
+    assert victim.rows == (3, 5)
+    assert victim.cols == (2, 6)
+    assert victim.count == 8
+    assert victim.mask.all()
+
+
+def test_from_polygon_triangle_selects_pixel_centers():
+    points = [QPointF(0, 0), QPointF(10, 0), QPointF(0, 10)]
+    victim = SelectionMask.from_polygon(points, num_rows=10, num_cols=10)
+
+    ys, xs = np.mgrid[0:10, 0:10] + 0.5
+    np.testing.assert_array_equal(victim.mask, xs + ys <= 10)
+
+
+def test_from_polygon_is_clipped_to_image():
+    points = [QPointF(-5, -5), QPointF(15, -5), QPointF(15, 15), QPointF(-5, 15)]
+    victim = SelectionMask.from_polygon(points, num_rows=8, num_cols=6)
+
+    assert victim.rows == (0, 8)
+    assert victim.cols == (0, 6)
+    assert victim.count == 48
+
+
+def test_from_polygon_outside_image_is_empty():
+    points = [QPointF(20, 20), QPointF(30, 20), QPointF(30, 30)]
+    victim = SelectionMask.from_polygon(points, num_rows=10, num_cols=10)
+    assert victim.count == 0
+
+
+def test_coordinates_are_offset_by_bounding_box():
+    mask = np.array([[True, False], [False, True]])
+    xs, ys = SelectionMask(mask, top=5, left=7).coordinates()
+
+    np.testing.assert_array_equal(xs, [7, 8])
+    np.testing.assert_array_equal(ys, [5, 6])
+
+
+def test_thin_limits_count():
+    victim = SelectionMask(np.ones((20, 20), dtype=bool), top=1, left=2)
+    thinned = victim.thin(50)
+
+    assert thinned.count == 50
+    assert thinned.rows == victim.rows
+    assert thinned.cols == victim.cols
+    assert victim.thin(400) is victim
+
+
+def test_read_spectra_gathers_masked_pixels(hypercube, data):
+    mask = np.zeros((10, 12), dtype=bool)
+    mask[1, 3] = mask[4, 0] = mask[9, 11] = True
+    victim = SelectionMask(mask, top=20, left=10)
+
+    spectra = victim.read_spectra(hypercube)
+
+    np.testing.assert_array_equal(spectra, [data[21, 13], data[24, 10], data[29, 21]])
+
+
+def test_read_spectra_skips_empty_blocks(hypercube, data):
+    mask = np.zeros((40, 30), dtype=bool)
+    mask[35:37, 10:12] = True
+
+    victim = SelectionMask(mask)
+    victim.BLOCK_BYTES = 30 * 4 * 4 * 10
+
+    spectra = victim.read_spectra(hypercube)
+
+    assert spectra.shape == (4, 4)
+    hypercube.read_subregion.assert_called_once_with((35, 37), (10, 12))
+
+
+def test_read_spectra_gathers_sparse_pixels(hypercube, data):
+    mask = np.zeros((40, 30), dtype=bool)
+    mask[[1, 7, 20, 38], [3, 29, 0, 15]] = True
+    victim = SelectionMask(mask)
+
+    spectra = victim.read_spectra(hypercube)
+
+    np.testing.assert_array_equal(spectra, data[mask])
+    hypercube.read_subregion.assert_not_called()
+    hypercube.read_pixels.assert_called_once_with([(1, 3), (7, 29), (20, 0), (38, 15)])
+
+
+def test_statistics_match_numpy(hypercube, data):
+    mask = np.random.default_rng(1).random((40, 30)) < 0.3
+    victim = SelectionMask(mask)
+    victim.BLOCK_BYTES = 30 * 4 * 4 * 7
+
+    statistics = victim.statistics(hypercube)
+    expected = data[mask].astype(np.float64)
+
+    np.testing.assert_allclose(statistics[0], expected.mean(axis=0))
+    np.testing.assert_allclose(statistics[1], expected.std(axis=0))
+    np.testing.assert_allclose(statistics[2], expected.min(axis=0))
+    np.testing.assert_allclose(statistics[3], expected.max(axis=0))
+
+
+def test_statistics_of_empty_selection(hypercube):
+    statistics = SelectionMask(np.zeros((3, 3), dtype=bool)).statistics(hypercube)
+
+    assert statistics.shape == (4, 4)
+    assert np.isnan(statistics).all()
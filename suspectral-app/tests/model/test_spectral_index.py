@@ -0,0 +1,157 @@
+import os
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.spectral_index import SpectralIndex
+from suspectral.worker.worker_index import IndexWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    endmembers = rng.random((4, 12)) + 0.1
+    abundances = rng.dirichlet(np.ones(4), size=(30, 20))
+    return (abundances @ endmembers * rng.uniform(0.5, 2.0, size=(30, 20, 1))).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data, tmp_path):
+    (tmp_path / "cube.img").write_bytes(data.tobytes())
+
+    mock = MagicMock()
+    mock.shape = data.shape
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.path = str(tmp_path / "cube.hdr")
+    mock.data_path = str(tmp_path / "cube.img")
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    mock.read_pixels.side_effect = lambda points: \
+        np.array([data[row, col] for row, col in points])
+    return mock
+
+
+@pytest.fixture
+def victim(qtbot, hypercube):
+    worker = IndexWorker(hypercube, num_components=3)
+    with qtbot.waitSignal(worker.indexed, timeout=1000) as blocker:
+        worker.run()
+
+    return blocker.args[0]
+
+
+def exact_angles(data, target):
+    pixels = data.reshape(-1, data.shape[-1]).astype(np.float64)
+    cosines = pixels @ target / (np.linalg.norm(pixels, axis=1) * np.linalg.norm(target))
+    return np.arccos(np.clip(cosines, -1, 1))
+
+
+def test_normalize():
+    spectra = np.array([[3, 4], [0, 0], [np.nan, 1]], dtype=np.float32)
+    unit, valid = SpectralIndex.normalize(spectra)
+
+    assert valid.tolist() == [True, False, False]
+    np.testing.assert_allclose(unit[0], [0.6, 0.8])
+
+
+def test_nearest_matches_exhaustive_search(victim, hypercube, data):
+    target = data[5, 7]
+    pixels, angles = victim.nearest(hypercube, target, 10)
+
+    expected = exact_angles(data, target)
+    assert pixels[0] == 5 * 20 + 7
+    assert np.all(np.diff(angles) >= 0)
+    np.testing.assert_allclose(angles, expected[pixels], atol=1e-5)
+    np.testing.assert_allclose(angles, np.sort(expected)[:10], atol=1e-5)
+
+
+def test_nearest_is_limited_by_number_of_pixels(victim, hypercube, data):
+    pixels, angles = victim.nearest(hypercube, data[0, 0], 10_000)
+    assert len(pixels) == len(angles) == 600
+
+
+def test_within_finds_every_pixel_in_range(victim, hypercube, data):
+    target = data[12, 3]
+    pixels, angles = victim.within(hypercube, target, 0.05)
+
+    expected = exact_angles(data, target)
+    assert set(pixels.tolist()) == set(np.flatnonzero(expected <= 0.05).tolist())
+    assert np.all(angles <= 0.05)
+
+
+def test_zero_spectra_are_not_indexed(qtbot, hypercube, data):
+    data[0, :5] = 0
+
+    worker = IndexWorker(hypercube, num_components=3)
+    with qtbot.waitSignal(worker.indexed, timeout=1000) as blocker:
+        worker.run()
+
+    pixels, _ = blocker.args[0].nearest(hypercube, data[0, 0] + 1, 10_000)
+    assert len(pixels) == 595
+    assert not set(range(5)) & set(pixels.tolist())
+
+
+def test_pixel_ids_are_implied_when_every_pixel_is_indexed(victim):
+    assert victim.num_pixels == 600
+    assert victim._pixels is None
+
+
+def test_nbytes_covers_tree(victim):
+    tree = victim.tree
+    assert victim.nbytes >= tree.data.nbytes + tree.indices.nbytes
+
+
+def test_pixel_ids_are_stored_compactly(qtbot, hypercube, data):
+    data[0, :5] = 0
+
+    worker = IndexWorker(hypercube, num_components=3)
+    with qtbot.waitSignal(worker.indexed, timeout=1000) as blocker:
+        worker.run()
+
+    index = blocker.args[0]
+    assert index.num_pixels == 595
+    assert index._pixels.dtype == np.int32
+
+
+def test_candidates_are_read_in_storage_order(victim, hypercube, data):
+    victim.nearest(hypercube, data[5, 7], 10)
+
+    points = hypercube.read_pixels.call_args.args[0]
+    offsets = points[:, 0] * 20 + points[:, 1]
+    assert np.all(np.diff(offsets) > 0)
+
+
+def test_save_and_load(victim, hypercube, tmp_path):
+    path = tmp_path / "index.npz"
+    victim.save(path, (1, 2, 3))
+
+    loaded = SpectralIndex.load(path, (1, 2, 3))
+    assert loaded.shape == victim.shape
+    assert loaded.num_bands == victim.num_bands
+    np.testing.assert_array_equal(loaded.tree.data, victim.tree.data)
+
+
+def test_load_stale_index(victim, tmp_path):
+    path = tmp_path / "index.npz"
+    victim.save(path, (1, 2, 3))
+
+    assert SpectralIndex.load(path, (1, 2, 4)) is None
+
+
+def test_load_missing_index(tmp_path):
+    assert SpectralIndex.load(tmp_path / "missing.npz", (1,)) is None
+
+
+def test_path_of(hypercube, tmp_path):
+    assert SpectralIndex.path_of(hypercube) == tmp_path / "cube.index.npz"
+
+
+def test_key_of_changes_with_data(hypercube):
+    key = SpectralIndex.key_of(hypercube)
+
+    stat = os.stat(hypercube.data_path)
+    os.utime(hypercube.data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert SpectralIndex.key_of(hypercube) != key
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from suspectral.model.spectral_library import SpectralLibrary
+
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / "grass.csv").write_text("Wavelength,Reflectance\n400,0.1\n500,0.5\n600,0.2\n700,0.6\n")
+    (tmp_path / "soil.csv").write_text("Wavelength,Dry,Wet\n450,0.3,0.1\n550,0.4,0.2\n750,0.6,0.4\n")
+    (tmp_path / "notes.txt").write_text("Not a spectrum.")
+    return tmp_path
+
+
+def test_load(directory):
+    victim = SpectralLibrary.load(str(directory))
+
+    assert len(victim) == 3
+    assert victim.names == ["grass", "soil (Dry)", "soil (Wet)"]
+
+
+def test_load_file(directory):
+    victim = SpectralLibrary.load_file(str(directory / "soil.csv"))
+
+    assert victim.names == ["soil (Dry)", "soil (Wet)"]
+
+    references, mask = victim.resample(np.array([450.0, 750.0]))
+    np.testing.assert_allclose(references, [[0.3, 0.6], [0.1, 0.4]])
+    assert mask.all()
+
+
+def test_load_sorts_wavelengths(tmp_path):
+    (tmp_path / "a.csv").write_text("Wavelength,A\n600,3\n400,1\n500,2\n")
+    victim = SpectralLibrary.load(str(tmp_path))
+
+    references, _ = victim.resample(np.array([450.0, 550.0]))
+    np.testing.assert_allclose(references, [[1.5, 2.5]])
+
+
+def test_load_empty_directory(tmp_path):
+    with pytest.raises(ValueError):
+        SpectralLibrary.load(str(tmp_path))
+
+
+def test_load_without_wavelength_column(tmp_path):
+    (tmp_path / "a.csv").write_text("Band,A\n1,0.1\n2,0.2\n")
+    with pytest.raises(ValueError):
+        SpectralLibrary.load(str(tmp_path))
+
+
+def test_load_with_missing_values(tmp_path):
+    (tmp_path / "a.csv").write_text("Wavelength,A\n400,0.1\n500,\n")
+    with pytest.raises(ValueError):
+        SpectralLibrary.load(str(tmp_path))
+
+
+def test_resample_keeps_common_wavelengths(directory):
+    victim = SpectralLibrary.load(str(directory))
+
+    wavelengths = np.array([400.0, 450.0, 500.0, 650.0, 700.0, 750.0])
+    references, mask = victim.resample(wavelengths)
+
+    assert mask.tolist() == [False, True, True, True, True, False]
+    assert references.shape == (3, 4)
+    np.testing.assert_allclose(references[0], [0.3, 0.5, 0.4, 0.6])
+    np.testing.assert_allclose(references[2], [0.1, 0.15, 0.3, 0.35])
+
+
+def test_resample_without_overlap(directory):
+    victim = SpectralLibrary.load(str(directory))
+    with pytest.raises(ValueError):
+        victim.resample(np.array([800.0, 900.0]))
@@ -0,0 +1,19 @@
+import sys
+
+import pytest
+
+from suspectral.model.system_memory import available_memory
+
+
+def test_available_memory_is_reported():
+    available = available_memory()
+    assert available is None or available > 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Requires /proc/meminfo.")
+def test_available_memory_from_meminfo():
+    with open("/proc/meminfo") as file:
+        fields = dict(line.split(":", 1) for line in file)
+
+    expected = int(fields["MemAvailable"].split()[0]) * 1024
+    assert abs(available_memory() - expected) < 256 * 1024 ** 2
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+import scipy.optimize
+
+from suspectral.model.unmixing import Unmixing
+
+
+@pytest.fixture
+def endmembers():
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.0, 1.0, size=(4, 30))
+
+
+@pytest.fixture
+def pixels(endmembers):
+    rng = np.random.default_rng(1)
+    abundances = rng.normal(0.25, 0.4, size=(500, 4))
+    return abundances @ endmembers + rng.normal(scale=0.05, size=(500, 30))
+
+
+def test_unconstrained_recovers_abundances(endmembers):
+    abundances = np.array([[0.1, 0.2, 0.3, 0.4], [-1.0, 2.0, 0.0, 0.5]])
+    victim = Unmixing(endmembers)
+
+    actual, errors = victim.unmix(abundances @ endmembers)
+
+    np.testing.assert_allclose(actual, abundances, atol=1e-4)
+    np.testing.assert_allclose(errors, 0, atol=1e-5)
+
+
+def test_unconstrained_matches_least_squares(endmembers, pixels):
+    actual, _ = Unmixing(endmembers).unmix(pixels)
+
+    expected = np.linalg.lstsq(endmembers.T, pixels.T, rcond=None)[0].T
+    np.testing.assert_allclose(actual, expected, atol=1e-4)
+
+
+def test_sum_to_one(endmembers, pixels):
+    actual, _ = Unmixing(endmembers, Unmixing.SUM_TO_ONE).unmix(pixels)
+
+    np.testing.assert_allclose(actual.sum(axis=1), 1, atol=1e-5)
+
+    # The solution is optimal among all abundances summing up to one.
+    basis = np.eye(4)[:, :3] - np.eye(4)[:, 3:]
+    gradient = (pixels - actual @ endmembers) @ endmembers.T @ basis
+    np.testing.assert_allclose(gradient, 0, atol=1e-3)
+
+
+def test_non_negative_matches_nnls(endmembers, pixels):
+    actual, errors = Unmixing(endmembers, Unmixing.NON_NEGATIVE).unmix(pixels)
+
+    expected = np.array([scipy.optimize.nnls(endmembers.T, it)[0] for it in pixels])
+    assert (actual >= 0).all()
+    np.testing.assert_allclose(actual, expected, atol=1e-4)
+
+    residuals = pixels - expected @ endmembers
+    np.testing.assert_allclose(errors, np.sqrt(np.mean(residuals ** 2, axis=1)), atol=1e-4)
+
+
+def test_non_negative_keeps_feasible_pixels(endmembers):
+    abundances = np.array([[0.1, 0.2, 0.3, 0.4]])
+    actual, _ = Unmixing(endmembers, Unmixing.NON_NEGATIVE).unmix(abundances @ endmembers)
+
+    np.testing.assert_allclose(actual, abundances, atol=1e-4)
+
+
+def test_preserves_shape_and_invalid_pixels(endmembers, pixels):
+    cube = pixels.reshape(20, 25, 30).astype(np.float32)
+    cube[0, 0, 3] = np.nan
+
+    actual, errors = Unmixing(endmembers, Unmixing.NON_NEGATIVE).unmix(cube)
+
+    assert actual.shape == (20, 25, 4)
+    assert errors.shape == (20, 25)
+    assert np.isnan(actual[0, 0]).all()
+    assert np.isnan(errors[0, 0])
+    assert np.isfinite(actual[1:]).all()
+
+
+def test_dependent_endmembers(endmembers):
+    with pytest.raises(ValueError):
+        Unmixing(np.vstack([endmembers, endmembers[0] * 2]))
+
+
+def test_unknown_constraint(endmembers):
+    with pytest.raises(ValueError):
+        Unmixing(endmembers, "unknown")
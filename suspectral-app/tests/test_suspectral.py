@@ -4,6 +4,7 @@ import pytest
 from PySide6.QtCore import Qt, QMimeData, QUrl
 from PySide6.QtGui import QDragEnterEvent
 
+from suspectral.model.hypercube import HypercubeDataMissing, HypercubeHeaderInvalid
 from suspectral.suspectral import Suspectral
 
 import resources
@@ -29,11 +30,19 @@ def test_model_signals_update_window_title(qtbot, victim):
     assert victim.windowTitle() == "Suspectral"
 
 
-def test_handle_open_calls_model_open(qtbot, victim):
+def test_handle_open_calls_model_open_async(qtbot, victim):
     with patch("suspectral.suspectral.QFileDialog.getOpenFileName", return_value=("path.hdr", None)):
-        victim._model.open = MagicMock()
+        victim._model.open_async = MagicMock()
         victim._handle_open()
-        victim._model.open.assert_called_once_with("path.hdr")
+        victim._model.open_async.assert_called_once_with("path.hdr")
+
+
+def test_handle_open_offers_all_formats(qtbot, victim):
+    with patch("suspectral.suspectral.QFileDialog.getOpenFileName", return_value=("", None)) as dialog:
+        victim._handle_open()
+
+    for pattern in ["*.hdr", "*.h5", "*.mat", "*.npy", "*.png"]:
+        assert pattern in dialog.call_args.kwargs["filter"]
 
 
 def test_handle_close_calls_model_close(qtbot, victim):
@@ -60,9 +69,10 @@ def test_license_exec_called(qtbot, victim):
         mock.assert_called_once()
 
 
-def test_drag_enter_accepts_hdr_files(qtbot, victim):
+@pytest.mark.parametrize("name", ["file.hdr", "file.HDR", "file.h5", "file.mat", "file.npy", "file_01.png"])
+def test_drag_enter_accepts_hypercube_files(qtbot, victim, name):
     mime_data = QMimeData()
-    mime_data.setUrls([QUrl.fromLocalFile("file.hdr")])
+    mime_data.setUrls([QUrl.fromLocalFile(name)])
     event = QDragEnterEvent(
         victim.rect().center(),
         Qt.DropAction.CopyAction,
@@ -106,7 +116,7 @@ def test_drag_move_accepts(qtbot, victim):
 
 
 def test_drop_opens_model(qtbot, victim):
-    victim._model.open = MagicMock()
+    victim._model.open_async = MagicMock()
     mime_data = QMimeData()
     mime_data.setUrls([QUrl.fromLocalFile("file.hdr")])
     event = QDragEnterEvent(
@@ -118,4 +128,68 @@ def test_drop_opens_model(qtbot, victim):
     )
 
     victim._handle_drop(event)
-    victim._model.open.assert_called_once_with("file.hdr")
+    victim._model.open_async.assert_called_once_with("file.hdr")
+
+
+def test_opening_shows_cancellable_progress(qtbot, victim):
+    victim._model.cancel = MagicMock()
+    victim._handle_hypercube_opening()
+
+    dialog = victim._progress_dialog
+    assert dialog is not None
+    dialog.canceled.emit()
+    victim._model.cancel.assert_called_once()
+
+    victim._handle_hypercube_opened(MagicMock())
+    assert victim._progress_dialog is None
+
+
+@pytest.mark.parametrize("error, title", [
+    (HypercubeDataMissing(), "Missing Data"),
+    (HypercubeHeaderInvalid(), "Invalid Header"),
+    (OSError("unreachable"), "Error"),
+])
+def test_failed_open_shows_error(qtbot, victim, error, title):
+    victim._handle_hypercube_opening()
+
+    with patch("suspectral.suspectral.QMessageBox.critical") as critical:
+        victim._handle_hypercube_failed(error)
+
+    assert critical.call_args.args[1] == title
+    assert victim._progress_dialog is None
+
+
+def test_load_memory_action_loads_and_releases(qtbot, victim):
+    victim._model.load_into_memory = MagicMock()
+    victim._model.release_memory = MagicMock()
+
+    victim._handle_load_memory(True)
+    victim._model.load_into_memory.assert_called_once_with()
+
+    victim._handle_load_memory(False)
+    victim._model.release_memory.assert_called_once_with()
+
+
+def test_load_memory_action_follows_current_hypercube(qtbot, victim):
+    assert not victim._load_memory_action.isEnabled()
+
+    victim._model._hypercube = hypercube = MagicMock()
+    hypercube.resident = True
+    victim._update_load_memory_action()
+
+    assert victim._load_memory_action.isEnabled()
+    assert victim._load_memory_action.isChecked()
+
+
+def test_failed_load_shows_warning(qtbot, victim):
+    with patch("suspectral.suspectral.QMessageBox.warning") as warning:
+        victim._handle_load_failed(MagicMock(), MemoryError())
+
+    assert warning.call_args.args[1] == "Not Loaded into Memory"
+
+
+def test_failed_calibration_shows_warning(qtbot, victim):
+    with patch("suspectral.suspectral.QMessageBox.warning") as warning:
+        victim._handle_calibration_failed(MagicMock(), ValueError())
+
+    assert warning.call_args.args[1] == "Not Calibrated"
@@ -6,7 +6,10 @@ from PySide6.QtCore import QObject, Signal
 from suspectral.exporter.exporter import Exporter
 from suspectral.tool.manager import ToolManager
 from suspectral.tool.tool_area import AreaTool
+from suspectral.tool.tool_cross_section import CrossSectionTool
 from suspectral.tool.tool_pan import PanTool
+from suspectral.tool.tool_polygon import PolygonTool
+from suspectral.tool.tool_wand import WandTool
 from suspectral.tool.tool_inspect import InspectTool
 from suspectral.tool.tool_none import NoneTool
 from suspectral.tool.tool_zoom import ZoomTool
@@ -43,7 +46,10 @@ def test_tool_manager_initialization(qtbot, victim):
     assert isinstance(victim.pan, PanTool)
     assert isinstance(victim.zoom, ZoomTool)
     assert isinstance(victim.area, AreaTool)
+    assert isinstance(victim.polygon, PolygonTool)
+    assert isinstance(victim.wand, WandTool)
     assert isinstance(victim.inspect, InspectTool)
+    assert isinstance(victim.cross_section, CrossSectionTool)
     assert victim._active_tool == victim.none
 
 
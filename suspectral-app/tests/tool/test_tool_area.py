@@ -33,7 +33,7 @@ def mock_container():
     container.hypercube.name = "test_cube"
     container.hypercube.wavelengths = np.array([1, 2, 3])
     container.hypercube.read_subregion.return_value = np.ones((2, 2, 3))
-    container.hypercube.read_pixels.return_value = np.ones((9, 3))
+    container.hypercube.read_subimage.return_value = np.ones((3, 3, 3))
     return container
 
 
@@ -65,7 +65,7 @@ def test_deactivate_disconnects_resets(victim, mock_view, qtbot):
         victim.deactivate()
     assert victim._selecting is False
     assert victim._highlight is None
-    assert victim._samples == []
+    assert victim._samples is None
 
 
 def make_event(event_type):
@@ -126,7 +126,7 @@ def test_start_selection_emits_signal(victim, qtbot):
     with qtbot.waitSignal(victim.selectionStarted):
         victim._handle_mouse_press(event)
     assert victim._selecting is True
-    assert victim._samples == []
+    assert victim._samples is None
 
 
 def test_move_selection_updates_rectangle(victim, qtbot):
@@ -150,7 +150,7 @@ def test_stop_selection_emits_correct_signal(victim, qtbot):
     assert victim._selecting is False
     assert victim._selection_moved is False
     assert isinstance(victim._selection_rect, QRect)
-    assert len(victim._samples) > 0
+    assert victim._samples.count > 0
 
 
 def test_stop_selection_without_movement(victim, qtbot):
@@ -164,7 +164,7 @@ def test_stop_selection_without_movement(victim, qtbot):
 
     assert victim._selecting is False
     assert victim._selection_rect is None
-    assert victim._samples == []
+    assert victim._samples is None
 
 
 def test_sampling_selection_creates_samples_and_emits(victim, qtbot):
@@ -176,7 +176,7 @@ def test_sampling_selection_creates_samples_and_emits(victim, qtbot):
 
     assert isinstance(victim._sample_xs, np.ndarray)
     assert isinstance(victim._sample_ys, np.ndarray)
-    assert len(victim._samples) == 9  # 3x3 grid
+    assert victim._samples.count == 9  # 3x3 grid
 
 
 def test_update_highlight_creates_and_sets_rect(victim, mock_view):
@@ -234,7 +234,12 @@ def test_export_selection_points_calls_exporter(victim, mock_exporter, mock_cont
     victim._container = mock_container
 
     victim._export_selection_points(mock_exporter)
-    assert mock_container.hypercube.read_pixels.call_count == 1
+    mock_container.hypercube.read_subimage.assert_called_once()
+
+    rows, cols = mock_container.hypercube.read_subimage.call_args.args
+    np.testing.assert_array_equal(rows, victim._sample_ys)
+    np.testing.assert_array_equal(cols, victim._sample_xs)
+
     assert mock_exporter.export.call_count == 1
 
     call_args = mock_exporter.export.call_args
@@ -261,3 +266,42 @@ def test_handle_context_menu_adds_actions(victim, mock_exporter):
 
     assert menu.addMenu.call_count == 2
     assert menu.addMenu.return_value.addAction.call_count == 2
+
+    menu_grid = menu.addMenu.return_value.addMenu.return_value
+    assert menu_grid.addAction.call_count == len(AreaTool.GRID_SIZES)
+
+
+@pytest.mark.parametrize("size", [1, 10, 100])
+def test_sampling_uses_grid_size(victim, size):
+    victim._selection_rect = QRect(QPoint(0, 0), QPoint(199, 199))
+    victim.grid_size = size
+
+    victim._sample_selection()
+
+    assert len(victim._sample_xs) == size
+    assert len(victim._sample_ys) == size
+    assert victim._samples.count == size * size
+
+
+@pytest.mark.parametrize("size", [0, -1, 101])
+def test_grid_size_out_of_range_raises(victim, size):
+    with pytest.raises(ValueError):
+        victim.grid_size = size
+
+
+def test_grid_size_change_resamples_selection(victim, qtbot):
+    victim._selection_rect = QRect(QPoint(0, 0), QPoint(49, 49))
+    victim._sample_selection()
+
+    with qtbot.assertNotEmitted(victim.selectionMoved), qtbot.assertNotEmitted(victim.selectionStopped):
+        with qtbot.waitSignals([victim.selectionResampled, victim.selectionSampled], order="strict"):
+            victim.grid_size = 5
+
+    assert victim._samples.count == 25
+
+
+def test_grid_size_change_without_selection_does_not_sample(victim, qtbot):
+    with qtbot.assertNotEmitted(victim.selectionSampled):
+        victim.grid_size = 5
+
+    assert victim._samples is None
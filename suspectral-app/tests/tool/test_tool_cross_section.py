@@ -0,0 +1,153 @@
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtCore import QPointF, Qt, QEvent
+from PySide6.QtGui import QMouseEvent
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.tool.highlight_polyline import PolylineHighlight
+from suspectral.tool.tool_cross_section import CrossSectionTool
+from suspectral.view.image.image_view import ImageView
+
+
+@pytest.fixture
+def mock_view():
+    mock = MagicMock(spec=ImageView)
+    mock.mapToScene.side_effect = lambda p: QPointF(p)
+    mock.mapFromScene.side_effect = lambda p: QPointF(p).toPoint()
+    mock.image.mapFromScene.side_effect = lambda p: QPointF(p)
+    mock.image.mapToScene.side_effect = lambda p: p
+    mock.scene.return_value = MagicMock()
+    mock.viewport.return_value = MagicMock()
+    return mock
+
+
+@pytest.fixture
+def mock_container():
+    container = MagicMock(spec=HypercubeContainer)
+    container.hypercube.num_rows = 50
+    container.hypercube.num_cols = 40
+    return container
+
+
+@pytest.fixture
+def victim(qtbot, mock_view, mock_container):
+    return CrossSectionTool(mock_view, mock_container)
+
+
+def create_mouse_event(x, y, button=Qt.MouseButton.LeftButton, modifiers=Qt.KeyboardModifier.NoModifier):
+    event = MagicMock(spec=QMouseEvent)
+    event.button.return_value = button
+    event.position.return_value = QPointF(x, y)
+    event.modifiers.return_value = modifiers
+    return event
+
+
+def vertices(polyline):
+    return [(point.x(), point.y()) for point in polyline]
+
+
+def last_section(victim):
+    slot = MagicMock()
+    victim.sectionChanged.connect(slot)
+    return slot
+
+
+def click(victim, x, y):
+    victim._handle_mouse_press(create_mouse_event(x, y))
+    victim._handle_mouse_release(create_mouse_event(x, y))
+
+
+def drag(victim, start, end, modifiers=Qt.KeyboardModifier.NoModifier):
+    victim._handle_mouse_press(create_mouse_event(*start))
+    victim._handle_mouse_move(create_mouse_event(*end, modifiers=modifiers))
+    victim._handle_mouse_release(create_mouse_event(*end))
+
+
+def test_event_filter_handles_double_click(victim):
+    victim._handle_mouse_double_click = MagicMock(return_value=False)
+
+    event = MagicMock()
+    event.type.return_value = QEvent.Type.MouseButtonDblClick
+    victim.eventFilter(None, event)
+
+    victim._handle_mouse_double_click.assert_called_once()
+
+
+def test_dragging_draws_straight_line(victim):
+    slot = last_section(victim)
+    drag(victim, (5, 5), (20, 10))
+
+    assert vertices(slot.call_args.args[0]) == [(5, 5), (20, 10)]
+    assert victim._drawing is False
+    assert isinstance(victim._highlight, PolylineHighlight)
+
+
+def test_line_follows_mouse_while_drawing(victim, qtbot):
+    victim._handle_mouse_press(create_mouse_event(5, 5))
+
+    with qtbot.waitSignal(victim.sectionChanged) as blocker:
+        victim._handle_mouse_move(create_mouse_event(8, 9))
+
+    assert vertices(blocker.args[0]) == [(5, 5), (8, 9)]
+
+
+def test_shift_snaps_to_horizontal_and_vertical(victim):
+    drag(victim, (5, 5), (20, 8), Qt.KeyboardModifier.ShiftModifier)
+    assert vertices(victim.polyline) == [(5, 5), (20, 5)]
+
+    drag(victim, (30, 5), (32, 30), Qt.KeyboardModifier.ShiftModifier)
+    assert vertices(victim.polyline) == [(30, 5), (30, 30)]
+
+
+def test_clicks_place_polyline(victim, qtbot):
+    click(victim, 0, 0)
+    click(victim, 10, 0)
+    click(victim, 10, 10)
+
+    with qtbot.waitSignal(victim.sectionChanged) as blocker:
+        victim._handle_mouse_double_click(create_mouse_event(10, 10))
+
+    assert vertices(blocker.args[0]) == [(0, 0), (10, 0), (10, 10)]
+    assert victim._drawing is False
+
+
+def test_single_point_ends_section(victim, qtbot):
+    click(victim, 5, 5)
+
+    with qtbot.waitSignal(victim.sectionEnded):
+        victim._handle_mouse_double_click(create_mouse_event(5, 5))
+
+    assert victim._highlight is None
+
+
+def test_dragging_finished_line_moves_it(victim):
+    drag(victim, (5, 5), (5, 25))
+
+    slot = last_section(victim)
+    drag(victim, (6, 15), (16, 17))
+
+    assert vertices(slot.call_args.args[0]) == [(15, 7), (15, 27)]
+
+
+def test_pressing_away_from_line_starts_new_one(victim):
+    drag(victim, (5, 5), (5, 25))
+    drag(victim, (30, 5), (35, 5))
+
+    assert vertices(victim.polyline) == [(30, 5), (35, 5)]
+
+
+def test_points_are_clamped_to_image(victim):
+    point = victim._get_image_point(create_mouse_event(-10, 500))
+    assert point == QPointF(0, 50)
+
+
+def test_deactivate_resets(victim, qtbot):
+    victim.activate()
+    drag(victim, (5, 5), (20, 10))
+
+    with qtbot.waitSignal(victim.sectionEnded):
+        victim.deactivate()
+
+    assert victim._points == []
+    assert victim._highlight is None
@@ -176,3 +176,39 @@ def test_remove_crosshair_clears_scene(victim):
     victim._remove_crosshair()
     scene.removeItem.assert_called_once_with(item)
     assert victim._crosshair == []
+
+
+def test_handle_context_menu_requests_similarity(qtbot, victim):
+    victim._points = [QPoint(1, 2), QPoint(3, 4)]
+    menu = QMenu()
+    victim._handle_context_menu(menu)
+
+    similar = next(it for it in menu.findChildren(QMenu) if it.title() == "Find Similar")
+    assert similar.isEnabled()
+
+    with qtbot.waitSignal(victim.similarityRequested) as blocker:
+        similar.actions()[0].trigger()
+
+    assert blocker.args == [QPoint(3, 4), "angle"]
+
+
+def test_handle_context_menu_disables_similarity_without_points(qtbot, victim):
+    menu = QMenu()
+    victim._handle_context_menu(menu)
+
+    similar = next(it for it in menu.findChildren(QMenu) if it.title() == "Find Similar")
+    assert not similar.isEnabled()
+
+
+def test_handle_context_menu_requests_neighbours(qtbot, victim):
+    victim._points = [QPoint(1, 2), QPoint(3, 4)]
+    menu = QMenu()
+    victim._handle_context_menu(menu)
+
+    similar = next(it for it in menu.findChildren(QMenu) if it.title() == "Find Similar")
+    action = next(it for it in similar.actions() if it.text() == "Nearest Pixels (Indexed)")
+
+    with qtbot.waitSignal(victim.neighboursRequested) as blocker:
+        action.trigger()
+
+    assert blocker.args == [QPoint(3, 4)]
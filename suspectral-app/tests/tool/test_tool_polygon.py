@@ -0,0 +1,217 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPointF, Qt, QEvent, QPoint
+from PySide6.QtGui import QMouseEvent
+
+from suspectral.exporter.exporter import Exporter
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.tool.highlight_polygon import PolygonHighlight
+from suspectral.tool.tool_polygon import PolygonTool
+from suspectral.view.image.image_view import ImageView
+
+
+@pytest.fixture
+def mock_view():
+    mock = MagicMock(spec=ImageView)
+    mock.mapToScene.side_effect = lambda p: QPointF(p)
+    mock.mapFromScene.side_effect = lambda p: QPointF(p).toPoint()
+    mock.image.mapFromScene.side_effect = lambda p: QPointF(p)
+    mock.image.mapToScene.side_effect = lambda p: p
+    mock.scene.return_value = MagicMock()
+    mock.contextMenuRequested = MagicMock()
+    mock.viewport.return_value = MagicMock()
+    return mock
+
+
+@pytest.fixture
+def data():
+    return np.arange(50 * 40 * 3, dtype=np.float32).reshape(50, 40, 3)
+
+
+@pytest.fixture
+def mock_container(data):
+    container = MagicMock(spec=HypercubeContainer)
+    container.hypercube.name = "test_cube"
+    container.hypercube.wavelengths = np.array([1, 2, 3])
+    container.hypercube.num_rows, container.hypercube.num_cols, container.hypercube.num_bands = data.shape
+    container.hypercube.bytes_per_sample = data.itemsize
+    container.hypercube.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return container
+
+
+@pytest.fixture
+def mock_exporter():
+    exporter = MagicMock(spec=Exporter)
+    exporter.label = "Exporter1"
+    return exporter
+
+
+@pytest.fixture
+def victim(qtbot, mock_view, mock_container, mock_exporter):
+    return PolygonTool(mock_view, mock_container, [mock_exporter])
+
+
+def create_mouse_event(x, y, button=Qt.MouseButton.LeftButton):
+    event = MagicMock(spec=QMouseEvent)
+    event.button.return_value = button
+    event.position.return_value = QPointF(x, y)
+    return event
+
+
+def click(victim, x, y):
+    victim._handle_mouse_press(create_mouse_event(x, y))
+    victim._handle_mouse_release(create_mouse_event(x, y))
+
+
+def test_event_filter_handles_double_click(victim):
+    victim._handle_mouse_double_click = MagicMock(return_value=False)
+
+    event = MagicMock()
+    event.type.return_value = QEvent.Type.MouseButtonDblClick
+    victim.eventFilter(None, event)
+
+    victim._handle_mouse_double_click.assert_called_once()
+
+
+def test_first_click_starts_selection(victim, qtbot):
+    with qtbot.waitSignal(victim.selectionStarted) as blocker:
+        click(victim, 5, 5)
+
+    assert blocker.args == [QPointF(5, 5)]
+    assert victim._drawing is True
+    assert isinstance(victim._highlight, PolygonHighlight)
+
+
+def test_clicking_near_first_vertex_closes_polygon(victim, qtbot):
+    click(victim, 10, 10)
+    click(victim, 30, 10)
+    click(victim, 30, 20)
+
+    with qtbot.waitSignal(victim.selectionMasked) as blocker:
+        click(victim, 12, 11)
+
+    mask = blocker.args[0]
+    assert isinstance(mask, SelectionMask)
+    assert victim.mask is mask
+    assert victim._drawing is False
+    assert mask.rows == (10, 20)
+    assert mask.cols == (10, 30)
+
+
+def test_double_click_closes_polygon(victim, qtbot):
+    click(victim, 0, 0)
+    click(victim, 10, 0)
+    click(victim, 10, 10)
+    click(victim, 0, 10)
+
+    with qtbot.waitSignal(victim.selectionMasked):
+        victim._handle_mouse_double_click(create_mouse_event(0, 10))
+
+    assert victim.mask.count == 100
+
+
+def test_dragging_draws_lasso(victim, qtbot):
+    victim._handle_mouse_press(create_mouse_event(0, 0))
+    for x, y in [(20, 0), (20, 20), (0, 20)]:
+        victim._handle_mouse_move(create_mouse_event(x, y))
+
+    with qtbot.waitSignal(victim.selectionMasked):
+        victim._handle_mouse_release(create_mouse_event(0, 20))
+
+    assert victim.mask.count == 400
+
+
+def test_jitter_while_clicking_does_not_draw_lasso(victim, qtbot):
+    click(victim, 10, 10)
+    click(victim, 30, 10)
+
+    victim._handle_mouse_press(create_mouse_event(30, 20))
+    victim._handle_mouse_move(create_mouse_event(31, 20))
+
+    with qtbot.assertNotEmitted(victim.selectionMasked):
+        victim._handle_mouse_release(create_mouse_event(31, 20))
+
+    assert victim._drawing is True
+    assert len(victim._points) == 3
+
+
+def test_degenerate_polygon_ends_selection(victim, qtbot):
+    click(victim, 5, 5)
+    click(victim, 10, 10)
+
+    with qtbot.waitSignal(victim.selectionEnded):
+        victim._handle_mouse_double_click(create_mouse_event(10, 10))
+
+    assert victim.mask is None
+    assert victim._highlight is None
+
+
+def test_hover_previews_next_vertex(victim):
+    click(victim, 5, 5)
+    victim._handle_mouse_move(create_mouse_event(8, 9))
+
+    assert victim._points == [QPointF(5, 5)]
+    assert victim._cursor == QPointF(8, 9)
+
+
+def test_points_are_clamped_to_image(victim):
+    point = victim._get_image_point(create_mouse_event(-10, 500))
+    assert point == QPointF(0, 50)
+
+
+def test_selection_sampled_is_thinned(victim, qtbot):
+    victim.SAMPLE_LIMIT = 10
+    victim._handle_mouse_press(create_mouse_event(0, 0))
+    for x, y in [(40, 0), (40, 50), (0, 50)]:
+        victim._handle_mouse_move(create_mouse_event(x, y))
+
+    with qtbot.waitSignal(victim.selectionSampled) as blocker:
+        victim._handle_mouse_release(create_mouse_event(0, 50))
+
+    assert blocker.args[0].count == 10
+    assert victim.mask.count == 2000
+
+
+def test_export_selection(victim, mock_exporter, data):
+    victim._mask = SelectionMask(np.array([[True, False], [False, True]]), top=1, left=2)
+    victim._export_selection(mock_exporter)
+
+    name, spectra, wavelengths = mock_exporter.export.call_args.args
+    assert name == "test_cube"
+    np.testing.assert_array_equal(spectra, [data[1, 2], data[2, 3]])
+
+
+def test_export_statistics(victim, mock_exporter, data):
+    victim._mask = SelectionMask(np.ones((2, 2), dtype=bool))
+    victim._export_statistics(mock_exporter)
+
+    name, statistics, wavelengths = mock_exporter.export.call_args.args
+    assert statistics.shape == (4, 3)
+    np.testing.assert_allclose(statistics[0], data[:2, :2].reshape(-1, 3).mean(axis=0))
+
+
+def test_context_menu_disabled_without_selection(victim):
+    menu = MagicMock()
+    victim._handle_context_menu(menu)
+
+    actions = [call.args[0] for call in menu.addMenu.return_value.addAction.call_args_list]
+    assert [action.text() for action in actions] == [
+        "Export All to Exporter1",
+        "Export Statistics to Exporter1",
+    ]
+    assert not any(action.isEnabled() for action in actions)
+
+
+def test_deactivate_resets(victim, qtbot):
+    victim.activate()
+    click(victim, 5, 5)
+
+    with qtbot.waitSignal(victim.selectionEnded):
+        victim.deactivate()
+
+    assert victim._drawing is False
+    assert victim._points == []
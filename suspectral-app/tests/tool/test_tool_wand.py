@@ -0,0 +1,202 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPointF, Qt, QEvent
+from PySide6.QtGui import QMouseEvent
+
+from suspectral.exporter.exporter import Exporter
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.tool.highlight_mask import MaskHighlight
+from suspectral.tool.tool_wand import WandTool
+from suspectral.view.image.image_view import ImageView
+from suspectral.worker.worker import join_workers
+
+
+@pytest.fixture
+def mock_view():
+    mock = MagicMock(spec=ImageView)
+    mock.mapToScene.side_effect = lambda p: QPointF(p)
+    mock.image.mapFromScene.side_effect = lambda p: QPointF(p)
+    mock.image.mapToScene.side_effect = lambda p: p
+    mock.scene.return_value = MagicMock()
+    mock.contextMenuRequested = MagicMock()
+    mock.viewport.return_value = MagicMock()
+    return mock
+
+
+@pytest.fixture
+def data():
+    data = np.tile(np.array([1.0, 0.2, 0.1], dtype=np.float32), (50, 40, 1))
+    data[5:15, 10:30] = [0.1, 0.9, 1.0]
+    data[15:25, 10:30] = [0.1, 0.8, 1.0]
+    return data
+
+
+@pytest.fixture
+def mock_container(data):
+    container = MagicMock(spec=HypercubeContainer)
+    container.hypercube.name = "test_cube"
+    container.hypercube.wavelengths = np.array([1, 2, 3])
+    container.hypercube.num_rows, container.hypercube.num_cols, container.hypercube.num_bands = data.shape
+    container.hypercube.bytes_per_sample = data.itemsize
+    container.hypercube.read_pixel.side_effect = lambda row, col: data[row, col]
+    container.hypercube.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return container
+
+
+@pytest.fixture
+def mock_exporter():
+    exporter = MagicMock(spec=Exporter)
+    exporter.label = "Exporter1"
+    return exporter
+
+
+@pytest.fixture
+def victim(qtbot, mock_view, mock_container, mock_exporter):
+    victim = WandTool(mock_view, mock_container, [mock_exporter])
+    yield victim
+    join_workers(victim)
+
+
+def create_mouse_event(x, y, button=Qt.MouseButton.LeftButton):
+    event = MagicMock(spec=QMouseEvent)
+    event.button.return_value = button
+    event.position.return_value = QPointF(x, y)
+    return event
+
+
+def test_event_filter_handles_mouse_press(victim):
+    victim._handle_mouse_press = MagicMock(return_value=False)
+
+    event = MagicMock()
+    event.type.return_value = QEvent.Type.MouseButtonPress
+    victim.eventFilter(None, event)
+
+    victim._handle_mouse_press.assert_called_once()
+
+
+def test_click_grows_selection(victim, qtbot):
+    with qtbot.waitSignal(victim.selectionStarted) as started:
+        with qtbot.waitSignal(victim.selectionMasked) as masked:
+            victim._handle_mouse_press(create_mouse_event(12, 7))
+
+    mask = masked.args[0]
+    assert started.args == [QPointF(12, 7)]
+    assert isinstance(mask, SelectionMask)
+    assert victim.mask is mask
+    assert mask.rows == (5, 25)
+    assert mask.cols == (10, 30)
+    assert mask.count == 400
+    assert isinstance(victim._highlight, MaskHighlight)
+
+
+def test_changing_tolerance_regrows_selection(victim, qtbot):
+    with qtbot.waitSignal(victim.selectionMasked):
+        victim._handle_mouse_press(create_mouse_event(12, 7))
+
+    assert victim.mask.count == 400
+
+    with qtbot.waitSignal(victim.selectionMasked):
+        victim.set_tolerance(1.0)
+
+    assert victim.tolerance == 1.0
+    assert victim.mask.rows == (5, 15)
+    assert victim.mask.count == 200
+
+
+def test_click_outside_image_is_ignored(victim, qtbot):
+    with qtbot.assertNotEmitted(victim.selectionStarted):
+        victim._handle_mouse_press(create_mouse_event(-1, 60))
+
+    assert victim.mask is None
+
+
+def test_right_click_is_ignored(victim, qtbot):
+    with qtbot.assertNotEmitted(victim.selectionStarted):
+        victim._handle_mouse_press(create_mouse_event(12, 7, Qt.MouseButton.RightButton))
+
+
+def test_invalid_seed_ends_selection(victim, data, qtbot):
+    data[0, 0] = np.nan
+
+    with qtbot.waitSignal(victim.selectionEnded):
+        victim._handle_mouse_press(create_mouse_event(0, 0))
+
+    assert victim.mask is None
+    assert victim._highlight is None
+
+
+def test_selection_sampled_is_thinned(victim, qtbot):
+    victim.SAMPLE_LIMIT = 10
+
+    with qtbot.waitSignal(victim.selectionSampled) as blocker:
+        victim._handle_mouse_press(create_mouse_event(12, 7))
+
+    assert blocker.args[0].count == 10
+    assert victim.mask.count == 400
+
+
+def test_new_click_abandons_pending_selection(victim, qtbot):
+    with qtbot.waitSignal(victim.selectionMasked) as masked:
+        victim._handle_mouse_press(create_mouse_event(12, 7))
+        victim._handle_mouse_press(create_mouse_event(1, 1))
+
+    assert masked.args[0].rows == (0, 50)
+    assert victim.mask is masked.args[0]
+
+
+def test_busy_cursor_while_growing(victim, mock_view, qtbot):
+    victim._handle_mouse_press(create_mouse_event(12, 7))
+    mock_view.setCursor.assert_called_with(Qt.CursorShape.BusyCursor)
+
+    qtbot.waitUntil(lambda: victim._worker is None, timeout=1000)
+    mock_view.setCursor.assert_called_with(Qt.CursorShape.CrossCursor)
+
+
+def test_export_selection(victim, mock_exporter, data):
+    victim._mask = SelectionMask(np.array([[True, False], [False, True]]), top=1, left=2)
+    victim._export_selection(mock_exporter)
+
+    name, spectra, wavelengths = mock_exporter.export.call_args.args
+    assert name == "test_cube"
+    np.testing.assert_array_equal(spectra, [data[1, 2], data[2, 3]])
+
+
+def test_export_statistics(victim, mock_exporter, data):
+    victim._mask = SelectionMask(np.ones((2, 2), dtype=bool))
+    victim._export_statistics(mock_exporter)
+
+    name, statistics, wavelengths = mock_exporter.export.call_args.args
+    assert statistics.shape == (4, 3)
+    np.testing.assert_allclose(statistics[0], data[:2, :2].reshape(-1, 3).mean(axis=0))
+
+
+def test_context_menu_disabled_without_selection(victim):
+    menu = MagicMock()
+    victim._handle_context_menu(menu)
+
+    menu_wand = menu.addMenu.return_value
+    actions = [call.args[0] for call in menu_wand.addAction.call_args_list]
+    assert [action.text() for action in actions] == [
+        "Export All to Exporter1",
+        "Export Statistics to Exporter1",
+    ]
+    assert not any(action.isEnabled() for action in actions)
+
+    tolerances = [call.args[0] for call in menu_wand.addMenu.return_value.addAction.call_args_list]
+    assert [action.text() for action in tolerances] == ["1°", "2°", "5°", "10°", "20°"]
+    assert [action.isChecked() for action in tolerances] == [False, False, True, False, False]
+
+
+def test_deactivate_resets(victim, qtbot):
+    victim.activate()
+    victim._handle_mouse_press(create_mouse_event(12, 7))
+
+    with qtbot.waitSignal(victim.selectionEnded):
+        victim.deactivate()
+
+    assert victim.mask is None
+    assert victim._highlight is None
@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.calibration_button import CalibrationButton
+
+
+@pytest.fixture
+def mock_model():
+    model = MagicMock(spec=HypercubeContainer)
+    model.hypercube = MagicMock()
+    model.hypercube.calibrated = False
+    model.is_calibrating.return_value = False
+    return model
+
+
+@pytest.fixture
+def white_ref_select():
+    return MagicMock()
+
+
+@pytest.fixture
+def black_ref_select():
+    return MagicMock()
+
+
+@pytest.fixture
+def victim(qtbot, mock_model, white_ref_select, black_ref_select):
+    victim = CalibrationButton(mock_model, white_ref_select, black_ref_select)
+    qtbot.addWidget(victim)
+    return victim
+
+
+def test_initialization(victim):
+    assert victim.text() == "Calibrate Reflectance"
+
+
+def test_click_calibrates_with_references(victim, mock_model, white_ref_select, black_ref_select):
+    white_ref_select.get.return_value = np.full(5, 2.0)
+    black_ref_select.get.return_value = None
+
+    victim.click()
+
+    mock_model.calibrate.assert_called_once_with(white_ref_select.get.return_value, None)
+
+
+def test_click_without_references_does_nothing(victim, mock_model, white_ref_select, black_ref_select):
+    white_ref_select.get.return_value = None
+    black_ref_select.get.return_value = None
+
+    victim.click()
+
+    mock_model.calibrate.assert_not_called()
+
+
+def test_click_removes_calibration(victim, mock_model):
+    mock_model.hypercube.calibrated = True
+    victim._handle_calibration_changed(mock_model.hypercube)
+    assert victim.text() == "Remove Calibration"
+
+    victim.click()
+
+    mock_model.remove_calibration.assert_called_once_with()
+    mock_model.calibrate.assert_not_called()
+
+
+def test_shows_progress_of_current_hypercube(victim, mock_model):
+    mock_model.is_calibrating.return_value = True
+    victim._handle_calibration_changed(mock_model.hypercube)
+    assert victim.text() == "Cancel Calibration"
+
+    victim._handle_calibration_progress(MagicMock(), 40)
+    assert victim.text() == "Cancel Calibration"
+
+    victim._handle_calibration_progress(mock_model.hypercube, 40)
+    assert victim.text() == "Cancel Calibration (40%)"
@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.coloring_mode_band_math import ColoringModeBandMath
+
+
+@pytest.fixture
+def mock_model():
+    model = MagicMock(spec=HypercubeContainer)
+    model.hypercube = MagicMock()
+    model.hypercube.num_bands = 10
+    model.hypercube.wavelengths = np.linspace(400, 850, 10)
+    return model
+
+
+@pytest.fixture
+def victim(qtbot, mock_model):
+    victim = ColoringModeBandMath(model=mock_model)
+    qtbot.addWidget(victim)
+    return victim
+
+
+def test_initialization(victim):
+    assert not victim._evaluate.isEnabled()
+
+
+def test_valid_expression_enables_evaluation(victim):
+    victim._expression_field.setText("w[850] - b[2]")
+
+    assert victim._evaluate.isEnabled()
+    assert victim._expression.bands == [2, 9]
+    assert victim._message.text() == "Reads bands 2, 9."
+
+
+def test_invalid_expression_shows_error(victim):
+    victim._expression_field.setText("b[42]")
+
+    assert not victim._evaluate.isEnabled()
+    assert "does not exist" in victim._message.text()
+
+
+def test_evaluation_starts_worker(victim):
+    victim._expression_field.setText("b[1] / b[2]")
+
+    with patch("suspectral.view.image.coloring_mode_band_math.BandMathWorker") as worker, \
+            patch("suspectral.view.image.coloring_mode_band_math.start_worker") as start, \
+            patch("suspectral.view.image.coloring_mode_band_math.QProgressDialog"):
+        victim._handle_evaluation()
+
+    worker.assert_called_once_with(victim._model.hypercube, victim._expression)
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_set_values_renders_colormap(qtbot, victim):
+    values = np.linspace(0, 1, 100, dtype=np.float32).reshape(10, 10)
+    values[0, 0] = np.nan
+
+    with qtbot.waitSignal(victim.imageChanged) as blocker:
+        victim.set_values(values)
+
+    image = blocker.args[0]
+    assert image.shape == (10, 10, 3)
+    assert image.min() >= 0.0 and image.max() <= 1.0
+    np.testing.assert_array_equal(image[0, 0], [0, 0, 0])
+    assert victim._range == pytest.approx(tuple(np.percentile(values[np.isfinite(values)], [2, 98])))
+
+
+def test_colormap_change_rerenders_without_evaluation(qtbot, victim):
+    victim.set_values(np.linspace(0, 1, 100, dtype=np.float32).reshape(10, 10))
+
+    with patch("suspectral.view.image.coloring_mode_band_math.BandMathWorker") as worker, \
+            qtbot.waitSignal(victim.imageChanged):
+        victim._colormap_dropdown.setCurrentText("inferno")
+
+    worker.assert_not_called()
+
+
+def test_hypercube_opened_revalidates_expression(qtbot, victim, mock_model):
+    victim._expression_field.setText("b[9]")
+    mock_model.hypercube.num_bands = 5
+
+    with qtbot.waitSignal(victim.statusChanged):
+        victim._handle_hypercube_opened(mock_model.hypercube)
+
+    assert victim._expression is None
+    assert not victim._evaluate.isEnabled()
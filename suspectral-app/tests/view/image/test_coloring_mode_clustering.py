@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.coloring_mode_clustering import ColoringModeClustering
+
+
+@pytest.fixture
+def mock_model():
+    model = MagicMock(spec=HypercubeContainer)
+    model.hypercube = MagicMock()
+    return model
+
+
+@pytest.fixture
+def victim(qtbot, mock_model):
+    victim = ColoringModeClustering(model=mock_model)
+    qtbot.addWidget(victim)
+    return victim
+
+
+def test_initialization(victim):
+    assert victim._generate.isEnabled()
+    assert victim._legend.rowCount() == 0
+
+
+def test_clustered_renders_labels_and_legend(qtbot, victim):
+    victim._worker = MagicMock()
+    victim.sender = lambda: victim._worker
+
+    labels = np.array([[0, 1], [1, -1]])
+    centroids = np.array([[1.0, 2.0, 3.0], [3.0, 2.0, 1.0]])
+    with qtbot.waitSignal(victim.imageChanged) as image_blocker, \
+            qtbot.waitSignal(victim.centroidsChanged) as centroid_blocker:
+        victim._handle_clustered(labels, centroids)
+
+    image = image_blocker.args[0]
+    assert image.shape == (2, 2, 3)
+    np.testing.assert_array_equal(image[1, 1], [0, 0, 0])
+    np.testing.assert_array_equal(image[0, 1], image[1, 0])
+    np.testing.assert_array_equal(centroid_blocker.args[0], centroids)
+
+    assert victim._legend.rowCount() == 3
+    assert [victim._legend.item(row, 1).text() for row in range(3)] == ["Cluster 1", "Cluster 2", "Unclassified"]
+    assert [victim._legend.item(row, 2).text() for row in range(3)] == ["1", "2", "1"]
+
+
+def test_stale_results_are_ignored(qtbot, victim):
+    victim._worker = MagicMock()
+    victim.sender = lambda: MagicMock()
+
+    with qtbot.assertNotEmitted(victim.imageChanged):
+        victim._handle_clustered(np.zeros((2, 2), dtype=int), np.zeros((1, 3)))
+
+
+def test_activate_restores_clusters(qtbot, victim):
+    victim.set_clusters(np.zeros((2, 2), dtype=int), np.zeros((1, 3)))
+
+    with qtbot.waitSignal(victim.imageChanged), qtbot.waitSignal(victim.centroidsChanged):
+        victim.activate()
+
+
+def test_clustering_starts_worker(victim, mock_model):
+    victim._clusters.setValue(5)
+
+    with patch("suspectral.view.image.coloring_mode_clustering.ClusteringWorker") as worker, \
+            patch("suspectral.view.image.coloring_mode_clustering.start_worker") as start, \
+            patch("suspectral.view.image.coloring_mode_clustering.QProgressDialog"):
+        victim._handle_clustering()
+
+    worker.assert_called_once_with(hypercube=mock_model.hypercube, num_clusters=5)
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_hypercube_opened_resets(qtbot, victim):
+    victim.set_clusters(np.zeros((2, 2), dtype=int), np.zeros((1, 3)))
+
+    with qtbot.waitSignal(victim.statusChanged) as blocker:
+        victim._handle_hypercube_opened(MagicMock())
+
+    assert blocker.args == [True]
+    assert victim._legend.rowCount() == 0
+    assert victim._image is None
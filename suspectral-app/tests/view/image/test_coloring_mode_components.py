@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.coloring_mode_components import ColoringModeComponents
+from suspectral.worker.worker_components import ComponentsWorker
+
+
+@pytest.fixture
+def mock_model():
+    model = MagicMock(spec=HypercubeContainer)
+    model.hypercube = MagicMock()
+    return model
+
+
+@pytest.fixture
+def victim(qtbot, mock_model):
+    victim = ColoringModeComponents(model=mock_model)
+    qtbot.addWidget(victim)
+    return victim
+
+
+@pytest.fixture
+def scores():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(10, 8, 4)).astype(np.float32)
+
+
+def test_initialization(victim):
+    assert all(not channel.isEnabled() for channel in victim._channels)
+
+
+def test_set_components_renders_image(qtbot, victim, scores):
+    with qtbot.waitSignal(victim.imageChanged) as blocker:
+        victim.set_components(ComponentsWorker.PCA, scores, np.array([4.0, 3.0, 2.0, 1.0]))
+
+    image = blocker.args[0]
+    assert image.shape == (10, 8, 3)
+    assert image.min() >= 0.0 and image.max() <= 1.0
+
+    channel = victim._channels[0]
+    assert channel.isEnabled()
+    assert channel.count() == 4
+    assert channel.itemText(0) == "PC 1 (40.0%)"
+    assert [it.currentIndex() for it in victim._channels] == [0, 1, 2]
+
+
+def test_switching_components_does_not_recompute(qtbot, victim, scores):
+    victim.set_components(ComponentsWorker.PCA, scores, np.ones(4))
+
+    with patch("suspectral.view.image.coloring_mode_components.ComponentsWorker") as worker, \
+            qtbot.waitSignal(victim.imageChanged) as blocker:
+        victim._channels[0].setCurrentIndex(3)
+
+    worker.assert_not_called()
+    lo, hi = np.percentile(scores[..., 3], ColoringModeComponents.STRETCH_PERCENTILES)
+    expected = np.clip((scores[..., 3] - lo) / (hi - lo), 0, 1)
+    np.testing.assert_allclose(blocker.args[0][..., 0], expected, atol=1e-6)
+
+
+def test_switching_transform_uses_cached_result(qtbot, victim, scores):
+    victim.set_components(ComponentsWorker.MNF, scores, np.array([50.0, 5.0, 2.0, 1.0]))
+    assert not victim._channels[0].isEnabled()
+
+    with qtbot.waitSignal(victim.imageChanged):
+        victim._transform_dropdown.setCurrentIndex(1)
+
+    assert victim._channels[0].itemText(0) == "MNF 1 (SNR 50)"
+
+
+def test_generation_passes_cached_statistics(victim):
+    victim._covariance = MagicMock()
+    victim._noise = MagicMock()
+
+    with patch("suspectral.view.image.coloring_mode_components.ComponentsWorker") as worker, \
+            patch("suspectral.view.image.coloring_mode_components.start_worker") as start, \
+            patch("suspectral.view.image.coloring_mode_components.QProgressDialog"):
+        victim._handle_generation()
+
+    kwargs = worker.call_args.kwargs
+    assert kwargs["covariance"] is victim._covariance
+    assert kwargs["noise"] is victim._noise
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_hypercube_opened_drops_results(qtbot, victim, scores, mock_model):
+    victim.set_components(ComponentsWorker.PCA, scores, np.ones(4))
+
+    with qtbot.waitSignal(victim.statusChanged):
+        victim._handle_hypercube_opened(mock_model.hypercube)
+
+    assert victim._results == {}
+    assert not victim._channels[0].isEnabled()
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.view.image.coloring_mode_library import ColoringModeLibrary
+
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / "a.csv").write_text("Wavelength,A\n400,1\n700,0\n")
+    (tmp_path / "b.csv").write_text("Wavelength,B\n400,0\n700,1\n")
+    return tmp_path
+
+
+@pytest.fixture
+def mock_model():
+    model = MagicMock(spec=HypercubeContainer)
+    model.hypercube = MagicMock()
+    model.hypercube.wavelengths = np.array([400.0, 500.0, 600.0, 700.0])
+    return model
+
+
+@pytest.fixture
+def victim(qtbot, mock_model):
+    victim = ColoringModeLibrary(model=mock_model)
+    qtbot.addWidget(victim)
+    return victim
+
+
+def test_initialization(victim):
+    assert not victim._generate.isEnabled()
+    assert victim._legend.rowCount() == 0
+
+
+def test_set_library(victim, directory):
+    assert victim.set_library(str(directory))
+
+    assert victim._generate.isEnabled()
+    assert victim._references.shape == (2, 4)
+    assert victim._library_field.text() == directory.name
+
+
+def test_set_invalid_library(victim, tmp_path):
+    with patch("suspectral.view.image.coloring_mode_library.QMessageBox.critical") as critical:
+        assert not victim.set_library(str(tmp_path))
+
+    critical.assert_called_once()
+    assert not victim._generate.isEnabled()
+
+
+def test_classified_renders_labels_and_legend(qtbot, victim, directory):
+    victim.set_library(str(directory))
+    victim._worker = MagicMock()
+    victim.sender = lambda: victim._worker
+
+    labels = np.array([[0, 1], [1, -1]])
+    with qtbot.waitSignal(victim.imageChanged) as blocker:
+        victim._handle_classified(labels, np.zeros((2, 2)))
+
+    image = blocker.args[0]
+    assert image.shape == (2, 2, 3)
+    np.testing.assert_array_equal(image[1, 1], [0, 0, 0])
+    np.testing.assert_array_equal(image[0, 1], image[1, 0])
+
+    assert victim._legend.rowCount() == 3
+    assert [victim._legend.item(row, 1).text() for row in range(3)] == ["a", "b", "Unclassified"]
+    assert [victim._legend.item(row, 2).text() for row in range(3)] == ["1", "2", "1"]
+
+
+def test_classification_starts_worker(victim, directory):
+    victim.set_library(str(directory))
+
+    with patch("suspectral.view.image.coloring_mode_library.ClassificationWorker") as worker, \
+            patch("suspectral.view.image.coloring_mode_library.start_worker") as start, \
+            patch("suspectral.view.image.coloring_mode_library.QProgressDialog"):
+        victim._handle_classification()
+
+    kwargs = worker.call_args.kwargs
+    assert kwargs["hypercube"] is victim._model.hypercube
+    assert kwargs["metric"] == "angle"
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_hypercube_opened_resets_library(qtbot, victim, directory, mock_model):
+    victim.set_library(str(directory))
+
+    with qtbot.waitSignal(victim.statusChanged) as blocker:
+        victim._handle_hypercube_opened(mock_model.hypercube)
+
+    assert blocker.args == [True]
+    assert victim._library is None
+    assert not victim._generate.isEnabled()
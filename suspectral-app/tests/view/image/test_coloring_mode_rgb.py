@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from PySide6.QtCore import QObject, Signal
+from spectral import get_rgb
 
 from suspectral.view.image.coloring_mode_rgb import ColoringModeRGB
 
@@ -12,8 +13,20 @@ class DummyHypercube:
         self.default_bands = default_bands or [0, 1, 2]
         self.wavelengths_unit = wavelengths_unit
 
-    def get_rgb(self, r, g, b):
-        return f"rgb_{r}_{g}_{b}"
+        self.data = np.arange(4 * 3 * num_bands, dtype=np.int16).reshape(4, 3, num_bands) % 7
+        self.num_rows, self.num_cols = self.data.shape[:2]
+        self.bytes_per_sample = self.data.itemsize
+        self.cache = {}
+
+    def get_cached(self, key):
+        return self.cache.get(key)
+
+    def set_cached(self, key, value, num_bytes=None):
+        self.cache[key] = value
+
+    def read_subregion(self, rows, cols, bands=None):
+        block = self.data[rows[0]:rows[1], cols[0]:cols[1]]
+        return block if bands is None else block[:, :, bands]
 
 
 class DummyHypercubeContainer(QObject):
@@ -87,10 +100,10 @@ def test_on_band_changed_emits_image_changed(victim, qtbot):
     victim._band_b = 2
     victim._model.hypercube = DummyHypercube()
 
-    with qtbot.waitSignal(victim.imageChanged, timeout=500) as blocker:
+    with qtbot.waitSignal(victim.imageChanged, timeout=5000) as blocker:
         victim._on_r_changed(3)
 
-    assert blocker.args[0] == "rgb_3_1_2"
+    assert np.allclose(blocker.args[0], get_rgb(victim._model.hypercube.data, [3, 1, 2]))
 
 
 def test_start_emits_initial_rgb(victim, qtbot):
@@ -100,10 +113,22 @@ def test_start_emits_initial_rgb(victim, qtbot):
     victim._band_b = 3
     victim._model.hypercube = DummyHypercube()
 
-    with qtbot.waitSignal(victim.imageChanged, timeout=500) as blocker:
+    with qtbot.waitSignal(victim.imageChanged, timeout=5000) as blocker:
+        victim.activate()
+
+    assert np.allclose(blocker.args[0], get_rgb(victim._model.hypercube.data, [1, 2, 3]))
+
+def test_cached_image_is_emitted_without_rendering(victim, qtbot, mocker):
+    start = mocker.patch("suspectral.view.image.coloring_mode_rgb.start_worker")
+    victim._band_r, victim._band_g, victim._band_b = 1, 2, 3
+    victim._model.hypercube = DummyHypercube()
+    victim._model.hypercube.cache[("bands", (1, 2, 3))] = image = np.zeros((4, 3, 3))
+
+    with qtbot.waitSignal(victim.imageChanged, timeout=1000) as blocker:
         victim.activate()
 
-    assert blocker.args[0] == "rgb_1_2_3"
+    assert blocker.args[0] is image
+    start.assert_not_called()
 
 def test_handle_hypercube_opened_without_wavelength(victim, hypercube_container, qtbot):
     hypercube = DummyHypercube(num_bands=3, wavelengths=None)
@@ -125,10 +150,10 @@ def test_on_g_changed_emits_correct_rgb(victim, qtbot):
     victim._band_b = 3
     victim._model.hypercube = DummyHypercube()
 
-    with qtbot.waitSignal(victim.imageChanged) as blocker:
+    with qtbot.waitSignal(victim.imageChanged, timeout=5000) as blocker:
         victim._on_g_changed(4)
 
-    assert blocker.args[0] == "rgb_1_4_3"
+    assert np.allclose(blocker.args[0], get_rgb(victim._model.hypercube.data, [1, 4, 3]))
 
 def test_on_b_changed_emits_correct_rgb(victim, qtbot):
     victim._indexing = "Band Number"
@@ -137,10 +162,10 @@ def test_on_b_changed_emits_correct_rgb(victim, qtbot):
     victim._band_b = 3
     victim._model.hypercube = DummyHypercube()
 
-    with qtbot.waitSignal(victim.imageChanged) as blocker:
+    with qtbot.waitSignal(victim.imageChanged, timeout=5000) as blocker:
         victim._on_b_changed(0)
 
-    assert blocker.args[0] == "rgb_1_2_0"
+    assert np.allclose(blocker.args[0], get_rgb(victim._model.hypercube.data, [1, 2, 0]))
 
 def test_get_band_index_wavelength_mode(victim):
     victim._indexing = "Wavelength"
@@ -148,3 +173,38 @@ def test_get_band_index_wavelength_mode(victim):
 
     index = victim._get_band_index(570)
     assert index == 1
+
+
+def test_superseded_render_is_discarded(victim, qtbot):
+    victim._indexing = "Band Number"
+    victim._band_r = 1
+    victim._band_g = 2
+    victim._band_b = 3
+    victim._model.hypercube = DummyHypercube()
+
+    images = []
+    victim.imageChanged.connect(images.append)
+    victim._on_r_changed(0)
+
+    with qtbot.waitSignal(victim.imageChanged, timeout=5000):
+        victim._on_g_changed(4)
+
+    qtbot.waitUntil(lambda: victim._worker is None, timeout=5000)
+    assert len(images) == 1
+    assert np.allclose(images[0], get_rgb(victim._model.hypercube.data, [0, 4, 3]))
+
+
+def test_deactivate_stops_render(victim, qtbot):
+    victim._band_r = 1
+    victim._band_g = 2
+    victim._band_b = 3
+    victim._model.hypercube = DummyHypercube()
+
+    images = []
+    victim.imageChanged.connect(images.append)
+    victim.activate()
+    victim.deactivate()
+
+    qtbot.wait(100)
+    assert victim._worker is None
+    assert images == []
@@ -113,3 +113,26 @@ def test_handle_cancel_stops_worker(_mock_dialog_cls, _mock_synth_cls, victim):
     victim._worker = mock_worker
     victim._handle_cancel()
     mock_worker.stop.assert_called_once()
+
+
+@patch("suspectral.view.image.coloring_mode_srf.QThread")
+@patch("suspectral.view.image.coloring_mode_srf.SynthesizerSRF")
+@patch("suspectral.view.image.coloring_mode_srf.QProgressDialog")
+def test_handle_synthesis_preview(_mock_dialog_cls, mock_synth_cls, _mock_qthread_cls, victim, mock_model):
+    mock_model.hypercube.num_rows = 10
+    mock_model.hypercube.num_cols = 7
+    victim._preview_checkbox.setChecked(True)
+
+    victim._handle_synthesis()
+
+    mock_model.hypercube.view.assert_called_once_with(binning=(4, 4, 1))
+    assert mock_synth_cls.call_args.kwargs["hypercube"] is mock_model.hypercube.view.return_value
+
+    victim.imageChanged = MagicMock()
+    image = np.arange(3 * 2 * 3).reshape(3, 2, 3)
+    victim._handle_produced(image)
+
+    enlarged = victim.imageChanged.emit.call_args.args[0]
+    assert enlarged.shape == (10, 7, 3)
+    np.testing.assert_array_equal(enlarged[9, 6], image[2, 1])
+    np.testing.assert_array_equal(enlarged[3, 4], image[0, 1])
@@ -0,0 +1,179 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPoint
+
+from suspectral.model.hypercube_container import HypercubeContainer
+from suspectral.model.unmixing import Unmixing
+from suspectral.view.image.coloring_mode_unmixing import ColoringModeUnmixing
+
+
+@pytest.fixture
+def mock_model():
+    model = MagicMock(spec=HypercubeContainer)
+    model.hypercube = MagicMock()
+    model.hypercube.wavelengths = np.array([400.0, 500.0, 600.0, 700.0])
+    model.hypercube.read_pixel.side_effect = lambda row, col: np.array([row, col, 1.0, 0.0])
+    return model
+
+
+@pytest.fixture
+def victim(qtbot, mock_model):
+    victim = ColoringModeUnmixing(model=mock_model)
+    qtbot.addWidget(victim)
+    return victim
+
+
+def test_initialization(victim):
+    assert not victim._unmix.isEnabled()
+    assert victim._endmember_list.count() == 0
+
+
+def test_add_pixel_endmember(victim):
+    victim.add_reference_points([QPoint(1, 2), QPoint(3, 4)])
+    victim._pixel_select._select.setCurrentIndex(2)
+
+    victim._add_pixel()
+
+    assert victim._unmix.isEnabled()
+    assert victim._names == ["Pixel (3, 4)"]
+    np.testing.assert_array_equal(victim._endmembers[0], [4, 3, 1, 0])
+
+
+def test_add_pixel_without_selection(victim):
+    victim.add_reference_point(QPoint(1, 2))
+    victim._add_pixel()
+    assert victim._endmember_list.count() == 0
+
+
+def test_add_library(victim, tmp_path):
+    path = tmp_path / "minerals.csv"
+    path.write_text("Wavelength,A,B\n450,1,0\n700,0,1\n")
+
+    assert victim.add_library(str(path))
+
+    assert victim._names == ["minerals (A)", "minerals (B)"]
+    assert np.isnan(victim._endmembers[0][0])
+    np.testing.assert_allclose(victim._endmembers[0][1:], [0.8, 0.4, 0.0])
+
+
+def test_add_invalid_library(victim, tmp_path):
+    path = tmp_path / "invalid.csv"
+    path.write_text("Band,A\n1,2\n")
+
+    with patch("suspectral.view.image.coloring_mode_unmixing.QMessageBox.critical") as critical:
+        assert not victim.add_library(str(path))
+
+    critical.assert_called_once()
+    assert victim._endmember_list.count() == 0
+
+
+def test_remove_endmember(victim):
+    victim.add_endmember("A", np.ones(4))
+    victim.add_endmember("B", np.arange(4))
+    victim._endmember_list.setCurrentRow(0)
+
+    victim._remove_endmember()
+
+    assert victim._names == ["B"]
+    assert victim._endmember_list.count() == 1
+    assert victim._unmix.isEnabled()
+
+
+def test_clear_endmembers(victim):
+    victim.add_endmember("A", np.ones(4))
+    victim.clear_endmembers()
+
+    assert victim._names == []
+    assert not victim._unmix.isEnabled()
+
+
+def test_unmixing_uses_common_bands(victim):
+    victim.add_endmember("A", np.array([np.nan, 1.0, 0.0, 0.0]))
+    victim.add_endmember("B", np.array([1.0, 0.0, 1.0, 0.0]))
+    victim._constraint_dropdown.setCurrentIndex(2)
+
+    with patch("suspectral.view.image.coloring_mode_unmixing.UnmixingWorker") as worker, \
+            patch("suspectral.view.image.coloring_mode_unmixing.start_worker") as start, \
+            patch("suspectral.view.image.coloring_mode_unmixing.QProgressDialog"):
+        victim._handle_unmixing()
+
+    kwargs = worker.call_args.kwargs
+    np.testing.assert_array_equal(kwargs["bands"], [False, True, True, True])
+    assert kwargs["unmixing"].constraint == Unmixing.NON_NEGATIVE
+    assert kwargs["unmixing"].num_endmembers == 2
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_unmixing_dependent_endmembers(victim):
+    victim.add_endmember("A", np.ones(4))
+    victim.add_endmember("B", np.ones(4))
+
+    with patch("suspectral.view.image.coloring_mode_unmixing.UnmixingWorker") as worker, \
+            patch("suspectral.view.image.coloring_mode_unmixing.QMessageBox.critical") as critical:
+        victim._handle_unmixing()
+
+    critical.assert_called_once()
+    worker.assert_not_called()
+
+
+def test_set_abundances_renders_selected_map(qtbot, victim):
+    victim.add_endmember("A", np.ones(4))
+    victim.add_endmember("B", np.arange(4))
+
+    abundances = np.array([[[0.0, 1.0], [1.0, 0.0]]], dtype=np.float32)
+    errors = np.array([[0.0, 2.0]], dtype=np.float32)
+
+    with qtbot.waitSignal(victim.imageChanged) as blocker:
+        victim.set_abundances(abundances, errors)
+
+    first = blocker.args[0]
+    assert first.shape == (1, 2, 3)
+    assert [victim._display_dropdown.itemText(it) for it in range(3)] == ["A", "B", victim.ERROR]
+
+    with qtbot.waitSignal(victim.imageChanged) as blocker:
+        victim._display_dropdown.setCurrentIndex(1)
+
+    np.testing.assert_array_equal(blocker.args[0][0, 0], first[0, 1])
+
+
+def test_extraction_starts_worker(victim, mock_model):
+    mock_model.hypercube.num_bands = 4
+    victim._extract_count.setValue(6)
+
+    with patch("suspectral.view.image.coloring_mode_unmixing.EndmemberWorker") as worker, \
+            patch("suspectral.view.image.coloring_mode_unmixing.start_worker") as start, \
+            patch("suspectral.view.image.coloring_mode_unmixing.QProgressDialog"):
+        victim._handle_extraction()
+
+    worker.assert_called_once_with(hypercube=mock_model.hypercube, num_endmembers=4)
+    start.assert_called_once_with(worker.return_value, victim)
+
+
+def test_extracted_endmembers(qtbot, victim):
+    victim._extraction_worker = MagicMock()
+    victim.sender = lambda: victim._extraction_worker
+
+    spectra = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+    positions = np.array([[3, 5], [7, 9]])
+
+    with qtbot.waitSignal(victim.endmembersExtracted) as blocker:
+        victim._handle_extracted(spectra, positions)
+
+    assert victim._names == ["Pixel (5, 3)", "Pixel (9, 7)"]
+    assert victim._unmix.isEnabled()
+    np.testing.assert_array_equal(blocker.args[1], [5, 9])
+    np.testing.assert_array_equal(blocker.args[2], [3, 7])
+
+
+def test_hypercube_opened_resets(qtbot, victim):
+    victim.add_endmember("A", np.ones(4))
+    hypercube = MagicMock(wavelengths=None)
+
+    with qtbot.waitSignal(victim.statusChanged) as blocker:
+        victim._handle_hypercube_opened(hypercube)
+
+    assert blocker.args == [True]
+    assert victim._endmember_list.count() == 0
+    assert not victim._library_button.isEnabled()
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from PySide6.QtCore import QPoint
 from PySide6.QtWidgets import QWidget
@@ -17,6 +18,8 @@ class DummyColoringMode(QWidget):
 
         self.imageChanged = MagicMock()
         self.statusChanged = MagicMock()
+        self.centroidsChanged = MagicMock()
+        self.endmembersExtracted = MagicMock()
 
         self.add_reference_point = MagicMock()
         self.clear_reference_points = MagicMock()
@@ -32,6 +35,11 @@ def victim(qtbot, mock_model):
     with patch("suspectral.view.image.image_controls_view.ColoringModeRGB", new=DummyColoringMode), \
             patch("suspectral.view.image.image_controls_view.ColoringModeCIE", new=DummyColoringMode), \
             patch("suspectral.view.image.image_controls_view.ColoringModeSRF", new=DummyColoringMode), \
+            patch("suspectral.view.image.image_controls_view.ColoringModeComponents", new=DummyColoringMode), \
+            patch("suspectral.view.image.image_controls_view.ColoringModeBandMath", new=DummyColoringMode), \
+            patch("suspectral.view.image.image_controls_view.ColoringModeLibrary", new=DummyColoringMode), \
+            patch("suspectral.view.image.image_controls_view.ColoringModeClustering", new=DummyColoringMode), \
+            patch("suspectral.view.image.image_controls_view.ColoringModeUnmixing", new=DummyColoringMode), \
             patch("suspectral.view.image.image_controls_view.ColoringModeGrayscale", new=DummyColoringMode):
         victim = ImageControlsView(mock_model)
         qtbot.addWidget(victim)
@@ -41,7 +49,7 @@ def victim(qtbot, mock_model):
 def test_initial_state(victim):
     assert not victim._active
     assert victim.currentWidget() == victim._placeholder
-    assert victim._mode_dropdown.count() == 4
+    assert victim._mode_dropdown.count() == 9
 
 
 def test_activate_sets_controls_view(victim):
@@ -72,6 +80,7 @@ def test_clear_reference_points(victim):
 
     victim._true_coloring_srf.clear_reference_points.assert_called_once()
     victim._true_coloring_cie.clear_reference_points.assert_called_once()
+    victim._unmixing.clear_reference_points.assert_called_once()
 
 
 def test_add_reference_points(victim):
@@ -83,6 +92,7 @@ def test_add_reference_points(victim):
 
     victim._true_coloring_srf.add_reference_point.assert_called_once_with(point)
     victim._true_coloring_cie.add_reference_point.assert_called_once_with(point)
+    victim._unmixing.add_reference_point.assert_called_once_with(point)
 
 
 def test_mode_change_switches_widget(victim):
@@ -91,3 +101,16 @@ def test_mode_change_switches_widget(victim):
 
     victim._handle_mode_changed(2)
     assert victim._mode_controls.currentWidget() == victim._modes[2]
+
+
+def test_extracted_endmembers_are_plotted_and_highlighted(victim, qtbot):
+    spectra = np.ones((2, 3))
+    xs, ys = np.array([1, 2]), np.array([3, 4])
+
+    with qtbot.waitSignal(victim.spectraChanged) as spectra_blocker, \
+            qtbot.waitSignal(victim.pointsHighlighted) as points_blocker:
+        victim._handle_endmembers_extracted(spectra, xs, ys)
+
+    np.testing.assert_array_equal(spectra_blocker.args[0], spectra)
+    np.testing.assert_array_equal(points_blocker.args[0], xs)
+    np.testing.assert_array_equal(points_blocker.args[1], ys)
@@ -32,6 +32,23 @@ def test_reset(victim):
     assert victim._zoom == 1.0
 
 
+def test_overlay_is_drawn_above_image(victim):
+    victim.display(QPixmap(5, 5))
+    victim.set_overlay(QPixmap(5, 5))
+
+    assert not victim.overlay.pixmap().isNull()
+    assert victim.scene().items()[0] is victim.overlay
+
+    victim.clear_overlay()
+    assert victim.overlay.pixmap().isNull()
+
+
+def test_reset_clears_overlay(victim):
+    victim.set_overlay(QPixmap(5, 5))
+    victim.reset()
+    assert victim.overlay.pixmap().isNull()
+
+
 @pytest.mark.parametrize("method,angle", [
     ("rotate_left", -90.0),
     ("rotate_right", +90.0),
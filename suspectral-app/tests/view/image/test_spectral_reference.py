@@ -25,28 +25,37 @@ def victim(qtbot, mock_model):
 def test_initial_state(victim):
     assert victim._select.count() == 1
     assert victim._select.itemText(0) == "Select..."
-    assert victim._points == []
+    assert victim._references.points == []
 
 
 def test_add_point_updates_dropdown(victim):
     victim.add(QPoint(3, 5))
-    assert len(victim._points) == 1
-    assert victim._points[0] == QPoint(3, 5)
+    assert len(victim._references.points) == 1
+    assert victim._references.points[0] == QPoint(3, 5)
     assert victim._select.count() == 2
     assert victim._select.itemText(1) == "Selection (1)"
 
 
+def test_extend_appends_after_existing_points(victim):
+    victim.add(QPoint(0, 0))
+    victim.extend([QPoint(x, 0) for x in range(1, 12)])
+
+    assert len(victim._references.points) == 12
+    assert victim._select.count() == 13
+    assert victim._select.itemText(12) == "Selection (12)"
+
+
 def test_clear_resets_state(victim):
     victim.add(QPoint(1, 1))
     victim.add(QPoint(2, 2))
     assert victim._select.count() == 3
-    assert len(victim._points) == 2
+    assert len(victim._references.points) == 2
 
     victim.clear()
 
     assert victim._select.count() == 1
     assert victim._select.itemText(0) == "Select..."
-    assert victim._points == []
+    assert victim._references.points == []
 
 
 def test_get_returns_correct_spectrum(victim, mock_model):
@@ -64,3 +73,21 @@ def test_get_returns_none_if_not_selected(victim):
     victim.add(QPoint(2, 3))
     victim._select.setCurrentIndex(0)
     assert victim.get() is None
+
+
+def test_point_returns_selected_point(victim):
+    victim.add(QPoint(2, 3))
+    assert victim.point() is None
+
+    victim._select.setCurrentIndex(1)
+    assert victim.point() == QPoint(2, 3)
+
+
+def test_extend_inserts_rows_at_once(victim, qtbot):
+    victim.add(QPoint(0, 0))
+
+    with qtbot.waitSignal(victim._references.rowsInserted) as blocker:
+        victim.extend([QPoint(x, 0) for x in range(10_000)])
+
+    assert blocker.args[1:] == [2, 10_001]
+    assert victim._select.count() == 10_002
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from suspectral.view.cross_section.cross_section_view import CrossSectionView
+
+
+@pytest.fixture
+def victim(qtbot):
+    widget = CrossSectionView()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_initialization(victim):
+    assert victim.currentWidget() == victim._placeholder
+
+
+def test_display_shows_heat_map(victim):
+    spectra = np.arange(30, dtype=np.float32).reshape(10, 3)
+    victim.display(spectra)
+
+    assert victim.currentWidget() == victim._plot
+    np.testing.assert_array_equal(victim.image.image, spectra)
+
+    lo, hi = victim.image.getLevels()
+    assert np.percentile(spectra, 2) == pytest.approx(lo)
+    assert np.percentile(spectra, 98) == pytest.approx(hi)
+
+
+def test_display_spans_wavelengths(victim):
+    victim.set_wavelengths(np.array([400.0, 500.0, 600.0]), "nm")
+    victim.display(np.ones((10, 3), dtype=np.float32))
+
+    rect = victim.image.mapRectToParent(victim.image.boundingRect())
+    assert (rect.left(), rect.width()) == pytest.approx((0, 10))
+    assert (rect.top(), rect.height()) == pytest.approx((350, 300))
+    assert victim._plot.getPlotItem().getAxis("left").labelText == "Wavelength (nm)"
+
+
+def test_display_handles_non_finite_values(victim):
+    spectra = np.full((4, 3), np.nan, dtype=np.float32)
+    victim.display(spectra)
+
+    assert victim.image.getLevels() == pytest.approx((0, 1))
+
+
+def test_clear_shows_placeholder(victim):
+    victim.display(np.ones((10, 3), dtype=np.float32))
+    victim.clear()
+
+    assert victim.currentWidget() == victim._placeholder
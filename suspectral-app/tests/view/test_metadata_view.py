@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from PySide6.QtCore import Qt
 
@@ -49,6 +50,17 @@ def test_set_metadata(victim):
     assert victim.currentWidget() == victim._table
 
 
+def test_set_metadata_with_arrays(victim):
+    victim.set({
+        "wavelength": np.array([400.5, 410.0, 420.25]),
+        "bbl": np.array([1, 0, 1]),
+    })
+
+    table = victim._table
+    assert table.item(0, 1).text() == "{400.5, 410.0, 420.25}"
+    assert table.item(1, 1).text() == "{1, 0, 1}"
+
+
 def test_clear(victim):
     victim.set({
         "Key 1": "Value 1",
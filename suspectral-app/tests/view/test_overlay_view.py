@@ -0,0 +1,102 @@
+import pytest
+
+from suspectral.view.overlay.overlay_view import OverlayView
+
+
+@pytest.fixture
+def victim(qtbot):
+    widget = OverlayView()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_initialization(victim):
+    assert victim.currentWidget() == victim._placeholder
+
+
+def test_start_shows_progress(victim):
+    victim.start("Spectral Angle")
+    victim.set_progress(40)
+
+    assert victim.currentWidget() == victim._panel
+    assert victim._title.text() == "Spectral Angle"
+    assert victim._progress.value() == 40
+    assert not victim._slider.isEnabled()
+
+
+def test_set_range_enables_threshold(victim):
+    victim.start("Spectral Angle")
+    victim.set_range(0.0, 2.0, 0.5)
+
+    assert victim._slider.isEnabled()
+    assert victim.threshold == pytest.approx(0.5)
+    assert victim._value.text() == "0.5"
+
+
+def test_slider_emits_threshold(victim, qtbot):
+    victim.set_range(-1.0, 1.0, 0.0)
+
+    with qtbot.waitSignal(victim.thresholdChanged) as blocker:
+        victim._slider.setValue(victim.SLIDER_STEPS)
+
+    assert blocker.args[0] == pytest.approx(1.0)
+
+
+def test_set_range_does_not_emit(victim, qtbot):
+    with qtbot.assertNotEmitted(victim.thresholdChanged):
+        victim.set_range(0.0, 1.0, 0.3)
+
+
+def test_clear_button_requests_clear(victim, qtbot):
+    victim.start("Spectral Angle")
+
+    with qtbot.waitSignal(victim.clearRequested):
+        victim._clear.click()
+
+
+def test_clear_shows_placeholder(victim):
+    victim.start("Spectral Angle")
+    victim.clear()
+    assert victim.currentWidget() == victim._placeholder
+
+
+def test_detection_disabled_by_default(victim):
+    assert not victim._detect.isEnabled()
+
+    victim.set_detection_enabled(True)
+    assert victim._detect.isEnabled()
+
+
+def test_detect_global_anomalies(victim, qtbot):
+    victim.set_detection_enabled(True)
+    assert not victim._window.isEnabled()
+
+    with qtbot.waitSignal(victim.anomaliesRequested) as blocker:
+        victim._detect.click()
+
+    assert blocker.args == [0, 0]
+
+
+def test_detect_local_anomalies(victim, qtbot):
+    victim.set_detection_enabled(True)
+    victim._background.setCurrentText(OverlayView.LOCAL)
+    victim._window.setValue(10)
+    victim._guard.setValue(3)
+
+    assert victim._window.isEnabled()
+    with qtbot.waitSignal(victim.anomaliesRequested) as blocker:
+        victim._detect.click()
+
+    assert blocker.args == [11, 3]
+
+
+def test_detect_local_anomalies_clamps_guard(victim, qtbot):
+    victim.set_detection_enabled(True)
+    victim._background.setCurrentText(OverlayView.LOCAL)
+    victim._window.setValue(5)
+    victim._guard.setValue(9)
+
+    with qtbot.waitSignal(victim.anomaliesRequested) as blocker:
+        victim._detect.click()
+
+    assert blocker.args == [5, 3]
@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
-from PySide6.QtCore import QPoint
+from PySide6.QtCore import QPoint, Qt
 from PySide6.QtWidgets import QLabel
 
+from suspectral.colors import get_color
 from suspectral.view.selection.selection_view import SelectionView
 
 
@@ -15,7 +17,7 @@ def victim(qtbot):
 def test_initialization(victim):
     assert victim.currentWidget() == victim._placeholder
     assert isinstance(victim._placeholder, QLabel)
-    assert victim._table.rowCount() == 0
+    assert victim._model.rowCount() == 0
 
 
 def test_add_single_point(victim):
@@ -23,9 +25,9 @@ def test_add_single_point(victim):
     victim.add_point(point)
 
     assert victim.currentWidget() == victim._table
-    assert victim._table.rowCount() == 1
-    assert victim._table.item(0, 1).text() == "10"
-    assert victim._table.item(0, 2).text() == "20"
+    assert victim._model.rowCount() == 1
+    assert victim._model.index(0, 1).data() == "10"
+    assert victim._model.index(0, 2).data() == "20"
 
 
 def test_add_multiple_points(victim):
@@ -33,11 +35,11 @@ def test_add_multiple_points(victim):
     victim.add_points(points)
 
     assert victim.currentWidget() == victim._table
-    assert victim._table.rowCount() == 3
+    assert victim._model.rowCount() == 3
 
     for row, point in enumerate(points):
-        assert victim._table.item(row, 1).text() == str(point.x())
-        assert victim._table.item(row, 2).text() == str(point.y())
+        assert victim._model.index(row, 1).data() == str(point.x())
+        assert victim._model.index(row, 2).data() == str(point.y())
 
 
 def test_clear_resets_table_and_view(victim):
@@ -45,4 +47,22 @@ def test_clear_resets_table_and_view(victim):
     victim.clear()
 
     assert victim.currentWidget() == victim._placeholder
-    assert victim._table.rowCount() == 0
+    assert victim._model.rowCount() == 0
+
+
+def test_add_coordinates(victim):
+    victim.add_coordinates(np.array([1, 2, 3]), np.array([4, 5, 6]))
+    victim.add_coordinates(np.array([7]), np.array([8]))
+
+    assert victim.currentWidget() == victim._table
+    assert victim._model.rowCount() == 4
+    assert victim._model.index(3, 1).data() == "7"
+    assert victim._model.index(3, 2).data() == "8"
+
+
+def test_legend_colors_follow_rows(victim):
+    victim.add_coordinates(np.arange(12), np.arange(12))
+
+    assert victim._model.index(0, 0).data(Qt.ItemDataRole.BackgroundRole) == get_color(0)
+    assert victim._model.index(11, 0).data(Qt.ItemDataRole.BackgroundRole) == get_color(11)
+    assert victim._model.index(11, 0).data() is None
@@ -7,6 +7,7 @@ from PySide6.QtCore import QPoint, QEvent
 from PySide6.QtGui import QContextMenuEvent
 from PySide6.QtWidgets import QApplication
 
+from suspectral.colors import NUM_COLORS
 from suspectral.model.hypercube_container import HypercubeContainer
 from suspectral.view.spectral.spectral_view import SpectralView
 
@@ -58,8 +59,48 @@ def test_add_spectrum(victim):
     assert len(victim.listDataItems()) == 1
 
 
+def test_add_spectra_batched(victim):
+    spectra = np.random.rand(100, 10)
+    victim.add_spectra(spectra)
+    assert np.array_equal(victim.spectra, spectra)
+    assert len(victim.listDataItems()) == NUM_COLORS
+
+
+def test_add_spectra_grows_buffer(victim):
+    for i in range(50):
+        victim.add_spectrum(np.full(10, i))
+
+    assert victim.spectra.shape == (50, 10)
+    assert victim._spectra.shape[0] >= 50
+    assert np.array_equal(victim.spectra[:, 0], np.arange(50))
+
+
+def test_add_spectra_promotes_dtype(victim):
+    victim.add_spectrum(np.ones(10, dtype=np.int16))
+    victim.add_spectrum(np.full(10, 0.5, dtype=np.float32))
+    assert victim.spectra.dtype == np.float32
+    assert np.array_equal(victim.spectra[:, 0], [1.0, 0.5])
+
+
+def test_add_spectra_band_mismatch(victim):
+    victim.add_spectrum(np.ones(10))
+    with pytest.raises(ValueError):
+        victim.add_spectrum(np.ones(5))
+
+
+def test_visible_bands_decimated(victim):
+    victim.resize(400, 300)
+    wavelengths = np.linspace(400, 1000, 5000)
+    victim.set_wavelengths(wavelengths)
+    victim.add_spectrum(np.ones(5000))
+
+    x, _ = victim.listDataItems()[0].getData()
+    assert len(x) < 5000
+    assert x[np.isfinite(x)][-1] == wavelengths[-1]
+
+
 def test_clear_spectra(victim):
-    victim._spectra.append(np.ones(10))
+    victim.add_spectrum(np.ones(10))
     victim.clear_spectra()
 
     assert len(victim.spectra) == 0
@@ -67,7 +108,7 @@ def test_clear_spectra(victim):
 
 
 def test_reset(victim):
-    victim._spectra = [np.array([1, 2, 3])]
+    victim.add_spectrum(np.array([1, 2, 3]))
     victim._wavelengths = np.array([1, 2, 3])
 
     victim.reset()
@@ -103,3 +144,45 @@ def test_context_menu_signal_not_emitted_without_spectra(qtbot, victim):
     with pytest.raises(pytestqt.exceptions.TimeoutError):
         with qtbot.waitSignal(victim.contextMenuRequested, timeout=300):
             victim.contextMenuEvent(event)
+
+
+def test_set_density(victim):
+    victim.set_band_numbers(5)
+    victim.set_density(np.ones((5, 16), dtype=np.int64), 0.0, 2.0)
+
+    assert victim._density is not None
+    assert victim._density.image.shape == (5, 16)
+    assert victim._density in victim.getPlotItem().items
+
+
+def test_density_mode_hides_spectra(victim):
+    victim.add_spectrum(np.ones(10))
+    victim.set_density_mode(True)
+    assert victim.density_mode
+    assert not victim.listDataItems()[0].isVisible()
+
+    victim.set_density(np.ones((10, 4), dtype=np.int64), 0.0, 1.0)
+    victim.set_density_mode(False)
+    assert victim.listDataItems()[0].isVisible()
+    assert victim._density is None
+
+
+def test_decimation_preserves_peaks(victim):
+    victim.resize(400, 300)
+    victim.set_band_numbers(5000)
+    spectrum = np.zeros(5000)
+    spectrum[1234] = 10.0
+    spectrum[3001] = -5.0
+    victim.add_spectrum(spectrum)
+
+    x, y = victim.listDataItems()[0].getData()
+    assert len(x) < 5000
+    assert np.nanmax(y) == 10.0 and x[np.nanargmax(y)] == 1234
+    assert np.nanmin(y) == -5.0 and x[np.nanargmin(y)] == 3001
+
+
+def test_spectra_are_read_only(victim):
+    victim.add_spectrum(np.ones(10))
+
+    with pytest.raises(ValueError):
+        victim.spectra[0, 0] = 5.0
@@ -23,6 +23,7 @@ def hypercube():
     mock.num_rows = 200
     mock.num_bands = 150
     mock.num_bytes = 100 * 200 * 150 * 2
+    mock.resident_bytes = 0
     mock.wavelengths = np.arange(400, 700 + 1, 10)
     mock.wavelengths_unit = "nm"
     return mock
@@ -114,6 +115,23 @@ def test_memory_status_set_negative_value(qtbot):
         victim.set(-1234)
 
 
+def test_memory_status_set_resident(qtbot):
+    victim = MemoryStatus()
+    qtbot.addWidget(victim)
+
+    victim.set(2048, 1024)
+    assert victim._label.text() == "1.00 KB / 2.00 KB"
+    assert victim.toolTip() == "In memory: 1.00 KB\nOn disk: 2.00 KB"
+
+
+def test_memory_status_set_progress(qtbot):
+    victim = MemoryStatus()
+    qtbot.addWidget(victim)
+
+    victim.set_progress(42)
+    assert victim._label.text() == "Loading 42%"
+
+
 def test_wavelength_status_initialization(qtbot):
     victim = WavelengthStatus()
     qtbot.addWidget(victim)
@@ -169,6 +187,18 @@ def test_status_view_update_hypercube_status_without_wavelengths(qtbot, hypercub
     assert not victim._wavelength_status._label.text()
 
 
+def test_status_view_update_memory_status(qtbot, hypercube):
+    victim = StatusView()
+    qtbot.addWidget(victim)
+
+    victim.update_loading(50)
+    assert victim._memory_status._label.text() == "Loading 50%"
+
+    hypercube.resident_bytes = hypercube.num_bytes
+    victim.update_memory(hypercube)
+    assert victim._memory_status._label.text() == "5.72 MB / 5.72 MB"
+
+
 def test_status_view_update_cursor_status(qtbot):
     victim = StatusView()
     qtbot.addWidget(victim)
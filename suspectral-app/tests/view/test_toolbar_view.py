@@ -19,6 +19,9 @@ def mock_tools():
     tools.pan = MagicMock(spec=Tool)
     tools.none = MagicMock(spec=Tool)
     tools.area = MagicMock(spec=Tool)
+    tools.polygon = MagicMock(spec=Tool)
+    tools.wand = MagicMock(spec=Tool)
+    tools.cross_section = MagicMock(spec=Tool)
     tools.zoom = MagicMock(spec=Tool)
     tools.inspect = MagicMock(spec=Tool)
     return tools
@@ -43,7 +46,7 @@ def test_tools_added_to_action_group(victim):
     assert group.isExclusive()
 
     names = [action.text() for action in group.actions()]
-    assert set(names) == {"None", "Pan", "Inspect", "Select Area", "Zoom"}
+    assert set(names) == {"None", "Pan", "Inspect", "Select Area", "Select Polygon", "Select Similar", "Cross-Section", "Zoom"}
 
 
 def test_correct_default_tool_checked(victim):
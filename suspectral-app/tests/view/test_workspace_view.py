@@ -0,0 +1,58 @@
+import pytest
+from PySide6.QtCore import Qt
+
+from suspectral.view.workspace.workspace_view import WorkspaceView
+
+
+@pytest.fixture
+def victim(qtbot):
+    widget = WorkspaceView()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_initialization(victim):
+    assert victim.currentWidget() == victim._placeholder
+    assert victim._placeholder.text() == "Load hypercubes to switch between them."
+    assert victim._list.count() == 0
+
+
+def test_set_lists_names(victim):
+    victim.set(["first", "second", "third"], 1)
+
+    assert victim.currentWidget() == victim._list
+    assert [victim._list.item(row).text() for row in range(victim._list.count())] == ["first", "second", "third"]
+    assert victim._list.currentRow() == 1
+
+
+def test_set_does_not_emit_selection(victim, qtbot):
+    with qtbot.assertNotEmitted(victim.hypercubeSelected):
+        victim.set(["first", "second"], 0)
+        victim.set(["first", "second"], 1)
+
+
+def test_set_empty_shows_placeholder(victim):
+    victim.set(["first"], 0)
+    victim.set([], None)
+
+    assert victim.currentWidget() == victim._placeholder
+    assert victim._list.count() == 0
+
+
+def test_clear(victim):
+    victim.set(["first"], 0)
+    victim.clear()
+
+    assert victim.currentWidget() == victim._placeholder
+    assert victim._list.count() == 0
+
+
+def test_click_emits_selected(victim, qtbot):
+    victim.set(["first", "second"], 0)
+    victim.show()
+
+    rect = victim._list.visualItemRect(victim._list.item(1))
+    with qtbot.waitSignal(victim.hypercubeSelected, timeout=1000) as blocker:
+        qtbot.mouseClick(victim._list.viewport(), Qt.MouseButton.LeftButton, pos=rect.center())
+
+    assert blocker.args == [1]
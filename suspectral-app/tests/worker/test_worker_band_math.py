@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.band_expression import BandExpression
+from suspectral.worker.worker_band_math import BandMathWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.uniform(1, 2, size=(30, 20, 12)).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        block = data[rows[0]:rows[1], cols[0]:cols[1]]
+        return block if bands is None else block[..., bands]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def test_evaluates_expression(qtbot, hypercube, data):
+    expression = BandExpression("(b[9] - b[2]) / (b[9] + b[2])", 12)
+    victim = BandMathWorker(hypercube, expression)
+    victim.BLOCK_BYTES = 20 * 2 * 4 * 3
+
+    with qtbot.waitSignal(victim.computed, timeout=1000) as blocker:
+        victim.run()
+
+    expected = (data[..., 9] - data[..., 2]) / (data[..., 9] + data[..., 2])
+    np.testing.assert_allclose(blocker.args[0], expected, rtol=1e-6)
+
+
+def test_reads_only_referenced_bands(qtbot, hypercube):
+    victim = BandMathWorker(hypercube, BandExpression("b[7] * b[3]", 12))
+    victim.BLOCK_BYTES = 20 * 2 * 4 * 10
+
+    with qtbot.waitSignal(victim.computed, timeout=1000):
+        victim.run()
+
+    # Blocks are sized by the referenced bands only.
+    assert hypercube.read_subregion.call_count == 3
+    for call in hypercube.read_subregion.call_args_list:
+        assert call.args[2] == [3, 7]
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = BandMathWorker(hypercube, BandExpression("b[0]", 12))
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.computed):
+        victim.run()
@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from spectral import get_rgb
+
+from suspectral.worker.worker_bands import BandsWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(30, 20, 12)).astype(np.int16)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        block = data[rows[0]:rows[1], cols[0]:cols[1]]
+        return block if bands is None else block[..., bands]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def test_renders_rgb(qtbot, hypercube, data):
+    victim = BandsWorker(hypercube, (9, 2, 5))
+    victim.BLOCK_BYTES = 20 * 2 * 3 * 4
+
+    with qtbot.waitSignal(victim.computed, timeout=1000) as blocker:
+        victim.run()
+
+    np.testing.assert_allclose(blocker.args[0], get_rgb(data, [9, 2, 5]))
+    assert hypercube.read_subregion.call_count == 8
+
+
+def test_reads_repeated_bands_once(qtbot, hypercube, data):
+    victim = BandsWorker(hypercube, (4, 4, 4))
+
+    with qtbot.waitSignal(victim.computed, timeout=1000) as blocker:
+        victim.run()
+
+    np.testing.assert_allclose(blocker.args[0], get_rgb(data, [4, 4, 4]))
+    for call in hypercube.read_subregion.call_args_list:
+        assert call.args[2] == [4]
+
+
+def test_caches_image(qtbot, hypercube):
+    victim = BandsWorker(hypercube, (9, 2, 5))
+
+    with qtbot.waitSignal(victim.computed, timeout=1000) as blocker:
+        victim.run()
+
+    hypercube.set_cached.assert_called_once_with(("bands", (9, 2, 5)), blocker.args[0])
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = BandsWorker(hypercube, (0, 1, 2))
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.computed):
+        victim.run()
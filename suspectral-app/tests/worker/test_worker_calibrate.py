@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_calibrate import CalibrateWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(30, 20, 12)).astype(np.int16)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.shape = data.shape
+    mock.dtype = data.dtype
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        return data[rows[0]:rows[1], cols[0]:cols[1]]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def test_calibrates_whole_hypercube(qtbot, hypercube, data):
+    white_ref = np.full(12, 800.0)
+    black_ref = np.full(12, 100.0)
+    victim = CalibrateWorker(hypercube, white_ref, black_ref)
+    victim.BLOCK_BYTES = 4 * data[0].nbytes
+
+    with qtbot.waitSignal(victim.calibrated, timeout=1000) as blocker:
+        victim.run()
+
+    expected = np.clip((data - black_ref) / (white_ref - black_ref), 0, 1)
+    assert isinstance(blocker.args[0], np.memmap)
+    assert blocker.args[0].dtype == np.float32
+    np.testing.assert_allclose(blocker.args[0], expected, atol=1e-6)
+    assert hypercube.read_subregion.call_count == 8
+
+
+@pytest.mark.parametrize("white_ref,black_ref,expected", [
+    (None, None, ([1.0, 1.0], [0.0, 0.0], None)),
+    ([4.0, 0.0], None, ([0.25, 0.0], [0.0, 0.0], 1.0)),
+    (None, [2.0, 3.0], ([1.0, 1.0], [-2.0, -3.0], None)),
+    ([6.0, 5.0], [2.0, 3.0], ([0.25, 0.5], [-0.5, -1.5], 1.0)),
+])
+def test_transform(white_ref, black_ref, expected):
+    scale, offset, upper = CalibrateWorker.transform(white_ref, black_ref)
+
+    np.testing.assert_allclose(np.broadcast_to(scale, 2), expected[0])
+    np.testing.assert_allclose(np.broadcast_to(offset, 2), expected[1])
+    assert upper == expected[2]
+
+
+def test_mismatched_references_are_reported(qtbot, hypercube):
+    victim = CalibrateWorker(hypercube, white_ref=np.ones(3))
+
+    with qtbot.assertNotEmitted(victim.calibrated):
+        with qtbot.waitSignal(victim.failed, timeout=1000) as blocker:
+            victim.run()
+
+    assert isinstance(blocker.args[0], ValueError)
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = CalibrateWorker(hypercube, black_ref=np.zeros(12))
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.calibrated):
+        victim.run()
@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_classification import ClassificationWorker
+
+
+@pytest.fixture
+def references():
+    return np.array([
+        [1.0, 0.0, 0.0, 0.2],
+        [0.0, 1.0, 0.0, 0.2],
+        [0.0, 0.0, 1.0, 0.2],
+    ])
+
+
+@pytest.fixture
+def labels():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 3, size=(30, 20))
+
+
+@pytest.fixture
+def data(references, labels):
+    rng = np.random.default_rng(1)
+    brightness = rng.uniform(0.5, 2.0, size=(30, 20, 1))
+    noise = rng.normal(scale=0.01, size=(30, 20, 4))
+    return (references[labels] * brightness + noise).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        block = data[rows[0]:rows[1], cols[0]:cols[1]]
+        return block if bands is None else block[..., bands]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.classified, timeout=1000) as blocker:
+        victim.run()
+
+    return blocker.args
+
+
+@pytest.mark.parametrize("metric", [ClassificationWorker.ANGLE, ClassificationWorker.CORRELATION])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_classifies_pixels(qtbot, hypercube, references, labels, metric, num_threads):
+    victim = ClassificationWorker(hypercube, references, metric=metric, num_threads=num_threads)
+    victim.BLOCK_BYTES = 20 * 4 * 4 * 3
+
+    actual, scores = run(qtbot, victim)
+
+    np.testing.assert_array_equal(actual, labels)
+    assert scores.shape == (30, 20)
+
+
+def test_angle_scores(qtbot, hypercube, references, data):
+    actual, scores = run(qtbot, ClassificationWorker(hypercube, references))
+
+    pixels = data.reshape(-1, 4).astype(np.float64)
+    best = references[actual.ravel()]
+    cosines = np.sum(pixels * best, axis=1) / (np.linalg.norm(pixels, axis=1) * np.linalg.norm(best, axis=1))
+    np.testing.assert_allclose(scores.ravel(), np.arccos(cosines), atol=1e-3)
+
+
+def test_reads_only_selected_bands(qtbot, hypercube, references, labels):
+    bands = np.array([True, True, True, False])
+    actual, _ = run(qtbot, ClassificationWorker(hypercube, references[:, :3], bands=bands))
+
+    np.testing.assert_array_equal(actual, labels)
+    for call in hypercube.read_subregion.call_args_list:
+        assert call.args[2] == [0, 1, 2]
+
+
+def test_unclassified_pixels(qtbot, hypercube, references, data):
+    data[0, 0] = 0
+    actual, scores = run(qtbot, ClassificationWorker(hypercube, references))
+
+    assert actual[0, 0] == -1
+    assert np.isnan(scores[0, 0])
+
+
+def test_unknown_metric(hypercube, references):
+    with pytest.raises(ValueError):
+        ClassificationWorker(hypercube, references, metric="unknown")
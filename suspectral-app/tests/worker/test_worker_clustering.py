@@ -0,0 +1,114 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_clustering import ClusteringWorker
+
+
+@pytest.fixture
+def centers():
+    return np.array([
+        [10.0, 0.0, 0.0, 5.0],
+        [0.0, 10.0, 0.0, 5.0],
+        [0.0, 0.0, 10.0, 5.0],
+    ])
+
+
+@pytest.fixture
+def labels():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 3, size=(30, 20))
+
+
+@pytest.fixture
+def data(centers, labels):
+    rng = np.random.default_rng(1)
+    noise = rng.normal(scale=0.1, size=(30, 20, 4))
+    return (centers[labels] + noise).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        return data[rows[0]:rows[1], cols[0]:cols[1]]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.clustered, timeout=5000) as blocker:
+        victim.run()
+
+    return blocker.args
+
+
+def match(actual: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    # Clusters are found in arbitrary order; map each one onto the true label of its members.
+    mapping = {label: np.bincount(expected[actual == label]).argmax() for label in np.unique(actual)}
+    return np.vectorize(mapping.get)(actual)
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_recovers_clusters(qtbot, hypercube, centers, labels, num_threads):
+    victim = ClusteringWorker(hypercube, num_clusters=3, num_threads=num_threads, seed=0)
+    victim.BLOCK_BYTES = 20 * 4 * 4 * 3
+
+    actual, centroids = run(qtbot, victim)
+
+    assert actual.shape == (30, 20)
+    assert centroids.shape == (3, 4)
+    assert len(np.unique(actual)) == 3
+    np.testing.assert_array_equal(match(actual, labels), labels)
+
+    for index, centroid in enumerate(centroids):
+        expected = centers[np.bincount(labels[actual == index]).argmax()]
+        np.testing.assert_allclose(centroid, expected, atol=0.1)
+
+
+def test_sample_is_bounded(qtbot, hypercube, labels):
+    victim = ClusteringWorker(hypercube, num_clusters=3, sample_size=50, seed=0)
+    victim.BLOCK_BYTES = 20 * 4 * 4 * 3
+
+    sample = victim._sample()
+
+    assert sample.shape == (50, 4)
+    assert len(np.unique(sample, axis=0)) == 50
+
+
+def test_sample_is_uniform(hypercube):
+    data = np.arange(1000, dtype=np.float32).reshape(100, 10, 1)
+    hypercube.num_rows, hypercube.num_cols, hypercube.num_bands = data.shape
+    hypercube.read_subregion.side_effect = lambda rows, cols, bands=None: data[rows[0]:rows[1]]
+
+    victim = ClusteringWorker(hypercube, sample_size=100, seed=0)
+    victim.BLOCK_BYTES = 10 * 4 * 7
+
+    means = [victim._sample().mean() for _ in range(50)]
+    assert np.mean(means) == pytest.approx(499.5, rel=0.03)
+
+
+def test_unassigned_pixels(qtbot, hypercube, data):
+    data[0, 0] = np.nan
+    actual, _ = run(qtbot, ClusteringWorker(hypercube, num_clusters=3, seed=0))
+
+    assert actual[0, 0] == -1
+    assert (actual.ravel()[1:] >= 0).all()
+
+
+def test_stopped_worker_does_not_emit(qtbot, hypercube):
+    victim = ClusteringWorker(hypercube, num_clusters=3, seed=0)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.clustered):
+        victim.run()
+
+
+def test_invalid_number_of_clusters(hypercube):
+    with pytest.raises(ValueError):
+        ClusteringWorker(hypercube, num_clusters=0)
@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.covariance import Covariance
+from suspectral.worker.worker_components import ComponentsWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return (rng.normal(size=(30, 20, 3)) @ rng.normal(size=(3, 8))).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.computed, timeout=1000) as blocker:
+        victim.run()
+
+    return blocker.args
+
+
+def test_principal_components(qtbot, hypercube, data):
+    victim = ComponentsWorker(hypercube, num_components=3)
+    victim.BLOCK_BYTES = 20 * 8 * 4 * 3
+
+    scores, variances = run(qtbot, victim)
+
+    pixels = data.reshape(-1, 8).astype(np.float64)
+    expected = np.linalg.eigvalsh(np.cov(pixels, rowvar=False))[::-1][:3]
+
+    assert scores.shape == (30, 20, 3)
+    assert scores.dtype == np.float32
+    np.testing.assert_allclose(variances, expected, rtol=1e-5)
+    np.testing.assert_allclose(scores.reshape(-1, 3).var(axis=0, ddof=1), expected, rtol=1e-4)
+
+
+def test_noise_adjusted_components(qtbot, hypercube):
+    scores, ratios = run(qtbot, ComponentsWorker(hypercube, ComponentsWorker.MNF, num_components=2))
+
+    assert scores.shape == (30, 20, 2)
+    assert ratios[0] >= ratios[1]
+
+
+def test_reuses_statistics(qtbot, hypercube):
+    first = ComponentsWorker(hypercube)
+    run(qtbot, first)
+    assert isinstance(first.covariance, Covariance)
+    hypercube.read_subregion.reset_mock()
+
+    second = ComponentsWorker(hypercube, ComponentsWorker.MNF, covariance=first.covariance, noise=first.noise)
+    run(qtbot, second)
+
+    # Only the projection pass reads the hypercube again.
+    assert hypercube.read_subregion.call_count == 1
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = ComponentsWorker(hypercube)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.computed):
+        victim.run()
+
+    assert victim.covariance is None
+
+
+def test_unknown_transform(hypercube):
+    with pytest.raises(ValueError):
+        ComponentsWorker(hypercube, transform="unknown")
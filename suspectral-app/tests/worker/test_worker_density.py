@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import pytestqt
+
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.worker.worker_density import DensityWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random((40, 30, 5)).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def test_density_counts_every_pixel(qtbot, hypercube, data):
+    victim = DensityWorker(hypercube, num_bins=16)
+
+    with qtbot.waitSignal(victim.finished, timeout=1000):
+        with qtbot.waitSignal(victim.accumulated, timeout=1000) as blocker:
+            victim.run()
+
+    counts, lo, hi = blocker.args
+    assert counts.shape == (5, 16)
+    assert np.all(counts.sum(axis=1) == 40 * 30)
+    assert lo < hi
+
+
+def test_density_streams_in_blocks(qtbot, hypercube):
+    victim = DensityWorker(hypercube, rows=(10, 30), cols=(5, 15), num_bins=8)
+    victim.BLOCK_BYTES = 10 * 5 * 4 * 3
+    victim.EMIT_INTERVAL = 0.0
+
+    snapshots = []
+    victim.accumulated.connect(lambda counts, *_: snapshots.append(counts))
+    victim.run()
+
+    assert len(snapshots) > 2
+    assert np.all(snapshots[-1].sum(axis=1) == 20 * 10)
+    assert all(a.sum() <= b.sum() for a, b in zip(snapshots, snapshots[1:]))
+
+
+def test_density_matches_histogram(hypercube, data):
+    victim = DensityWorker(hypercube, num_bins=10)
+    counts = victim._histogram(data, 0.0, 1.0)
+    expected = [np.histogram(data[..., band], bins=10, range=(0, 1))[0] for band in range(5)]
+    np.testing.assert_array_equal(counts.reshape(5, 10), expected)
+
+
+def test_density_ignores_invalid_values(hypercube):
+    victim = DensityWorker(hypercube, num_bins=4)
+    block = np.array([[[np.nan, 0.5], [np.inf, 2.0]]], dtype=np.float32)
+    counts = victim._histogram(block, 0.0, 1.0).reshape(2, 4)
+    np.testing.assert_array_equal(counts, [[0, 0, 0, 0], [0, 0, 1, 1]])
+
+
+def test_density_stopped(qtbot, hypercube):
+    victim = DensityWorker(hypercube)
+    victim.stop()
+
+    with pytest.raises(pytestqt.exceptions.TimeoutError):
+        with qtbot.waitSignal(victim.accumulated, timeout=300):
+            victim.run()
+
+
+def test_density_counts_only_masked_pixels(qtbot, hypercube):
+    mask = np.zeros((10, 8), dtype=bool)
+    mask[2:5, 1:4] = True
+    mask[9, 7] = True
+
+    victim = DensityWorker(hypercube, mask=SelectionMask(mask, top=20, left=10), num_bins=8)
+
+    with qtbot.waitSignal(victim.accumulated, timeout=1000) as blocker:
+        victim.run()
+
+    counts, _, _ = blocker.args
+    assert np.all(counts.sum(axis=1) == 10)
+    assert hypercube.read_subregion.call_args.args[:2] == ((20, 30), (10, 18))
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_endmembers import EndmemberWorker
+
+PURE = [(3, 5), (10, 19), (25, 7), (28, 15)]
+
+
+@pytest.fixture
+def endmembers():
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.0, 1.0, size=(4, 12))
+
+
+@pytest.fixture
+def abundances():
+    rng = np.random.default_rng(1)
+    abundances = rng.dirichlet(np.ones(4), size=(30, 20))
+    for index, position in enumerate(PURE):
+        abundances[position] = np.eye(4)[index]
+    return abundances
+
+
+@pytest.fixture
+def data(endmembers, abundances):
+    return (abundances @ endmembers).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        return data[rows[0]:rows[1], cols[0]:cols[1]]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.extracted, timeout=5000) as blocker:
+        victim.run()
+
+    return blocker.args
+
+
+@pytest.mark.parametrize("noise", [0.0, 0.001])
+def test_finds_pure_pixels(qtbot, hypercube, data, noise):
+    rng = np.random.default_rng(2)
+    data += rng.normal(scale=noise, size=data.shape).astype(np.float32)
+
+    victim = EndmemberWorker(hypercube, num_endmembers=4, seed=0)
+    victim.BLOCK_BYTES = 20 * 12 * 4 * 3
+
+    spectra, positions = run(qtbot, victim)
+
+    assert sorted(map(tuple, positions.tolist())) == PURE
+    np.testing.assert_array_equal(spectra, data[positions[:, 0], positions[:, 1]])
+
+
+def test_reads_hypercube_once(qtbot, hypercube):
+    victim = EndmemberWorker(hypercube, num_endmembers=4, seed=0)
+    victim.BLOCK_BYTES = 20 * 12 * 4 * 3
+
+    run(qtbot, victim)
+
+    rows = [call.args[0] for call in hypercube.read_subregion.call_args_list]
+    assert rows == [(start, min(start + 3, 30)) for start in range(0, 30, 3)]
+
+
+def test_stopped_worker_does_not_emit(qtbot, hypercube):
+    victim = EndmemberWorker(hypercube, num_endmembers=4, seed=0)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.extracted):
+        victim.run()
+
+
+def test_invalid_number_of_endmembers(hypercube):
+    with pytest.raises(ValueError):
+        EndmemberWorker(hypercube, num_endmembers=13)
@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.spectral_index import SpectralIndex
+from suspectral.worker.worker_index import IndexWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random((30, 20, 6)).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data, tmp_path):
+    (tmp_path / "cube.img").write_bytes(data.tobytes())
+
+    mock = MagicMock()
+    mock.shape = data.shape
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.path = str(tmp_path / "cube.hdr")
+    mock.data_path = str(tmp_path / "cube.img")
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.indexed, timeout=1000) as blocker:
+        victim.run()
+
+    return blocker.args[0]
+
+
+def test_builds_and_stores_index(qtbot, hypercube, tmp_path):
+    victim = IndexWorker(hypercube, num_components=4)
+    victim.BLOCK_BYTES = 20 * 6 * 4 * 3
+
+    index = run(qtbot, victim)
+
+    assert index.shape == (30, 20)
+    assert index.tree.data.shape == (600, 4)
+    assert (tmp_path / "cube.index.npz").exists()
+
+
+def test_reuses_stored_index(qtbot, hypercube):
+    run(qtbot, IndexWorker(hypercube))
+    hypercube.read_subregion.reset_mock()
+
+    run(qtbot, IndexWorker(hypercube))
+
+    hypercube.read_subregion.assert_not_called()
+
+
+def test_rebuilds_stale_index(qtbot, hypercube, tmp_path):
+    SpectralIndex.path_of(hypercube).write_bytes(b"garbage")
+
+    run(qtbot, IndexWorker(hypercube))
+
+    hypercube.read_subregion.assert_called()
+    assert SpectralIndex.load(tmp_path / "cube.index.npz", SpectralIndex.key_of(hypercube)) is not None
+
+
+def test_reports_progress(qtbot, hypercube):
+    victim = IndexWorker(hypercube)
+    victim.BLOCK_BYTES = 20 * 6 * 4 * 3
+
+    values = []
+    victim.progress.connect(values.append)
+    run(qtbot, victim)
+
+    assert values == sorted(values)
+    assert values[-1] == 100
+    assert any(0 < it <= 50 for it in values)
+
+
+def test_stop_prevents_emission(qtbot, hypercube, tmp_path):
+    victim = IndexWorker(hypercube)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.indexed):
+        victim.run()
+
+    assert not (tmp_path / "cube.index.npz").exists()
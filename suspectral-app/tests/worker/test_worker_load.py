@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_load import LoadWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(30, 20, 12)).astype(np.int16)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.shape = data.shape
+    mock.dtype = data.dtype
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        return data[rows[0]:rows[1], cols[0]:cols[1]]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def test_loads_whole_hypercube(qtbot, hypercube, data):
+    victim = LoadWorker(hypercube)
+    victim.BLOCK_BYTES = 4 * data[0].nbytes
+
+    with qtbot.waitSignal(victim.loaded, timeout=1000) as blocker:
+        with qtbot.waitSignal(victim.progress, check_params_cb=lambda percent: percent == 100, timeout=1000):
+            victim.run()
+
+    assert victim.hypercube is hypercube
+    assert blocker.args[0].flags.c_contiguous
+    np.testing.assert_array_equal(blocker.args[0], data)
+    assert hypercube.read_subregion.call_count == 8
+
+
+def test_read_error_is_reported(qtbot, hypercube):
+    error = OSError("unreachable")
+    hypercube.read_subregion.side_effect = error
+    victim = LoadWorker(hypercube)
+
+    with qtbot.assertNotEmitted(victim.loaded):
+        with qtbot.waitSignal(victim.failed, timeout=1000) as blocker:
+            victim.run()
+
+    assert blocker.args == [error]
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = LoadWorker(hypercube)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.loaded):
+        victim.run()
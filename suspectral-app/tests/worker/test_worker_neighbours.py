@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_neighbours import NeighboursWorker
+
+
+@pytest.fixture
+def hypercube():
+    mock = MagicMock()
+    mock.read_pixel.return_value = np.array([1.0, 2.0, 3.0])
+    return mock
+
+
+@pytest.fixture
+def index():
+    mock = MagicMock()
+    mock.nearest.return_value = (np.array([7, 3]), np.array([0.0, 0.25], dtype=np.float32))
+    return mock
+
+
+def test_queries_index_for_pixel(qtbot, hypercube, index):
+    victim = NeighboursWorker(hypercube, index, 4, 2, 10)
+
+    with qtbot.waitSignal(victim.found, timeout=1000) as blocker:
+        victim.run()
+
+    hypercube.read_pixel.assert_called_once_with(4, 2)
+    index.nearest.assert_called_once_with(hypercube, hypercube.read_pixel.return_value, 10)
+
+    pixels, angles = blocker.args
+    np.testing.assert_array_equal(pixels, [7, 3])
+    np.testing.assert_array_equal(angles, [0.0, 0.25])
+
+
+def test_stop_prevents_emission(qtbot, hypercube, index):
+    victim = NeighboursWorker(hypercube, index, 4, 2, 10)
+    index.nearest.side_effect = lambda *args: (victim.stop(), index.nearest.return_value)[1]
+
+    with qtbot.assertNotEmitted(victim.found):
+        victim.run()
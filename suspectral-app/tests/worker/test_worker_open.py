@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock, patch
+
+from suspectral.model.hypercube import HypercubeDataMissing
+from suspectral.worker.worker_open import OpenWorker
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+def test_emits_opened(mock_hypercube_class, qtbot):
+    mock_hypercube_class.return_value = hypercube = MagicMock()
+    victim = OpenWorker("dummy/path.hdr")
+
+    with qtbot.waitSignal(victim.opened, timeout=1000) as blocker:
+        victim.run()
+
+    mock_hypercube_class.assert_called_once_with("dummy/path.hdr")
+    assert blocker.args == [hypercube]
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+def test_emits_failed(mock_hypercube_class, qtbot):
+    error = HypercubeDataMissing()
+    mock_hypercube_class.side_effect = error
+    victim = OpenWorker("dummy/path.hdr")
+
+    with qtbot.assertNotEmitted(victim.opened):
+        with qtbot.waitSignal(victim.failed, timeout=1000) as blocker:
+            victim.run()
+
+    assert blocker.args == [error]
+
+
+@patch("suspectral.worker.worker_open.Hypercube")
+def test_stop_discards_result(mock_hypercube_class, qtbot):
+    victim = OpenWorker("dummy/path.hdr")
+    mock_hypercube_class.side_effect = lambda path: victim.stop()
+
+    with qtbot.assertNotEmitted(victim.opened), qtbot.assertNotEmitted(victim.failed):
+        with qtbot.waitSignal(victim.finished, timeout=1000):
+            victim.run()
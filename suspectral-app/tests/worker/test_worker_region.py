@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_region import RegionWorker
+
+
+@pytest.fixture
+def data():
+    data = np.tile(np.array([1.0, 0.2, 0.1], dtype=np.float32), (50, 40, 1))
+    data[5:15, 10:30] = [0.1, 0.9, 1.0]
+    return data
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.read_pixel.side_effect = lambda row, col: data[row, col]
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def test_grows_region(qtbot, hypercube):
+    victim = RegionWorker(hypercube, 7, 12, tolerance=1.0)
+
+    with qtbot.waitSignal(victim.grown, timeout=1000) as blocker:
+        victim.run()
+
+    mask = blocker.args[0]
+    assert mask.rows == (5, 15)
+    assert mask.cols == (10, 30)
+    assert mask.count == 200
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = RegionWorker(hypercube, 7, 12)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.grown):
+        victim.run()
+
+    hypercube.read_subregion.assert_not_called()
@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_rx import RXWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    data = (rng.normal(size=(24, 18, 3)) @ rng.normal(size=(3, 5))).astype(np.float32)
+    data += rng.normal(scale=0.1, size=data.shape).astype(np.float32)
+    data[7, 9] += 10.0
+    return data
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.computed, timeout=2000) as blocker:
+        victim.run()
+
+    return blocker.args[0]
+
+
+def local_rx(data, window, guard, num_components):
+    pixels = data.reshape(-1, data.shape[-1]).astype(np.float64)
+    mean = pixels.mean(axis=0)
+    variances, components = np.linalg.eigh(np.cov(pixels, rowvar=False))
+    reduced = ((pixels - mean) @ components[:, ::-1][:, :num_components]).reshape(*data.shape[:2], -1)
+
+    rows, cols = data.shape[:2]
+    expected = np.empty((rows, cols))
+    for row in range(rows):
+        for col in range(cols):
+            r, g = window // 2, guard // 2
+            mask = np.zeros((rows, cols), dtype=bool)
+            mask[max(row - r, 0):row + r + 1, max(col - r, 0):col + r + 1] = True
+            if guard:
+                mask[max(row - g, 0):row + g + 1, max(col - g, 0):col + g + 1] = False
+
+            background = reduced[mask]
+            centered = reduced[row, col] - background.mean(axis=0)
+            covariance = np.cov(background, rowvar=False, bias=True)
+            covariance += RXWorker.RIDGE * np.trace(covariance) / num_components * np.eye(num_components)
+            expected[row, col] = centered @ np.linalg.solve(covariance, centered)
+
+    return expected
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_global(qtbot, hypercube, data, num_threads):
+    victim = RXWorker(hypercube, num_threads=num_threads)
+    victim.BLOCK_BYTES = 18 * 5 * 4 * 3
+
+    scores = run(qtbot, victim)
+
+    pixels = data.reshape(-1, 5).astype(np.float64)
+    centered = pixels - pixels.mean(axis=0)
+    inverse = np.linalg.inv(np.cov(pixels, rowvar=False))
+    expected = np.einsum("ij,jk,ik->i", centered, inverse, centered).reshape(24, 18)
+
+    assert scores.dtype == np.float32
+    np.testing.assert_allclose(scores, expected, rtol=1e-3)
+    assert np.unravel_index(np.argmax(scores), scores.shape) == (7, 9)
+
+
+@pytest.mark.parametrize("window, guard", [(7, 0), (9, 3)])
+@pytest.mark.parametrize("block_bytes", [18 * 9 * 8, 18 * 9 * 8 * 4, 8 * 1024 ** 2])
+def test_local(qtbot, hypercube, data, window, guard, block_bytes):
+    victim = RXWorker(hypercube, window, guard, num_components=3, num_threads=2)
+    victim.BLOCK_BYTES = block_bytes
+
+    scores = run(qtbot, victim)
+
+    np.testing.assert_allclose(scores, local_rx(data, window, guard, 3), rtol=1e-4, atol=1e-6)
+
+
+def test_non_finite_pixels_are_nan(qtbot, hypercube, data):
+    data[0, 0, 2] = np.nan
+
+    scores = run(qtbot, RXWorker(hypercube, 5, num_components=2))
+
+    assert np.isnan(scores[0, 0])
+    assert np.isfinite(scores[1:, 1:]).all()
+
+
+def test_reports_progress(qtbot, hypercube):
+    values = []
+    victim = RXWorker(hypercube, 5)
+    victim.progress.connect(values.append)
+
+    run(qtbot, victim)
+
+    assert values == sorted(values)
+    assert values[-1] == 100
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = RXWorker(hypercube)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.computed):
+        victim.run()
+
+
+@pytest.mark.parametrize("window, guard", [(4, 0), (1, 0), (5, 5), (7, 2)])
+def test_invalid_windows(hypercube, window, guard):
+    with pytest.raises(ValueError):
+        RXWorker(hypercube, window, guard)
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.cross_section import CrossSection
+from suspectral.worker.worker_section import SectionWorker
+
+
+@pytest.fixture
+def data():
+    return np.arange(30 * 20 * 3, dtype=np.int16).reshape(30, 20, 3)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.dtype = data.dtype
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    mock.read_col.side_effect = lambda col, bands=None: data[:, col:col + 1]
+    return mock
+
+
+def test_fetches_missing_columns(qtbot, hypercube, data):
+    section = CrossSection(hypercube)
+    rows, cols = CrossSection.trace(np.array([[4, 0], [6, 29]]), 30, 20)
+    victim = SectionWorker(hypercube, section, rows, cols)
+
+    values = []
+    victim.progress.connect(values.append)
+    with qtbot.waitSignal(victim.loaded, timeout=1000) as blocker:
+        victim.run()
+
+    np.testing.assert_array_equal(blocker.args[0], data[rows, cols])
+    assert sorted(call.args[0] for call in hypercube.read_col.call_args_list) == [4, 5, 6]
+    assert section.missing_columns(rows, cols) == []
+    assert values[-1] == 100
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    rows, cols = CrossSection.trace(np.array([[4, 0], [4, 29]]), 30, 20)
+    victim = SectionWorker(hypercube, CrossSection(hypercube), rows, cols)
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.loaded):
+        victim.run()
+
+    hypercube.read_col.assert_not_called()
@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.worker.worker_similarity import SimilarityWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random((30, 20, 6)).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.computed, timeout=1000) as blocker:
+        victim.run()
+
+    return blocker.args[0]
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_spectral_angle(qtbot, hypercube, data, num_threads):
+    target = data[3, 4]
+    victim = SimilarityWorker(hypercube, target, SimilarityWorker.ANGLE, num_threads=num_threads)
+    victim.BLOCK_BYTES = 20 * 6 * 4 * 3
+
+    scores = run(qtbot, victim)
+
+    pixels = data.reshape(-1, 6).astype(np.float64)
+    cosines = pixels @ target / (np.linalg.norm(pixels, axis=1) * np.linalg.norm(target))
+    expected = np.arccos(np.clip(cosines, -1, 1)).reshape(30, 20)
+
+    assert scores.shape == (30, 20)
+    np.testing.assert_allclose(scores, expected, atol=1e-3)
+    assert scores[3, 4] == pytest.approx(0.0, abs=1e-3)
+
+
+def test_euclidean_distance(qtbot, hypercube, data):
+    target = data[10, 2]
+    victim = SimilarityWorker(hypercube, target, SimilarityWorker.EUCLIDEAN, num_threads=2)
+
+    scores = run(qtbot, victim)
+
+    expected = np.linalg.norm(data - target, axis=-1)
+    np.testing.assert_allclose(scores, expected, atol=1e-4)
+
+
+def test_angle_of_zero_spectrum_is_nan(qtbot, hypercube, data):
+    data[0, 0] = 0
+    scores = run(qtbot, SimilarityWorker(hypercube, data[5, 5]))
+
+    assert np.isnan(scores[0, 0])
+    assert np.isfinite(scores[1:]).all()
+
+
+def test_stopped_worker_does_not_emit(qtbot, hypercube, data):
+    victim = SimilarityWorker(hypercube, data[0, 0])
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.computed):
+        with qtbot.waitSignal(victim.finished, timeout=1000):
+            victim.run()
+
+
+def test_unknown_metric_raises(hypercube, data):
+    with pytest.raises(ValueError):
+        SimilarityWorker(hypercube, data[0, 0], "manhattan")
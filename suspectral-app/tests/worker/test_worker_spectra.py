@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.selection_mask import SelectionMask
+from suspectral.worker.worker_spectra import SpectraWorker
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random((30, 20, 4)).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+    mock.read_subregion.side_effect = lambda rows, cols, bands=None: \
+        data[rows[0]:rows[1], cols[0]:cols[1]]
+    return mock
+
+
+def test_emits_spectra_block_by_block(qtbot, hypercube, data):
+    mask = np.zeros((30, 20), dtype=bool)
+    mask[2:25, 3:17] = True
+    selection = SelectionMask(mask)
+    selection.BLOCK_BYTES = 20 * 4 * 4 * 5
+
+    victim = SpectraWorker(hypercube, selection)
+    blocks = []
+    victim.loaded.connect(blocks.append)
+
+    with qtbot.waitSignal(victim.progress, check_params_cb=lambda value: value == 100, timeout=1000):
+        victim.run()
+
+    assert len(blocks) > 1
+    np.testing.assert_array_equal(np.concatenate(blocks), data[mask])
+
+
+def test_stop_prevents_emission(qtbot, hypercube):
+    victim = SpectraWorker(hypercube, SelectionMask(np.ones((30, 20), dtype=bool)))
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.loaded):
+        victim.run()
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from suspectral.model.unmixing import Unmixing
+from suspectral.worker.worker_unmixing import UnmixingWorker
+
+
+@pytest.fixture
+def endmembers():
+    return np.array([
+        [1.0, 0.0, 0.0, 0.2],
+        [0.0, 1.0, 0.0, 0.2],
+        [0.0, 0.0, 1.0, 0.2],
+    ])
+
+
+@pytest.fixture
+def abundances():
+    rng = np.random.default_rng(0)
+    return rng.dirichlet(np.ones(3), size=(30, 20))
+
+
+@pytest.fixture
+def data(endmembers, abundances):
+    return (abundances @ endmembers).astype(np.float32)
+
+
+@pytest.fixture
+def hypercube(data):
+    mock = MagicMock()
+    mock.num_rows, mock.num_cols, mock.num_bands = data.shape
+    mock.bytes_per_sample = data.itemsize
+
+    def read_subregion(rows, cols, bands=None):
+        block = data[rows[0]:rows[1], cols[0]:cols[1]]
+        return block if bands is None else block[..., bands]
+
+    mock.read_subregion.side_effect = read_subregion
+    return mock
+
+
+def run(qtbot, victim):
+    with qtbot.waitSignal(victim.computed, timeout=1000) as blocker:
+        victim.run()
+
+    return blocker.args
+
+
+@pytest.mark.parametrize("constraint", list(Unmixing.CONSTRAINTS))
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_unmixes_pixels(qtbot, hypercube, endmembers, abundances, constraint, num_threads):
+    victim = UnmixingWorker(hypercube, Unmixing(endmembers, constraint), num_threads=num_threads)
+    victim.BLOCK_BYTES = 20 * 4 * 4 * 3
+
+    actual, errors = run(qtbot, victim)
+
+    np.testing.assert_allclose(actual, abundances, atol=1e-4)
+    np.testing.assert_allclose(errors, 0, atol=1e-5)
+
+
+def test_reads_only_selected_bands(qtbot, hypercube, endmembers, abundances):
+    bands = np.array([True, True, True, False])
+    actual, _ = run(qtbot, UnmixingWorker(hypercube, Unmixing(endmembers[:, :3]), bands=bands))
+
+    np.testing.assert_allclose(actual, abundances, atol=1e-4)
+    for call in hypercube.read_subregion.call_args_list:
+        assert call.args[2] == [0, 1, 2]
+
+
+def test_stopped_worker_does_not_emit(qtbot, hypercube, endmembers):
+    victim = UnmixingWorker(hypercube, Unmixing(endmembers))
+    victim.stop()
+
+    with qtbot.assertNotEmitted(victim.computed):
+        victim.run()
@@ -8,27 +8,42 @@ import scipy.interpolate as interpolate
 from tqdm import tqdm
 
 
-def resample(path: Path):
+NEW_WAVELENGTHS = np.arange(400, 1000 + 1, 5)
+BLOCK_ROWS = 64
+
+
+def spline_operator(old_wavelengths: np.ndarray, new_wavelengths: np.ndarray) -> np.ndarray:
+    # Cubic spline interpolation on fixed wavelengths is linear in the samples,
+    # so it amounts to a single (new × old) matrix, fitted once for all pixels.
+    order = np.argsort(old_wavelengths)
+    identity = np.eye(len(old_wavelengths))[order]
+    return interpolate.CubicSpline(old_wavelengths[order], identity)(new_wavelengths)
+
+
+def resample(path: Path, operators: dict):
     envi = spy.io.envi.open(path)
 
     old_wavelengths = np.array(envi.bands.centers)
-    new_wavelengths = np.arange(400, 1000 + 1, 5)
     metadata = {
         'default bands': [48, 30, 12],
-        'wavelength': new_wavelengths,
+        'wavelength': NEW_WAVELENGTHS,
         'wavelength unit': 'nm',
     }
 
-    # Note that we remove the leftmost two columns because they contain garbage.
-    image = np.empty((envi.nrows, envi.ncols - 2, len(new_wavelengths)))
-    for row in range(envi.nrows):
-        data = envi.read_subregion((row, row + 1), (2, envi.ncols))
-        data = data.reshape(-1, envi.nbands).T
+    # Images of the dataset share their wavelengths, so the operator is reused across them.
+    key = old_wavelengths.tobytes()
+    if key not in operators:
+        operators[key] = spline_operator(old_wavelengths, NEW_WAVELENGTHS).T
+
+    operator = operators[key]
 
-        splines = interpolate.CubicSpline(old_wavelengths, data)
-        image[row, :, :] = splines(new_wavelengths).T
+    # Note that we remove the leftmost two columns because they contain garbage.
+    image = np.empty((envi.nrows, envi.ncols - 2, len(NEW_WAVELENGTHS)), dtype=np.uint16)
+    for row in range(0, envi.nrows, BLOCK_ROWS):
+        end = min(row + BLOCK_ROWS, envi.nrows)
+        data = envi.read_subregion((row, end), (2, envi.ncols)).astype(np.float64)
+        image[row:end] = np.rint(data @ operator).astype(np.uint16)
 
-    image = np.rint(image).astype(np.uint16)
     spy.envi.save_image(path, image, ext='raw', force=True, metadata=metadata)
 
     del envi, image
@@ -50,8 +65,9 @@ def main():
         parser.error(f'The path {args.path} is not a valid directory.')
 
     warnings.filterwarnings('ignore')
+    operators = {}
     for file in tqdm(list(args.path.glob('*.hdr'))):
-        resample(file)
+        resample(file, operators)
 
 
 if __name__ == '__main__':
@@ -10,6 +10,8 @@ import scipy.interpolate as interpolate
 
 from tqdm import tqdm
 
+BLOCK_ROWS = 64
+
 
 def main():
     wavelengths = np.arange(400, 1000 + 1, 5)
@@ -38,13 +40,14 @@ def main():
         envi = spy.io.envi.open(path)
 
         image = np.zeros((envi.nrows, envi.ncols, 3))
-        for row in range(envi.nrows):
-            spectra = envi.read_subregion((row, row + 1), (0, envi.ncols)).astype(np.float64)
+        for row in range(0, envi.nrows, BLOCK_ROWS):
+            end = min(row + BLOCK_ROWS, envi.nrows)
+            spectra = envi.read_subregion((row, end), (0, envi.ncols)).astype(np.float64)
             spectra = spectra[:, :, wavelengths_mask] / 4095.0
 
-            image[row, :, 0] = integrate.simpson(spectra * srf_r, wavelengths)
-            image[row, :, 1] = integrate.simpson(spectra * srf_g, wavelengths)
-            image[row, :, 2] = integrate.simpson(spectra * srf_b, wavelengths)
+            image[row:end, :, 0] = integrate.simpson(spectra * srf_r, wavelengths)
+            image[row:end, :, 1] = integrate.simpson(spectra * srf_g, wavelengths)
+            image[row:end, :, 2] = integrate.simpson(spectra * srf_b, wavelengths)
 
         image[image < 0] = 0
         image[image > 1] = 1